@@ -1,26 +1,47 @@
 """EvalML."""
+import importlib
 import warnings
 
-# hack to prevent warnings from skopt
-# must import sklearn first
-import sklearn
-import evalml.demos
-import evalml.model_family
-import evalml.model_understanding
-import evalml.objectives
-import evalml.pipelines
-import evalml.preprocessing
-import evalml.problem_types
-import evalml.utils
-import evalml.data_checks
-from evalml.automl import AutoMLSearch, search_iterative, search
-from evalml.utils import print_info, update_checker
-
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore", FutureWarning)
-    warnings.simplefilter("ignore", DeprecationWarning)
-    import skopt
+# Set before any submodule is imported so that the warnings raised while importing skopt and friends are hidden
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 __version__ = "0.54.0"
+
+# Submodules and top-level names are loaded on first access (PEP 562), so that
+# `import evalml` stays cheap for processes that only need a subset of the library,
+# such as a server that loads a saved pipeline.
+_submodules = {
+    "automl",
+    "data_checks",
+    "demos",
+    "exceptions",
+    "model_family",
+    "model_understanding",
+    "objectives",
+    "pipelines",
+    "preprocessing",
+    "problem_types",
+    "tuners",
+    "utils",
+}
+_attributes_to_modules = {
+    "AutoMLSearch": "evalml.automl",
+    "search": "evalml.automl",
+    "search_iterative": "evalml.automl",
+    "print_info": "evalml.utils",
+}
+
+
+def __getattr__(name):
+    """Import EvalML submodules and top-level names on first access."""
+    if name in _submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _attributes_to_modules:
+        return getattr(importlib.import_module(_attributes_to_modules[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List the names available in the evalml namespace, including ones that have not been imported yet."""
+    return sorted(set(globals()) | _submodules | set(_attributes_to_modules))
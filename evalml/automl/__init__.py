@@ -6,3 +6,4 @@ from evalml.automl.utils import (
     tune_binary_threshold,
 )
 from evalml.automl.engine import SequentialEngine, EngineBase
+from evalml.utils import update_checker
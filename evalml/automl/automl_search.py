@@ -1,28 +1,30 @@
 """EvalML's core AutoML object."""
 import copy
 import logging
+import os
 import pickle
 import sys
 import time
 import traceback
 import warnings
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 
 import cloudpickle
 import numpy as np
 import pandas as pd
 from dask import distributed as dd
-from plotly import io as pio
 from sklearn.model_selection import BaseCrossValidator
 from skopt.space import Categorical
 
 from evalml.automl.automl_algorithm import DefaultAlgorithm, IterativeAlgorithm
-from evalml.automl.callbacks import log_error_callback
+from evalml.automl.callbacks import AsyncCallbackDispatcher, log_error_callback
 from evalml.automl.engine import SequentialEngine
 from evalml.automl.engine.cf_engine import CFClient, CFEngine
 from evalml.automl.engine.dask_engine import DaskEngine
+from evalml.automl.engine.sequential_engine import SequentialComputation
 from evalml.automl.pipeline_search_plots import PipelineSearchPlots, SearchIterationPlot
+from evalml.automl.search_metrics import SearchMetrics
 from evalml.automl.utils import (
     AutoMLConfig,
     check_all_pipeline_names_unique,
@@ -46,6 +48,7 @@ from evalml.pipelines import (
     BinaryClassificationPipeline,
     ComponentGraph,
     MulticlassClassificationPipeline,
+    PipelineExecutionPlan,
     RegressionPipeline,
 )
 from evalml.pipelines.components import ARIMARegressor
@@ -58,7 +61,7 @@ from evalml.problem_types import (
     is_time_series,
 )
 from evalml.tuners import SKOptTuner
-from evalml.utils import convert_to_seconds, infer_feature_types
+from evalml.utils import convert_to_seconds, import_or_raise, infer_feature_types
 from evalml.utils.gen_utils import contains_all_ts_parameters
 from evalml.utils.logger import (
     get_logger,
@@ -95,9 +98,15 @@ def build_engine_from_str(engine_str):
     elif engine_str == "sequential":
         return SequentialEngine()
     elif engine_str == "cf_threaded":
-        return CFEngine(CFClient(ThreadPoolExecutor()))
+        return CFEngine()
     elif engine_str == "cf_process":
-        return CFEngine(CFClient(ProcessPoolExecutor()))
+        max_workers = os.cpu_count() or 1
+        return CFEngine(
+            CFClient(
+                ProcessPoolExecutor(max_workers=max_workers),
+                max_workers=max_workers,
+            ),
+        )
     elif engine_str == "dask_threaded":
         return DaskEngine(cluster=dd.LocalCluster(processes=False))
     elif engine_str == "dask_process":
@@ -360,6 +369,7 @@ class AutoMLSearch:
 
         add_result_callback (callable): Function called after each pipeline training iteration.
             Callback function takes three positional parameters: A dictionary containing the training results for the new pipeline, an untrained_pipeline containing the parameters used during training, and the AutoMLSearch object.
+            Wrap the callback in `evalml.automl.callbacks.AsyncCallbackDispatcher` to run it on a background thread instead of the search loop.
 
         error_callback (callable): Function called when `search()` errors and raises an Exception.
             Callback function takes three positional parameters: the Exception raised, the traceback, and the AutoMLSearch object.
@@ -419,6 +429,9 @@ class AutoMLSearch:
         verbose (boolean): Whether or not to display semi-real-time updates to stdout while search is running. Defaults to False.
 
         timing (boolean): Whether or not to write pipeline search times to the logger. Defaults to False.
+
+        search_metrics_callback (callable): Function called after each pipeline evaluation is processed, to monitor search throughput and utilization.
+            Callback function takes two positional parameters: the `SearchMetrics` object for the search and the AutoMLSearch object. Defaults to None.
     """
 
     _MAX_NAME_LEN = 40
@@ -460,6 +473,7 @@ class AutoMLSearch:
         engine="sequential",
         verbose=False,
         timing=False,
+        search_metrics_callback=None,
     ):
         self.verbose = verbose
         if verbose:
@@ -492,6 +506,8 @@ class AutoMLSearch:
         self.start_iteration_callback = start_iteration_callback
         self.add_result_callback = add_result_callback
         self.error_callback = error_callback or log_error_callback
+        self.search_metrics_callback = search_metrics_callback
+        self.search_metrics = None
         self.data_splitter = data_splitter
         self.optimize_thresholds = optimize_thresholds
         self.ensembling = ensembling
@@ -872,12 +888,15 @@ class AutoMLSearch:
             else:
                 leading_char = ""
 
-    def search(self, interactive_plot=True):
+    def search(self, interactive_plot=True, return_search_metrics=False):
         """Find the best pipeline for the data set.
 
+        Throughput and utilization metrics for the search are available through `search_metrics` while it runs.
+
         Args:
             interactive_plot (boolean, True): Shows an iteration vs. score plot in Jupyter notebook.
                 Disabled by default in non-Jupyter enviroments.
+            return_search_metrics (bool): If True, also returns the final `SearchMetrics` of the search. Defaults to False.
 
         Raises:
             AutoMLSearchException: If all pipelines in the current AutoML batch produced a score of np.nan on the primary objective.
@@ -885,6 +904,7 @@ class AutoMLSearch:
         Returns:
             Dict[int, Dict[str, Timestamp]]: Dictionary keyed by batch number that maps to the timings for pipelines run in that batch,
             as well as the total time for each batch. Pipelines within a batch are labeled by pipeline name.
+            If return_search_metrics is True, a tuple of that dictionary and the `SearchMetrics` of the search.
         """
         batch_times = {}
 
@@ -934,102 +954,131 @@ class AutoMLSearch:
             )
 
         self._start = time.time()
+        self.search_metrics = SearchMetrics(
+            engine=self._engine.__class__.__name__,
+            n_workers=self._engine.n_workers,
+        )
 
+        # Result callbacks running asynchronously are flushed however the search ends. If the search raised, errors from the
+        # callbacks have already been logged and must not replace the search's own exception.
+        search_raised = True
         try:
-            self._add_baseline_pipelines()
-        except KeyboardInterrupt:
-            if self._handle_keyboard_interrupt():
-                self._interrupted = True
-
-        current_batch_pipelines = []
-        current_batch_pipeline_scores = []
-        new_pipeline_ids = []
-        loop_interrupted = False
-
-        while self._should_continue():
-            pipeline_times = {}
-            start_batch_time = time.time()
-            computations = []
-            try:
-                if not loop_interrupted:
-                    current_batch_pipelines = self.automl_algorithm.next_batch()
-            except StopIteration:
-                self.logger.info("AutoML Algorithm out of recommendations, ending")
-                break
             try:
-                if self._should_continue():
-                    new_pipeline_ids = []
-                    log_title(
-                        self.logger,
-                        f"Evaluating Batch Number {self._get_batch_number()}",
-                    )
-                    for pipeline in current_batch_pipelines:
-                        self._pre_evaluation_callback(pipeline)
-                        computation = self._engine.submit_evaluation_job(
-                            self.automl_config,
-                            pipeline,
-                            self.X_train,
-                            self.y_train,
-                        )
-                        computations.append((computation, False))
-                    current_computation_index = 0
-                    computations_left_to_process = len(computations)
-                while self._should_continue() and computations_left_to_process > 0:
-                    computation, has_been_processed = computations[
-                        current_computation_index
-                    ]
-                    if computation.done() and not has_been_processed:
-                        start_pipeline_time = time.time()
-                        evaluation = computation.get_result()
-                        data, cached_data, pipeline, job_log = (
-                            evaluation.get("scores"),
-                            evaluation.get("cached_data"),
-                            evaluation.get("pipeline"),
-                            evaluation.get("logger"),
-                        )
-                        pipeline_id = self._post_evaluation_callback(
-                            pipeline,
-                            data,
-                            cached_data,
-                            job_log,
-                        )
-                        pipeline_times[pipeline.name] = time_elapsed(
-                            start_pipeline_time,
-                        )
-                        new_pipeline_ids.append(pipeline_id)
-                        computations[current_computation_index] = (computation, True)
-                        computations_left_to_process -= 1
-                    current_computation_index = (current_computation_index + 1) % max(
-                        len(computations),
-                        1,
-                    )
-                    time.sleep(self._sleep_time)
-                loop_interrupted = False
+                self._add_baseline_pipelines()
             except KeyboardInterrupt:
-                loop_interrupted = True
                 if self._handle_keyboard_interrupt():
                     self._interrupted = True
-                    for computation, has_been_processed in computations:
-                        if not has_been_processed:
-                            computation.cancel()
-
-            full_rankings = self.full_rankings
-            current_batch_idx = full_rankings["id"].isin(new_pipeline_ids)
-            current_batch_pipeline_scores = full_rankings[current_batch_idx][
-                "validation_score"
-            ]
 
-            if (
-                len(current_batch_pipeline_scores)
-                and current_batch_pipeline_scores.isna().all()
-            ):
-                raise AutoMLSearchException(
-                    f"All pipelines in the current AutoML batch produced a score of np.nan on the primary objective {self.objective}.",
-                )
-            if len(pipeline_times) > 0:
-                pipeline_times["Total time of batch"] = time_elapsed(start_batch_time)
-                batch_times[self._get_batch_number()] = pipeline_times
+            current_batch_pipelines = []
+            current_batch_pipeline_scores = []
+            new_pipeline_ids = []
+            loop_interrupted = False
 
+            while self._should_continue():
+                pipeline_times = {}
+                start_batch_time = time.time()
+                computations = []
+                try:
+                    if not loop_interrupted:
+                        with self.search_metrics.timer("tuner_time"):
+                            current_batch_pipelines = self.automl_algorithm.next_batch()
+                except StopIteration:
+                    self.logger.info("AutoML Algorithm out of recommendations, ending")
+                    break
+                try:
+                    if self._should_continue():
+                        new_pipeline_ids = []
+                        log_title(
+                            self.logger,
+                            f"Evaluating Batch Number {self._get_batch_number()}",
+                        )
+                        for pipeline in current_batch_pipelines:
+                            self._pre_evaluation_callback(pipeline)
+                            with self.search_metrics.timer("submission_time"):
+                                computation = self._engine.submit_evaluation_job(
+                                    self.automl_config,
+                                    pipeline,
+                                    self.X_train,
+                                    self.y_train,
+                                )
+                            computations.append((computation, False))
+                            self.search_metrics.set_queue_depth(len(computations))
+                        current_computation_index = 0
+                        computations_left_to_process = len(computations)
+                    while self._should_continue() and computations_left_to_process > 0:
+                        computation, has_been_processed = computations[
+                            current_computation_index
+                        ]
+                        if computation.done() and not has_been_processed:
+                            start_pipeline_time = time.time()
+                            evaluation = self._get_evaluation_result(computation)
+                            data, cached_data, pipeline, job_log = (
+                                evaluation.get("scores"),
+                                evaluation.get("cached_data"),
+                                evaluation.get("pipeline"),
+                                evaluation.get("logger"),
+                            )
+                            with self.search_metrics.timer(
+                                "post_evaluation_callback_time",
+                            ):
+                                pipeline_id = self._post_evaluation_callback(
+                                    pipeline,
+                                    data,
+                                    cached_data,
+                                    job_log,
+                                )
+                            pipeline_times[pipeline.name] = time_elapsed(
+                                start_pipeline_time,
+                            )
+                            new_pipeline_ids.append(pipeline_id)
+                            computations[current_computation_index] = (
+                                computation,
+                                True,
+                            )
+                            computations_left_to_process -= 1
+                            self.search_metrics.set_queue_depth(
+                                computations_left_to_process,
+                            )
+                            self._update_search_metrics(data)
+                        current_computation_index = (
+                            current_computation_index + 1
+                        ) % max(
+                            len(computations),
+                            1,
+                        )
+                        time.sleep(self._sleep_time)
+                    loop_interrupted = False
+                except KeyboardInterrupt:
+                    loop_interrupted = True
+                    if self._handle_keyboard_interrupt():
+                        self._interrupted = True
+                        for computation, has_been_processed in computations:
+                            if not has_been_processed:
+                                computation.cancel()
+                        self.search_metrics.set_queue_depth(0)
+
+                full_rankings = self.full_rankings
+                current_batch_idx = full_rankings["id"].isin(new_pipeline_ids)
+                current_batch_pipeline_scores = full_rankings[current_batch_idx][
+                    "validation_score"
+                ]
+
+                if (
+                    len(current_batch_pipeline_scores)
+                    and current_batch_pipeline_scores.isna().all()
+                ):
+                    raise AutoMLSearchException(
+                        f"All pipelines in the current AutoML batch produced a score of np.nan on the primary objective {self.objective}.",
+                    )
+                if len(pipeline_times) > 0:
+                    pipeline_times["Total time of batch"] = time_elapsed(
+                        start_batch_time
+                    )
+                    batch_times[self._get_batch_number()] = pipeline_times
+            search_raised = False
+        finally:
+            self._flush_result_callback(raise_errors=not search_raised)
+        self.search_metrics.stop()
         self.search_duration = time.time() - self._start
         elapsed_time = time_elapsed(self._start)
         desc = f"\nSearch finished after {elapsed_time}"
@@ -1053,8 +1102,14 @@ class AutoMLSearch:
                 self.search_iteration_plot = self.plot.search_iteration_plot(
                     interactive_plot=interactive_plot,
                 )
+                pio = import_or_raise(
+                    "plotly.io",
+                    error_msg="Cannot find dependency plotly.io",
+                )
                 if pio.renderers.default != "browser":
                     self.search_iteration_plot.show()
+        if return_search_metrics:
+            return batch_times, self.search_metrics
         return batch_times
 
     def _find_best_pipeline(self):
@@ -1196,20 +1251,44 @@ class AutoMLSearch:
         baseline = self._get_baseline_pipeline()
         self._pre_evaluation_callback(baseline)
         self.logger.info(f"Evaluating Baseline Pipeline: {baseline.name}")
-        computation = self._engine.submit_evaluation_job(
-            self.automl_config,
-            baseline,
-            self.X_train,
-            self.y_train,
-        )
-        evaluation = computation.get_result()
+        with self.search_metrics.timer("submission_time"):
+            computation = self._engine.submit_evaluation_job(
+                self.automl_config,
+                baseline,
+                self.X_train,
+                self.y_train,
+            )
+        evaluation = self._get_evaluation_result(computation)
         data, cached_data, pipeline, job_log = (
             evaluation.get("scores"),
             evaluation.get("cached_data"),
             evaluation.get("pipeline"),
             evaluation.get("logger"),
         )
-        self._post_evaluation_callback(pipeline, data, cached_data, job_log)
+        with self.search_metrics.timer("post_evaluation_callback_time"):
+            self._post_evaluation_callback(pipeline, data, cached_data, job_log)
+        self._update_search_metrics(data)
+
+    def _get_evaluation_result(self, computation):
+        """Gets the result of an evaluation job, recording the time spent retrieving it in the search metrics."""
+        start = time.perf_counter()
+        evaluation = computation.get_result()
+        result_time = time.perf_counter() - start
+        if isinstance(computation, SequentialComputation):
+            # Sequential jobs run when their result is requested, so don't count the evaluation itself
+            result_time = max(
+                result_time - evaluation["scores"]["training_time"],
+                0.0,
+            )
+        self.search_metrics.result_time += result_time
+        return evaluation
+
+    def _update_search_metrics(self, evaluation_results):
+        """Records a processed pipeline evaluation in the search metrics and calls the search metrics callback."""
+        self.search_metrics.n_pipelines_evaluated += 1
+        self.search_metrics.pipeline_time += evaluation_results["training_time"]
+        if self.search_metrics_callback:
+            self.search_metrics_callback(self.search_metrics, self)
 
     @staticmethod
     def _get_mean_cv_scores_for_all_objectives(cv_data, objective_name_to_class):
@@ -1283,7 +1362,7 @@ class AutoMLSearch:
             ],
             "validation_score": validation_score,
         }
-        self._pipelines_searched.update({pipeline_id: pipeline.clone()})
+        self._pipelines_searched.update({pipeline_id: pipeline.spec})
 
         if pipeline.model_family == ModelFamily.ENSEMBLE:
             input_pipeline_ids = [
@@ -1324,6 +1403,16 @@ class AutoMLSearch:
             )
         return pipeline_id
 
+    def _flush_result_callback(self, raise_errors=True):
+        """Waits for result callbacks which are running asynchronously to finish, raising the first error they raised if raise_errors is True."""
+        if not isinstance(self.add_result_callback, AsyncCallbackDispatcher):
+            return
+        try:
+            self.add_result_callback.flush()
+        except Exception:
+            if raise_errors:
+                raise
+
     def _check_for_high_variance(self, pipeline, cv_scores, threshold=0.5):
         """Checks cross-validation scores and logs a warning if variance is higher than specified threshhold."""
         pipeline_name = pipeline.name
@@ -1357,13 +1446,16 @@ class AutoMLSearch:
         pipeline_results = self.results["pipeline_results"].get(pipeline_id)
         if pipeline_results is None:
             raise PipelineNotFoundError("Pipeline not found in automl results")
-        pipeline = self._pipelines_searched.get(pipeline_id)
+        pipeline_spec = self._pipelines_searched.get(pipeline_id)
         parameters = pipeline_results.get("parameters")
-        if pipeline is None or parameters is None:
+        if pipeline_spec is None or parameters is None:
             raise PipelineNotFoundError(
                 "Pipeline class or parameters not found in automl results",
             )
-        new_pipeline = pipeline.new(parameters, random_seed=self.random_seed)
+        new_pipeline = pipeline_spec.new(
+            parameters,
+            random_seed=self.random_seed,
+        ).instantiate()
         if is_binary(self.problem_type):
             new_pipeline.threshold = None
         return new_pipeline
@@ -1478,6 +1570,7 @@ class AutoMLSearch:
             evaluation.get("logger"),
         )
         self._post_evaluation_callback(pipeline, data, cached_data, job_log)
+        self._flush_result_callback()
         self._find_best_pipeline()
 
     @property
@@ -1660,6 +1753,35 @@ class AutoMLSearch:
         scores = {}
         objectives = [get_objective(o, return_instance=True) for o in objectives]
 
+        if (
+            isinstance(self._engine, SequentialEngine)
+            and not is_time_series(self.problem_type)
+            and all(pipeline._is_fitted for pipeline in pipelines)
+        ):
+            # Evaluate components shared by the pipelines, such as the same fitted Imputer, only once
+            try:
+                plan = PipelineExecutionPlan(pipelines)
+                for pipeline_name, pipeline_scores in plan.iter_scores(
+                    X_holdout,
+                    y_holdout,
+                    objectives,
+                ):
+                    if isinstance(pipeline_scores, Exception):
+                        pipeline_scores = self._handle_score_error(
+                            pipeline_name,
+                            pipeline_scores,
+                            objectives,
+                        )
+                    scores[pipeline_name] = pipeline_scores
+            except Exception as e:
+                self.logger.warning(
+                    f"Could not score pipelines together, scoring them separately instead: {str(e)}",
+                    exc_info=True,
+                )
+            pipelines = [
+                pipeline for pipeline in pipelines if pipeline.name not in scores
+            ]
+
         computations = []
         for pipeline in pipelines:
             X_train, y_train = None, None
@@ -1684,23 +1806,28 @@ class AutoMLSearch:
                 try:
                     scores[pipeline_name] = computation.get_result()
                 except Exception as e:
-                    self.logger.error(f"Score error for {pipeline_name}: {str(e)}")
-                    if isinstance(e, PipelineScoreError):
-                        nan_scores = {objective: np.nan for objective in e.exceptions}
-                        scores[pipeline_name] = {**nan_scores, **e.scored_successfully}
-                    else:
-                        # Traceback already included in the PipelineScoreError so we only
-                        # need to include it for all other errors
-                        tb = traceback.format_tb(sys.exc_info()[2])
-                        self.logger.error("Traceback:")
-                        self.logger.error("\n".join(tb))
-                        scores[pipeline_name] = {
-                            objective.name: np.nan for objective in objectives
-                        }
+                    scores[pipeline_name] = self._handle_score_error(
+                        pipeline_name,
+                        e,
+                        objectives,
+                    )
             else:
                 computations.append(computation)
         return scores
 
+    def _handle_score_error(self, pipeline_name, e, objectives):
+        """Logs an error raised while scoring a pipeline and returns the scores to record for it, with NaN for every objective which could not be scored."""
+        self.logger.error(f"Score error for {pipeline_name}: {str(e)}")
+        if isinstance(e, PipelineScoreError):
+            nan_scores = {objective: np.nan for objective in e.exceptions}
+            return {**nan_scores, **e.scored_successfully}
+        # Traceback already included in the PipelineScoreError so we only
+        # need to include it for all other errors
+        tb = traceback.format_tb(e.__traceback__)
+        self.logger.error("Traceback:")
+        self.logger.error("\n".join(tb))
+        return {objective.name: np.nan for objective in objectives}
+
     @property
     def plot(self):
         """Return an instance of the plot with the latest scores."""
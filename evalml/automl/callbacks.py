@@ -1,5 +1,7 @@
 """Callbacks available to pass to AutoML."""
 import logging
+import queue
+import threading
 
 from evalml.exceptions import PipelineScoreError
 
@@ -61,3 +63,93 @@ def log_error_callback(exception, traceback, automl, **kwargs):
     )
     logger.error(f"\t\t\tFold {fold_num}: Parameters:\n\t{pipeline.parameters}")
     logger.error(f"\t\t\tFold {fold_num}: Traceback:\n{trace}")
+
+
+class AsyncCallbackDispatcher:
+    """Runs a callback on a background thread so that slow callbacks do not stall the search loop.
+
+    Wrap an ``add_result_callback`` with this class to decouple it from search throughput. Calls are placed on a bounded queue
+    and run in order on a single worker thread. When the queue is full, the caller blocks until there is space, so a callback
+    which cannot keep up slows the search down instead of buffering an unbounded number of results. AutoMLSearch flushes the
+    queue before ``search()`` and ``add_to_rankings()`` return.
+
+    Args:
+        callback (callable): The callback to run. Receives the same arguments the dispatcher is called with.
+        max_queue_size (int): Maximum number of pending calls before callers block. Defaults to 100.
+
+    Raises:
+        ValueError: If max_queue_size is not a positive integer.
+
+    Example:
+        >>> def slow_callback(results, pipeline, automl):
+        ...     ...
+        >>> dispatcher = AsyncCallbackDispatcher(slow_callback, max_queue_size=10)
+        >>> dispatcher.name
+        'slow_callback'
+    """
+
+    _STOP = object()
+
+    def __init__(self, callback, max_queue_size=100):
+        if not isinstance(max_queue_size, int) or max_queue_size < 1:
+            raise ValueError(
+                f"max_queue_size must be a positive integer, received {max_queue_size}",
+            )
+        self.callback = callback
+        self.max_queue_size = max_queue_size
+        self.__name__ = getattr(callback, "__name__", type(callback).__name__)
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = None
+        self._exception = None
+
+    @property
+    def name(self):
+        """Name of the wrapped callback."""
+        return self.__name__
+
+    @property
+    def queue_depth(self):
+        """Number of calls waiting to be run."""
+        return self._queue.qsize()
+
+    def __call__(self, *args, **kwargs):
+        """Queue a call to the callback, blocking while the queue is full."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"evalml-callback-{self.name}",
+                daemon=True,
+            )
+            self._thread.start()
+        self._queue.put((args, kwargs))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._STOP:
+                    return
+                args, kwargs = item
+                self.callback(*args, **kwargs)
+            except Exception as e:
+                logger.error(
+                    f"Callback {self.name} raised an exception: {str(e)}",
+                )
+                if self._exception is None:
+                    self._exception = e
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Wait for all queued calls to finish and stop the worker thread.
+
+        Raises:
+            Exception: The first exception raised by the callback since the last flush, if any.
+        """
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+        exception, self._exception = self._exception, None
+        if exception is not None:
+            raise exception
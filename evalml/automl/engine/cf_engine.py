@@ -1,4 +1,5 @@
 """Custom CFClient API to match Dask's CFClient and allow context management."""
+import os
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from evalml.automl.engine.engine_base import (
@@ -15,10 +16,12 @@ class CFClient:
 
     Args:
         pool(cf.ThreadPoolExecutor or cf.ProcessPoolExecutor): The resource pool to execute the futures work on.
+        max_workers(int): Number of jobs the pool runs at the same time, which should match the max_workers the pool was created with. Defaults to 1.
     """
 
-    def __init__(self, pool):
+    def __init__(self, pool, max_workers=1):
         self.pool = pool
+        self.max_workers = max_workers
 
     def __enter__(self):
         """Enter runtime context."""
@@ -101,7 +104,12 @@ class CFEngine(EngineBase):
                 f"Expected evalml.automl.engine.cf_engine.CFClient, received {type(client)}",
             )
         elif client is None:
-            client = CFClient(ThreadPoolExecutor())
+            # The default size of a ThreadPoolExecutor
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+            client = CFClient(
+                ThreadPoolExecutor(max_workers=max_workers),
+                max_workers=max_workers,
+            )
         self.client = client
         self._data_futures_cache = {}
 
@@ -194,6 +202,11 @@ class CFEngine(EngineBase):
         computation.meta_data["pipeline_name"] = pipeline.name
         return computation
 
+    @property
+    def n_workers(self):
+        """Number of jobs the engine can run at the same time."""
+        return self.client.max_workers
+
     def close(self):
         """Function to properly shutdown the Engine's Client's resources."""
         self.client.close()
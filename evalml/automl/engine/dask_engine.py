@@ -191,6 +191,11 @@ class DaskEngine(EngineBase):
         computation.meta_data["pipeline_name"] = pipeline.name
         return computation
 
+    @property
+    def n_workers(self):
+        """Number of jobs the engine can run at the same time, i.e. the total number of threads across the cluster's workers."""
+        return max(sum(self.client.nthreads().values()), 1)
+
     def close(self):
         """Closes the underlying cluster."""
         # TODO: Might want to rethink this if using something other than a LocalCluster.
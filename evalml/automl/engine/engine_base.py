@@ -88,6 +88,11 @@ class EngineBase(ABC):
         """Set up logger for job."""
         return JobLogger()
 
+    @property
+    def n_workers(self):
+        """Number of jobs the engine can run at the same time."""
+        return 1
+
     @abstractmethod
     def submit_evaluation_job(self, automl_config, pipeline, X, y):
         """Submit job for pipeline evaluation during AutoMLSearch."""
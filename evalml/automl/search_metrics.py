@@ -0,0 +1,130 @@
+"""Throughput and utilization metrics recorded while AutoMLSearch runs."""
+import time
+from contextlib import contextmanager
+
+
+class SearchMetrics:
+    """Throughput and utilization metrics for an AutoML search.
+
+    The search loop updates this object as it submits jobs and processes their results, so it can be inspected while
+    the search is running. Comparing the time workers spend evaluating pipelines against the time the search loop spends
+    proposing pipelines, handling results and moving data to and from the engine shows whether a slow search is compute-bound
+    or scheduling-bound.
+
+    Args:
+        engine (str): Name of the engine class evaluating pipelines.
+        n_workers (int): Number of jobs the engine can run at the same time.
+
+    Attributes:
+        n_pipelines_evaluated (int): Number of pipeline evaluations processed so far.
+        queue_depth (int): Number of submitted evaluation jobs whose results have not been processed yet.
+        max_queue_depth (int): Largest queue depth seen so far.
+        pipeline_time (float): Total time, in seconds, evaluation jobs report spending on training and scoring pipelines.
+        tuner_time (float): Total time, in seconds, spent by the AutoML algorithm proposing pipelines.
+        post_evaluation_callback_time (float): Total time, in seconds, spent recording results, including updating the tuners and running ``add_result_callback``.
+        submission_time (float): Total time, in seconds, spent submitting jobs to the engine. For parallel engines this includes serializing and sending pipelines and data.
+        result_time (float): Total time, in seconds, spent retrieving results from the engine, not counting the time the job itself ran.
+    """
+
+    _time_attributes = [
+        "pipeline_time",
+        "tuner_time",
+        "post_evaluation_callback_time",
+        "submission_time",
+        "result_time",
+    ]
+
+    def __init__(self, engine, n_workers=1):
+        self.engine = engine
+        self.n_workers = n_workers
+        self.n_pipelines_evaluated = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        for attribute in self._time_attributes:
+            setattr(self, attribute, 0.0)
+        self._start = time.perf_counter()
+        self._end = None
+
+    @contextmanager
+    def timer(self, attribute):
+        """Adds the time spent in the context to one of the time attributes.
+
+        Args:
+            attribute (str): Name of the attribute to add to.
+
+        Yields:
+            None
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(
+                self,
+                attribute,
+                getattr(self, attribute) + time.perf_counter() - start,
+            )
+
+    def set_queue_depth(self, queue_depth):
+        """Records the current number of unprocessed evaluation jobs.
+
+        Args:
+            queue_depth (int): Number of submitted evaluation jobs whose results have not been processed yet.
+        """
+        self.queue_depth = queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def stop(self):
+        """Marks the end of the search, freezing the elapsed time. Jobs which have not been processed by then are dropped from the queue."""
+        self._end = time.perf_counter()
+        self.queue_depth = 0
+
+    @property
+    def elapsed_time(self):
+        """Seconds since the search started, or the total search time once it has finished."""
+        end = self._end if self._end is not None else time.perf_counter()
+        return end - self._start
+
+    @property
+    def pipelines_per_hour(self):
+        """Number of pipelines evaluated per hour of search."""
+        elapsed_time = self.elapsed_time
+        if elapsed_time <= 0:
+            return 0.0
+        return self.n_pipelines_evaluated * 3600 / elapsed_time
+
+    @property
+    def worker_idle_percent(self):
+        """Percentage of the available worker time which was not spent evaluating pipelines."""
+        available_time = self.elapsed_time * self.n_workers
+        if available_time <= 0:
+            return 0.0
+        return 100 * max(1 - self.pipeline_time / available_time, 0.0)
+
+    def to_dict(self):
+        """Returns the current values of all metrics.
+
+        Returns:
+            dict: Metric names mapped to their values.
+        """
+        metrics = {
+            "engine": self.engine,
+            "n_workers": self.n_workers,
+            "elapsed_time": self.elapsed_time,
+            "n_pipelines_evaluated": self.n_pipelines_evaluated,
+            "pipelines_per_hour": self.pipelines_per_hour,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "worker_idle_percent": self.worker_idle_percent,
+        }
+        metrics.update(
+            {
+                attribute: getattr(self, attribute)
+                for attribute in self._time_attributes
+            },
+        )
+        return metrics
+
+    def __repr__(self):
+        """String representation of the search metrics."""
+        return f"SearchMetrics({self.to_dict()})"
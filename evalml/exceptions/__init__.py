@@ -15,6 +15,7 @@ from evalml.exceptions.exceptions import (
     ParameterNotUsedWarning,
     PartialDependenceErrorCode,
     PartialDependenceError,
+    PartialDependenceMethodWarning,
     ValidationErrorCode,
     PipelineError,
     PipelineErrorCodeEnum,
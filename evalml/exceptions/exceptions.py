@@ -79,6 +79,10 @@ class NullsInColumnWarning(UserWarning):
     """Warning thrown when there are null values in the column of interest."""
 
 
+class PartialDependenceMethodWarning(UserWarning):
+    """Warning thrown when partial dependence cannot be computed with the requested method and the brute method is used instead."""
+
+
 class ObjectiveCreationError(Exception):
     """Exception when get_objective tries to instantiate an objective and required args are not provided."""
 
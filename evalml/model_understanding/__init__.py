@@ -1,41 +1,60 @@
 """Model understanding tools."""
-from evalml.model_understanding.visualizations import (
-    binary_objective_vs_threshold,
-    get_linear_coefficients,
-    get_prediction_vs_actual_data,
-    get_prediction_vs_actual_over_time_data,
-    graph_binary_objective_vs_threshold,
-    graph_prediction_vs_actual,
-    graph_prediction_vs_actual_over_time,
-    graph_t_sne,
-    t_sne,
-)
-from evalml.model_understanding.metrics import (
-    confusion_matrix,
-    graph_confusion_matrix,
-    graph_precision_recall_curve,
-    graph_roc_curve,
-    normalize_confusion_matrix,
-    precision_recall_curve,
-    roc_curve,
-)
-from evalml.model_understanding.partial_dependence_functions import (
-    graph_partial_dependence,
-    partial_dependence,
-)
-from evalml.model_understanding.prediction_explanations import (
-    explain_predictions,
-    explain_predictions_best_worst,
-)
-from evalml.model_understanding.permutation_importance import (
-    calculate_permutation_importance,
-    calculate_permutation_importance_one_column,
-    graph_permutation_importance,
-)
-from evalml.model_understanding.feature_explanations import (
-    readable_explanation,
-    get_influential_features,
-)
-from evalml.model_understanding.decision_boundary import (
-    find_confusion_matrix_per_thresholds,
-)
+import importlib
+
+# Functions are imported on first access (PEP 562) so that importing this package does not
+# load the plotting and explanation dependencies (plotly, shap, sklearn.manifold) up front.
+_submodules = {
+    "cache",
+    "decision_boundary",
+    "feature_explanations",
+    "force_plots",
+    "metrics",
+    "partial_dependence_functions",
+    "permutation_importance",
+    "prediction_explanations",
+    "visualizations",
+}
+_attributes_to_modules = {
+    "binary_objective_vs_threshold": "evalml.model_understanding.visualizations",
+    "get_linear_coefficients": "evalml.model_understanding.visualizations",
+    "get_prediction_vs_actual_data": "evalml.model_understanding.visualizations",
+    "get_prediction_vs_actual_over_time_data": "evalml.model_understanding.visualizations",
+    "graph_binary_objective_vs_threshold": "evalml.model_understanding.visualizations",
+    "graph_prediction_vs_actual": "evalml.model_understanding.visualizations",
+    "graph_prediction_vs_actual_over_time": "evalml.model_understanding.visualizations",
+    "graph_t_sne": "evalml.model_understanding.visualizations",
+    "t_sne": "evalml.model_understanding.visualizations",
+    "confusion_counts_per_threshold": "evalml.model_understanding.metrics",
+    "confusion_matrix": "evalml.model_understanding.metrics",
+    "graph_confusion_matrix": "evalml.model_understanding.metrics",
+    "graph_precision_recall_curve": "evalml.model_understanding.metrics",
+    "graph_roc_curve": "evalml.model_understanding.metrics",
+    "normalize_confusion_matrix": "evalml.model_understanding.metrics",
+    "precision_recall_curve": "evalml.model_understanding.metrics",
+    "roc_curve": "evalml.model_understanding.metrics",
+    "graph_partial_dependence": "evalml.model_understanding.partial_dependence_functions",
+    "partial_dependence": "evalml.model_understanding.partial_dependence_functions",
+    "explain_predictions": "evalml.model_understanding.prediction_explanations",
+    "explain_predictions_best_worst": "evalml.model_understanding.prediction_explanations",
+    "calculate_permutation_importance": "evalml.model_understanding.permutation_importance",
+    "calculate_permutation_importance_one_column": "evalml.model_understanding.permutation_importance",
+    "graph_permutation_importance": "evalml.model_understanding.permutation_importance",
+    "readable_explanation": "evalml.model_understanding.feature_explanations",
+    "get_influential_features": "evalml.model_understanding.feature_explanations",
+    "find_confusion_matrix_per_thresholds": "evalml.model_understanding.decision_boundary",
+    "ModelUnderstandingCache": "evalml.model_understanding.cache",
+}
+
+
+def __getattr__(name):
+    """Import model understanding submodules and functions on first access."""
+    if name in _submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _attributes_to_modules:
+        return getattr(importlib.import_module(_attributes_to_modules[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List the names available in this package, including ones that have not been imported yet."""
+    return sorted(set(globals()) | _submodules | set(_attributes_to_modules))
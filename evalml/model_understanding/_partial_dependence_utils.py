@@ -4,13 +4,43 @@ Implementation borrows from sklearn "brute" calculation but with our
 own modification to better handle mixed data types in the grid
 as well as EvalML pipelines.
 """
+import warnings
+
 import numpy as np
 import pandas as pd
 import woodwork as ww
 from scipy.stats.mstats import mquantiles
 
-from evalml.exceptions import PartialDependenceError, PartialDependenceErrorCode
-from evalml.problem_types import is_regression
+from evalml.exceptions import (
+    PartialDependenceError,
+    PartialDependenceErrorCode,
+    PartialDependenceMethodWarning,
+)
+from evalml.model_understanding.cache import _cached_call
+from evalml.pipelines.components import (
+    DecisionTreeClassifier,
+    DecisionTreeRegressor,
+    ExtraTreesClassifier,
+    ExtraTreesRegressor,
+    RandomForestClassifier,
+    RandomForestRegressor,
+)
+from evalml.problem_types import is_regression, is_time_series
+
+# Most feature values tiled into one pipeline call when computing partial dependence
+_PARTIAL_DEPENDENCE_BATCH_SIZE = 10_000_000
+
+# Estimators whose sklearn trees partial dependence can be computed from with the 'recursion' method
+_TREE_ESTIMATORS = (
+    DecisionTreeClassifier,
+    DecisionTreeRegressor,
+    ExtraTreesClassifier,
+    ExtraTreesRegressor,
+    RandomForestClassifier,
+    RandomForestRegressor,
+)
+# Child index sklearn trees give leaves
+_TREE_LEAF = -1
 
 
 def _add_ice_plot(_go, fig, ice_data, label=None, row=None, col=None):
@@ -224,6 +254,11 @@ def _cartesian(arrays):
 def _partial_dependence_calculation(pipeline, grid, features, X):
     """Do the partial dependence calculation once the grid is computed.
 
+    The rows of X are tiled once for each of a batch of grid points and the pipeline predicts on the whole batch in one call, with
+    at most _PARTIAL_DEPENDENCE_BATCH_SIZE feature values in a batch. For pipelines which support fast permutation importance, the
+    rows of X are only transformed once: the grid points are transformed on their own and swapped into the features derived from
+    the grid features before the estimator predicts.
+
     Args:
         pipeline (PipelineBase): pipeline.
         grid (pd.DataFrame): Grid of features to compute the partial dependence on.
@@ -237,28 +272,17 @@ def _partial_dependence_calculation(pipeline, grid, features, X):
     predictions = []
     averaged_predictions = []
 
-    if is_regression(pipeline.problem_type):
-        prediction_method = pipeline.predict
+    if pipeline._supports_fast_permutation_importance and not is_time_series(
+        pipeline.problem_type,
+    ):
+        batches = _predict_grid_from_features(pipeline, grid, features, X)
     else:
-        prediction_method = pipeline.predict_proba
-
-    X_eval = X.ww.copy()
-    for _, new_values in grid.iterrows():
-        for i, variable in enumerate(features):
-            part_dep_column = pd.Series(
-                [new_values[i]] * X_eval.shape[0],
-                index=X_eval.index,
-            )
-            X_eval.ww[variable] = ww.init_series(
-                part_dep_column,
-                logical_type=X_eval.ww.logical_types[variable],
-            )
-
-        pred = prediction_method(X_eval)
-
-        predictions.append(pred)
-        # average over samples
-        averaged_predictions.append(np.mean(pred, axis=0))
+        batches = _predict_grid(pipeline, grid, features, X)
+    for batch_predictions in batches:
+        for pred in batch_predictions:
+            predictions.append(pred)
+            # average over samples
+            averaged_predictions.append(np.mean(pred, axis=0))
 
     n_samples = X.shape[0]
 
@@ -283,6 +307,248 @@ def _partial_dependence_calculation(pipeline, grid, features, X):
     return averaged_predictions, predictions
 
 
+def _grid_batch_size(grid, n_values_per_point):
+    """Number of grid points to predict on in one call."""
+    return max(
+        1,
+        min(len(grid), _PARTIAL_DEPENDENCE_BATCH_SIZE // max(n_values_per_point, 1)),
+    )
+
+
+def _tile(X, n_tiles):
+    """Stacks n_tiles copies of the rows of X with a new index, keeping its Woodwork schema."""
+    X_tiled = pd.concat([X] * n_tiles, ignore_index=True)
+    X_tiled.ww.init(schema=X.ww.schema)
+    return X_tiled
+
+
+def _split_batch(pred, n_samples):
+    """Splits predictions on tiled rows into one array per grid point."""
+    pred = np.asarray(pred)
+    return [pred[start : start + n_samples] for start in range(0, len(pred), n_samples)]
+
+
+def _predict_grid(pipeline, grid, features, X):
+    """Yields the pipeline's predictions for batches of grid points, predicting on the rows of X tiled once for each grid point."""
+    if is_regression(pipeline.problem_type):
+        prediction_method = pipeline.predict
+    else:
+        prediction_method = pipeline.predict_proba
+
+    n_samples = X.shape[0]
+    # The tiled rows go through the whole pipeline, so size batches by the widest of the input and the features the
+    # estimator receives, which one-hot encoding or text featurization can make much wider than X
+    estimator_input_features = getattr(pipeline.estimator, "input_feature_names", None)
+    n_columns = max(X.shape[1], len(estimator_input_features or []))
+    # Predictions of time series pipelines depend on the order of the rows, so predict on one grid point at a time
+    batch_size = (
+        1
+        if is_time_series(pipeline.problem_type)
+        else _grid_batch_size(grid, n_samples * n_columns)
+    )
+    for start in range(0, len(grid), batch_size):
+        batch = grid.iloc[start : start + batch_size]
+        X_eval = X.ww.copy() if len(batch) == 1 else _tile(X, len(batch))
+        for i, variable in enumerate(features):
+            part_dep_column = pd.Series(
+                np.repeat(batch[i].to_numpy(), n_samples),
+                index=X_eval.index,
+            )
+            X_eval.ww[variable] = ww.init_series(
+                part_dep_column,
+                logical_type=X_eval.ww.logical_types[variable],
+            )
+        yield _split_batch(prediction_method(X_eval), n_samples)
+
+
+def _transform_grid(pipeline, grid, features, X):
+    """Transforms the grid points with the pipeline, taking the features which are not in the grid from the first row of X."""
+    X_grid = X.ww.iloc[np.zeros(len(grid), dtype=int)]
+    X_grid.index = pd.RangeIndex(len(grid))
+    X_grid.ww.init(schema=X.ww.schema)
+    for i, variable in enumerate(features):
+        X_grid.ww[variable] = ww.init_series(
+            pd.Series(grid[i].to_numpy(), index=X_grid.index),
+            logical_type=X_grid.ww.logical_types[variable],
+        )
+    return _cached_call(pipeline, "transform_all_but_final", X_grid)
+
+
+def _predict_grid_from_features(pipeline, grid, features, X):
+    """Yields the pipeline's predictions for batches of grid points, transforming the rows of X only once.
+
+    Only used for pipelines which transform each feature independently of the others, so that the features derived from the
+    grid features only depend on the grid point.
+    """
+    precomputed_features = _cached_call(pipeline, "transform_all_but_final", X)
+    grid_features = _transform_grid(pipeline, grid, features, X)
+
+    feature_provenance = pipeline._get_feature_provenance()
+    grid_columns = []
+    for variable in features:
+        if variable in precomputed_features.columns:
+            grid_columns.append(variable)
+        else:
+            # Features which are not in the provenance were dropped
+            grid_columns.extend(feature_provenance.get(variable, []))
+    grid_columns = [
+        col for col in precomputed_features.columns if col in set(grid_columns)
+    ]
+
+    n_samples = X.shape[0]
+    batch_size = _grid_batch_size(grid, precomputed_features.size)
+    for start in range(0, len(grid), batch_size):
+        n_points = min(batch_size, len(grid) - start)
+        features_eval = pd.concat([precomputed_features] * n_points, ignore_index=True)
+        point_rows = np.repeat(np.arange(start, start + n_points), n_samples)
+        for col in grid_columns:
+            features_eval[col] = (
+                grid_features[col]
+                .iloc[point_rows]
+                .astype(precomputed_features[col].dtype)
+                .set_axis(features_eval.index)
+            )
+        features_eval.ww.init(schema=precomputed_features.ww.schema)
+        if is_regression(pipeline.problem_type):
+            pred = pipeline._decode_predictions(
+                pipeline._predict_from_features(None, features_eval),
+            )
+        else:
+            pred = pipeline._predict_proba_from_features(features_eval)
+        yield _split_batch(pred, n_samples)
+
+
+def _recursion_target_columns(pipeline, grid, features, X, kind):
+    """Finds the positions in the estimator's input of the grid features, if partial dependence can be computed with the 'recursion' method.
+
+    Returns:
+        tuple(list(int), str): Positions of the grid features among the estimator's input features, or None and the reason
+            the 'recursion' method cannot be used.
+    """
+    if kind != "average":
+        return (
+            None,
+            "individual predictions cannot be computed with the 'recursion' method",
+        )
+    if not isinstance(pipeline.estimator, _TREE_ESTIMATORS):
+        return (
+            None,
+            "the 'recursion' method only supports decision tree, random forest and extra trees estimators",
+        )
+    if is_time_series(pipeline.problem_type):
+        return None, "the 'recursion' method does not support time series pipelines"
+    if not pipeline._supports_fast_permutation_importance:
+        return (
+            None,
+            "the pipeline's components do not transform each feature independently",
+        )
+    if is_regression(pipeline.problem_type) and _transforms_target(pipeline):
+        return None, "the pipeline transforms the target"
+
+    grid_features = _transform_grid(pipeline, grid, features, X)
+    input_feature_names = pipeline.estimator.input_feature_names
+    target_columns = []
+    for i, variable in enumerate(features):
+        try:
+            unchanged = variable in input_feature_names and np.array_equal(
+                grid_features[variable].to_numpy(dtype=float),
+                grid[i].to_numpy(dtype=float),
+            )
+        except (TypeError, ValueError):
+            unchanged = False
+        if not unchanged:
+            return (
+                None,
+                f"feature '{variable}' is not passed to the estimator unchanged",
+            )
+        target_columns.append(input_feature_names.index(variable))
+    return target_columns, None
+
+
+def _transforms_target(pipeline):
+    """Whether any component the estimator's target passes through transforms it, so that predictions are inverse transformed."""
+    component_graph = pipeline.component_graph
+    parent_y = component_graph._get_parent_y(component_graph.compute_order[-1])
+    while parent_y:
+        if hasattr(component_graph.get_component(parent_y), "inverse_transform"):
+            return True
+        parent_y = component_graph._get_parent_y(parent_y)
+    return False
+
+
+def _recursion_partial_dependence(pipeline, grid, target_columns):
+    """Computes averaged partial dependence from the estimator's trees, without predicting on any rows.
+
+    Each grid point is sent down every tree: splits on a grid feature follow the grid value, while splits on any other feature
+    follow both children, weighted by the fraction of training samples that went each way. The partial dependence is the
+    weighted average of the leaf values. Values are averaged over the data the trees were fit on.
+
+    Args:
+        pipeline (PipelineBase): Pipeline whose estimator is a decision tree, random forest or extra trees model.
+        grid (pd.DataFrame): Grid of feature values to compute the partial dependence on.
+        target_columns (list(int)): Positions of the grid features among the estimator's input features.
+
+    Returns:
+        np.ndarray: Averaged predictions, of shape (1, n_points) for regression and binary classification and
+            (n_classes, n_points) for multiclass classification.
+    """
+    estimator = pipeline.estimator._component_obj
+    trees = [tree.tree_ for tree in getattr(estimator, "estimators_", [estimator])]
+    # Trees compare their features as float32 against the split thresholds
+    grid_values = grid.to_numpy(dtype=np.float32)
+    batch_size = _grid_batch_size(grid, max(tree.node_count for tree in trees))
+    averaged_predictions = np.concatenate(
+        [
+            np.mean(
+                [
+                    _tree_partial_dependence(
+                        tree,
+                        grid_values[start : start + batch_size],
+                        target_columns,
+                        normalize=not is_regression(pipeline.problem_type),
+                    )
+                    for tree in trees
+                ],
+                axis=0,
+            )
+            for start in range(0, len(grid_values), batch_size)
+        ],
+    ).T
+    if averaged_predictions.shape[0] == 2:
+        averaged_predictions = averaged_predictions[1].reshape(1, -1)
+    return averaged_predictions
+
+
+def _tree_partial_dependence(tree, grid_values, target_columns, normalize):
+    """Partial dependence of one fitted sklearn tree on each grid point, of shape (n_points, n_outputs)."""
+    values = tree.value[:, 0, :]
+    if normalize:
+        # Classification trees store class counts, and predict the class fractions of their leaves
+        values = values / values.sum(axis=1, keepdims=True)
+    weights = np.zeros((len(grid_values), tree.node_count))
+    weights[:, 0] = 1
+    # Go down the tree one level at a time, splitting each node's weight between its children
+    nodes = np.array([0])
+    while len(nodes):
+        nodes = nodes[tree.children_left[nodes] != _TREE_LEAF]
+        left = tree.children_left[nodes]
+        right = tree.children_right[nodes]
+        go_left = np.tile(
+            tree.weighted_n_node_samples[left] / tree.weighted_n_node_samples[nodes],
+            (len(grid_values), 1),
+        )
+        for i, column in enumerate(target_columns):
+            splits_on_feature = tree.feature[nodes] == column
+            go_left[:, splits_on_feature] = (
+                grid_values[:, [i]] <= tree.threshold[nodes][splits_on_feature]
+            )
+        weights[:, left] = weights[:, nodes] * go_left
+        weights[:, right] = weights[:, nodes] * (1 - go_left)
+        nodes = np.concatenate([left, right])
+    leaves = tree.children_left == _TREE_LEAF
+    return weights[:, leaves] @ values[leaves]
+
+
 def _partial_dependence(
     pipeline,
     X,
@@ -291,6 +557,9 @@ def _partial_dependence(
     grid_resolution=100,
     kind="average",
     custom_range=None,
+    ice_sample_size=None,
+    random_seed=0,
+    method="brute",
 ):
     """Compute the partial dependence for features of X.
 
@@ -307,15 +576,28 @@ def _partial_dependence(
             range of values to use in partial dependence. If custom_range is specified,
             the percentile + interpolation procedure is skipped and the values in custom_range
             are used.
+        ice_sample_size (int): Number of randomly sampled rows of X to return individual predictions for. When kind is
+            'individual', predictions are only made for these rows. Defaults to None, which uses every row.
+        random_seed (int): Seed for sampling the rows individual predictions are returned for. Defaults to 0.
+        method ({'brute', 'recursion'}): How to compute the partial dependence. Falls back to 'brute', with a warning, when
+            'recursion' is not supported for the pipeline, features or kind. Defaults to 'brute'.
 
     Returns:
-        dict with 'average', 'individual', 'values' keys. 'values' is a list of
+        dict with 'average', 'individual', 'values', 'samples' and 'method' keys. 'values' is a list of
             the values used in the partial dependence for each feature.
             'average' and 'individual' are averaged and individual predictions for
-            each point in the grid.
+            each point in the grid. 'samples' are the positions in X of the rows individual
+            predictions are returned for. 'method' is the method used.
+
+    Raises:
+        ValueError: If grid_resolution is not greater than 1 or method is not 'brute' or 'recursion'.
     """
     if grid_resolution <= 1:
         raise ValueError("'grid_resolution' must be strictly greater than 1.")
+    if method not in ["brute", "recursion"]:
+        raise ValueError(
+            f"'method' must be 'brute' or 'recursion', not '{method}'.",
+        )
 
     custom_range = custom_range or {}
     custom_range = {
@@ -329,16 +611,55 @@ def _partial_dependence(
         grid_resolution,
         custom_range,
     )
+    if method == "recursion":
+        target_columns, reason = _recursion_target_columns(
+            pipeline,
+            grid,
+            features,
+            X,
+            kind,
+        )
+        if target_columns is not None:
+            averaged_predictions = _recursion_partial_dependence(
+                pipeline,
+                grid,
+                target_columns,
+            ).reshape(-1, *[val.shape[0] for val in values])
+            return {
+                "average": averaged_predictions,
+                "values": values,
+                "method": "recursion",
+            }
+        warnings.warn(
+            f"Partial dependence was computed with the 'brute' method because {reason}.",
+            PartialDependenceMethodWarning,
+        )
+
+    samples = np.arange(X.shape[0])
+    if ice_sample_size is not None and ice_sample_size < X.shape[0]:
+        samples = np.sort(
+            np.random.RandomState(random_seed).choice(
+                X.shape[0],
+                ice_sample_size,
+                replace=False,
+            ),
+        )
+    # Averages are over every row, so only predict on the sampled rows when no average is needed
+    X_eval = X.ww.iloc[samples] if kind == "individual" else X
     averaged_predictions, predictions = _partial_dependence_calculation(
         pipeline,
         grid,
         features,
-        X,
+        X_eval,
     )
 
     # reshape predictions to
     # (n_outputs, n_instances, n_values_feature_0, n_values_feature_1, ...)
-    predictions = predictions.reshape(-1, X.shape[0], *[val.shape[0] for val in values])
+    predictions = predictions.reshape(
+        -1, X_eval.shape[0], *[val.shape[0] for val in values]
+    )
+    if X_eval.shape[0] != len(samples):
+        predictions = predictions[:, samples]
 
     # reshape averaged_predictions to
     # (n_outputs, n_values_feature_0, n_values_feature_1, ...)
@@ -347,12 +668,19 @@ def _partial_dependence(
     )
 
     if kind == "average":
-        return {"average": averaged_predictions, "values": values}
+        return {"average": averaged_predictions, "values": values, "method": "brute"}
     elif kind == "individual":
-        return {"individual": predictions, "values": values}
+        return {
+            "individual": predictions,
+            "values": values,
+            "samples": samples,
+            "method": "brute",
+        }
     else:  # kind='both'
         return {
             "average": averaged_predictions,
             "individual": predictions,
             "values": values,
+            "samples": samples,
+            "method": "brute",
         }
@@ -0,0 +1,276 @@
+"""Cache of pipeline outputs shared by the model understanding functions."""
+import hashlib
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from evalml.utils import infer_feature_types
+
+# Caches entered with a with statement, the innermost last. Model understanding functions use the innermost one.
+_ACTIVE_CACHES = []
+
+
+class ModelUnderstandingCache:
+    """Memoizes the transformed features and predictions of fitted pipelines, so that model understanding functions called on the same pipeline and data compute them only once.
+
+    Reports usually call several model understanding functions, such as ``calculate_permutation_importance``, ``partial_dependence``
+    and ``explain_predictions``, on the same pipeline and holdout data, and each of them transforms the data or makes predictions.
+    While the cache is active, in a with statement, these functions get them from the cache instead. Entries are keyed by the
+    pipeline and a hash of the data, so different data is never given cached results. Entries for a pipeline are dropped when it
+    is refit or garbage collected; other changes to a pipeline, such as setting its components' attributes by hand, are not
+    detected, so call ``invalidate`` after making them.
+
+    Example:
+        >>> import pandas as pd
+        >>> from evalml.model_understanding import ModelUnderstandingCache, calculate_permutation_importance, explain_predictions
+        >>> from evalml.pipelines import BinaryClassificationPipeline
+        >>> X = pd.DataFrame({"a": [1, 2, 3, 4, 5, 6, 7, 8], "b": [0.5, 0.1, 0.9, 0.3, 0.6, 0.2, 0.8, 0.4]})
+        >>> y = pd.Series([0, 0, 0, 0, 1, 1, 1, 1])
+        >>> pipeline = BinaryClassificationPipeline(["Imputer", "Random Forest Classifier"]).fit(X, y)
+        >>> with ModelUnderstandingCache() as cache:
+        ...     importance = calculate_permutation_importance(pipeline, X, y, "log loss binary")
+        ...     report = explain_predictions(pipeline, X, y, indices_to_explain=[0])
+        >>> assert cache.misses == 1 and cache.hits == 1
+
+    Attributes:
+        hits (int): Number of times a result was found in the cache.
+        misses (int): Number of times a result was computed and added to the cache.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        """Make this the cache model understanding functions use until the with statement ends."""
+        _ACTIVE_CACHES.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop model understanding functions from using this cache."""
+        _ACTIVE_CACHES.remove(self)
+
+    def __len__(self):
+        """Number of results in the cache."""
+        return sum(len(results) for _, results in self._entries.values())
+
+    def invalidate(self, pipeline=None):
+        """Drops cached results.
+
+        Args:
+            pipeline (PipelineBase): Pipeline whose results to drop. Defaults to None, which drops the results of all pipelines.
+        """
+        if pipeline is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(id(pipeline), None)
+
+    def transform_all_but_final(self, pipeline, X, y=None, X_train=None, y_train=None):
+        """Transforms the data by applying all pre-processing components of the pipeline, or gets the result from the cache.
+
+        Args:
+            pipeline (PipelineBase): Fitted pipeline.
+            X (pd.DataFrame): Input data to the pipeline to transform.
+            y (pd.Series): Targets corresponding to the pipeline targets. Defaults to None.
+            X_train (pd.DataFrame): Training data. Only used for time series. Defaults to None.
+            y_train (pd.Series): Training labels. Only used for time series. Defaults to None.
+
+        Returns:
+            pd.DataFrame: New transformed features.
+        """
+        return self._get(
+            pipeline,
+            "transform_all_but_final",
+            X,
+            y=y,
+            X_train=X_train,
+            y_train=y_train,
+        )
+
+    def predict(self, pipeline, X, X_train=None, y_train=None):
+        """Makes predictions with the pipeline, or gets them from the cache.
+
+        Args:
+            pipeline (PipelineBase): Fitted pipeline.
+            X (pd.DataFrame): Data of shape [n_samples, n_features].
+            X_train (pd.DataFrame): Training data. Only used for time series. Defaults to None.
+            y_train (pd.Series): Training labels. Only used for time series. Defaults to None.
+
+        Returns:
+            pd.Series: Predicted values.
+        """
+        return self._get(pipeline, "predict", X, X_train=X_train, y_train=y_train)
+
+    def predict_proba(self, pipeline, X, X_train=None, y_train=None):
+        """Makes probability estimates with a classification pipeline, or gets them from the cache.
+
+        Args:
+            pipeline (PipelineBase): Fitted classification pipeline.
+            X (pd.DataFrame): Data of shape [n_samples, n_features].
+            X_train (pd.DataFrame): Training data. Only used for time series. Defaults to None.
+            y_train (pd.Series): Training labels. Only used for time series. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Probability estimates.
+        """
+        return self._get(
+            pipeline,
+            "predict_proba",
+            X,
+            X_train=X_train,
+            y_train=y_train,
+        )
+
+    def predict_in_sample(self, pipeline, X, y, X_train, y_train):
+        """Makes predictions with a time series pipeline on data whose targets are known, or gets them from the cache.
+
+        Args:
+            pipeline (TimeSeriesPipelineBase): Fitted time series pipeline.
+            X (pd.DataFrame): Future data of shape [n_samples, n_features].
+            y (pd.Series): Future target of shape [n_samples].
+            X_train (pd.DataFrame): Data the pipeline was trained on of shape [n_samples_train, n_features].
+            y_train (pd.Series): Target the pipeline was trained on of shape [n_samples_train].
+
+        Returns:
+            pd.Series: Predicted values.
+        """
+        return self._get(pipeline, "predict_in_sample", X, y, X_train, y_train)
+
+    def predict_proba_in_sample(self, pipeline, X, y, X_train, y_train):
+        """Makes probability estimates with a time series classification pipeline on data whose targets are known, or gets them from the cache.
+
+        Args:
+            pipeline (TimeSeriesClassificationPipeline): Fitted time series classification pipeline.
+            X (pd.DataFrame): Future data of shape [n_samples, n_features].
+            y (pd.Series): Future target of shape [n_samples].
+            X_train (pd.DataFrame): Data the pipeline was trained on of shape [n_samples_train, n_features].
+            y_train (pd.Series): Target the pipeline was trained on of shape [n_samples_train].
+
+        Returns:
+            pd.DataFrame: Probability estimates.
+        """
+        return self._get(pipeline, "predict_proba_in_sample", X, y, X_train, y_train)
+
+    def _get(self, pipeline, method, *args, **kwargs):
+        """Calls the pipeline's method, or gets its result from the cache. Results are copied, so callers can modify them."""
+        # Pipelines infer the types of their inputs, so infer them first to key the data by the types the pipeline uses
+        args = [_infer_feature_types(value) for value in args]
+        kwargs = {name: _infer_feature_types(value) for name, value in kwargs.items()}
+        data = [*args, *kwargs.values()]
+        fingerprints = tuple(_data_fingerprint(value, index=True) for value in data)
+        if any(
+            fingerprint is None and value is not None
+            for fingerprint, value in zip(fingerprints, data)
+        ):
+            return getattr(pipeline, method)(*args, **kwargs)
+        results = _get_fit_cache(self._entries, pipeline)
+        key = (method, getattr(pipeline, "threshold", None), fingerprints)
+        if key in results:
+            self.hits += 1
+        else:
+            self.misses += 1
+            results[key] = getattr(pipeline, method)(*args, **kwargs)
+        return _copy(results[key])
+
+
+def _cached_call(pipeline, method, *args, **kwargs):
+    """Calls one of the pipeline's methods, getting the result from the active model understanding cache if there is one.
+
+    Args:
+        pipeline (PipelineBase): Fitted pipeline.
+        method (str): Name of a method of ModelUnderstandingCache, which is also the name of the pipeline's method.
+        args: Positional arguments of the method.
+        kwargs: Keyword arguments of the method.
+
+    Returns:
+        The method's result.
+    """
+    if not _ACTIVE_CACHES:
+        return getattr(pipeline, method)(*args, **kwargs)
+    return getattr(_ACTIVE_CACHES[-1], method)(pipeline, *args, **kwargs)
+
+
+def _get_fit_cache(store, pipeline):
+    """Gets the dictionary of values cached in store for the pipeline's current fit.
+
+    The dictionary is replaced by an empty one when the pipeline is refit, and removed from store when the pipeline is garbage collected.
+
+    Args:
+        store (dict): Cached values of each pipeline, keyed by the pipeline's id.
+        pipeline (PipelineBase): Fitted pipeline.
+
+    Returns:
+        dict: Values cached for the pipeline's current fit.
+    """
+    key = id(pipeline)
+    fit_token = getattr(pipeline, "_fit_token", None)
+    cached = store.get(key)
+    if cached is None:
+        weakref.finalize(pipeline, store.pop, key, None)
+    if cached is None or cached[0] is not fit_token:
+        cached = (fit_token, {})
+        store[key] = cached
+    return cached[1]
+
+
+def _infer_feature_types(data):
+    """Infers the types of data which is not None."""
+    return None if data is None else infer_feature_types(data)
+
+
+def _copy(value):
+    """Copies a dataframe or series, keeping its woodwork schema."""
+    if isinstance(value, (pd.DataFrame, pd.Series)) and value.ww.schema is not None:
+        return value.ww.copy()
+    return value.copy()
+
+
+def _data_fingerprint(data, index=False):
+    """Hash of the values, column names and types of a dataframe, series or array, used to tell whether results computed on it can be reused.
+
+    Args:
+        data (pd.DataFrame, pd.Series, np.ndarray): Data to fingerprint.
+        index (bool): Whether the index of dataframes and series is part of the fingerprint. Defaults to False.
+
+    Returns:
+        tuple: The shape, column names, types and a hash of the values of the data, or None if data is None or cannot be hashed.
+    """
+    if data is None:
+        return None
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        if isinstance(data, pd.DataFrame):
+            columns = tuple(data.columns)
+            dtypes = tuple(str(dtype) for dtype in data.dtypes)
+        else:
+            columns = data.name
+            dtypes = str(data.dtype)
+        logical_types = None
+        if data.ww.schema is not None:
+            logical_types = (
+                tuple(str(ltype) for ltype in data.ww.logical_types.values())
+                if isinstance(data, pd.DataFrame)
+                else str(data.ww.logical_type)
+            )
+        try:
+            values = pd.util.hash_pandas_object(data, index=index).values
+        except TypeError:
+            return None
+        return (
+            data.shape,
+            columns,
+            dtypes,
+            logical_types,
+            hashlib.sha256(values.tobytes()).hexdigest(),
+        )
+    values = np.ascontiguousarray(data)
+    if values.dtype == object:
+        return None
+    return (
+        values.shape,
+        None,
+        str(values.dtype),
+        None,
+        hashlib.sha256(values.tobytes()).hexdigest(),
+    )
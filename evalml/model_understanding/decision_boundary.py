@@ -4,11 +4,13 @@ import json
 import numpy as np
 import pandas as pd
 
+from evalml.model_understanding.cache import _cached_call
 from evalml.pipelines import BinaryClassificationPipeline
-from evalml.utils import infer_feature_types
+from evalml.utils import _divide, infer_feature_types
 
 
 # these are helper functions to help us calculate the objective values
+# each accepts a single confusion matrix, or a stacked array of confusion matrices with one column per threshold
 def _accuracy(val_list):
     """Helper function to help us find the accuracy.
 
@@ -32,10 +34,7 @@ def _balanced_accuracy(val_list):
         float: Balanced Accuracy.
     """
     sens = _recall(val_list)
-    if val_list[1] == 0:
-        spec = 0
-    else:
-        spec = val_list[1] / (val_list[1] + val_list[2])
+    spec = _divide(val_list[1], val_list[1] + val_list[2])
     return (sens + spec) / 2
 
 
@@ -48,9 +47,7 @@ def _precision(val_list):
     Returns:
         float: Precision.
     """
-    if val_list[0] == 0:
-        return 0
-    return val_list[0] / (val_list[0] + val_list[2])
+    return _divide(val_list[0], val_list[0] + val_list[2])
 
 
 def _recall(val_list):
@@ -62,9 +59,7 @@ def _recall(val_list):
     Returns:
         float: Recall.
     """
-    if val_list[0] == 0:
-        return 0
-    return val_list[0] / (val_list[0] + val_list[3])
+    return _divide(val_list[0], val_list[0] + val_list[3])
 
 
 def _f1(val_list):
@@ -78,13 +73,11 @@ def _f1(val_list):
     """
     prec = _precision(val_list)
     rec = _recall(val_list)
-    if prec * rec == 0:
-        return 0
-    return 2 * (prec * rec) / (prec + rec)
+    return _divide(2 * (prec * rec), prec + rec)
 
 
 def _find_confusion_matrix_objective_threshold(pos_skew, neg_skew, ranges):
-    """Iterates through the arrays and determines the ideal objective thresholds and confusion matrix values for each threshold value.
+    """Determines the confusion matrix values for each threshold value and the ideal objective thresholds, from cumulative sums of the bin counts.
 
     Args:
         pos_skew (list): The number of rows per bin value for the actual postive values.
@@ -95,9 +88,12 @@ def _find_confusion_matrix_objective_threshold(pos_skew, neg_skew, ranges):
         tuple: The first element is a list of confusion matrix values at each threshold bin, and the second element
             is a dictionary with the ideal objective thresholds and associated objective scores.
     """
-    thresh_conf_matrix_list = []
-    num_fn, num_tn = 0, 0
-    total_pos, total_neg = sum(pos_skew), sum(neg_skew)
+    num_fn = np.cumsum(pos_skew)
+    num_tn = np.cumsum(neg_skew)
+    num_tp = num_fn[-1] - num_fn
+    num_fp = num_tn[-1] - num_tn
+    # one column of [tp, tn, fp, fn] per threshold
+    conf_matrices = np.stack([num_tp, num_tn, num_fp, num_fn])
     objective_dict = {
         "accuracy": [{"objective score": 0, "threshold value": 0}, _accuracy],
         "balanced_accuracy": [
@@ -107,29 +103,15 @@ def _find_confusion_matrix_objective_threshold(pos_skew, neg_skew, ranges):
         "precision": [{"objective score": 0, "threshold value": 0}, _precision],
         "f1": [{"objective score": 0, "threshold value": 0}, _f1],
     }
-    for i, thresh_val in enumerate(ranges[1:]):
-        num_fn += pos_skew[i]
-        num_tn += neg_skew[i]
-        num_tp = total_pos - num_fn
-        num_fp = total_neg - num_tn
-        # this is also the confusion matrix
-        val_list = [num_tp, num_tn, num_fp, num_fn]
-        thresh_conf_matrix_list.append(val_list)
-
-        # let's iterate through the list to find the vals
-        for k, v in objective_dict.items():
-            obj_val = v[1](val_list)
-            if obj_val > v[0]["objective score"]:
-                v[0]["objective score"] = obj_val
-                v[0]["threshold value"] = thresh_val
-
-        if num_fn == total_pos and num_tn == total_pos and i < len(ranges) - 1:
-            # finished iterating through, there are no other changes
-            v_extension = [val_list for _ in range(i + 1, len(ranges) - 1)]
-            thresh_conf_matrix_list.extend(v_extension)
-            break
-
-    return (thresh_conf_matrix_list, objective_dict)
+    for v in objective_dict.values():
+        obj_vals = v[1](conf_matrices)
+        # the first threshold with the best score, if it beats a score of 0
+        best = int(np.argmax(obj_vals))
+        if obj_vals[best] > v[0]["objective score"]:
+            v[0]["objective score"] = float(obj_vals[best])
+            v[0]["threshold value"] = ranges[best + 1]
+
+    return (conf_matrices.T.tolist(), objective_dict)
 
 
 def _find_data_between_ranges(data, ranges, top_k):
@@ -143,13 +125,20 @@ def _find_data_between_ranges(data, ranges, top_k):
     Returns:
         list(list): Each list corresponds to the row indices that fall in the range provided.
     """
+    n_bins = len(ranges) - 1
+    # bin i holds the values in [ranges[i], ranges[i + 1])
+    bin_of_row = np.searchsorted(np.asarray(ranges), data.to_numpy(), side="right") - 1
+    in_bins = (bin_of_row >= 0) & (bin_of_row < n_bins)
+    rows = np.flatnonzero(in_bins)
+    rows = rows[np.argsort(bin_of_row[rows], kind="stable")]
+    bin_ends = np.searchsorted(bin_of_row[rows], np.arange(n_bins + 1), side="left")
+    index = data.index
     results = []
-    for i in range(1, len(ranges)):
-        mask = data[(data >= ranges[i - 1]) & (data < ranges[i])]
+    for i in range(n_bins):
+        bin_rows = rows[bin_ends[i] : bin_ends[i + 1]]
         if top_k != -1:
-            results.append(mask.index.tolist()[: min(len(mask), top_k)])
-        else:
-            results.append(mask.index.tolist())
+            bin_rows = bin_rows[:top_k]
+        results.append(index[bin_rows].tolist())
     return results
 
 
@@ -188,7 +177,7 @@ def find_confusion_matrix_per_thresholds(
     X = infer_feature_types(X)
     y = infer_feature_types(y)
     pipeline_thresh = 0.5 if pipeline.threshold is None else pipeline.threshold
-    proba = pipeline.predict_proba(X)
+    proba = _cached_call(pipeline, "predict_proba", X)
     pos_preds = proba.iloc[:, -1]
     pos_preds.index = y.index.tolist()
     neg_class, pos_class = 0, 1
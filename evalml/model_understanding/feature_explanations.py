@@ -15,6 +15,7 @@ def readable_explanation(
     max_features=5,
     min_importance_threshold=0.05,
     objective="auto",
+    adaptive=False,
 ):
     """Outputs a human-readable explanation of trained pipeline behavior.
 
@@ -26,6 +27,8 @@ def readable_explanation(
         max_features (int): The maximum number of influential features to include in an explanation. This does not affect the number of detrimental features reported. Defaults to 5.
         min_importance_threshold (float): The minimum percent of total importance a single feature can have to be considered important. Defaults to 0.05.
         objective (str, ObjectiveBase): If importance_method is permutation, the objective to compute importance with. Ignored otherwise, defaults to "auto".
+        adaptive (bool): If importance_method is permutation, whether to compute importance in adaptive mode, which only permutes each
+            feature as many times as needed to estimate its importance. Ignored otherwise. Defaults to False.
 
     Raises:
         ValueError: if any arguments passed in are invalid or the pipeline is not fitted.
@@ -56,7 +59,13 @@ def readable_explanation(
 
         X = infer_feature_types(X)
         y = infer_feature_types(y)
-        imp_df = calculate_permutation_importance(pipeline, X, y, objective)
+        imp_df = calculate_permutation_importance(
+            pipeline,
+            X,
+            y,
+            objective,
+            adaptive=adaptive,
+        )
     elif importance_method == "feature":
         objective = None
         imp_df = pipeline.feature_importance
@@ -182,6 +182,53 @@ def graph_confusion_matrix(
     return fig
 
 
+def confusion_counts_per_threshold(y_true, y_pred_proba, thresholds):
+    """Computes the confusion matrix counts of binary predictions at many decision thresholds at once.
+
+    A row is predicted to be positive when its predicted probability is greater than the threshold, as binary classification
+    pipelines and objectives do. The probabilities are sorted once and the counts at every threshold are read off cumulative
+    sums, so this takes O((n_samples + n_thresholds) log n_samples) time instead of scoring each threshold separately.
+
+    Args:
+        y_true (pd.Series or np.ndarray): True binary labels, where 1 or True is the positive class.
+        y_pred_proba (pd.Series or np.ndarray): Predicted probabilities of the positive class.
+        thresholds (list or np.ndarray): Decision thresholds to compute the counts at.
+
+    Returns:
+        dict: Dictionary with the `true_positives`, `false_positives`, `true_negatives` and `false_negatives` at each threshold,
+            each a np.ndarray of the same length as thresholds.
+
+    Example:
+        >>> counts = confusion_counts_per_threshold([0, 0, 1, 1], [0.1, 0.6, 0.4, 0.9], [0.0, 0.5, 1.0])
+        >>> counts["true_positives"]
+        array([2, 1, 0])
+        >>> counts["false_positives"]
+        array([2, 1, 0])
+    """
+    y_true = np.asarray(y_true) == 1
+    y_pred_proba = np.asarray(y_pred_proba, dtype=float)
+    # Missing probabilities are never greater than a threshold, so they are always predicted negative
+    y_pred_proba = np.where(np.isnan(y_pred_proba), -np.inf, y_pred_proba)
+    order = np.argsort(y_pred_proba, kind="stable")
+    sorted_proba = y_pred_proba[order]
+    # Number of positives among the k rows with the highest predicted probabilities, for k from 0 to n_samples
+    positives_in_top = np.concatenate([[0], np.cumsum(y_true[order][::-1])])
+    n_predicted_positive = len(sorted_proba) - np.searchsorted(
+        sorted_proba,
+        np.asarray(thresholds, dtype=float),
+        side="right",
+    )
+    true_positives = positives_in_top[n_predicted_positive]
+    false_positives = n_predicted_positive - true_positives
+    n_positive = positives_in_top[-1]
+    return {
+        "true_positives": true_positives,
+        "false_positives": false_positives,
+        "true_negatives": len(y_true) - n_positive - false_positives,
+        "false_negatives": n_positive - true_positives,
+    }
+
+
 def precision_recall_curve(y_true, y_pred_proba, pos_label_idx=-1):
     """Given labels and binary classifier predicted probabilities, compute and return the data representing a precision-recall curve.
 
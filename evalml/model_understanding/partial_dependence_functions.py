@@ -34,6 +34,9 @@ def partial_dependence(
     percentiles=(0.05, 0.95),
     grid_resolution=100,
     kind="average",
+    ice_sample_size=None,
+    random_seed=0,
+    method="brute",
 ):
     """Calculates one or two-way partial dependence.
 
@@ -57,6 +60,16 @@ def partial_dependence(
         kind ({'average', 'individual', 'both'}): The type of predictions to return. 'individual' will return the predictions for
             all of the points in the grid for each sample in X. 'average' will return the predictions for all of the points in
             the grid but averaged over all of the samples in X.
+        ice_sample_size (int): Number of randomly sampled rows of X to return individual predictions for when kind is 'individual'
+            or 'both'. With kind='individual', predictions are only made for the sampled rows. Averaged predictions are always over
+            all of the samples in X. Defaults to None, which returns individual predictions for every row.
+        random_seed (int): Seed for sampling the rows individual predictions are returned for. Defaults to 0.
+        method ({'brute', 'recursion'}): How to compute the partial dependence. 'brute' predicts on every row of X for each
+            point in the grid. 'recursion' sends each point in the grid down the trees of the estimator once, without predicting
+            on X, and is much faster. It averages over the data the estimator was fit on rather than X, so its results can differ
+            from 'brute'. It is used when kind is 'average', the estimator is a decision tree, random forest or extra trees model
+            and the features are passed to the estimator unchanged, such as numeric features with no scaling. Otherwise a
+            PartialDependenceMethodWarning is raised stating why, and 'brute' is used. Defaults to 'brute'.
 
     Returns:
         pd.DataFrame, list(pd.DataFrame), or tuple(pd.DataFrame, list(pd.DataFrame)):
@@ -81,6 +94,8 @@ def partial_dependence(
             the partial dependence contour. The values of the data frame contain the partial dependence data for each
             feature value pair.
 
+            Each DataFrame records the method used to compute it, 'brute' or 'recursion', in ``attrs["method"]``.
+
     Raises:
         ValueError: Error during call to scikit-learn's partial dependence method.
         Exception: All other errors during calculation.
@@ -202,6 +217,9 @@ def partial_dependence(
                 grid_resolution=grid_resolution,
                 kind=kind,
                 custom_range=custom_range,
+                ice_sample_size=ice_sample_size,
+                random_seed=random_seed,
+                method=method,
             )
         except ValueError as e:
             if "percentiles are too close to each other" in str(e):
@@ -249,7 +267,7 @@ def partial_dependence(
                     ind_data.append(pd.DataFrame(label).T)
 
                 ind_data = pd.concat(ind_data)
-                ind_data.columns = [f"Sample {i}" for i in range(len(ind_preds[0]))]
+                ind_data.columns = [f"Sample {i}" for i in preds["samples"]]
 
                 if classes is not None:
                     ind_data["class_label"] = np.repeat(classes, len(values[0]))
@@ -275,6 +293,14 @@ def partial_dependence(
                 for sample in ind_data:
                     sample["class_label"] = np.repeat(classes, len(values[0]))
 
+        results = []
+        if kind in ["average", "both"]:
+            results.append(avg_data)
+        if kind in ["individual", "both"]:
+            results.extend(ind_data if isinstance(ind_data, list) else [ind_data])
+        for data in results:
+            data.attrs["method"] = preds["method"]
+
         if kind == "both":
             return (avg_data, ind_data)
         elif kind == "individual":
@@ -298,6 +324,9 @@ def graph_partial_dependence(
     class_label=None,
     grid_resolution=100,
     kind="average",
+    ice_sample_size=None,
+    random_seed=0,
+    method="brute",
 ):
     """Create an one-way or two-way partial dependence plot.
 
@@ -322,6 +351,10 @@ def graph_partial_dependence(
         kind ({'average', 'individual', 'both'}): Type of partial dependence to plot. 'average' creates a regular partial dependence
              (PD) graph, 'individual' creates an individual conditional expectation (ICE) plot, and 'both' creates a
              single-figure PD and ICE plot. ICE plots can only be shown for one-way partial dependence plots.
+        ice_sample_size (int): Number of randomly sampled rows of X to plot individual conditional expectation curves for.
+            Defaults to None, which plots a curve for every row.
+        random_seed (int): Seed for sampling the rows to plot individual conditional expectation curves for. Defaults to 0.
+        method ({'brute', 'recursion'}): How to compute the partial dependence. See `partial_dependence`. Defaults to 'brute'.
 
     Returns:
         plotly.graph_objects.Figure: figure object containing the partial dependence data for plotting
@@ -370,6 +403,9 @@ def graph_partial_dependence(
         features=features,
         grid_resolution=grid_resolution,
         kind=kind,
+        ice_sample_size=ice_sample_size,
+        random_seed=random_seed,
+        method=method,
     )
 
     ice_data = None
@@ -1,13 +1,22 @@
 """Permutation importance methods."""
 import numpy as np
 import pandas as pd
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy import stats
 
+from evalml.model_understanding.cache import _cached_call
 from evalml.objectives.utils import get_objective
-from evalml.problem_types import is_classification
+from evalml.problem_types import is_classification, is_time_series
 from evalml.problem_types.utils import is_regression
 from evalml.utils import import_or_raise, infer_feature_types, jupyter_check
 
+# Most feature values stacked into one estimator call when scoring permutations
+_PERMUTATION_BATCH_SIZE = 10_000_000
+# Repeats run for every feature in each round of adaptive permutation importance
+_ADAPTIVE_MIN_REPEATS = 3
+# Default tolerance of adaptive permutation importance, as a fraction of the magnitude of the baseline score
+_ADAPTIVE_RELATIVE_TOLERANCE = 0.01
+
 
 def calculate_permutation_importance(
     pipeline,
@@ -17,21 +26,40 @@ def calculate_permutation_importance(
     n_repeats=5,
     n_jobs=None,
     random_seed=0,
+    adaptive=False,
+    confidence_level=0.95,
+    tolerance=None,
+    screening_sample_size=5000,
 ):
     """Calculates permutation importance for features.
 
+    In adaptive mode, each feature is permuted until the confidence interval of its importance is narrower than tolerance on either
+    side or no longer contains zero, and at most n_repeats times. Features are first screened on a sample of screening_sample_size rows:
+    features whose confidence interval on the sample lies within tolerance of zero are not permuted on the full data and get the
+    importance computed on the sample. Features are permuted the same way as when adaptive is False, so a feature permuted
+    n_repeats times on the full data gets the same importance either way.
+
     Args:
         pipeline (PipelineBase or subclass): Fitted pipeline.
         X (pd.DataFrame): The input data used to score and compute permutation importance.
         y (pd.Series): The target data.
         objective (str, ObjectiveBase): Objective to score on.
-        n_repeats (int): Number of times to permute a feature. Defaults to 5.
+        n_repeats (int): Number of times to permute a feature. When adaptive is True, the most times to permute a feature. Defaults to 5.
         n_jobs (int or None): Non-negative integer describing level of parallelism used for pipelines.
             None and 1 are equivalent. If set to -1, all CPUs are used. For n_jobs below -1, (n_cpus + 1 + n_jobs) are used. Defaults to None.
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        adaptive (bool): Whether to only permute each feature as many times as needed to estimate its importance. Defaults to False.
+        confidence_level (float): Confidence level of the confidence intervals of adaptive mode. Defaults to 0.95.
+        tolerance (float): Importance below which features are considered negligible in adaptive mode, and the half-width of
+            confidence interval at which a feature stops being permuted. Defaults to None, which uses 1% of the magnitude of the
+            pipeline's score on X.
+        screening_sample_size (int): Number of rows to screen features on in adaptive mode. Features are not screened if X does not have
+            more rows than this, or if the pipeline is a time series pipeline. Defaults to 5000.
 
     Returns:
-        pd.DataFrame: Mean feature importance scores over a number of shuffles.
+        pd.DataFrame: Mean feature importance scores over a number of shuffles. When adaptive is True, also has the columns
+            "lower_bound" and "upper_bound", the bounds of the confidence interval of each importance, and "n_repeats", the number of
+            times each feature was permuted.
 
     Raises:
         ValueError: If objective cannot be used with the given pipeline.
@@ -45,8 +73,32 @@ def calculate_permutation_importance(
             f"Given objective '{objective.name}' cannot be used with '{pipeline.name}'",
         )
 
+    if adaptive:
+        perm_importance = _adaptive_permutation_importance(
+            pipeline,
+            X,
+            y,
+            objective,
+            n_repeats=n_repeats,
+            n_jobs=n_jobs,
+            random_seed=random_seed,
+            confidence_level=confidence_level,
+            tolerance=tolerance,
+            screening_sample_size=screening_sample_size,
+        )
+        return perm_importance.sort_values(
+            "importance",
+            ascending=False,
+            kind="stable",
+        ).reset_index(drop=True)
+
     if pipeline._supports_fast_permutation_importance:
-        precomputed_features = pipeline.transform_all_but_final(X, y)
+        precomputed_features = _cached_call(
+            pipeline,
+            "transform_all_but_final",
+            X,
+            y=y,
+        )
         perm_importance = _fast_permutation_importance(
             pipeline,
             X,
@@ -75,7 +127,14 @@ def calculate_permutation_importance(
     return pd.DataFrame(mean_perm_importance, columns=["feature", "importance"])
 
 
-def graph_permutation_importance(pipeline, X, y, objective, importance_threshold=0):
+def graph_permutation_importance(
+    pipeline,
+    X,
+    y,
+    objective,
+    importance_threshold=0,
+    adaptive=False,
+):
     """Generate a bar graph of the pipeline's permutation importance.
 
     Args:
@@ -84,6 +143,8 @@ def graph_permutation_importance(pipeline, X, y, objective, importance_threshold
         y (pd.Series): The target data.
         objective (str, ObjectiveBase): Objective to score on.
         importance_threshold (float, optional): If provided, graph features with a permutation importance whose absolute value is larger than importance_threshold. Defaults to 0.
+        adaptive (bool): Whether to calculate permutation importance in adaptive mode, which only permutes each feature as many times as
+            needed to estimate its importance. See calculate_permutation_importance. Defaults to False.
 
     Returns:
         plotly.Figure, a bar graph showing features and their respective permutation importance.
@@ -98,7 +159,13 @@ def graph_permutation_importance(pipeline, X, y, objective, importance_threshold
     if jupyter_check():
         import_or_raise("ipywidgets", warning=True)
 
-    perm_importance = calculate_permutation_importance(pipeline, X, y, objective)
+    perm_importance = calculate_permutation_importance(
+        pipeline,
+        X,
+        y,
+        objective,
+        adaptive=adaptive,
+    )
     perm_importance["importance"] = perm_importance["importance"]
 
     if importance_threshold < 0:
@@ -220,86 +287,354 @@ def _fast_permutation_importance(
 
     Only used for pipelines that support this optimization.
     """
+    col_names = list(X.columns) if col_name is None else [col_name]
+    baseline_score, scores = _fast_permutation_scores(
+        pipeline,
+        X,
+        y,
+        objective,
+        precomputed_features,
+        col_names,
+        n_repeats=n_repeats,
+        n_jobs=n_jobs,
+        random_seed=random_seed,
+    )
+    importances = baseline_score - scores
+    importances_mean = np.mean(importances, axis=1)
+    if col_name is not None:
+        importances_mean = importances_mean[0]
+    return {"importances_mean": importances_mean}
+
+
+def _fast_permutation_scores(
+    pipeline,
+    X,
+    y,
+    objective,
+    precomputed_features,
+    col_names,
+    first_repeat=0,
+    n_repeats=5,
+    n_jobs=None,
+    random_seed=None,
+):
+    """Score the pipeline's estimator on the precomputed features with each column in `col_names` permuted, for repeats `first_repeat` to `n_repeats` - 1.
+
+    Columns are split into one chunk per job. Each job makes one copy of the features, stacked once for each permutation it scores in a
+    single estimator call, and swaps each permuted column in and back out again. Features are passed to jobs as NumPy arrays, which
+    joblib memory-maps rather than copying to every worker.
+
+    Returns the baseline score and an array of scores with one row per column.
+    """
     if is_classification(pipeline.problem_type):
         y = pipeline._encode_targets(y)
     baseline_score = _fast_scorer(pipeline, precomputed_features, X, y, objective)
-    if col_name is None:
-        scores = Parallel(n_jobs=n_jobs)(
-            delayed(_calculate_permutation_scores_fast)(
-                pipeline,
-                precomputed_features,
-                y,
-                objective,
-                col_name,
-                random_seed,
-                n_repeats,
-                _fast_scorer,
-                baseline_score,
+    feature_provenance = pipeline._get_feature_provenance()
+    col_idxs = []
+    for name in col_names:
+        if name in precomputed_features.columns:
+            col_idxs.append([precomputed_features.columns.get_loc(name)])
+        elif name in feature_provenance:
+            col_idxs.append(
+                [
+                    precomputed_features.columns.get_loc(col)
+                    for col in feature_provenance[name]
+                ],
             )
-            for col_name in X.columns
+        else:
+            # If column is not in the features or provenance, assume the column was dropped
+            col_idxs.append(None)
+
+    shared_features = _to_shared_columns(precomputed_features)
+    chunks = [
+        chunk.tolist()
+        for chunk in np.array_split(
+            np.arange(len(col_idxs)),
+            min(effective_n_jobs(n_jobs), len(col_idxs)),
         )
-        importances = baseline_score - np.array(scores)
-        return {"importances_mean": np.mean(importances, axis=1)}
-    else:
-        scores = _calculate_permutation_scores_fast(
+    ]
+    chunk_scores = Parallel(n_jobs=n_jobs)(
+        delayed(_calculate_permutation_scores_batched)(
             pipeline,
-            precomputed_features,
+            shared_features,
+            X,
             y,
             objective,
-            col_name,
+            [col_idxs[i] for i in chunk],
             random_seed,
             n_repeats,
-            _fast_scorer,
             baseline_score,
+            first_repeat,
         )
-    importances = baseline_score - np.array(scores)
-    importances_mean = (
-        np.mean(importances, axis=1) if col_name is None else np.mean(importances)
+        for chunk in chunks
     )
-    return {"importances_mean": importances_mean}
+    return baseline_score, np.concatenate(chunk_scores)
 
 
-def _calculate_permutation_scores_fast(
+def _adaptive_permutation_importance(
     pipeline,
-    precomputed_features,
+    X,
     y,
     objective,
-    col_name,
-    random_seed,
     n_repeats,
-    scorer,
-    baseline_score,
+    n_jobs,
+    random_seed,
+    confidence_level,
+    tolerance,
+    screening_sample_size,
 ):
-    """Calculate the permutation score when `col_name` is permuted."""
-    random_state = np.random.RandomState(random_seed)
-    scores = np.zeros(n_repeats)
+    """Calculate permutation importance, permuting each column only until its importance is known well enough.
+
+    Columns are first screened on a sample of the rows, then permuted on all rows in rounds of _ADAPTIVE_MIN_REPEATS repeats. Repeats
+    carry on from the previous round's, so the permutations are the same as when every column is permuted n_repeats times.
+    """
+    precomputed_features = None
+    if pipeline._supports_fast_permutation_importance:
+        precomputed_features = _cached_call(
+            pipeline,
+            "transform_all_but_final",
+            X,
+            y=y,
+        )
+
+    def permutation_scores(
+        X, y, precomputed_features, col_names, first_repeat, n_repeats
+    ):
+        if precomputed_features is not None:
+            return _fast_permutation_scores(
+                pipeline,
+                X,
+                y,
+                objective,
+                precomputed_features,
+                col_names,
+                first_repeat=first_repeat,
+                n_repeats=n_repeats,
+                n_jobs=n_jobs,
+                random_seed=random_seed,
+            )
+        return _slow_permutation_scores(
+            pipeline,
+            X,
+            y,
+            objective,
+            col_names,
+            first_repeat=first_repeat,
+            n_repeats=n_repeats,
+            n_jobs=n_jobs,
+            random_seed=random_seed,
+        )
 
-    # If column is not in the features or provenance, assume the column was dropped
-    if (
-        col_name not in precomputed_features.columns
-        and col_name not in pipeline._get_feature_provenance()
+    min_repeats = min(_ADAPTIVE_MIN_REPEATS, n_repeats)
+    results = {}
+    active_cols = list(X.columns)
+    if X.shape[0] > screening_sample_size and not is_time_series(
+        pipeline.problem_type,
     ):
-        return scores + baseline_score
+        rows = np.sort(
+            np.random.RandomState(random_seed).choice(
+                X.shape[0],
+                screening_sample_size,
+                replace=False,
+            ),
+        )
+        baseline_score, scores = permutation_scores(
+            X.ww.iloc[rows],
+            y.ww.iloc[rows],
+            None
+            if precomputed_features is None
+            else precomputed_features.ww.iloc[rows],
+            active_cols,
+            0,
+            min_repeats,
+        )
+        screening_tolerance = _adaptive_tolerance(tolerance, baseline_score)
+        importances = baseline_score - scores
+        lower_bounds, upper_bounds = _confidence_interval(
+            importances,
+            confidence_level,
+        )
+        negligible = (lower_bounds >= -screening_tolerance) & (
+            upper_bounds <= screening_tolerance
+        )
+        for i in np.flatnonzero(negligible):
+            results[active_cols[i]] = (
+                importances[i].mean(),
+                lower_bounds[i],
+                upper_bounds[i],
+                min_repeats,
+            )
+        active_cols = [col for col in active_cols if col not in results]
+
+    importances = {col: np.zeros(0) for col in active_cols}
+    n_repeats_done = 0
+    while active_cols and n_repeats_done < n_repeats:
+        last_repeat = min(n_repeats, n_repeats_done + min_repeats)
+        baseline_score, scores = permutation_scores(
+            X,
+            y,
+            precomputed_features,
+            active_cols,
+            n_repeats_done,
+            last_repeat,
+        )
+        n_repeats_done = last_repeat
+        full_data_tolerance = _adaptive_tolerance(tolerance, baseline_score)
+        for col, col_scores in zip(active_cols, scores):
+            importances[col] = np.concatenate(
+                [importances[col], baseline_score - col_scores],
+            )
+        lower_bounds, upper_bounds = _confidence_interval(
+            np.array([importances[col] for col in active_cols]),
+            confidence_level,
+        )
+        for col, lower_bound, upper_bound in zip(
+            active_cols,
+            lower_bounds,
+            upper_bounds,
+        ):
+            separated_from_zero = lower_bound > 0 or upper_bound < 0
+            narrow = (upper_bound - lower_bound) / 2 <= full_data_tolerance
+            if separated_from_zero or narrow or n_repeats_done == n_repeats:
+                results[col] = (
+                    importances[col].mean(),
+                    lower_bound,
+                    upper_bound,
+                    n_repeats_done,
+                )
+        active_cols = [col for col in active_cols if col not in results]
+
+    return pd.DataFrame(
+        [(col, *results[col]) for col in X.columns],
+        columns=["feature", "importance", "lower_bound", "upper_bound", "n_repeats"],
+    )
+
 
-    if col_name in precomputed_features.columns:
-        col_idx = precomputed_features.columns.get_loc(col_name)
+def _adaptive_tolerance(tolerance, baseline_score):
+    if tolerance is not None:
+        return tolerance
+    return _ADAPTIVE_RELATIVE_TOLERANCE * abs(baseline_score)
+
+
+def _confidence_interval(importances, confidence_level):
+    """Bounds of the t-distribution confidence interval of the mean of each row of importances."""
+    n_repeats = importances.shape[1]
+    means = importances.mean(axis=1)
+    if n_repeats < 2:
+        half_widths = np.full(len(means), np.inf)
     else:
-        col_idx = [
-            precomputed_features.columns.get_loc(col)
-            for col in pipeline._get_feature_provenance()[col_name]
-        ]
+        half_widths = (
+            stats.t.ppf((1 + confidence_level) / 2, n_repeats - 1)
+            * importances.std(axis=1, ddof=1)
+            / np.sqrt(n_repeats)
+        )
+    return means - half_widths, means + half_widths
 
-    return _shuffle_and_score_helper(
-        pipeline,
-        precomputed_features,
-        y,
-        objective,
-        col_idx,
-        n_repeats,
-        scorer,
-        random_state,
-        is_fast=True,
+
+def _to_shared_columns(features):
+    """Splits a DataFrame into NumPy arrays joblib can memory-map, with what is needed to put it back together."""
+    columns = []
+    for name in features.columns:
+        values = features[name]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            columns.append((name, values.cat.codes.to_numpy(), values.dtype))
+        else:
+            columns.append((name, values.to_numpy(), values.dtype))
+    return columns, features.index, features.ww.schema
+
+
+def _from_shared_columns(columns, index, schema):
+    data = {}
+    for name, values, dtype in columns:
+        if isinstance(dtype, pd.CategoricalDtype):
+            data[name] = pd.Categorical.from_codes(values, dtype=dtype)
+        else:
+            data[name] = pd.Series(values, index=index, dtype=dtype, copy=False)
+    features = pd.DataFrame(data, index=index)
+    features.ww.init(schema=schema)
+    return features
+
+
+def _calculate_permutation_scores_batched(
+    pipeline,
+    shared_features,
+    X,
+    y,
+    objective,
+    col_idxs,
+    random_seed,
+    n_repeats,
+    baseline_score,
+    first_repeat=0,
+):
+    """Calculate the permutation scores of each group of feature columns in `col_idxs`, using the same permutations as `_shuffle_and_score_helper`.
+
+    Only repeats from `first_repeat` on are scored. Groups which are None belong to input columns the pipeline dropped, and get the
+    baseline score.
+    """
+    features = _from_shared_columns(*shared_features)
+    n_rows = len(features)
+    n_stacked = 1
+    if not is_time_series(pipeline.problem_type):
+        # Time series estimators predict a horizon from the rows they are given, so rows cannot be stacked
+        n_stacked = max(
+            1,
+            min(
+                n_repeats - first_repeat,
+                _PERMUTATION_BATCH_SIZE // max(features.size, 1),
+            ),
+        )
+    working_features = (
+        pd.concat([features] * n_stacked, ignore_index=True)
+        if n_stacked > 1
+        else features.copy()
     )
+    working_features.ww.init(schema=features.ww.schema)
+
+    all_scores = np.zeros((len(col_idxs), n_repeats - first_repeat))
+    for i, col_idx in enumerate(col_idxs):
+        if col_idx is None:
+            all_scores[i] = baseline_score
+            continue
+        random_state = np.random.RandomState(random_seed)
+        shuffling_idx = np.arange(n_rows)
+        permutation = np.arange(n_rows)
+        permutations = []
+        for _ in range(n_repeats):
+            # Each round shuffles the column permuted in the previous round
+            random_state.shuffle(shuffling_idx)
+            permutation = permutation[shuffling_idx]
+            permutations.append(permutation)
+        permutations = permutations[first_repeat:]
+        col_names = [features.columns[idx] for idx in col_idx]
+        original_columns = {name: working_features[name] for name in col_names}
+        for start in range(0, len(permutations), n_stacked):
+            batch = permutations[start : start + n_stacked]
+            for name in col_names:
+                permuted = pd.concat(
+                    [features[name].iloc[permutation] for permutation in batch]
+                    + [features[name]] * (n_stacked - len(batch)),
+                    ignore_index=True,
+                )
+                permuted.index = working_features.index
+                working_features[name] = permuted
+            batch_features = working_features
+            if len(batch) < n_stacked:
+                batch_features = working_features.ww.iloc[: len(batch) * n_rows]
+            predictions = _fast_predict(pipeline, batch_features, objective)
+            for j in range(len(batch)):
+                batch_predictions = predictions.iloc[j * n_rows : (j + 1) * n_rows]
+                batch_predictions.index = features.index
+                all_scores[i, start + j] = _fast_score(
+                    pipeline,
+                    X,
+                    y,
+                    batch_predictions,
+                    objective,
+                )
+        for name, column in original_columns.items():
+            working_features[name] = column
+    return all_scores
 
 
 def _slow_permutation_importance(
@@ -350,6 +685,39 @@ def _slow_permutation_importance(
     return {"importances_mean": importances_mean}
 
 
+def _slow_permutation_scores(
+    pipeline,
+    X,
+    y,
+    objective,
+    col_names,
+    first_repeat=0,
+    n_repeats=5,
+    n_jobs=None,
+    random_seed=None,
+):
+    """Score the pipeline with each column in `col_names` permuted, for repeats `first_repeat` to `n_repeats` - 1.
+
+    Returns the baseline score and an array of scores with one row per column.
+    """
+    baseline_score = _slow_scorer(pipeline, X, y, objective)
+    scores = Parallel(n_jobs=n_jobs)(
+        delayed(_calculate_permutation_scores_slow)(
+            pipeline,
+            X,
+            y,
+            col_name,
+            objective,
+            _slow_scorer,
+            n_repeats,
+            random_seed,
+            first_repeat,
+        )
+        for col_name in col_names
+    )
+    return baseline_score, np.array(scores)
+
+
 def _calculate_permutation_scores_slow(
     estimator,
     X,
@@ -359,6 +727,7 @@ def _calculate_permutation_scores_slow(
     scorer,
     n_repeats,
     random_seed,
+    first_repeat=0,
 ):
     """Calculate score when `col_idx` is permuted."""
     random_state = np.random.RandomState(random_seed)
@@ -374,7 +743,7 @@ def _calculate_permutation_scores_slow(
         n_repeats,
         scorer,
         random_state,
-        is_fast=False,
+        first_repeat,
     )
 
 
@@ -387,9 +756,9 @@ def _shuffle_and_score_helper(
     n_repeats,
     scorer,
     random_state,
-    is_fast=True,
+    first_repeat=0,
 ):
-    scores = np.zeros(n_repeats)
+    scores = np.zeros(n_repeats - first_repeat)
 
     # This is what sk_permutation_importance does. Useful for thread safety
     X_permuted = X_features.copy()
@@ -399,12 +768,11 @@ def _shuffle_and_score_helper(
         col = X_permuted.iloc[shuffling_idx, col_idx]
         col.index = X_permuted.index
         X_permuted.iloc[:, col_idx] = col
+        if n_round < first_repeat:
+            # Earlier repeats were scored by a previous call, but still shuffle the column to get to the same permutation
+            continue
         X_permuted.ww.init(schema=X_features.ww.schema)
-        if is_fast:
-            feature_score = scorer(pipeline, X_permuted, X_features, y, objective)
-        else:
-            feature_score = scorer(pipeline, X_permuted, y, objective)
-        scores[n_round] = feature_score
+        scores[n_round - first_repeat] = scorer(pipeline, X_permuted, y, objective)
     return scores
 
 
@@ -418,11 +786,19 @@ def _slow_scorer(pipeline, X, y, objective):
 
 
 def _fast_scorer(pipeline, features, X, y, objective):
+    return _fast_score(
+        pipeline, X, y, _fast_predict(pipeline, features, objective), objective
+    )
+
+
+def _fast_predict(pipeline, features, objective):
     if objective.score_needs_proba:
-        preds = pipeline.estimator.predict_proba(features)
-    else:
-        preds = pipeline.estimator.predict(features)
-        if is_regression(pipeline.problem_type):
-            preds = pipeline.inverse_transform(preds)
+        return pipeline.estimator.predict_proba(features)
+    return pipeline.estimator.predict(features)
+
+
+def _fast_score(pipeline, X, y, preds, objective):
+    if not objective.score_needs_proba and is_regression(pipeline.problem_type):
+        preds = pipeline.inverse_transform(preds)
     score = pipeline._score(X, y, preds, objective)
     return score if objective.greater_is_better else -score
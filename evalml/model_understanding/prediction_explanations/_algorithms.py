@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import warnings
 from operator import add
@@ -5,14 +6,20 @@ from operator import add
 import numpy as np
 import pandas as pd
 import shap
+from joblib import Parallel, delayed, effective_n_jobs
 from sklearn.utils import check_array
 
 from evalml.model_family.model_family import ModelFamily
+from evalml.model_understanding.cache import _data_fingerprint, _get_fit_cache
+from evalml.pipelines.components.estimators import Estimator
 from evalml.problem_types import is_binary, is_multiclass, is_regression
 from evalml.utils import import_or_raise
 
 logger = logging.getLogger(__name__)
 
+# Explainers built for each fitted pipeline, keyed by the pipeline's id. Entries are dropped when the pipeline is garbage collected.
+_EXPLAINER_CACHE = {}
+
 
 def _create_dictionary(explainer_values, feature_names):
     """Creates a mapping from a feature name to a list of explainer values for all points that were queried.
@@ -36,17 +43,101 @@ def _create_dictionary(explainer_values, feature_names):
     return mapping
 
 
-def _compute_lime_values(pipeline, features, index_to_explain):
+class _LimePredictFunction:
+    """Predict function LIME calls on arrays of perturbed rows.
+
+    Estimators which use the base Estimator predict and predict_proba are called through their underlying model directly on the
+    array, so no dataframe is built for each batch of perturbed rows. Other estimators get a dataframe with the feature names.
+    Instances can be pickled, so they can be sent to worker processes.
+
+    Args:
+        estimator (Estimator): Fitted estimator of the pipeline.
+        mode (str): "regression" or "classification".
+        feature_names (list, None): Names of the features the estimator was fit on.
+    """
+
+    def __init__(self, estimator, mode, feature_names):
+        self.estimator = estimator
+        self.method_name = "predict" if mode == "regression" else "predict_proba"
+        self.feature_names = feature_names
+        self.use_component_obj = getattr(type(estimator), self.method_name,) is getattr(
+            Estimator, self.method_name
+        ) and hasattr(
+            estimator._component_obj,
+            self.method_name,
+        )
+
+    def __call__(self, rows):
+        if self.use_component_obj:
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    "ignore", message="X does not have valid feature names"
+                )
+                return np.asarray(
+                    getattr(self.estimator._component_obj, self.method_name)(rows),
+                )
+        rows = pd.DataFrame(rows, columns=self.feature_names)
+        return np.array(getattr(self.estimator, self.method_name)(rows))
+
+
+def _explain_lime_rows(
+    explainer, predict_fn, instances, seeds, num_features, top_labels
+):
+    """Explains rows with LIME, seeding the sampling for each row so the results do not depend on which process explains it.
+
+    Args:
+        explainer (LimeTabularExplainer): Explainer built on the pipeline features.
+        predict_fn (callable): Function mapping an array of rows to predictions.
+        instances (list): Rows to explain.
+        seeds (list): Seed for each row.
+        num_features (int): Number of features to include in the explanations.
+        top_labels (int, None): Number of labels to explain for classification problems, or None for regression problems.
+
+    Returns:
+        list(list): For each row, the list of (feature name, LIME value) pairs of each label explained.
+    """
+    explanations = []
+    for instance, seed in zip(instances, seeds):
+        random_state = np.random.RandomState(seed)
+        explainer.random_state = random_state
+        explainer.base.random_state = random_state
+        if top_labels is None:
+            exp = explainer.explain_instance(
+                instance,
+                predict_fn,
+                num_features=num_features,
+            )
+            explanations.append([exp.as_list()])
+        else:
+            exp = explainer.explain_instance(
+                instance,
+                predict_fn,
+                num_features=num_features,
+                top_labels=top_labels,
+            )
+            explanations.append(
+                [exp.as_list(label) for label in exp.available_labels()]
+            )
+    return explanations
+
+
+def _compute_lime_values(
+    pipeline, features, index_to_explain, n_jobs=None, random_seed=0
+):
     """Computes LIME values for each feature.
 
     Args:
         pipeline (PipelineBase): Trained pipeline whose predictions we want to explain with LIME.
         features (pd.DataFrame): Dataframe of features - needs to correspond to data the pipeline was fit on.
-        index_to_explain (int): Index in the pipeline_features/input_features to explain.
+        index_to_explain (int, list(int)): Index, or list of indices, in the pipeline_features/input_features to explain.
+            The explainer is built once for all of the indices, and reused while the pipeline's fit and the features are the same.
+        n_jobs (int or None): Non-negative integer describing level of parallelism used to explain the rows. None and 1 are equivalent.
+            If set to -1, all CPUs are used. For n_jobs below -1, (n_cpus + 1 + n_jobs) are used. Defaults to None.
+        random_seed (int): Seed for the sampling around each row. The values of a row depend only on the seed and its index. Defaults to 0.
 
     Returns:
-        dict or list(dict): For regression problems, a dictionary mapping a feature name to a list of LIME values.
-            For classification problems, returns a list of dictionaries. One for each class.
+        dict or list(dict): For regression problems, a dictionary mapping a feature name to a list of LIME values,
+            one for each index explained. For classification problems, returns a list of dictionaries. One for each class.
     """
     error_msg = "lime is not installed. Please install using 'pip install lime'"
     lime = import_or_raise("lime.lime_tabular", error_msg=error_msg)
@@ -58,50 +149,73 @@ def _compute_lime_values(pipeline, features, index_to_explain):
     if is_regression(pipeline.problem_type):
         mode = "regression"
 
-    def array_predict(row):
-        row = pd.DataFrame(row, columns=feature_names)
-        if mode == "regression":
-            pred = pipeline.estimator.predict(row)
-        else:
-            pred = pipeline.estimator.predict_proba(row)
-        return np.array(pred)
-
-    def list_to_dict(l):
-        return {item[0]: [item[1]] for item in l}
+    def add_to_dict(mapping, l):
+        for feature_name, value in l:
+            mapping.setdefault(feature_name, []).append(value)
 
+    indices_to_explain = (
+        index_to_explain if isinstance(index_to_explain, list) else [index_to_explain]
+    )
     num_features = features.shape[1]
     if isinstance(features, pd.DataFrame):
         feature_names = features.columns
-        instance = features.iloc[index_to_explain]
+        instances = [features.iloc[index] for index in indices_to_explain]
     else:
         feature_names = None
-        instance = features[index_to_explain]
-
-    explainer = lime.LimeTabularExplainer(
-        features,
-        feature_names=feature_names,
-        discretize_continuous=False,
-        mode=mode,
-    )
-    if mode == "regression":
-        exp = explainer.explain_instance(
-            instance,
-            array_predict,
-            num_features=num_features,
+        instances = [features[index] for index in indices_to_explain]
+
+    # Building the explainer computes statistics of every feature, so reuse it while the features are the same.
+    # Features which cannot be hashed cannot be told apart from other features, so their explainer is not cached
+    fingerprint = _data_fingerprint(features)
+    explainer_cache = _get_fit_cache(_EXPLAINER_CACHE, pipeline)
+    explainer_key = (mode, fingerprint)
+    cached_key, explainer = explainer_cache.get("lime", (None, None))
+    if fingerprint is None or cached_key != explainer_key:
+        explainer = lime.LimeTabularExplainer(
+            features,
+            feature_names=feature_names,
+            discretize_continuous=False,
+            mode=mode,
         )
-        mapping_list = exp.as_list()
-        mappings = list_to_dict(mapping_list)
+        if fingerprint is not None:
+            explainer_cache["lime"] = (explainer_key, explainer)
+
+    predict_fn = _LimePredictFunction(pipeline.estimator, mode, feature_names)
+    top_labels = None if mode == "regression" else len(pipeline.classes_)
+    seeds = [[random_seed, index] for index in indices_to_explain]
+    n_chunks = min(effective_n_jobs(n_jobs), len(instances))
+    if n_chunks > 1:
+        chunks = np.array_split(np.arange(len(instances)), n_chunks)
+        explanations = Parallel(n_jobs=n_jobs)(
+            delayed(_explain_lime_rows)(
+                explainer,
+                predict_fn,
+                [instances[i] for i in chunk],
+                [seeds[i] for i in chunk],
+                num_features,
+                top_labels,
+            )
+            for chunk in chunks
+        )
+        explanations = [row for chunk in explanations for row in chunk]
     else:
-        exp = explainer.explain_instance(
-            instance,
-            array_predict,
-            num_features=num_features,
-            top_labels=len(pipeline.classes_),
+        explanations = _explain_lime_rows(
+            explainer,
+            predict_fn,
+            instances,
+            seeds,
+            num_features,
+            top_labels,
         )
-        mappings = []
-        for label in exp.available_labels():
-            mapping_list = exp.as_list(label)
-            mappings.append(list_to_dict(mapping_list))
+
+    n_labels = len(explanations[0]) if explanations else 0
+    mappings = {} if mode == "regression" else [{} for _ in range(n_labels)]
+    for row_explanations in explanations:
+        if mode == "regression":
+            add_to_dict(mappings, row_explanations[0])
+        else:
+            for mapping, label_explanation in zip(mappings, row_explanations):
+                add_to_dict(mapping, label_explanation)
 
     return mappings
 
@@ -134,15 +248,19 @@ def _compute_shap_values(pipeline, features, training_data=None):
     if estimator.model_family != ModelFamily.CATBOOST:
         features = check_array(features.values)
 
+    explainer_cache = _get_fit_cache(_EXPLAINER_CACHE, pipeline)
     if estimator.model_family.is_tree_estimator():
-        # Use tree_path_dependent to avoid linear runtime with dataset size
-        with warnings.catch_warnings(record=True) as ws:
-            explainer = shap.TreeExplainer(
-                estimator._component_obj,
-                feature_perturbation="tree_path_dependent",
-            )
-        if ws:
-            logger.debug(f"_compute_shap_values TreeExplainer: {ws[0].message}")
+        explainer = explainer_cache.get("tree")
+        if explainer is None:
+            # Use tree_path_dependent to avoid linear runtime with dataset size
+            with warnings.catch_warnings(record=True) as ws:
+                explainer = shap.TreeExplainer(
+                    estimator._component_obj,
+                    feature_perturbation="tree_path_dependent",
+                )
+            if ws:
+                logger.debug(f"_compute_shap_values TreeExplainer: {ws[0].message}")
+            explainer_cache["tree"] = explainer
         shap_values = explainer.shap_values(features, check_additivity=False)
         # shap only outputs values for positive class for Catboost/Xgboost binary estimators.
         # this modifies the output to match the output format of other binary estimators.
@@ -165,16 +283,24 @@ def _compute_shap_values(pipeline, features, training_data=None):
         # https://github.com/slundberg/shap/blob/master/shap/explainers/kernel.py#L114
         sampled_training_data_features = shap.sample(training_data, 100)
         sampled_training_data_features = check_array(sampled_training_data_features)
+        # The explainer summarizes its background sample when it is built, so reuse it while the sample is the same
+        background_key = hashlib.sha256(
+            np.ascontiguousarray(sampled_training_data_features).tobytes(),
+        ).hexdigest()
+        background_key = (sampled_training_data_features.shape, background_key)
         if is_regression(pipeline.problem_type):
             decision_function = estimator._component_obj.predict
         else:
             decision_function = estimator._component_obj.predict_proba
         with warnings.catch_warnings(record=True) as ws:
-            explainer = shap.KernelExplainer(
-                decision_function,
-                sampled_training_data_features,
-                link_function="identity",
-            )
+            cached_key, explainer = explainer_cache.get("kernel", (None, None))
+            if cached_key != background_key:
+                explainer = shap.KernelExplainer(
+                    decision_function,
+                    sampled_training_data_features,
+                    link_function="identity",
+                )
+                explainer_cache["kernel"] = (background_key, explainer)
             shap_values = explainer.shap_values(features)
         if ws:
             logger.debug(f"_compute_shap_values KernelExplainer: {ws[0].message}")
@@ -203,6 +329,102 @@ def _compute_shap_values(pipeline, features, training_data=None):
         raise ValueError(f"Unknown shap_values datatype {str(type(shap_values))}!")
 
 
+def _select_row(values, position):
+    """Selects one row from explainer values computed for several rows, in the format of values computed for that row alone.
+
+    Args:
+        values (dict or list(dict)): Dictionary mapping feature name to list of values, one for each row,
+            or a list of dictionaries (one for each class).
+        position (int): Position of the row in the lists of values.
+
+    Returns:
+        dict or list(dict)
+
+    Examples:
+        >>> assert _select_row({"a": [1, 2], "b": [3, 4]}, 1) == {"a": [2], "b": [4]}
+    """
+    if isinstance(values, dict):
+        return {
+            feature_name: [feature_values[position]]
+            for feature_name, feature_values in values.items()
+        }
+    return [_select_row(class_values, position) for class_values in values]
+
+
+class _BatchedExplainerValues:
+    """Explainer values for rows of the pipeline features, computed for all of the rows with a single call to the explainer.
+
+    The values are only computed the first time the values of any row are requested, so nothing is computed if no table
+    is made.
+
+    Args:
+        pipeline (PipelineBase): Fitted pipeline whose predictions we want to explain with SHAP or LIME.
+        pipeline_features (pd.DataFrame): Dataframe of features computed by the pipeline.
+        indices (list(int)): Positions in pipeline_features of the rows to explain.
+        algorithm (str): Algorithm to use, one of "shap" or "lime".
+        n_jobs (int or None): Level of parallelism used to compute LIME values. Defaults to None.
+        random_seed (int): Seed for the sampling LIME does around each row. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        pipeline,
+        pipeline_features,
+        indices,
+        algorithm,
+        n_jobs=None,
+        random_seed=0,
+    ):
+        self.pipeline = pipeline
+        self.pipeline_features = pipeline_features
+        self.indices = list(dict.fromkeys(indices))
+        self._positions = {
+            index: position for position, index in enumerate(self.indices)
+        }
+        self.algorithm = algorithm
+        self.n_jobs = n_jobs
+        self.random_seed = random_seed
+        self._values = None
+        self._expected_value = None
+
+    def _compute(self):
+        if self.algorithm == "shap":
+            self._values, self._expected_value = _compute_shap_values(
+                self.pipeline,
+                self.pipeline_features.iloc[self.indices],
+                training_data=self.pipeline_features.dropna(axis=0),
+            )
+        elif self.algorithm == "lime":
+            self._values = _compute_lime_values(
+                self.pipeline,
+                self.pipeline_features,
+                self.indices,
+                n_jobs=self.n_jobs,
+                random_seed=self.random_seed,
+            )
+        else:
+            raise ValueError(
+                f"Unknown algorithm {self.algorithm}, should be one of ['shap', 'lime']",
+            )
+
+    def get(self, index):
+        """Gets the explainer values of one row.
+
+        Args:
+            index (int): Position in pipeline_features of the row.
+
+        Returns:
+            tuple(dict or list(dict), float): The row's explainer values, in the format of values computed for that row alone,
+                and the expected value, which is None for LIME.
+        """
+        if self._values is None:
+            self._compute()
+        return (
+            _select_row(self._values, self._positions[index]),
+            self._expected_value,
+        )
+
+
 def _aggreggate_explainer_values_dict(values, provenance):
     """Aggregates explainer values across features created from a common feature.
 
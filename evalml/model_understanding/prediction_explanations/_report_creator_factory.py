@@ -25,6 +25,8 @@ def _report_creator_factory(
     include_expected_value,
     num_to_explain=None,
     algorithm="shap",
+    n_jobs=None,
+    random_seed=0,
 ):
     """Get and initialize the report creator class given the ReportData and parameters passed in by the user.
 
@@ -37,6 +39,8 @@ def _report_creator_factory(
         include_expected_value (bool): Whether the expected value should be included in the table - passed in by user.
         num_to_explain (int): How many rows to include in the entire report - passed in by user.
         algorithm (str): Algorithm to use while generating top contributing features, one of "shap" or "lime". Defaults to "shap".
+        n_jobs (int or None): Level of parallelism used to compute LIME values - passed in by user. Defaults to None.
+        random_seed (int): Seed for the sampling LIME does around each row - passed in by user. Defaults to 0.
 
     Returns:
         _ReportCreator method needed to create the desired report.
@@ -47,6 +51,8 @@ def _report_creator_factory(
             top_k_features,
             include_explainer_values,
             algorithm,
+            n_jobs=n_jobs,
+            random_seed=random_seed,
         )
         report_maker = _ReportMaker(heading, None, explanation_table).make_text
     elif report_type == "explain_predictions" and output_format == "dict":
@@ -54,6 +60,8 @@ def _report_creator_factory(
             top_k_features,
             include_explainer_values,
             algorithm,
+            n_jobs=n_jobs,
+            random_seed=random_seed,
         )
         report_maker = _ReportMaker(None, None, explanation_table).make_dict
     elif report_type == "explain_predictions" and output_format == "dataframe":
@@ -61,6 +69,8 @@ def _report_creator_factory(
             top_k_features,
             include_explainer_values,
             algorithm,
+            n_jobs=n_jobs,
+            random_seed=random_seed,
         )
         report_maker = _ReportMaker(None, None, explanation_table).make_dataframe
     elif report_type == "explain_predictions_best_worst" and output_format == "text":
@@ -74,6 +84,8 @@ def _report_creator_factory(
             top_k_features,
             include_explainer_values,
             algorithm,
+            n_jobs=n_jobs,
+            random_seed=random_seed,
         )
         report_maker = _ReportMaker(
             heading_maker,
@@ -88,6 +100,8 @@ def _report_creator_factory(
             top_k_features,
             include_explainer_values,
             algorithm,
+            n_jobs=n_jobs,
+            random_seed=random_seed,
         )
         predicted_values = _best_worst_predicted_values_section(
             data,
@@ -105,6 +119,8 @@ def _report_creator_factory(
             top_k_features,
             include_explainer_values,
             algorithm,
+            n_jobs=n_jobs,
+            random_seed=random_seed,
         )
         predicted_values = _best_worst_predicted_values_section(
             data,
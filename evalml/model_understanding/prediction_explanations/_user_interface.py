@@ -5,6 +5,7 @@ from texttable import Texttable
 
 from evalml.model_understanding.prediction_explanations._algorithms import (
     _aggregate_explainer_values,
+    _BatchedExplainerValues,
     _compute_lime_values,
     _compute_shap_values,
     _normalize_explainer_values,
@@ -515,6 +516,7 @@ def _make_single_prediction_explanation_table(
     include_expected_value=False,
     output_format="text",
     algorithm="shap",
+    explainer_values=None,
 ):
     """Creates table summarizing the top_k_features positive and top_k_features negative contributing features to the prediction of a single datapoint.
 
@@ -531,6 +533,8 @@ def _make_single_prediction_explanation_table(
         include_expected_value (bool): Whether the expected value should be included in the table. Default is False.
         output_format (str): The desired format of the output.  Can be "text", "dict", or "dataframe".
         algorithm (str): Algorithm to use while generating top contributing features, one of "shap" or "lime". Defaults to "shap".
+        explainer_values (_BatchedExplainerValues): Explainer values computed for all of the rows in the report, including
+            index_to_explain. Defaults to None, which computes the explainer values of this row alone.
 
     Returns:
         str: Table
@@ -541,7 +545,9 @@ def _make_single_prediction_explanation_table(
     pipeline_features_row = pipeline_features.iloc[[index_to_explain]]
     input_features_row = input_features.iloc[[index_to_explain]]
 
-    if algorithm == "shap":
+    if explainer_values is not None:
+        explainer_values, expected_value = explainer_values.get(index_to_explain)
+    elif algorithm == "shap":
         explainer_values, expected_value = _compute_shap_values(
             pipeline,
             pipeline_features_row,
@@ -816,12 +822,46 @@ class _RegressionPredictedValues(_SectionMaker):
 
 
 class _ExplanationTable(_SectionMaker):
-    def __init__(self, top_k_features, include_explainer_values, algorithm="shap"):
+    def __init__(
+        self,
+        top_k_features,
+        include_explainer_values,
+        algorithm="shap",
+        n_jobs=None,
+        random_seed=0,
+    ):
         self.top_k_features = top_k_features
         self.include_explainer_values = include_explainer_values
         self.algorithm = algorithm
+        self.n_jobs = n_jobs
+        self.random_seed = random_seed
+
+    def make_explainer_values(self, data):
+        """Sets up the explainer values for every row in the report, which are computed with one call to the explainer.
+
+        Args:
+            data (_ReportData): Data passed in by the user.
 
-    def make_text(self, index, pipeline, pipeline_features, input_features):
+        Returns:
+            _BatchedExplainerValues: Explainer values to pass to the make methods.
+        """
+        return _BatchedExplainerValues(
+            data.pipeline,
+            data.pipeline_features,
+            data.index_list,
+            self.algorithm,
+            n_jobs=self.n_jobs,
+            random_seed=self.random_seed,
+        )
+
+    def make_text(
+        self,
+        index,
+        pipeline,
+        pipeline_features,
+        input_features,
+        explainer_values=None,
+    ):
         """Makes the explanation table section for reports formatted as text.
 
         The table is the same whether the user requests a best/worst report or they manually specified the
@@ -835,6 +875,8 @@ class _ExplanationTable(_SectionMaker):
             pipeline (PipelineBase): The pipeline to explain.
             pipeline_features (pd.DataFrame): The dataframe of features created by the pipeline.
             input_features (pd.Dataframe): The dataframe of features passed to the pipeline.
+            explainer_values (_BatchedExplainerValues): Explainer values of the rows in the report. Defaults to None,
+                which computes the explainer values of this row alone.
 
         Returns:
             The explanation table section for reports formatted as text.
@@ -848,12 +890,20 @@ class _ExplanationTable(_SectionMaker):
             include_explainer_values=self.include_explainer_values,
             output_format="text",
             algorithm=self.algorithm,
+            explainer_values=explainer_values,
         )
         table = table.splitlines()
         # Indent the rows of the table to match the indentation of the entire report.
         return ["\t\t" + line + "\n" for line in table] + ["\n\n"]
 
-    def make_dict(self, index, pipeline, pipeline_features, input_features):
+    def make_dict(
+        self,
+        index,
+        pipeline,
+        pipeline_features,
+        input_features,
+        explainer_values=None,
+    ):
         """Makes the explanation table section formatted as a dictionary."""
         json_output = _make_single_prediction_explanation_table(
             pipeline,
@@ -864,10 +914,18 @@ class _ExplanationTable(_SectionMaker):
             include_explainer_values=self.include_explainer_values,
             output_format="dict",
             algorithm=self.algorithm,
+            explainer_values=explainer_values,
         )
         return json_output
 
-    def make_dataframe(self, index, pipeline, pipeline_features, input_features):
+    def make_dataframe(
+        self,
+        index,
+        pipeline,
+        pipeline_features,
+        input_features,
+        explainer_values=None,
+    ):
         """Makes the explanation table section formatted as a dataframe."""
         return _make_single_prediction_explanation_table(
             pipeline,
@@ -878,6 +936,7 @@ class _ExplanationTable(_SectionMaker):
             include_explainer_values=self.include_explainer_values,
             output_format="dataframe",
             algorithm=self.algorithm,
+            explainer_values=explainer_values,
         )
 
 
@@ -912,6 +971,7 @@ class _ReportMaker:
              str
         """
         report = [data.pipeline.name + "\n\n", str(data.pipeline.parameters) + "\n\n"]
+        explainer_values = self.table_maker.make_explainer_values(data)
         for rank, index in enumerate(data.index_list):
             report.extend(self.heading_maker.make_text(rank))
             if self.make_predicted_values_maker:
@@ -932,6 +992,7 @@ class _ReportMaker:
                     data.pipeline,
                     data.pipeline_features,
                     data.input_features,
+                    explainer_values,
                 ),
             )
         return "".join(report)
@@ -946,6 +1007,7 @@ class _ReportMaker:
              dict
         """
         report = []
+        explainer_values = self.table_maker.make_explainer_values(data)
         for rank, index in enumerate(data.index_list):
             section = {}
             # We want to omit heading and predicted values sections for "explain_predictions"-style reports
@@ -966,18 +1028,21 @@ class _ReportMaker:
                 data.pipeline,
                 data.pipeline_features,
                 data.input_features,
+                explainer_values,
             )["explanations"]
             report.append(section)
         return {"explanations": report}
 
     def make_dataframe(self, data):
         report = []
+        explainer_values = self.table_maker.make_explainer_values(data)
         for rank, index in enumerate(data.index_list):
             explanation_table = self.table_maker.make_dataframe(
                 index,
                 data.pipeline,
                 data.pipeline_features,
                 data.input_features,
+                explainer_values,
             )
             if self.make_predicted_values_maker:
                 heading = self.make_predicted_values_maker.make_dataframe(
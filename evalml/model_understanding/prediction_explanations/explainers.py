@@ -9,6 +9,7 @@ import numpy as np
 import pandas as pd
 
 from evalml.exceptions import PipelineScoreError
+from evalml.model_understanding.cache import _cached_call
 from evalml.model_understanding.prediction_explanations._report_creator_factory import (
     _report_creator_factory,
 )
@@ -50,6 +51,8 @@ def explain_predictions(
     training_data=None,
     training_target=None,
     algorithm="shap",
+    n_jobs=None,
+    random_seed=0,
 ):
     """Creates a report summarizing the top contributing features for each data point in the input features.
 
@@ -71,6 +74,11 @@ def explain_predictions(
         training_data (pd.DataFrame, np.ndarray): Data the pipeline was trained on. Required and only used for time series pipelines.
         training_target (pd.Series, np.ndarray): Targets used to train the pipeline. Required and only used for time series pipelines.
         algorithm (str): Algorithm to use while generating top contributing features, one of "shap" or "lime". Defaults to "shap".
+        n_jobs (int or None): Non-negative integer describing level of parallelism used to compute LIME values, which are computed for
+            several rows at once in separate processes. None and 1 are equivalent. If set to -1, all CPUs are used. For n_jobs below -1,
+            (n_cpus + 1 + n_jobs) are used. Only used with the LIME algorithm. Defaults to None.
+        random_seed (int): Seed for the sampling LIME does around each row. The LIME values of a row are the same for the same seed
+            no matter how many jobs are used. Only used with the LIME algorithm. Defaults to 0.
 
     Returns:
         str, dict, or pd.DataFrame: A report explaining the top contributing features to each prediction for each row of input_features.
@@ -107,11 +115,13 @@ def explain_predictions(
     if algorithm == "lime" and "CatBoost" in pipeline.estimator.name:
         raise ValueError("CatBoost models are not supported by LIME at this time")
 
-    pipeline_features = pipeline.transform_all_but_final(
+    pipeline_features = _cached_call(
+        pipeline,
+        "transform_all_but_final",
         input_features,
-        y,
-        training_data,
-        training_target,
+        y=y,
+        X_train=training_data,
+        y_train=training_target,
     )
 
     data = _ReportData(
@@ -134,6 +144,8 @@ def explain_predictions(
         include_explainer_values=include_explainer_values,
         include_expected_value=include_expected_value,
         algorithm=algorithm,
+        n_jobs=n_jobs,
+        random_seed=random_seed,
     )
     return report_creator(data)
 
@@ -173,6 +185,8 @@ def explain_predictions_best_worst(
     training_data=None,
     training_target=None,
     algorithm="shap",
+    n_jobs=None,
+    random_seed=0,
 ):
     """Creates a report summarizing the top contributing features for the best and worst points in the dataset as measured by error to true labels.
 
@@ -200,6 +214,11 @@ def explain_predictions_best_worst(
         training_data (pd.DataFrame, np.ndarray): Data the pipeline was trained on. Required and only used for time series pipelines.
         training_target (pd.Series, np.ndarray): Targets used to train the pipeline. Required and only used for time series pipelines.
         algorithm (str): Algorithm to use while generating top contributing features, one of "shap" or "lime". Defaults to "shap".
+        n_jobs (int or None): Non-negative integer describing level of parallelism used to compute LIME values, which are computed for
+            several rows at once in separate processes. None and 1 are equivalent. If set to -1, all CPUs are used. For n_jobs below -1,
+            (n_cpus + 1 + n_jobs) are used. Only used with the LIME algorithm. Defaults to None.
+        random_seed (int): Seed for the sampling LIME does around each row. The LIME values of a row are the same for the same seed
+            no matter how many jobs are used. Only used with the LIME algorithm. Defaults to 0.
 
     Returns:
         str, dict, or pd.DataFrame: A report explaining the top contributing features for the best/worst predictions in the input_features.
@@ -263,34 +282,40 @@ def explain_predictions_best_worst(
     try:
         if is_regression(pipeline.problem_type):
             if is_time_series(pipeline.problem_type):
-                y_pred = pipeline.predict_in_sample(
+                y_pred = _cached_call(
+                    pipeline,
+                    "predict_in_sample",
                     input_features,
                     y_true,
                     training_data,
                     training_target,
                 )
             else:
-                y_pred = pipeline.predict(input_features)
+                y_pred = _cached_call(pipeline, "predict", input_features)
             y_pred_values = None
             y_true_no_nan, y_pred_no_nan = drop_rows_with_nans(y_true, y_pred)
             errors = metric(y_true_no_nan, y_pred_no_nan)
         else:
             if is_time_series(pipeline.problem_type):
-                y_pred = pipeline.predict_proba_in_sample(
+                y_pred = _cached_call(
+                    pipeline,
+                    "predict_proba_in_sample",
                     input_features,
                     y_true,
                     training_data,
                     training_target,
                 )
-                y_pred_values = pipeline.predict_in_sample(
+                y_pred_values = _cached_call(
+                    pipeline,
+                    "predict_in_sample",
                     input_features,
                     y_true,
                     training_data,
                     training_target,
                 )
             else:
-                y_pred = pipeline.predict_proba(input_features)
-                y_pred_values = pipeline.predict(input_features)
+                y_pred = _cached_call(pipeline, "predict_proba", input_features)
+                y_pred_values = _cached_call(pipeline, "predict", input_features)
             y_true_no_nan, y_pred_no_nan, y_pred_values_no_nan = drop_rows_with_nans(
                 y_true,
                 y_pred,
@@ -318,11 +343,13 @@ def explain_predictions_best_worst(
         callback,
     )
 
-    pipeline_features = pipeline.transform_all_but_final(
+    pipeline_features = _cached_call(
+        pipeline,
+        "transform_all_but_final",
         input_features,
-        y_true,
-        training_data,
-        training_target,
+        y=y_true,
+        X_train=training_data,
+        y_train=training_target,
     )
 
     _update_progress(
@@ -353,6 +380,8 @@ def explain_predictions_best_worst(
         num_to_explain=num_to_explain,
         include_expected_value=True,
         algorithm=algorithm,
+        n_jobs=n_jobs,
+        random_seed=random_seed,
     )
 
     _update_progress(start_time, timer(), ExplainPredictionsStage.DONE, callback)
@@ -5,19 +5,30 @@ from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
+from sklearn.decomposition import PCA
 from sklearn.exceptions import NotFittedError
 from sklearn.manifold import TSNE
 from sklearn.tree import export_graphviz
 
 from evalml.model_family import ModelFamily
+from evalml.model_understanding.cache import _cached_call
+from evalml.model_understanding.metrics import confusion_counts_per_threshold
 from evalml.objectives.utils import get_objective
 from evalml.problem_types import ProblemTypes
-from evalml.utils import import_or_raise, infer_feature_types, jupyter_check
+from evalml.utils import (
+    get_random_state,
+    import_or_raise,
+    infer_feature_types,
+    jupyter_check,
+)
 
 
 def binary_objective_vs_threshold(pipeline, X, y, objective, steps=100):
     """Computes objective score as a function of potential binary classification decision thresholds for a fitted binary classification pipeline.
 
+    Objectives which can be scored from confusion matrix counts, such as F1 or the cost-benefit matrix, are scored at every
+    threshold at once from a single set of predicted probabilities. Other objectives are scored at each threshold in turn.
+
     Args:
         pipeline (BinaryClassificationPipeline obj): Fitted binary classification pipeline.
         X (pd.DataFrame): The input data used to compute objective score.
@@ -40,13 +51,23 @@ def binary_objective_vs_threshold(pipeline, X, y, objective, steps=100):
     if objective.score_needs_proba:
         raise ValueError("Objective `score_needs_proba` must be False")
 
-    pipeline_tmp = copy.copy(pipeline)
     thresholds = np.linspace(0, 1, steps + 1)
-    costs = []
-    for threshold in thresholds:
-        pipeline_tmp.threshold = threshold
-        scores = pipeline_tmp.score(X, y, [objective])
-        costs.append(scores[objective.name])
+    if objective.can_score_from_confusion_counts:
+        # Every threshold is scored from one set of predicted probabilities
+        y = infer_feature_types(y)
+        if pipeline._encoder is not None:
+            y = pipeline._encode_targets(y)
+        ypred_proba = _cached_call(pipeline, "predict_proba", X).iloc[:, 1]
+        costs = objective.objective_function_from_confusion_counts(
+            **confusion_counts_per_threshold(y, ypred_proba, thresholds),
+        )
+    else:
+        pipeline_tmp = copy.copy(pipeline)
+        costs = []
+        for threshold in thresholds:
+            pipeline_tmp.threshold = threshold
+            scores = pipeline_tmp.score(X, y, [objective])
+            costs.append(scores[objective.name])
     df = pd.DataFrame({"threshold": thresholds, "score": costs})
     return df
 
@@ -371,7 +392,14 @@ def get_prediction_vs_actual_over_time_data(pipeline, X, y, X_train, y_train, da
         pd.DataFrame: Predictions vs. time.
     """
     dates = infer_feature_types(dates)
-    prediction = pipeline.predict_in_sample(X, y, X_train=X_train, y_train=y_train)
+    prediction = _cached_call(
+        pipeline,
+        "predict_in_sample",
+        X,
+        y=y,
+        X_train=X_train,
+        y_train=y_train,
+    )
 
     return pd.DataFrame(
         {
@@ -479,26 +507,74 @@ def get_linear_coefficients(estimator, features=None):
     return coef_
 
 
+def _stratified_sample_indices(n_rows, sample_size, stratify, random_seed):
+    """Picks sample_size row positions at random, keeping the proportion of each class in stratify when it is given.
+
+    Each class gets its proportional share of the sample, rounded with the largest remainder method, so classes with enough
+    rows to deserve at least one sample always appear.
+
+    Args:
+        n_rows (int): Number of rows to sample from.
+        sample_size (int): Number of rows to sample. Must be less than n_rows.
+        stratify (pd.Series, None): Class labels of the rows, or None to sample uniformly.
+        random_seed (int): Seed for the random number generator.
+
+    Returns:
+        np.ndarray: Sorted positions of the sampled rows.
+    """
+    random_state = get_random_state(random_seed)
+    if stratify is None:
+        return np.sort(random_state.choice(n_rows, sample_size, replace=False))
+    codes, _ = pd.factorize(pd.Series(stratify).astype(str))
+    class_counts = np.bincount(codes)
+    shares = class_counts * sample_size / n_rows
+    allocation = np.floor(shares).astype(int)
+    remainders = shares - allocation
+    n_left = sample_size - allocation.sum()
+    allocation[np.argsort(-remainders, kind="stable")[:n_left]] += 1
+    indices = [
+        random_state.choice(np.flatnonzero(codes == code), n_class, replace=False)
+        for code, n_class in enumerate(allocation)
+    ]
+    return np.sort(np.concatenate(indices))
+
+
 def t_sne(
     X,
     n_components=2,
     perplexity=30.0,
     learning_rate=200.0,
     metric="euclidean",
+    sample_size=None,
+    stratify=None,
+    pca_components=None,
+    n_jobs=None,
+    random_seed=0,
+    return_indices=False,
     **kwargs,
 ):
     """Get the transformed output after fitting X to the embedded space using t-SNE.
 
+    t-SNE is slow and memory hungry on large datasets, so a sample of the rows can be embedded instead, and the data can first
+    be reduced to fewer dimensions with PCA, which speeds up the nearest neighbor search on wide data.
+
      Args:
         X (np.ndarray, pd.DataFrame): Data to be transformed. Must be numeric.
         n_components (int, optional): Dimension of the embedded space.
         perplexity (float, optional): Related to the number of nearest neighbors that is used in other manifold learning algorithms. Larger datasets usually require a larger perplexity. Consider selecting a value between 5 and 50.
         learning_rate (float, optional): Usually in the range [10.0, 1000.0]. If the cost function gets stuck in a bad local minimum, increasing the learning rate may help.
         metric (str, optional): The metric to use when calculating distance between instances in a feature array.
+        sample_size (int, optional): Number of rows to embed, chosen at random. Defaults to None, which embeds every row.
+        stratify (pd.Series, np.ndarray, optional): Class labels of the rows of X. If given, the sample keeps the proportion of each class. Defaults to None.
+        pca_components (int, optional): Number of principal components to reduce X to before running t-SNE. Only used when X has more columns than this. Defaults to None, which does not reduce X.
+        n_jobs (int or None, optional): Number of parallel jobs used for the nearest neighbor search. None means 1 and -1 means all CPUs. Defaults to None.
+        random_seed (int, optional): Seed for the sampling, PCA and t-SNE. Defaults to 0.
+        return_indices (bool, optional): Whether to also return the positions of the rows of X which were embedded. Defaults to False.
         kwargs: Arbitrary keyword arguments.
 
     Returns:
-        np.ndarray (n_samples, n_components): TSNE output.
+        np.ndarray (n_samples, n_components): TSNE output. If return_indices is True, a tuple of the TSNE output and a np.ndarray
+            of the positions in X of the embedded rows, in the same order.
 
     Raises:
         ValueError: If specified parameters are not valid values.
@@ -509,16 +585,49 @@ def t_sne(
         )
     if not perplexity >= 0:
         raise ValueError("The parameter perplexity must be non-negative")
+    if sample_size is not None and (
+        not isinstance(sample_size, (int, np.integer)) or not sample_size > 0
+    ):
+        raise ValueError(
+            "The parameter sample_size must be of type integer and greater than 0",
+        )
+    if pca_components is not None and (
+        not isinstance(pca_components, (int, np.integer)) or not pca_components > 0
+    ):
+        raise ValueError(
+            "The parameter pca_components must be of type integer and greater than 0",
+        )
 
     X = infer_feature_types(X)
+    indices = np.arange(len(X))
+    if stratify is not None:
+        stratify = infer_feature_types(stratify)
+        if len(stratify) != len(X):
+            raise ValueError("stratify must have the same number of rows as X")
+    if sample_size is not None and sample_size < len(X):
+        indices = _stratified_sample_indices(
+            len(X),
+            sample_size,
+            stratify,
+            random_seed,
+        )
+        X = X.iloc[indices]
+    if pca_components is not None and pca_components < X.shape[1]:
+        X = PCA(n_components=pca_components, random_state=random_seed).fit_transform(
+            X,
+        )
+    kwargs.setdefault("random_state", random_seed)
     t_sne_ = TSNE(
         n_components=n_components,
         perplexity=perplexity,
         learning_rate=learning_rate,
         metric=metric,
+        n_jobs=n_jobs,
         **kwargs,
     )
     X_new = t_sne_.fit_transform(X)
+    if return_indices:
+        return X_new, indices
     return X_new
 
 
@@ -530,6 +639,11 @@ def graph_t_sne(
     metric="euclidean",
     marker_line_width=2,
     marker_size=7,
+    sample_size=None,
+    stratify=None,
+    pca_components=None,
+    n_jobs=None,
+    random_seed=0,
     **kwargs,
 ):
     """Plot high dimensional data into lower dimensional space using t-SNE.
@@ -542,10 +656,15 @@ def graph_t_sne(
         metric (str): The metric to use when calculating distance between instances in a feature array. The default is "euclidean" which is interpreted as the squared euclidean distance.
         marker_line_width (int): Determines the line width of the marker boundary. Defaults to 2.
         marker_size (int): Determines the size of the marker. Defaults to 7.
+        sample_size (int): Number of rows to plot, chosen at random. Defaults to None, which plots every row.
+        stratify (pd.Series, np.ndarray): Class labels of the rows of X. If given, the sample keeps the proportion of each class. Defaults to None.
+        pca_components (int): Number of principal components to reduce X to before running t-SNE. Defaults to None, which does not reduce X.
+        n_jobs (int or None): Number of parallel jobs used for the nearest neighbor search. None means 1 and -1 means all CPUs. Defaults to None.
+        random_seed (int): Seed for the sampling, PCA and t-SNE. Defaults to 0.
         kwargs: Arbitrary keyword arguments.
 
     Returns:
-        plotly.Figure: Figure representing the transformed data.
+        plotly.Figure: Figure representing the transformed data. Hovering over a point shows the index of its row in X.
 
     Raises:
         ValueError: If marker_line_width or marker_size are not valid values.
@@ -560,17 +679,31 @@ def graph_t_sne(
     if not marker_size >= 0:
         raise ValueError("The parameter marker_size must be non-negative")
 
-    X_embedded = t_sne(
+    X = infer_feature_types(X)
+    X_embedded, indices = t_sne(
         X,
         n_components=n_components,
         perplexity=perplexity,
         learning_rate=learning_rate,
         metric=metric,
+        sample_size=sample_size,
+        stratify=stratify,
+        pca_components=pca_components,
+        n_jobs=n_jobs,
+        random_seed=random_seed,
+        return_indices=True,
         **kwargs,
     )
 
     fig = _go.Figure()
-    fig.add_trace(_go.Scatter(x=X_embedded[:, 0], y=X_embedded[:, 1], mode="markers"))
+    fig.add_trace(
+        _go.Scatter(
+            x=X_embedded[:, 0],
+            y=X_embedded[:, 1],
+            mode="markers",
+            text=[f"Row {index}" for index in X.index[indices]],
+        ),
+    )
     fig.update_traces(
         mode="markers",
         marker_line_width=marker_line_width,
@@ -25,9 +25,42 @@ class BinaryClassificationObjective(ObjectiveBase):
         """
         return not cls.score_needs_proba
 
+    @property
+    def can_score_from_confusion_counts(self):
+        """Returns whether the objective's score only depends on the confusion matrix counts of its thresholded predictions.
+
+        This is true for objectives which define `objective_function_from_confusion_counts` and use the default decision
+        function, and false for objectives which use X, such as fraud cost. `objective_function_from_confusion_counts` computes
+        the objective from the confusion matrix counts of many sets of thresholded predictions at once, giving the same scores
+        as `objective_function`. Subclasses which override `objective_function` without also overriding
+        `objective_function_from_confusion_counts` are scored from their predictions.
+
+        Returns:
+            bool: Whether the objective can be scored with `objective_function_from_confusion_counts`.
+        """
+        objective_class = type(self)
+        if (
+            getattr(objective_class, "objective_function_from_confusion_counts", None)
+            is None
+            or objective_class.decision_function
+            is not BinaryClassificationObjective.decision_function
+        ):
+            return False
+        return issubclass(
+            _defining_class(
+                objective_class,
+                "objective_function_from_confusion_counts",
+            ),
+            _defining_class(objective_class, "objective_function"),
+        )
+
     def optimize_threshold(self, ypred_proba, y_true, X=None):
         """Learn a binary classification threshold which optimizes the current objective.
 
+        Objectives which can be scored from confusion matrix counts are optimized exactly, by sorting the predicted probabilities
+        and scoring every distinct set of predictions from cumulative counts. Other objectives, such as those which use X, are
+        optimized with differential evolution.
+
         Args:
             ypred_proba (pd.Series): The classifier's predicted probabilities
             y_true (pd.Series): The ground truth for the predictions.
@@ -47,6 +80,9 @@ class BinaryClassificationObjective(ObjectiveBase):
         if not self.can_optimize_threshold:
             raise RuntimeError("Trying to optimize objective that can't be optimized!")
 
+        if self.can_score_from_confusion_counts:
+            return self._optimize_threshold_from_confusion_counts(ypred_proba, y_true)
+
         def cost(threshold):
             y_predicted = self.decision_function(
                 ypred_proba=ypred_proba,
@@ -60,6 +96,28 @@ class BinaryClassificationObjective(ObjectiveBase):
 
         return optimal.x[0]
 
+    def _optimize_threshold_from_confusion_counts(self, ypred_proba, y_true):
+        """Finds the threshold which optimizes the objective exactly, by scoring one threshold between each pair of consecutive distinct predicted probabilities.
+
+        Predictions only change when the threshold passes a predicted probability, so these thresholds cover every possible set of
+        predictions. Ties are broken in favor of the lowest threshold.
+        """
+        from evalml.model_understanding.metrics import confusion_counts_per_threshold
+
+        probabilities = np.asarray(ypred_proba, dtype=float)
+        probabilities = probabilities[~np.isnan(probabilities)]
+        edges = np.unique(np.concatenate([[0.0], probabilities, [1.0]]))
+        # Midpoints leave as much margin as possible on both sides of the threshold,
+        # and a last threshold of 1 predicts every row to be negative
+        thresholds = np.append((edges[:-1] + edges[1:]) / 2, 1.0)
+        scores = self.objective_function_from_confusion_counts(
+            **confusion_counts_per_threshold(y_true, ypred_proba, thresholds),
+        )
+        scores = np.asarray(scores, dtype=float)
+        if not self.greater_is_better:
+            scores = -scores
+        return thresholds[np.nanargmax(scores)]
+
     def decision_function(self, ypred_proba, threshold=0.5, X=None):
         """Apply a learned threshold to predicted probabilities to get predicted classes.
 
@@ -81,3 +139,8 @@ class BinaryClassificationObjective(ObjectiveBase):
             raise ValueError("y_true contains more than two unique values")
         if len(np.unique(y_predicted)) > 2 and not self.score_needs_proba:
             raise ValueError("y_predicted contains more than two unique values")
+
+
+def _defining_class(cls, attribute):
+    """Finds the class in the method resolution order of cls which defines an attribute."""
+    return next(klass for klass in cls.__mro__ if attribute in vars(klass))
@@ -5,6 +5,7 @@ import evalml
 from evalml.objectives.binary_classification_objective import (
     BinaryClassificationObjective,
 )
+from evalml.utils import _divide
 
 
 class CostBenefitMatrix(BinaryClassificationObjective):
@@ -52,6 +53,11 @@ class CostBenefitMatrix(BinaryClassificationObjective):
             y_predicted,
             normalize_method="all",
         )
+        if conf_matrix.shape == (1, 1):
+            # Only one class occurs in the labels and predictions, so every prediction is a true positive or a true negative
+            return (
+                self.true_positive if conf_matrix.index[0] == 1 else self.true_negative
+            )
         cost_matrix = np.array(
             [
                 [self.true_negative, self.false_positive],
@@ -61,3 +67,29 @@ class CostBenefitMatrix(BinaryClassificationObjective):
 
         total_cost = np.multiply(conf_matrix.values, cost_matrix).sum()
         return total_cost
+
+    def objective_function_from_confusion_counts(
+        self,
+        true_positives,
+        false_positives,
+        true_negatives,
+        false_negatives,
+    ):
+        """Calculates cost-benefit from the confusion matrix counts of many sets of predictions.
+
+        Args:
+            true_positives (np.ndarray): Number of true positives of each set of predictions.
+            false_positives (np.ndarray): Number of false positives of each set of predictions.
+            true_negatives (np.ndarray): Number of true negatives of each set of predictions.
+            false_negatives (np.ndarray): Number of false negatives of each set of predictions.
+
+        Returns:
+            np.ndarray: Cost-benefit matrix score of each set of predictions.
+        """
+        n_samples = true_positives + false_positives + true_negatives + false_negatives
+        return (
+            _divide(true_negatives, n_samples) * self.true_negative
+            + _divide(false_positives, n_samples) * self.false_positive
+            + _divide(false_negatives, n_samples) * self.false_negative
+            + _divide(true_positives, n_samples) * self.true_positive
+        )
@@ -1,9 +1,12 @@
 """Lead scoring objective."""
 import math
 
+import numpy as np
+
 from evalml.objectives.binary_classification_objective import (
     BinaryClassificationObjective,
 )
+from evalml.utils import _divide
 
 
 class LeadScoring(BinaryClassificationObjective):
@@ -51,3 +54,32 @@ class LeadScoring(BinaryClassificationObjective):
         same_class_penalty = (2 - len(set(y_predicted))) * abs(profit_per_lead)
 
         return profit_per_lead - same_class_penalty
+
+    def objective_function_from_confusion_counts(
+        self,
+        true_positives,
+        false_positives,
+        true_negatives,
+        false_negatives,
+    ):
+        """Calculate the profit per lead from the confusion matrix counts of many sets of predictions.
+
+        Args:
+            true_positives (np.ndarray): Number of true positives of each set of predictions.
+            false_positives (np.ndarray): Number of false positives of each set of predictions.
+            true_negatives (np.ndarray): Number of true negatives of each set of predictions.
+            false_negatives (np.ndarray): Number of false negatives of each set of predictions.
+
+        Returns:
+            np.ndarray: Profit per lead of each set of predictions.
+        """
+        n_samples = true_positives + false_positives + true_negatives + false_negatives
+        predicted_positives = true_positives + false_positives
+        profit = (
+            self.true_positives * true_positives
+            + self.false_positives * false_positives
+        )
+        profit_per_lead = _divide(profit, n_samples)
+        # penalty if our estimator only predicts 1 output by making the score 0
+        same_class = (predicted_positives == 0) | (predicted_positives == n_samples)
+        return profit_per_lead - np.where(same_class, np.abs(profit_per_lead), 0)
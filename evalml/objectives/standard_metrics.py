@@ -16,7 +16,7 @@ from evalml.objectives.regression_objective import RegressionObjective
 from evalml.objectives.time_series_regression_objective import (
     TimeSeriesRegressionObjective,
 )
-from evalml.utils import classproperty
+from evalml.utils import _divide, classproperty
 
 
 class AccuracyBinary(BinaryClassificationObjective):
@@ -39,6 +39,19 @@ class AccuracyBinary(BinaryClassificationObjective):
         """Objective function for accuracy score for binary classification."""
         return metrics.accuracy_score(y_true, y_predicted, sample_weight=sample_weight)
 
+    def objective_function_from_confusion_counts(
+        self,
+        true_positives,
+        false_positives,
+        true_negatives,
+        false_negatives,
+    ):
+        """Objective function for accuracy score for binary classification, computed from confusion matrix counts."""
+        return _divide(
+            true_positives + true_negatives,
+            true_positives + false_positives + true_negatives + false_negatives,
+        )
+
 
 class AccuracyMulticlass(MulticlassClassificationObjective):
     """Accuracy score for multiclass classification.
@@ -85,6 +98,25 @@ class BalancedAccuracyBinary(BinaryClassificationObjective):
             sample_weight=sample_weight,
         )
 
+    def objective_function_from_confusion_counts(
+        self,
+        true_positives,
+        false_positives,
+        true_negatives,
+        false_negatives,
+    ):
+        """Objective function for balanced accuracy for binary classification, computed from confusion matrix counts."""
+        # Like scikit-learn, classes which do not occur in y_true are left out of the average
+        sensitivity = _divide(true_positives, true_positives + false_negatives)
+        specificity = _divide(true_negatives, true_negatives + false_positives)
+        has_positives = np.asarray(true_positives + false_negatives) > 0
+        has_negatives = np.asarray(true_negatives + false_positives) > 0
+        return np.where(
+            has_positives & has_negatives,
+            (sensitivity + specificity) / 2,
+            np.where(has_positives, sensitivity, specificity),
+        )
+
 
 class BalancedAccuracyMulticlass(MulticlassClassificationObjective):
     """Balanced accuracy score for multiclass classification.
@@ -136,6 +168,18 @@ class F1(BinaryClassificationObjective):
             sample_weight=sample_weight,
         )
 
+    def objective_function_from_confusion_counts(
+        self,
+        true_positives,
+        false_positives,
+        true_negatives,
+        false_negatives,
+    ):
+        """Objective function for F1 score for binary classification, computed from confusion matrix counts."""
+        precision = _divide(true_positives, true_positives + false_positives)
+        recall = _divide(true_positives, true_positives + false_negatives)
+        return _divide(2 * precision * recall, precision + recall)
+
 
 class F1Micro(MulticlassClassificationObjective):
     """F1 score for multiclass classification using micro averaging.
@@ -243,6 +287,16 @@ class Precision(BinaryClassificationObjective):
             sample_weight=sample_weight,
         )
 
+    def objective_function_from_confusion_counts(
+        self,
+        true_positives,
+        false_positives,
+        true_negatives,
+        false_negatives,
+    ):
+        """Objective function for precision score for binary classification, computed from confusion matrix counts."""
+        return _divide(true_positives, true_positives + false_positives)
+
 
 class PrecisionMicro(MulticlassClassificationObjective):
     """Precision score for multiclass classification using micro averaging.
@@ -350,6 +404,16 @@ class Recall(BinaryClassificationObjective):
             sample_weight=sample_weight,
         )
 
+    def objective_function_from_confusion_counts(
+        self,
+        true_positives,
+        false_positives,
+        true_negatives,
+        false_negatives,
+    ):
+        """Objective function for recall score for binary classification, computed from confusion matrix counts."""
+        return _divide(true_positives, true_positives + false_negatives)
+
 
 class RecallMicro(MulticlassClassificationObjective):
     """Recall score for multiclass classification using micro averaging.
@@ -645,6 +709,34 @@ class MCCBinary(BinaryClassificationObjective):
                 sample_weight=sample_weight,
             )
 
+    def objective_function_from_confusion_counts(
+        self,
+        true_positives,
+        false_positives,
+        true_negatives,
+        false_negatives,
+    ):
+        """Objective function for Matthews correlation coefficient for binary classification, computed from confusion matrix counts."""
+        true_positives = np.asarray(true_positives, dtype=float)
+        false_positives = np.asarray(false_positives, dtype=float)
+        true_negatives = np.asarray(true_negatives, dtype=float)
+        false_negatives = np.asarray(false_negatives, dtype=float)
+        actual_positives = true_positives + false_negatives
+        actual_negatives = true_negatives + false_positives
+        predicted_positives = true_positives + false_positives
+        predicted_negatives = true_negatives + false_negatives
+        n_samples = actual_positives + actual_negatives
+        # Same covariance formulation as scikit-learn, which scores 0 when either covariance is 0
+        cov_ytyp = (true_positives + true_negatives) * n_samples - (
+            actual_negatives * predicted_negatives
+            + actual_positives * predicted_positives
+        )
+        cov_ypyp = n_samples**2 - (
+            predicted_negatives**2 + predicted_positives**2
+        )
+        cov_ytyt = n_samples**2 - (actual_negatives**2 + actual_positives**2)
+        return _divide(cov_ytyp, np.sqrt(cov_ytyt * cov_ypyp))
+
 
 class MCCMulticlass(MulticlassClassificationObjective):
     """Matthews correlation coefficient for multiclass classification.
@@ -61,3 +61,6 @@ from evalml.pipelines.time_series_classification_pipelines import (
 from evalml.pipelines.time_series_regression_pipeline import (
     TimeSeriesRegressionPipeline,
 )
+from evalml.pipelines.compiled_pipeline import CompiledPipeline
+from evalml.pipelines.execution_plan import PipelineExecutionPlan
+from evalml.pipelines.pipeline_spec import PipelineSpec
@@ -25,6 +25,7 @@ class BinaryClassificationPipeline(
              An empty dictionary or None implies using all default values for component parameters. Defaults to None.
         custom_name (str): Custom name for the pipeline. Defaults to None.
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        executor (str, concurrent.futures.Executor): How the component graph evaluates components which do not depend on each other. Defaults to None.
 
     Example:
         >>> pipeline = BinaryClassificationPipeline(component_graph=["Simple Imputer", "Logistic Regression Classifier"],
@@ -50,15 +51,19 @@ class BinaryClassificationPipeline(
     problem_type = ProblemTypes.BINARY
     """ProblemTypes.BINARY"""
 
-    def _predict(self, X, objective=None):
-        """Make predictions using selected features.
+    def _predict_from_features(self, X, features, objective=None):
+        """Make predictions from the features the final estimator receives, thresholding the predicted probabilities if the pipeline has a threshold.
 
         Args:
-            X (pd.DataFrame): Data of shape [n_samples, n_features]
-            objective (Object or string): The objective to use to make predictions.
+            X (pd.DataFrame): Data the features were computed from.
+            features (pd.DataFrame): Features returned by ``transform_all_but_final`` for X.
+            objective (ObjectiveBase, str, None): The objective to use to make predictions.
 
         Returns:
-            pd.Series: Estimated labels
+            pd.Series: Estimated labels.
+
+        Raises:
+            ValueError: If the objective is not a binary classification objective.
         """
         if objective is not None:
             objective = get_objective(objective, return_instance=True)
@@ -68,8 +73,8 @@ class BinaryClassificationPipeline(
                 )
 
         if self.threshold is None:
-            return self.component_graph.predict(X)
-        ypred_proba = self.predict_proba(X)
+            return super()._predict_from_features(X, features)
+        ypred_proba = self._predict_proba_from_features(features)
         predictions = self._predict_with_objective(X, ypred_proba, objective)
         return infer_feature_types(predictions)
 
@@ -21,18 +21,14 @@ class BinaryClassificationPipelineMixin:
             return ypred_proba > self.threshold
         return objective.decision_function(ypred_proba, threshold=self.threshold, X=X)
 
-    def _compute_predictions(self, X, y, objectives, time_series=False):
-        """Compute predictions/probabilities based on objectives."""
+    def _compute_predictions(self, X, features, objectives):
+        """Compute predictions/probabilities from the features the final estimator receives, based on objectives."""
         y_predicted = None
         y_predicted_proba = None
         if any(o.score_needs_proba for o in objectives) or self.threshold is not None:
-            y_predicted_proba = (
-                self.predict_proba(X, y) if time_series else self.predict_proba(X)
-            )
+            y_predicted_proba = self._predict_proba_from_features(features)
         if any(not o.score_needs_proba for o in objectives) and self.threshold is None:
-            y_predicted = (
-                self._predict(X, y, pad=True) if time_series else self._predict(X)
-            )
+            y_predicted = self._predict_from_features(X, features)
         return y_predicted, y_predicted_proba
 
     def _select_y_pred_for_score(self, X, y, y_pred, y_pred_proba, objective):
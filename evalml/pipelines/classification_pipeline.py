@@ -21,6 +21,7 @@ class ClassificationPipeline(PipelineBase):
              An empty dictionary or None implies using all default values for component parameters. Defaults to None.
         custom_name (str): Custom name for the pipeline. Defaults to None.
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        executor (str, concurrent.futures.Executor): How the component graph evaluates components which do not depend on each other. Defaults to None.
     """
 
     def __init__(
@@ -29,6 +30,7 @@ class ClassificationPipeline(PipelineBase):
         parameters=None,
         custom_name=None,
         random_seed=0,
+        executor=None,
     ):
         self._classes_ = None
         super().__init__(
@@ -36,6 +38,7 @@ class ClassificationPipeline(PipelineBase):
             custom_name=custom_name,
             parameters=parameters,
             random_seed=random_seed,
+            executor=executor,
         )
         try:
             self._encoder = self.component_graph.get_component("Label Encoder")
@@ -97,7 +100,9 @@ class ClassificationPipeline(PipelineBase):
         Returns:
             pd.Series: Estimated labels
         """
-        return self.component_graph.predict(X)
+        X = infer_feature_types(X)
+        features = self.transform_all_but_final(X)
+        return self._predict_from_features(X, features, objective=objective)
 
     def predict(self, X, objective=None, X_train=None, y_train=None):
         """Make predictions using selected features.
@@ -115,14 +120,18 @@ class ClassificationPipeline(PipelineBase):
         Returns:
             pd.Series: Estimated labels.
         """
-        _predictions = self._predict(X, objective=objective)
-        predictions = self.inverse_transform(_predictions.astype(int))
-        predictions = pd.Series(
-            predictions,
+        predictions = self._predict(X, objective=objective)
+        return self._decode_predictions(predictions)
+
+    def _decode_predictions(self, predictions):
+        """Converts encoded predictions back to class labels and names them after the target."""
+        labels = self.component_graph.inverse_transform(predictions.astype(int))
+        labels = pd.Series(
+            labels,
             name=self.input_target_name,
-            index=_predictions.index,
+            index=predictions.index,
         )
-        return infer_feature_types(predictions)
+        return infer_feature_types(labels)
 
     def predict_proba(self, X, X_train=None, y_train=None):
         """Make probability estimates for labels.
@@ -142,8 +151,19 @@ class ClassificationPipeline(PipelineBase):
             raise ValueError(
                 "Cannot call predict_proba() on a component graph because the final component is not an Estimator.",
             )
-        X = self.transform_all_but_final(X, y=None)
-        proba = self.estimator.predict_proba(X)
+        features = self.transform_all_but_final(X, y=None)
+        return self._predict_proba_from_features(features)
+
+    def _predict_proba_from_features(self, features):
+        """Make probability estimates from the features the final estimator receives.
+
+        Args:
+            features (pd.DataFrame): Features returned by ``transform_all_but_final``.
+
+        Returns:
+            pd.DataFrame: Probability estimates, with one column per class.
+        """
+        proba = self._estimator_predict_proba(features)
         proba = proba.ww.rename(
             columns={
                 col: new_col for col, new_col in zip(proba.columns, self.classes_)
@@ -151,6 +171,16 @@ class ClassificationPipeline(PipelineBase):
         )
         return infer_feature_types(proba)
 
+    def _estimator_predict_proba(self, features):
+        """Get estimator predicted probabilities, recording them in the profile if one is being recorded."""
+        with self.component_graph._profile_component(
+            self._estimator_name,
+            features,
+        ) as profile_record:
+            proba = self.estimator.predict_proba(features)
+            profile_record["output"] = proba
+        return proba
+
     def score(self, X, y, objectives, X_train=None, y_train=None):
         """Evaluate model performance on objectives.
 
@@ -161,6 +191,22 @@ class ClassificationPipeline(PipelineBase):
             X_train (pd.DataFrame): Training data. Ignored. Only used for time series.
             y_train (pd.Series): Training labels. Ignored. Only used for time series.
 
+        Returns:
+            dict: Ordered dictionary of objective scores.
+        """
+        X = infer_feature_types(X)
+        features = self.transform_all_but_final(X)
+        return self._score_from_features(X, y, features, objectives)
+
+    def _score_from_features(self, X, y, features, objectives):
+        """Evaluate model performance on objectives, given the features the final estimator receives.
+
+        Args:
+            X (pd.DataFrame): Data the features were computed from.
+            y (pd.Series): True labels of length [n_samples].
+            features (pd.DataFrame): Features returned by ``transform_all_but_final`` for X.
+            objectives (list): List of objectives to score.
+
         Returns:
             dict: Ordered dictionary of objective scores.
         """
@@ -168,7 +214,11 @@ class ClassificationPipeline(PipelineBase):
         objectives = self.create_objectives(objectives)
         if self._encoder is not None:
             y = self._encode_targets(y)
-        y_predicted, y_predicted_proba = self._compute_predictions(X, y, objectives)
+        y_predicted, y_predicted_proba = self._compute_predictions(
+            X,
+            features,
+            objectives,
+        )
         return self._score_all_objectives(
             X,
             y,
@@ -177,12 +227,12 @@ class ClassificationPipeline(PipelineBase):
             objectives,
         )
 
-    def _compute_predictions(self, X, y, objectives):
-        """Compute predictions/probabilities based on objectives."""
+    def _compute_predictions(self, X, features, objectives):
+        """Compute predictions/probabilities from the features the final estimator receives, based on objectives."""
         y_predicted = None
         y_predicted_proba = None
         if any(o.score_needs_proba for o in objectives):
-            y_predicted_proba = self.predict_proba(X)
+            y_predicted_proba = self._predict_proba_from_features(features)
         if any(not o.score_needs_proba for o in objectives):
-            y_predicted = self._predict(X)
+            y_predicted = self._predict_from_features(X, features)
         return y_predicted, y_predicted_proba
@@ -0,0 +1,361 @@
+"""Frozen, low-latency inference object for fitted pipelines."""
+import copy
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from evalml.pipelines.component_graph import _evaluate_component
+from evalml.problem_types import is_classification, is_time_series
+from evalml.utils import import_or_raise
+
+
+class CompiledPipeline:
+    """Frozen copy of a fitted pipeline which makes predictions with as little per-call overhead as possible.
+
+    Everything a pipeline works out on every call to ``predict`` is worked out once, when the pipeline is compiled: the
+    Woodwork schema of the input features, the order in which components run and where each component's inputs come from.
+    Input data is given the logical types the pipeline was fitted on directly instead of having Woodwork infer them and
+    compare the result against the fitted schema, which is what dominates the latency of single-row predictions. This also means
+    a single row is typed the same way as the training data even when inference on it alone would pick different logical types.
+
+    Later changes to the original pipeline, such as refitting it, do not affect the compiled pipeline.
+
+    Args:
+        pipeline (PipelineBase): Fitted pipeline to compile. Time series pipelines and pipelines with a DFS Transformer are not supported.
+
+    Raises:
+        ValueError: If the pipeline is a time series pipeline or contains a DFS Transformer.
+    """
+
+    def __init__(self, pipeline):
+        if is_time_series(pipeline.problem_type):
+            raise ValueError(
+                "Time series pipelines cannot be compiled because their predictions depend on the training data.",
+            )
+        component_graph = pipeline.component_graph
+        if "DFS Transformer" in component_graph.compute_order:
+            raise ValueError(
+                "Pipelines with a DFS Transformer cannot be compiled because their input features are not fixed.",
+            )
+        self._pipeline = copy.deepcopy(pipeline)
+        self._component_graph = self._pipeline.component_graph
+        self._schema = self._component_graph._input_types
+        self.input_feature_names = list(self._schema.columns)
+        self._logical_types = [
+            self._schema.logical_types[column] for column in self.input_feature_names
+        ]
+        self._compute_order = list(self._component_graph.compute_order)
+        self._components = [
+            self._component_graph.get_component(component_name)
+            for component_name in self._compute_order
+        ]
+        (
+            self._remaining_consumers,
+            self._outputs_to_keep,
+        ) = self._component_graph._get_output_consumers(self._compute_order[:-1])
+
+    @property
+    def name(self):
+        """Name of the compiled pipeline."""
+        return self._pipeline.name
+
+    @property
+    def problem_type(self):
+        """Problem type of the compiled pipeline."""
+        return self._pipeline.problem_type
+
+    @property
+    def classes_(self):
+        """Class names of a compiled classification pipeline, or None for other problem types."""
+        if is_classification(self.problem_type):
+            return self._pipeline.classes_
+        return None
+
+    def _to_dataframe(self, data):
+        """Converts the input data to a DataFrame of the features the pipeline was fitted on, typed with the fitted schema."""
+        if isinstance(data, dict):
+            is_single_row = all(np.ndim(value) == 0 for value in data.values())
+            data = pd.DataFrame([data] if is_single_row else data)
+        elif isinstance(data, list) and len(data) and isinstance(data[0], dict):
+            data = pd.DataFrame.from_records(data)
+        elif isinstance(data, (list, tuple, np.ndarray)):
+            array = np.asarray(data, dtype=object)
+            if array.ndim == 1:
+                array = array.reshape(1, -1)
+            if array.ndim != 2 or array.shape[1] != len(self.input_feature_names):
+                raise ValueError(
+                    f"Expected {len(self.input_feature_names)} features per row, got input of shape {array.shape}.",
+                )
+            data = pd.DataFrame(array, columns=self.input_feature_names)
+        elif not isinstance(data, pd.DataFrame):
+            raise ValueError(
+                f"Input must be a dict, a list of records, an array or a DataFrame, not {type(data).__name__}.",
+            )
+
+        missing_features = [
+            column for column in self.input_feature_names if column not in data.columns
+        ]
+        if missing_features:
+            raise ValueError(
+                f"Input is missing features the pipeline was fitted on: {missing_features}",
+            )
+        X = pd.DataFrame(
+            {
+                column: logical_type.transform(data[column])
+                for column, logical_type in zip(
+                    self.input_feature_names,
+                    self._logical_types,
+                )
+            },
+            index=data.index,
+        )
+        X.ww.init_with_full_schema(
+            self._schema.get_subset_schema(self.input_feature_names),
+            validate=False,
+        )
+        return X
+
+    def _transform_features(self, X, component_names):
+        """Evaluates the given leading components of the compute order and returns the output cache."""
+        remaining_consumers = dict(self._remaining_consumers)
+        output_cache = {}
+        for component_name, component_instance in zip(
+            component_names,
+            self._components,
+        ):
+            x_inputs, y_input = self._component_graph._consolidate_inputs_for_component(
+                output_cache,
+                component_name,
+                X,
+                remaining_consumers=remaining_consumers,
+            )
+            self._component_graph._release_inputs(
+                output_cache,
+                component_name,
+                remaining_consumers,
+            )
+            _, outputs = _evaluate_component(
+                component_instance,
+                component_name,
+                x_inputs,
+                y_input,
+                fit=False,
+                is_final_component=component_name == self._compute_order[-1],
+                evaluate_training_only_components=False,
+                elided=component_name in self._component_graph._elided_components,
+            )
+            self._component_graph._store_outputs(
+                output_cache,
+                outputs,
+                remaining_consumers,
+                self._outputs_to_keep,
+            )
+        return output_cache
+
+    def _estimator_inputs(self, X):
+        """Returns the features the pipeline's final component receives."""
+        output_cache = self._transform_features(X, self._compute_order[:-1])
+        x_inputs, _ = self._component_graph._consolidate_inputs_for_component(
+            output_cache,
+            self._compute_order[-1],
+            X,
+        )
+        return x_inputs
+
+    def predict(self, data, objective=None):
+        """Make predictions, giving the same results as the pipeline's ``predict``.
+
+        Args:
+            data (dict, list, np.ndarray, pd.DataFrame): A single row as a dict of feature values or a 1D array, several rows as a dict of
+                feature columns, a list of records or a 2D array with the features in ``input_feature_names`` order, or a DataFrame.
+            objective (ObjectiveBase, str): The objective to use to make predictions. Only used by binary classification pipelines. Defaults to None.
+
+        Returns:
+            pd.Series: Predicted values.
+
+        Raises:
+            ValueError: If the objective is not a binary classification objective, or the final component is not an Estimator.
+        """
+        X = self._to_dataframe(data)
+        predictions = self._pipeline._predict_from_features(
+            X,
+            self._estimator_inputs(X),
+            objective=objective,
+        )
+        return self._pipeline._decode_predictions(predictions)
+
+    def predict_proba(self, data):
+        """Make probability estimates for labels, giving the same results as the pipeline's ``predict_proba``.
+
+        Args:
+            data (dict, list, np.ndarray, pd.DataFrame): Input rows, in any of the forms accepted by ``predict``.
+
+        Returns:
+            pd.DataFrame: Probability estimates.
+
+        Raises:
+            ValueError: If the pipeline is not a classification pipeline.
+        """
+        if not is_classification(self.problem_type):
+            raise ValueError(
+                "predict_proba is only available for classification pipelines.",
+            )
+        X = self._to_dataframe(data)
+        return self._pipeline._predict_proba_from_features(self._estimator_inputs(X))
+
+    def predict_batches(
+        self,
+        data,
+        chunk_size=100000,
+        n_jobs=1,
+        method="predict",
+        output_path=None,
+    ):
+        """Make predictions on data too large to transform in one pass, a chunk of rows at a time.
+
+        Only ``chunk_size`` rows, and the features the pipeline computes from them, are held in memory by each worker at once.
+        Each chunk's results are typed independently, in the same way ``predict`` types its output.
+
+        Args:
+            data (pd.DataFrame, iterable, str): A DataFrame, an iterable of DataFrames or of any other input ``predict`` accepts, or the path
+                to a CSV or Parquet file. Reading Parquet files requires pyarrow.
+            chunk_size (int): Largest number of rows to predict on at once. Larger DataFrames are split. Defaults to 100000.
+            n_jobs (int): Number of processes to predict with. -1 uses all CPUs. Defaults to 1, which predicts in the calling process.
+            method (str): Either "predict" or "predict_proba". Defaults to "predict".
+            output_path (str): If given, the results are written to this Parquet file as they are computed instead of being yielded.
+                Writing Parquet files requires pyarrow. Defaults to None.
+
+        Returns:
+            generator or str: A generator yielding the results for each chunk in order, or output_path once all results have been written.
+
+        Raises:
+            ValueError: If chunk_size is not positive or method is not "predict" or "predict_proba".
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+        if method not in ["predict", "predict_proba"]:
+            raise ValueError(
+                f"method must be 'predict' or 'predict_proba', not {method!r}",
+            )
+        results = self._iter_batch_results(
+            _iter_chunks(data, chunk_size),
+            joblib.effective_n_jobs(n_jobs),
+            method,
+        )
+        if output_path is None:
+            return results
+        _write_parquet(results, output_path)
+        return output_path
+
+    def _iter_batch_results(self, chunks, n_jobs, method):
+        """Yields the results of `method` on each chunk in order, keeping at most two chunks per process in flight."""
+        if n_jobs == 1:
+            for chunk in chunks:
+                yield getattr(self, method)(chunk)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_set_worker_pipeline,
+            initargs=(self,),
+        ) as executor:
+            running = deque()
+            for chunk in chunks:
+                if len(running) >= 2 * n_jobs:
+                    yield _result_with_schema(*running.popleft().result())
+                running.append(executor.submit(_predict_chunk_in_worker, chunk, method))
+            while running:
+                yield _result_with_schema(*running.popleft().result())
+
+    def __repr__(self):
+        """String representation of the compiled pipeline."""
+        return f"CompiledPipeline({self._pipeline!r})"
+
+
+_worker_pipeline = None
+
+
+def _set_worker_pipeline(compiled_pipeline):
+    """Stores the compiled pipeline in a worker process, so that it is sent to each worker once rather than with every chunk."""
+    global _worker_pipeline
+    _worker_pipeline = compiled_pipeline
+
+
+def _predict_chunk_in_worker(chunk, method):
+    """Predicts on a chunk in a worker process.
+
+    Woodwork schemas are not kept when data is pickled back to the calling process, so the result's schema is returned separately.
+
+    Returns:
+        tuple(pd.Series or pd.DataFrame, ww.ColumnSchema or ww.TableSchema): The result and its Woodwork schema.
+    """
+    result = getattr(_worker_pipeline, method)(chunk)
+    return result, result.ww.schema
+
+
+def _result_with_schema(result, schema):
+    result.ww.init(schema=schema)
+    return result
+
+
+def _iter_chunks(data, chunk_size):
+    """Yields the rows of data in chunks of at most chunk_size rows."""
+    if isinstance(data, (str, os.PathLike)):
+        path = os.fspath(data)
+        if path.endswith((".parquet", ".pq")):
+            pq = import_or_raise(
+                "pyarrow.parquet",
+                error_msg="pyarrow is required to read Parquet files",
+            )
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(path, chunksize=chunk_size)
+    elif isinstance(data, pd.DataFrame):
+        for start in range(0, len(data), chunk_size):
+            yield data.iloc[start : start + chunk_size]
+    else:
+        for chunk in data:
+            if isinstance(chunk, pd.DataFrame):
+                yield from _iter_chunks(chunk, chunk_size)
+            else:
+                yield chunk
+
+
+def _write_parquet(results, output_path):
+    """Appends each result to a Parquet file as it is computed."""
+    pa = import_or_raise(
+        "pyarrow", error_msg="pyarrow is required to write Parquet files"
+    )
+    pq = import_or_raise(
+        "pyarrow.parquet",
+        error_msg="pyarrow is required to write Parquet files",
+    )
+    writer = None
+    try:
+        for result in results:
+            if isinstance(result, pd.Series):
+                result = result.to_frame(
+                    result.name if result.name is not None else "prediction",
+                )
+            # Categories can differ from chunk to chunk, so write the values rather than dictionary-encoded columns
+            result = pd.DataFrame(
+                {
+                    str(column): values.astype(values.cat.categories.dtype)
+                    if isinstance(values.dtype, pd.CategoricalDtype)
+                    else values
+                    for column, values in result.items()
+                },
+                index=result.index,
+            )
+            table = pa.Table.from_pandas(result, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(output_path, table.schema)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
@@ -1,6 +1,17 @@
 """Component graph for a pipeline as a directed acyclic graph (DAG)."""
 import inspect
+import time
+import tracemalloc
 import warnings
+import weakref
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
 
 import networkx as nx
 import pandas as pd
@@ -36,6 +47,12 @@ class ComponentGraph:
             {hash1: {component_name: trained_component, ...}, hash2: {...}, ...}.
             Defaults to None.
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        executor (str, concurrent.futures.Executor): How to evaluate components which do not depend on each other, such as separate
+            preprocessing branches or the input estimators of an ensemble. If None, components are evaluated one at a time in compute order.
+            If "threads" or "processes", each component is submitted to a thread or process pool as soon as its parents have finished. The pool
+            is created the first time it is needed and reused by every later call to fit, transform or predict until ``shutdown_executor``
+            is called or the graph is garbage collected. An existing executor can also be passed, in which case it is not shut down by the
+            graph, and is not kept when the graph is pickled. Results are the same as when evaluating sequentially. Defaults to None.
 
     Examples:
         >>> component_dict = {'Imputer': ['Imputer', 'X', 'y'],
@@ -82,8 +99,23 @@ class ComponentGraph:
 
     """
 
-    def __init__(self, component_dict=None, cached_data=None, random_seed=0):
+    def __init__(
+        self,
+        component_dict=None,
+        cached_data=None,
+        random_seed=0,
+        executor=None,
+    ):
         self.random_seed = random_seed
+        if not (
+            executor in [None, "threads", "processes"] or isinstance(executor, Executor)
+        ):
+            raise ValueError(
+                f"executor must be None, 'threads', 'processes' or a concurrent.futures.Executor, not {executor}",
+            )
+        self.executor = executor
+        self._pool = None
+        self._pool_finalizer = None
         self.component_dict = component_dict or {}
         if not isinstance(self.component_dict, dict):
             raise ValueError(
@@ -91,20 +123,70 @@ class ComponentGraph:
             )
         self._validate_component_dict()
         self.cached_data = cached_data
-        self.component_instances = {}
-        self._is_instantiated = False
-        for component_name, component_info in self.component_dict.items():
-            component_class = handle_component_class(component_info[0])
-            self.component_instances[component_name] = component_class
-
+        self._component_classes = {
+            component_name: handle_component_class(component_info[0])
+            for component_name, component_info in self.component_dict.items()
+        }
+        self._init_state()
         self._validate_component_dict_edges()
+        self._compute_order = self.generate_order(self.component_dict)
+        # What the component classes and compute order were worked out from, in case the component dictionary is changed in place
+        self._validated_component_dict = {
+            component_name: list(component_info)
+            for component_name, component_info in self.component_dict.items()
+        }
 
+    def _init_state(self):
+        """Resets the components to their classes and clears everything learned while fitting or predicting."""
+        self.component_instances = dict(self._component_classes)
+        self._is_instantiated = False
         self.input_feature_names = {}
         self._feature_provenance = {}
         self._feature_logical_types = {}
+        self._elided_components = []
         self._i = 0
-        self._compute_order = self.generate_order(self.component_dict)
         self._input_types = {}
+        self.profile_ = None
+        self._profile_records = None
+
+    def _copy_topology(self, cached_data=None, random_seed=0, executor=None):
+        """Constructs an uninstantiated graph with the same components and edges as this one.
+
+        The component dictionary, resolved component classes and compute order are shared with this graph rather than validated
+        and worked out again, which makes cloning pipelines cheap. If the component dictionary has been changed since this graph
+        was constructed, the new graph is constructed from scratch.
+
+        Args:
+            cached_data (dict): Cached data for the new graph. Defaults to None.
+            random_seed (int): Seed for the random number generator of the new graph. Defaults to 0.
+            executor (str, concurrent.futures.Executor): How the new graph evaluates independent components. Defaults to None.
+
+        Returns:
+            ComponentGraph: The new graph.
+        """
+        if (
+            # Graphs pickled by older versions of evalml
+            not hasattr(self, "_validated_component_dict")
+            or self.component_dict != self._validated_component_dict
+        ):
+            return self.__class__(
+                component_dict=self.component_dict,
+                cached_data=cached_data,
+                random_seed=random_seed,
+                executor=executor,
+            )
+        component_graph = self.__class__.__new__(self.__class__)
+        component_graph.random_seed = random_seed
+        component_graph.executor = executor
+        component_graph._pool = None
+        component_graph._pool_finalizer = None
+        component_graph.component_dict = self.component_dict
+        component_graph.cached_data = cached_data
+        component_graph._component_classes = self._component_classes
+        component_graph._compute_order = self._compute_order
+        component_graph._validated_component_dict = self._validated_component_dict
+        component_graph._init_state()
+        return component_graph
 
     def _validate_component_dict(self):
         for _, component_inputs in self.component_dict.items():
@@ -229,22 +311,153 @@ class ComponentGraph:
         self.component_instances = component_instances
         return self
 
-    def fit(self, X, y):
+    def fit(self, X, y, profile=False):
         """Fit each component in the graph.
 
         Args:
             X (pd.DataFrame): The input training data of shape [n_samples, n_features].
             y (pd.Series): The target training data of length [n_samples].
+            profile (bool): If True, record the wall time, CPU time, peak memory, input/output shapes, output size and retained output size of each component in ``profile_``. Defaults to False.
 
         Returns:
             self
         """
         X = infer_feature_types(X)
         y = infer_feature_types(y)
-        self._transform_features(self.compute_order, X, y, fit=True)
+        self._elided_components = []
+        with self._profiling(profile):
+            self._transform_features(self.compute_order, X, y, fit=True)
         self._feature_provenance = self._get_feature_provenance(X.columns)
         return self
 
+    def eliminate_dead_features(self):
+        """Stops fitted transformers from computing features that no downstream component uses.
+
+        Walks the graph backwards from the final component, working out which features each component actually needs.
+        Transformers then drop the fitted outputs nobody consumes, such as one-hot encoded columns or DFS features
+        discarded by a feature selector, so they are no longer computed on every call to transform or predict.
+        Features are only pruned when all their consumers select columns, since other components need every feature
+        they were fitted on. Predictions are unchanged.
+
+        Returns:
+            dict: Names of the components which were pruned mapped to the features they no longer compute.
+
+        Raises:
+            ValueError: If the component graph has not been fitted.
+        """
+        if any(
+            component_name not in self.input_feature_names
+            for component_name in self.compute_order
+        ):
+            raise ValueError(
+                "Cannot eliminate dead features before the component graph is fitted.",
+            )
+        used_features = {component_name: set() for component_name in self.compute_order}
+        dropped_features = {}
+        for component_name in reversed(self.compute_order):
+            component_instance = self.get_component(component_name)
+            input_feature_names = self.input_feature_names[component_name]
+            is_final = component_name == self.compute_order[-1]
+            if isinstance(component_instance, Transformer) and not is_final:
+                used = used_features[component_name]
+                dropped = component_instance._drop_unused_features(used)
+                if dropped:
+                    dropped_features[component_name] = dropped
+                needed = component_instance._input_features_used(
+                    input_feature_names,
+                    used,
+                )
+            else:
+                needed = input_feature_names
+            for parent_input in self.get_inputs(component_name):
+                if parent_input.endswith(".x"):
+                    used_features[parent_input[:-2]].update(needed)
+
+        for component_name, dropped in dropped_features.items():
+            for parent_input, child in self._get_edges(self.component_dict, "features"):
+                if parent_input != component_name:
+                    continue
+                self.input_feature_names[child] = [
+                    feature
+                    for feature in self.input_feature_names[child]
+                    if feature not in dropped
+                ]
+                if child in self._feature_logical_types:
+                    self._feature_logical_types[child] = {
+                        feature: logical_type
+                        for feature, logical_type in self._feature_logical_types[
+                            child
+                        ].items()
+                        if feature not in dropped
+                    }
+        if dropped_features:
+            self._feature_provenance = self._get_feature_provenance(
+                list(self._feature_provenance),
+            )
+        return dropped_features
+
+    def elide_noop_components(self, X):
+        """Elides fitted transformers which do nothing for the given data from the inference path.
+
+        Transformers such as an Imputer fitted on data without nulls, a ReplaceNullableTypes fitted on data without
+        nullable types or a DropNullColumns which drops no columns return their input unchanged. After this is called,
+        transform and predict pass the data straight through these components. Each elided component still checks the
+        data it receives and runs as usual when it would change it, for example to impute nulls not seen during fit.
+
+        Args:
+            X (pd.DataFrame): Data representative of what the graph will transform, usually the data it was fitted on.
+
+        Returns:
+            list(str): Names of the components elided from the inference path.
+
+        Raises:
+            ValueError: If the component graph has not been fitted.
+        """
+        if any(
+            component_name not in self.input_feature_names
+            for component_name in self.compute_order
+        ):
+            raise ValueError(
+                "Cannot elide components before the component graph is fitted.",
+            )
+        X = infer_feature_types(X)
+        self._elided_components = []
+        remaining_consumers, outputs_to_keep = self._get_output_consumers(
+            self.compute_order[:-1],
+        )
+        output_cache = {}
+        for component_name in self.compute_order[:-1]:
+            component_instance = self.get_component(component_name)
+            x_inputs, y_input = self._consolidate_inputs_for_component(
+                output_cache,
+                component_name,
+                X,
+                remaining_consumers=remaining_consumers,
+            )
+            self._release_inputs(output_cache, component_name, remaining_consumers)
+            if isinstance(
+                component_instance,
+                Transformer,
+            ) and component_instance._is_identity_transform(x_inputs, y_input):
+                self._elided_components.append(component_name)
+            _, outputs = _evaluate_component(
+                component_instance,
+                component_name,
+                x_inputs,
+                y_input,
+                fit=False,
+                is_final_component=False,
+                evaluate_training_only_components=False,
+                elided=component_name in self._elided_components,
+            )
+            self._store_outputs(
+                output_cache,
+                outputs,
+                remaining_consumers,
+                outputs_to_keep,
+            )
+        return list(self._elided_components)
+
     def fit_and_transform_all_but_final(self, X, y):
         """Fit and transform all components save the final one, usually an estimator.
 
@@ -310,14 +523,35 @@ class ComponentGraph:
         component,
         X,
         y=None,
+        remaining_consumers=None,
     ):
+        """Gathers the features and target a component receives from its parents.
+
+        A single parent's output is handed over as a shallow copy, sharing its data, only when no other component reads it
+        afterwards. X and outputs which other components still read are copied, so that a component changing its input in
+        place cannot change the user's data or another component's input.
+
+        Args:
+            component_outputs (dict): Outputs of the components evaluated so far.
+            component (str): Name of the component to gather the inputs of.
+            X (pd.DataFrame): The graph's input features.
+            y (pd.Series): The graph's input target. Defaults to None.
+            remaining_consumers (dict): Number of components, including this one, which still have to read each output, as
+                returned by ``_get_output_consumers``. Outputs missing from it are treated as read by other components as well.
+                Defaults to None, which means component_outputs are not read again after this component.
+
+        Returns:
+            tuple(pd.DataFrame, pd.Series): The features and target for the component.
+        """
         x_inputs = []
+        x_parents = []
         y_input = None
         for parent_input in self.get_inputs(component):
             if parent_input == "y":
                 y_input = y
             elif parent_input == "X":
                 x_inputs.append(X)
+                x_parents.append(parent_input)
             elif parent_input.endswith(".y"):
                 y_input = component_outputs[parent_input]
             elif parent_input.endswith(".x"):
@@ -325,15 +559,35 @@ class ComponentGraph:
                 if isinstance(parent_x, pd.Series):
                     parent_x = parent_x.rename(parent_input)
                 x_inputs.append(parent_x)
-        x_inputs = ww.concat_columns(x_inputs)
+                x_parents.append(parent_input)
+        if (
+            len(x_inputs) == 1
+            and isinstance(x_inputs[0], pd.DataFrame)
+            and x_inputs[0].ww.schema is not None
+        ):
+            # A single parent needs no concatenation. Share the parent's data only when nothing
+            # else will read it, so that changes the component makes in place cannot leak out.
+            parent_x = x_inputs[0]
+            last_consumer = x_parents[0] != "X" and (
+                remaining_consumers is None
+                or remaining_consumers.get(x_parents[0]) == 1
+            )
+            x_inputs = parent_x.copy(deep=not last_consumer)
+            x_inputs.ww.init_with_full_schema(
+                parent_x.ww.schema.get_subset_schema(list(parent_x.columns)),
+                validate=False,
+            )
+        else:
+            x_inputs = ww.concat_columns(x_inputs)
         return x_inputs, y_input
 
-    def transform(self, X, y=None):
+    def transform(self, X, y=None, profile=False):
         """Transform the input using the component graph.
 
         Args:
             X (pd.DataFrame): Input features of shape [n_samples, n_features].
             y (pd.Series): The target data of length [n_samples]. Defaults to None.
+            profile (bool): If True, record the wall time, CPU time, peak memory, input/output shapes, output size and retained output size of each component in ``profile_``. Defaults to False.
 
         Returns:
             pd.DataFrame: Transformed output.
@@ -350,24 +604,26 @@ class ComponentGraph:
                 "Cannot call transform() on a component graph because the final component is not a Transformer.",
             )
 
-        outputs = self._transform_features(
-            self.compute_order,
-            X,
-            y,
-            fit=False,
-            evaluate_training_only_components=True,
-        )
+        with self._profiling(profile):
+            outputs = self._transform_features(
+                self.compute_order,
+                X,
+                y,
+                fit=False,
+                evaluate_training_only_components=True,
+            )
         output_x = infer_feature_types(outputs.get(f"{final_component_name}.x"))
         output_y = outputs.get(f"{final_component_name}.y", None)
         if output_y is not None:
             return output_x, output_y
         return output_x
 
-    def predict(self, X):
+    def predict(self, X, profile=False):
         """Make predictions using selected features.
 
         Args:
             X (pd.DataFrame): Input features of shape [n_samples, n_features].
+            profile (bool): If True, record the wall time, CPU time, peak memory, input/output shapes, output size and retained output size of each component in ``profile_``. Defaults to False.
 
         Returns:
             pd.Series: Predicted values.
@@ -383,11 +639,12 @@ class ComponentGraph:
             raise ValueError(
                 "Cannot call predict() on a component graph because the final component is not an Estimator.",
             )
-        outputs = self._transform_features(
-            self.compute_order,
-            X,
-            evaluate_training_only_components=False,
-        )
+        with self._profiling(profile):
+            outputs = self._transform_features(
+                self.compute_order,
+                X,
+                evaluate_training_only_components=False,
+            )
         return infer_feature_types(outputs.get(f"{final_component}.x"))
 
     def _return_non_engineered_features(self, X):
@@ -398,6 +655,23 @@ class ComponentGraph:
         ]
         return X.ww[base_features]
 
+    def _validate_input_types(self, X):
+        """Raises a PipelineError if the types of X are different from the input types the graph was fitted on."""
+        X_schema = (
+            self._return_non_engineered_features(X).ww.schema
+            if "DFS Transformer" in self.compute_order
+            else X.ww.schema
+        )
+        if not _schema_is_equal(X_schema, self._input_types):
+            raise PipelineError(
+                "Input X data types are different from the input types the pipeline was fitted on.",
+                code=PipelineErrorCodeEnum.PREDICT_INPUT_SCHEMA_UNEQUAL,
+                details={
+                    "input_features_types": X_schema.types,
+                    "pipeline_features_types": self._input_types.types,
+                },
+            )
+
     def _transform_features(
         self,
         component_list,
@@ -416,27 +690,15 @@ class ComponentGraph:
             evaluate_training_only_components (boolean): Whether to evaluate training-only components (such as the samplers) during transform or predict. Defaults to False.
 
         Returns:
-            dict: Outputs from each component.
+            dict: Outputs of the graph's final component and of the components whose outputs are consumed by components outside component_list.
+                Other intermediate outputs are released as soon as the last component which consumes them has run, to keep peak memory down.
 
         Raises:
             PipelineError: if input data types are different from the input types the pipeline was fitted on
         """
         X = infer_feature_types(X)
         if not fit:
-            X_schema = (
-                self._return_non_engineered_features(X).ww.schema
-                if "DFS Transformer" in self.compute_order
-                else X.ww.schema
-            )
-            if not _schema_is_equal(X_schema, self._input_types):
-                raise PipelineError(
-                    "Input X data types are different from the input types the pipeline was fitted on.",
-                    code=PipelineErrorCodeEnum.PREDICT_INPUT_SCHEMA_UNEQUAL,
-                    details={
-                        "input_features_types": X_schema.types,
-                        "pipeline_features_types": self._input_types.types,
-                    },
-                )
+            self._validate_input_types(X)
         else:
             self._input_types = (
                 self._return_non_engineered_features(X).ww.schema
@@ -454,6 +716,23 @@ class ComponentGraph:
         if self.cached_data is not None:
             hashes = hash(tuple(X.index))
 
+        if (
+            self.executor is not None
+            and self._profile_records is None
+            and len(component_list) > 1
+        ):
+            return self._transform_features_in_executor(
+                component_list,
+                X,
+                y,
+                fit,
+                evaluate_training_only_components,
+                hashes,
+            )
+
+        remaining_consumers, outputs_to_keep = self._get_output_consumers(
+            component_list,
+        )
         output_cache = {}
         for component_name in component_list:
             component_instance = self._get_component_from_cache(
@@ -461,68 +740,235 @@ class ComponentGraph:
                 component_name,
                 fit,
             )
-            if not isinstance(component_instance, ComponentBase):
-                raise ValueError(
-                    "All components must be instantiated before fitting or predicting",
-                )
             x_inputs, y_input = self._consolidate_inputs_for_component(
                 output_cache,
                 component_name,
                 X,
                 y,
+                remaining_consumers=remaining_consumers,
             )
+            self._release_inputs(output_cache, component_name, remaining_consumers)
             self.input_feature_names.update({component_name: list(x_inputs.columns)})
             self._feature_logical_types[component_name] = x_inputs.ww.logical_types
-            if isinstance(component_instance, Transformer):
-                if fit:
-                    if component_instance._is_fitted:
-                        output = component_instance.transform(x_inputs, y_input)
-                    else:
-                        output = component_instance.fit_transform(x_inputs, y_input)
-                elif (
-                    component_instance.training_only
-                    and evaluate_training_only_components is False
-                ):
-                    output = x_inputs, y_input
-                else:
-                    output = component_instance.transform(x_inputs, y_input)
-
-                if isinstance(output, tuple):
-                    output_x, output_y = output[0], output[1]
-                else:
-                    output_x = output
-                    output_y = None
-                output_cache[f"{component_name}.x"] = output_x
-                output_cache[f"{component_name}.y"] = output_y
-            else:
-                if fit and not component_instance._is_fitted:
-                    component_instance.fit(x_inputs, y_input)
-                if fit and component_name == self.compute_order[-1]:
-                    # Don't call predict on the final component during fit
-                    output = None
-                elif component_name != self.compute_order[-1]:
-                    try:
-                        output = component_instance.predict_proba(x_inputs)
-                        if isinstance(output, pd.DataFrame):
-                            if len(output.columns) == 2:
-                                # If it is a binary problem, drop the first column since both columns are colinear
-                                output = output.ww.drop(output.columns[0])
-                            output = output.ww.rename(
-                                {
-                                    col: f"Col {str(col)} {component_name}.x"
-                                    for col in output.columns
-                                },
-                            )
-                    except MethodPropertyNotFoundError:
-                        output = component_instance.predict(x_inputs)
-                else:
-                    output = component_instance.predict(x_inputs)
-                output_cache[f"{component_name}.x"] = output
+            with self._profile_component(component_name, x_inputs) as profile_record:
+                component_instance, outputs = _evaluate_component(
+                    component_instance,
+                    component_name,
+                    x_inputs,
+                    y_input,
+                    fit=fit,
+                    is_final_component=component_name == self.compute_order[-1],
+                    evaluate_training_only_components=evaluate_training_only_components,
+                    elided=component_name in self._elided_components,
+                )
+                self._store_outputs(
+                    output_cache,
+                    outputs,
+                    remaining_consumers,
+                    outputs_to_keep,
+                )
+                profile_record["output"] = outputs[f"{component_name}.x"]
+                profile_record["output_cache"] = output_cache
             if self.cached_data is not None and fit:
                 self.component_instances[component_name] = component_instance
 
         return output_cache
 
+    def _transform_features_in_executor(
+        self,
+        component_list,
+        X,
+        y,
+        fit,
+        evaluate_training_only_components,
+        hashes,
+    ):
+        """Evaluates the given components in `executor`, submitting each one as soon as all of its parents have finished.
+
+        Inputs are gathered and bookkeeping is done on the calling thread, in compute order, so the outputs and fitted state
+        are the same as when evaluating sequentially.
+        """
+        waiting_on = {component_name: set() for component_name in component_list}
+        for parent, child in self._get_edges(self.component_dict):
+            if parent in waiting_on and child in waiting_on:
+                waiting_on[child].add(parent)
+
+        remaining_consumers, outputs_to_keep = self._get_output_consumers(
+            component_list,
+        )
+        output_cache = {}
+        input_feature_names = {}
+        feature_logical_types = {}
+        fitted_components = {}
+        not_submitted = list(component_list)
+        running = {}
+        executor = self._get_executor()
+        while not_submitted or running:
+            ready = [c for c in not_submitted if not waiting_on[c]]
+            for component_name in ready:
+                not_submitted.remove(component_name)
+                component_instance = self._get_component_from_cache(
+                    hashes,
+                    component_name,
+                    fit,
+                )
+                x_inputs, y_input = self._consolidate_inputs_for_component(
+                    output_cache,
+                    component_name,
+                    X,
+                    y,
+                    remaining_consumers=remaining_consumers,
+                )
+                self._release_inputs(
+                    output_cache,
+                    component_name,
+                    remaining_consumers,
+                )
+                input_feature_names[component_name] = list(x_inputs.columns)
+                feature_logical_types[component_name] = x_inputs.ww.logical_types
+                future = executor.submit(
+                    _evaluate_component_in_worker,
+                    component_instance,
+                    component_name,
+                    x_inputs,
+                    x_inputs.ww.schema,
+                    y_input,
+                    None if y_input is None else y_input.ww.schema,
+                    fit=fit,
+                    is_final_component=component_name == self.compute_order[-1],
+                    evaluate_training_only_components=evaluate_training_only_components,
+                    elided=component_name in self._elided_components,
+                )
+                running[future] = component_name
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                component_name = running.pop(future)
+                component_instance, outputs, output_schemas = future.result()
+                for output_name, schema in output_schemas.items():
+                    if outputs[output_name].ww.schema is None:
+                        outputs[output_name].ww.init(schema=schema)
+                self._store_outputs(
+                    output_cache,
+                    outputs,
+                    remaining_consumers,
+                    outputs_to_keep,
+                )
+                fitted_components[component_name] = component_instance
+                for parents in waiting_on.values():
+                    parents.discard(component_name)
+
+        for component_name in component_list:
+            self.input_feature_names[component_name] = input_feature_names[
+                component_name
+            ]
+            self._feature_logical_types[component_name] = feature_logical_types[
+                component_name
+            ]
+            if fit:
+                # Components evaluated in another process are fitted copies
+                self.component_instances[component_name] = fitted_components[
+                    component_name
+                ]
+        return output_cache
+
+    def _get_output_consumers(self, component_list):
+        """Works out how long each component output needs to be kept while evaluating component_list.
+
+        Args:
+            component_list (list): The names of the components being evaluated, in compute order.
+
+        Returns:
+            tuple(dict, set): The number of components in component_list which consume each output that can be released, and the outputs
+                which must be kept and returned: those of the graph's final component and those consumed by components outside component_list.
+        """
+        remaining_consumers = {}
+        outputs_to_keep = {
+            f"{self.compute_order[-1]}.x",
+            f"{self.compute_order[-1]}.y",
+        }
+        for component_name in self.compute_order:
+            for parent_input in self.get_inputs(component_name):
+                if parent_input in ["X", "y"]:
+                    continue
+                if component_name in component_list:
+                    remaining_consumers[parent_input] = (
+                        remaining_consumers.get(parent_input, 0) + 1
+                    )
+                else:
+                    outputs_to_keep.add(parent_input)
+        for output_name in outputs_to_keep:
+            remaining_consumers.pop(output_name, None)
+        return remaining_consumers, outputs_to_keep
+
+    def _release_inputs(self, output_cache, component_name, remaining_consumers):
+        """Drops the outputs a component has consumed from output_cache if no other component still needs them."""
+        for parent_input in self.get_inputs(component_name):
+            if parent_input not in remaining_consumers:
+                continue
+            remaining_consumers[parent_input] -= 1
+            if remaining_consumers[parent_input] == 0:
+                output_cache.pop(parent_input, None)
+
+    @staticmethod
+    def _store_outputs(output_cache, outputs, remaining_consumers, outputs_to_keep):
+        """Adds a component's outputs to output_cache, skipping those which no component will consume."""
+        for output_name, output in outputs.items():
+            if output_name in outputs_to_keep or remaining_consumers.get(output_name):
+                output_cache[output_name] = output
+
+    def _get_executor(self):
+        """Gets the executor used to evaluate independent components, creating the graph's pool the first time it is needed."""
+        if isinstance(self.executor, Executor):
+            return self.executor
+        if getattr(self, "_pool", None) is None:
+            pool_class = (
+                ThreadPoolExecutor
+                if self.executor == "threads"
+                else ProcessPoolExecutor
+            )
+            self._pool = pool_class()
+            # Shut the pool down when the graph is garbage collected without shutdown_executor being called
+            self._pool_finalizer = weakref.finalize(self, self._pool.shutdown, False)
+        return self._pool
+
+    def shutdown_executor(self, wait=True):
+        """Shuts down the thread or process pool the graph created to evaluate independent components, if there is one.
+
+        A new pool is created the next time one is needed. Executors passed to the graph are not shut down.
+
+        Args:
+            wait (bool): Whether to wait for running components to finish before returning. Defaults to True.
+        """
+        if getattr(self, "_pool", None) is None:
+            return
+        self._pool_finalizer.detach()
+        self._pool.shutdown(wait=wait)
+        self._pool = None
+        self._pool_finalizer = None
+
+    def __getstate__(self):
+        """Gets the state to pickle, leaving out the executor's pool, which cannot be pickled."""
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_pool_finalizer"] = None
+        if isinstance(self.executor, Executor):
+            state["executor"] = None
+        return state
+
+    def __setstate__(self, state):
+        """Restores a pickled graph, filling in attributes which graphs pickled by older versions of evalml do not have."""
+        self.__dict__.update(state)
+        for attribute, default in [
+            ("executor", None),
+            ("_pool", None),
+            ("_pool_finalizer", None),
+            ("profile_", None),
+            ("_profile_records", None),
+            ("_elided_components", []),
+        ]:
+            if not hasattr(self, attribute):
+                setattr(self, attribute, default)
+
     def _get_component_from_cache(self, hashes, component_name, fit):
         """Gets either the stacked ensemble component or the component from component_instances."""
         component_instance = self.get_component(component_name)
@@ -533,6 +979,102 @@ class ComponentGraph:
                 pass
         return component_instance
 
+    @contextmanager
+    def _profiling(self, enabled=True):
+        """Records per-component resource usage into `profile_` for every component evaluated while active.
+
+        Nested calls reuse the outermost profile, so a pipeline method that calls several component graph methods yields a single profile.
+
+        Args:
+            enabled (bool): Whether to profile. If False or if a profile is already being recorded, this is a no-op. Defaults to True.
+        """
+        if not enabled or self._profile_records is not None:
+            yield
+            return
+        self._profile_records = {}
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            yield
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            self.profile_ = pd.DataFrame.from_dict(
+                self._profile_records,
+                orient="index",
+                columns=[
+                    "wall_time",
+                    "cpu_time",
+                    "peak_memory",
+                    "input_shape",
+                    "output_shape",
+                    "output_memory",
+                    "retained_memory",
+                    "n_calls",
+                ],
+            )
+            self._profile_records = None
+
+    @contextmanager
+    def _profile_component(self, component_name, x_inputs):
+        """Measures a single component evaluation if a profile is being recorded.
+
+        Yields a dictionary in which the caller should store the component's result under "output" so that its shape and size can be recorded,
+        and the cache of outputs still held once the component has run under "output_cache" so that the memory retained by the graph can be recorded.
+
+        Args:
+            component_name (str): Name of the component being evaluated.
+            x_inputs (pd.DataFrame): Features passed to the component.
+        """
+        profile_record = {}
+        if self._profile_records is None:
+            yield profile_record
+            return
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        memory_start, _ = tracemalloc.get_traced_memory()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        yield profile_record
+        cpu_time = time.process_time() - cpu_start
+        wall_time = time.perf_counter() - wall_start
+        _, memory_peak = tracemalloc.get_traced_memory()
+
+        output = profile_record.get("output")
+        if isinstance(output, tuple):
+            output = output[0]
+        retained_outputs = {
+            id(cached): cached
+            for cached in profile_record.get("output_cache", {}).values()
+            if cached is not None
+        }
+        record = self._profile_records.setdefault(
+            component_name,
+            {
+                "wall_time": 0.0,
+                "cpu_time": 0.0,
+                "peak_memory": 0,
+                "output_memory": 0,
+                "retained_memory": 0,
+                "n_calls": 0,
+            },
+        )
+        record["wall_time"] += wall_time
+        record["cpu_time"] += cpu_time
+        record["peak_memory"] = max(
+            record["peak_memory"],
+            max(memory_peak - memory_start, 0),
+        )
+        record["input_shape"] = getattr(x_inputs, "shape", None)
+        record["output_shape"] = getattr(output, "shape", None)
+        record["output_memory"] = max(record["output_memory"], _memory_usage(output))
+        record["retained_memory"] = max(
+            record["retained_memory"],
+            sum(_memory_usage(cached) for cached in retained_outputs.values()),
+        )
+        record["n_calls"] += 1
+
     def _get_feature_provenance(self, input_feature_names):
         """Get the feature provenance for each feature in the input_feature_names.
 
@@ -733,19 +1275,25 @@ class ComponentGraph:
         if return_dict:
             return components
 
-    def graph(self, name=None, graph_format=None):
+    def graph(self, name=None, graph_format=None, show_profile=False):
         """Generate an image representing the component graph.
 
         Args:
             name (str): Name of the graph. Defaults to None.
             graph_format (str): file format to save the graph in. Defaults to None.
+            show_profile (bool): If True, annotate each component with the wall time and peak memory recorded in ``profile_``. Defaults to False.
 
         Returns:
             graphviz.Digraph: Graph object that can be directly displayed in Jupyter notebooks.
 
         Raises:
             RuntimeError: If graphviz is not installed.
+            ValueError: If show_profile is True but no profile has been recorded.
         """
+        if show_profile and self.profile_ is None:
+            raise ValueError(
+                "No profile has been recorded. Call fit, transform or predict with profile=True first.",
+            )
         graphviz = import_or_raise(
             "graphviz",
             error_msg="Please install graphviz to visualize pipelines.",
@@ -780,6 +1328,12 @@ class ComponentGraph:
                     ],
                 )  # noqa: W605
                 label = "%s |%s\l" % (component_name, parameters)  # noqa: W605
+            if show_profile and component_name in self.profile_.index:
+                component_profile = self.profile_.loc[component_name]
+                label += r"|wall time : {:0.4f}s\lpeak memory : {:0.2f} MB\l".format(
+                    component_profile["wall_time"],
+                    component_profile["peak_memory"] / 1e6,
+                )
             graph.node(component_name, shape="record", label=label, nodesep="0.03")
 
         graph.node("X", shape="circle", label="X")
@@ -955,3 +1509,135 @@ class ComponentGraph:
                 has_incoming_y_from_parent = False
 
         return data_to_transform
+
+
+def _evaluate_component(
+    component_instance,
+    component_name,
+    x_inputs,
+    y_input,
+    fit,
+    is_final_component,
+    evaluate_training_only_components,
+    elided=False,
+):
+    """Fits and/or evaluates a single component of a component graph.
+
+    Args:
+        component_instance (ComponentBase): The component to evaluate.
+        component_name (str): Name of the component in the graph.
+        x_inputs (pd.DataFrame): Features for the component.
+        y_input (pd.Series): Target for the component.
+        fit (bool): Whether to fit the component if it has not been fitted yet.
+        is_final_component (bool): Whether the component is the last one in the graph.
+        evaluate_training_only_components (bool): Whether to evaluate training-only components when not fitting.
+        elided (bool): Whether the component was elided from the inference path. Elided transformers pass their inputs
+            through unchanged whenever they would not modify them. Defaults to False.
+
+    Returns:
+        tuple(ComponentBase, dict): The component and its outputs, keyed by "{component_name}.x" and, for transformers, "{component_name}.y".
+
+    Raises:
+        ValueError: If the component has not been instantiated.
+    """
+    if not isinstance(component_instance, ComponentBase):
+        raise ValueError(
+            "All components must be instantiated before fitting or predicting",
+        )
+    if isinstance(component_instance, Transformer):
+        if fit:
+            if component_instance._is_fitted:
+                output = component_instance.transform(x_inputs, y_input)
+            else:
+                output = component_instance.fit_transform(x_inputs, y_input)
+        elif (
+            component_instance.training_only
+            and evaluate_training_only_components is False
+        ):
+            output = x_inputs, y_input
+        elif elided and component_instance._is_identity_transform(x_inputs, y_input):
+            output = x_inputs, y_input
+        else:
+            output = component_instance.transform(x_inputs, y_input)
+
+        if isinstance(output, tuple):
+            output_x, output_y = output[0], output[1]
+        else:
+            output_x = output
+            output_y = None
+        return component_instance, {
+            f"{component_name}.x": output_x,
+            f"{component_name}.y": output_y,
+        }
+
+    if fit and not component_instance._is_fitted:
+        component_instance.fit(x_inputs, y_input)
+    if fit and is_final_component:
+        # Don't call predict on the final component during fit
+        output = None
+    elif not is_final_component:
+        try:
+            output = component_instance.predict_proba(x_inputs)
+            if isinstance(output, pd.DataFrame):
+                if len(output.columns) == 2:
+                    # If it is a binary problem, drop the first column since both columns are colinear
+                    output = output.ww.drop(output.columns[0])
+                output = output.ww.rename(
+                    {
+                        col: f"Col {str(col)} {component_name}.x"
+                        for col in output.columns
+                    },
+                )
+        except MethodPropertyNotFoundError:
+            output = component_instance.predict(x_inputs)
+    else:
+        output = component_instance.predict(x_inputs)
+    return component_instance, {f"{component_name}.x": output}
+
+
+def _evaluate_component_in_worker(
+    component_instance,
+    component_name,
+    x_inputs,
+    x_schema,
+    y_input,
+    y_schema,
+    fit=False,
+    **kwargs,
+):
+    """Runs `_evaluate_component` in an executor.
+
+    Woodwork schemas are not kept when data is pickled to and from another process, so they are passed and returned separately.
+    The component is only returned when it was fitted, so that predicting does not send it back from another process.
+
+    Returns:
+        tuple(ComponentBase, dict, dict): The fitted component, or None if not fitting, its outputs and the Woodwork schemas of its outputs.
+    """
+    if x_inputs.ww.schema is None:
+        x_inputs.ww.init(schema=x_schema)
+    if y_input is not None and y_input.ww.schema is None:
+        y_input.ww.init(schema=y_schema)
+    component_instance, outputs = _evaluate_component(
+        component_instance,
+        component_name,
+        x_inputs,
+        y_input,
+        fit=fit,
+        **kwargs,
+    )
+    output_schemas = {
+        output_name: output.ww.schema
+        for output_name, output in outputs.items()
+        if isinstance(output, (pd.DataFrame, pd.Series))
+        and output.ww.schema is not None
+    }
+    return component_instance if fit else None, outputs, output_schemas
+
+
+def _memory_usage(data):
+    """Number of bytes used by a component output, or 0 if it is not a DataFrame or Series."""
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(deep=True).sum())
+    if isinstance(data, pd.Series):
+        return int(data.memory_usage(deep=True))
+    return 0
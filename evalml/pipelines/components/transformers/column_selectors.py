@@ -90,6 +90,10 @@ class DropColumns(ColumnSelector):
         column_intersection = list(set(cols).intersection(X.columns))
         return X.ww.drop(column_intersection)
 
+    def _input_features_used(self, input_feature_names, used_features):
+        cols = self.parameters.get("columns") or []
+        return [col for col in input_feature_names if col not in cols]
+
     def transform(self, X, y=None):
         """Transforms data X by dropping columns.
 
@@ -137,6 +141,10 @@ class SelectColumns(ColumnSelector):
         )
         return X.ww[column_intersection]
 
+    def _input_features_used(self, input_feature_names, used_features):
+        cols = self.parameters.get("columns") or []
+        return [col for col in input_feature_names if col in cols]
+
 
 class SelectByType(Transformer):
     """Selects columns by specified Woodwork logical type or semantic tag in input data.
@@ -88,6 +88,7 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
         )
         self._initial_state = self.random_seed
         self._provenance = {}
+        self._unused_features = []
 
     @staticmethod
     def _get_cat_cols(X):
@@ -125,6 +126,7 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
 
         X_t = self._handle_parameter_handle_missing(X_t)
         self._binary_values_to_drop = []
+        self._unused_features = []
 
         if len(self.features_to_encode) == 0:
             categories = "auto"
@@ -189,14 +191,23 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
 
         X = X.ww.drop(columns=self.features_to_encode)
 
+        if len(self.features_to_encode) > 0 and self._can_encode_used_categories():
+            X_cat = self._encode_used_categories(X_copy)
+            X_cat.ww.init(logical_types={c: "Boolean" for c in X_cat.columns})
+            self._feature_names = X_cat.columns
+
+            X = ww.utils.concat_columns([X, X_cat])
         # Call sklearn's transform on the categorical columns
-        if len(self.features_to_encode) > 0:
+        elif len(self.features_to_encode) > 0:
             X_cat = pd.DataFrame(
                 self._encoder.transform(X_copy[self.features_to_encode]).toarray(),
                 index=X_copy.index,
             )
             X_cat.columns = self._get_feature_names()
-            X_cat.drop(columns=self._features_to_drop, inplace=True)
+            X_cat.drop(
+                columns=self._features_to_drop + self._unused_features,
+                inplace=True,
+            )
             X_cat.ww.init(logical_types={c: "Boolean" for c in X_cat.columns})
             self._feature_names = X_cat.columns
 
@@ -204,6 +215,28 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
 
         return X
 
+    def _can_encode_used_categories(self):
+        """Whether to build the encoded columns still in use directly instead of encoding every category with scikit-learn.
+
+        Only done once some encoded columns are unused, and not when unknown categories must raise an error.
+        """
+        return bool(self._unused_features) and (
+            self.parameters["handle_unknown"] == "ignore"
+        )
+
+    def _encode_used_categories(self, X):
+        """Builds only the one-hot encoded columns which are still in use, comparing each feature to their categories."""
+        self._get_feature_names()
+        not_used = set(self._features_to_drop + self._unused_features)
+        return pd.DataFrame(
+            {
+                name: (X[col] == category).to_numpy(dtype=bool)
+                for col, category, name in self._encoded_columns
+                if name not in not_used
+            },
+            index=X.index,
+        )
+
     def _handle_parameter_handle_missing(self, X):
         """Helper method to handle the `handle_missing` parameter."""
         cat_cols = self.features_to_encode
@@ -267,6 +300,7 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
             np.ndarray: The feature names after encoding, provided in the same order as input_features.
         """
         self._features_to_drop = []
+        self._encoded_columns = []
         unique_names = []
         seen_before = set([])
         provenance = {}
@@ -291,12 +325,16 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
                     encoded_features_to_drop.append(proposed_name)
 
                 unique_names.append(proposed_name)
+                self._encoded_columns.append((col, category, proposed_name))
                 unique_encoded_columns.append(proposed_name)
                 seen_before.add(proposed_name)
             self._features_to_drop.extend(encoded_features_to_drop)
             unique_encoded_columns_without_dropped = unique_encoded_columns
             for feature_to_drop in encoded_features_to_drop:
                 unique_encoded_columns_without_dropped.remove(feature_to_drop)
+            for feature_to_drop in self._unused_features:
+                if feature_to_drop in unique_encoded_columns_without_dropped:
+                    unique_encoded_columns_without_dropped.remove(feature_to_drop)
             provenance[col] = unique_encoded_columns_without_dropped
         self._provenance = provenance
         return unique_names
@@ -314,9 +352,18 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
             np.ndarray: The feature names after encoding, provided in the same order as input_features.
         """
         feature_names = self._get_feature_names()
-        for feature_name in self._features_to_drop:
+        for feature_name in self._features_to_drop + self._unused_features:
             feature_names.remove(feature_name)
         return feature_names
 
     def _get_feature_provenance(self):
         return self._provenance
+
+    def _drop_unused_features(self, used_features):
+        if not self.features_to_encode:
+            return []
+        self._unused_features += [
+            name for name in self.get_feature_names() if name not in used_features
+        ]
+        self._get_feature_names()
+        return list(self._unused_features)
@@ -31,6 +31,21 @@ class FeatureSelector(Transformer):
             if selected
         ]
 
+    def fit(self, X, y=None):
+        """Fits the feature selector.
+
+        Args:
+            X (pd.DataFrame): The input training data of shape [n_samples, n_features].
+            y (pd.Series, optional): The target training data of length [n_samples].
+
+        Returns:
+            self
+        """
+        X = infer_feature_types(X)
+        self.input_feature_names = list(X.columns)
+        self._discarded_inputs_pruned = False
+        return super().fit(X, y)
+
     def transform(self, X, y=None):
         """Transforms input data by selecting features. If the component_obj does not have a transform method, will raise an MethodPropertyNotFoundError exception.
 
@@ -45,6 +60,14 @@ class FeatureSelector(Transformer):
             MethodPropertyNotFoundError: If feature selector does not have a transform method or a component_obj that implements transform
         """
         X_ww = infer_feature_types(X)
+        if getattr(self, "_discarded_inputs_pruned", False) and set(X_ww.columns) < set(
+            self.input_feature_names,
+        ):
+            # Dead feature elimination may have pruned the features the selector discards from its input,
+            # in which case the selected features can be taken directly.
+            selected_col_names = self.get_names()
+            if set(selected_col_names).issubset(X_ww.columns):
+                return X_ww.ww[selected_col_names]
         self.input_feature_names = list(X_ww.columns.values)
 
         try:
@@ -70,3 +93,11 @@ class FeatureSelector(Transformer):
             pd.DataFrame: Transformed data.
         """
         return self.fit(X, y).transform(X, y)
+
+    def _input_features_used(self, input_feature_names, used_features):
+        return self.get_names()
+
+    def _drop_unused_features(self, used_features):
+        # Upstream transformers may now stop computing the features this selector discards
+        self._discarded_inputs_pruned = True
+        return []
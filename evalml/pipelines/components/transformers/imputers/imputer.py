@@ -174,3 +174,18 @@ class Imputer(Transformer):
             X_no_all_null[X_boolean.columns] = imputed
 
         return X_no_all_null
+
+    def _is_identity_transform(self, X, y=None):
+        if self._all_null_cols or X.isnull().values.any():
+            return False
+        X = infer_feature_types(X)
+        # Without nulls, the imputers still cast nullable integers to doubles under mean and median
+        # and categorical columns holding only booleans to bool, which changes the output schema.
+        if self.parameters["numeric_impute_strategy"] in ["mean", "median"] and len(
+            X.ww.select(["IntegerNullable"], return_schema=True).columns,
+        ):
+            return False
+        return not any(
+            is_categorical_actually_boolean(X, col)
+            for col in X.ww.select(["category"], return_schema=True).columns
+        )
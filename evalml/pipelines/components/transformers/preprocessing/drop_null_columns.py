@@ -66,3 +66,6 @@ class DropNullColumns(Transformer):
         if len(self._cols_to_drop) == 0:
             return X_t
         return X_t.ww.drop(self._cols_to_drop)
+
+    def _is_identity_transform(self, X, y=None):
+        return not self._cols_to_drop
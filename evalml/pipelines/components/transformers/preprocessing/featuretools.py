@@ -2,7 +2,10 @@
 from featuretools import EntitySet, calculate_feature_matrix, dfs
 from featuretools.feature_base import IdentityFeature
 
-from evalml.pipelines.components.transformers.transformer import Transformer
+from evalml.pipelines.components.transformers.transformer import (
+    Transformer,
+    _drop_unused_featuretools_features,
+)
 from evalml.utils import infer_feature_types
 
 
@@ -96,6 +99,8 @@ class DFSTransformer(Transformer):
                 features_only=True,
                 max_depth=1,
             )
+        else:
+            self.features = self.parameters["features"]
         return self
 
     def transform(self, X, y=None):
@@ -128,3 +133,12 @@ class DFSTransformer(Transformer):
         partial_schema.metadata = {}
         feature_matrix.ww.init(schema=partial_schema)
         return feature_matrix
+
+    def _drop_unused_features(self, used_features):
+        if not self.features:
+            return []
+        self.features, dropped = _drop_unused_featuretools_features(
+            self.features,
+            used_features,
+        )
+        return dropped
@@ -6,6 +6,9 @@ from featuretools.primitives import NumCharacters, NumWords
 from nlp_primitives import DiversityScore, MeanCharactersPerWord, PolarityScore
 
 from evalml.pipelines.components.transformers.preprocessing import LSA, TextTransformer
+from evalml.pipelines.components.transformers.transformer import (
+    _drop_unused_featuretools_features,
+)
 from evalml.utils import infer_feature_types
 
 
@@ -167,6 +170,14 @@ class NaturalLanguageFeaturizer(TextTransformer):
             return {}
         provenance = self._get_primitives_provenance(self._features)
         for col, lsa_features in self._lsa._get_feature_provenance().items():
-            if col in provenance:
-                provenance[col] += lsa_features
+            provenance.setdefault(col, []).extend(lsa_features)
         return provenance
+
+    def _drop_unused_features(self, used_features):
+        if not self._text_columns:
+            return []
+        self._features, dropped = _drop_unused_featuretools_features(
+            self._features,
+            used_features,
+        )
+        return dropped
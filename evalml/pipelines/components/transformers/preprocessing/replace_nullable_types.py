@@ -105,3 +105,10 @@ class ReplaceNullableTypes(Transformer):
         else:
             y_ww = y
         return self.fit(X_ww, y_ww).transform(X_ww, y_ww)
+
+    def _is_identity_transform(self, X, y=None):
+        return (
+            not self._nullable_int_cols
+            and not self._nullable_bool_cols
+            and (y is None or self._nullable_target is None)
+        )
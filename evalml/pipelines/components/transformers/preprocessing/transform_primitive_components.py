@@ -4,7 +4,10 @@ from abc import abstractmethod
 import featuretools as ft
 import woodwork as ww
 
-from evalml.pipelines.components.transformers.transformer import Transformer
+from evalml.pipelines.components.transformers.transformer import (
+    Transformer,
+    _drop_unused_featuretools_features,
+)
 from evalml.utils import infer_feature_types
 
 
@@ -109,6 +112,15 @@ class _ExtractFeaturesWithTransformPrimitives(Transformer):
             provenance = self._get_primitives_provenance(self._features)
         return provenance
 
+    def _drop_unused_features(self, used_features):
+        if not self._features:
+            return []
+        self._features, dropped = _drop_unused_featuretools_features(
+            self._features,
+            used_features,
+        )
+        return dropped
+
 
 class EmailFeaturizer(_ExtractFeaturesWithTransformPrimitives):
     """Transformer that can automatically extract features from emails.
@@ -68,3 +68,42 @@ class Transformer(ComponentBase):
 
     def _get_feature_provenance(self):
         return {}
+
+    def _is_identity_transform(self, X, y=None):
+        """Returns whether the fitted transformer would return X and y unchanged. By default transformers are assumed to modify their input."""
+        return False
+
+    def _input_features_used(self, input_feature_names, used_features):
+        """Returns the input features this transformer needs to compute the outputs in used_features. By default every input is needed."""
+        return list(input_feature_names)
+
+    def _drop_unused_features(self, used_features):
+        """Stops computing the fitted outputs which are not in used_features. Returns the names of the outputs which were dropped."""
+        return []
+
+
+def _drop_unused_featuretools_features(features, used_features):
+    """Splits featuretools feature definitions into those computing any of used_features and those computing none of them.
+
+    If none of the features is used, all of them are kept, since featurizers left without any features skip their transform entirely.
+
+    Args:
+        features (list): Featuretools feature definitions.
+        used_features (set): Names of the output features which are used.
+
+    Returns:
+        tuple(list, list): The feature definitions to keep, and the names of the outputs of the ones to drop.
+    """
+    is_used = [
+        any(name in used_features for name in feature.get_feature_names())
+        for feature in features
+    ]
+    if not any(is_used):
+        return features, []
+    dropped = [
+        name
+        for feature, used in zip(features, is_used)
+        if not used
+        for name in feature.get_feature_names()
+    ]
+    return [feature for feature, used in zip(features, is_used) if used], dropped
@@ -31,6 +31,31 @@ def all_components():
     return _all_estimators() + _all_transformers()
 
 
+_component_registry = {"components": None, "names": {}}
+
+
+def _clear_component_registry():
+    """Forgets the name to class mapping of components, so that it is built again on the next lookup."""
+    _component_registry["components"] = None
+    _component_registry["names"] = {}
+
+
+def _components_by_name(refresh=False):
+    """Name to class mapping of all available components.
+
+    The mapping is built on first use and only checked against the available components again when refresh is True.
+    """
+    if _component_registry["components"] is not None and not refresh:
+        return _component_registry["names"]
+    components = tuple(all_components())
+    if _component_registry["components"] != components:
+        _component_registry["components"] = components
+        _component_registry["names"] = {
+            component.name: component for component in components
+        }
+    return _component_registry["names"]
+
+
 def allowed_model_families(problem_type):
     """List the model types allowed for a particular problem type.
 
@@ -154,7 +179,10 @@ def handle_component_class(component_class):
                 "component_class may only contain str or ComponentBase subclasses, not '{}'"
             ).format(type(component_class)),
         )
-    component_classes = {component.name: component for component in all_components()}
+    component_classes = _components_by_name()
+    if component_class not in component_classes:
+        # The component may have been defined since the registry was built
+        component_classes = _components_by_name(refresh=True)
     if component_class not in component_classes:
         raise MissingComponentError(
             'Component "{}" was not found'.format(component_class),
@@ -0,0 +1,332 @@
+"""Execution plan which evaluates several fitted pipelines together, computing each distinct fitted component only once."""
+import hashlib
+import pickle
+from collections import Counter, defaultdict
+
+from evalml.pipelines.component_graph import _evaluate_component
+from evalml.pipelines.components import Transformer
+from evalml.problem_types import is_classification, is_time_series
+from evalml.utils import infer_feature_types
+
+
+class PipelineExecutionPlan:
+    """Merges the component graphs of several fitted pipelines into one graph and evaluates it once to get every pipeline's predictions.
+
+    Pipelines found by the same search often share their preprocessing: an Imputer, a One Hot Encoder and so on, fitted with the
+    same parameters on the same data. Fitted transformers are identified by a fingerprint of their fitted state and by the
+    components their inputs come from, so a transformer which appears in several pipelines, or several times in one ensemble
+    pipeline, is only evaluated once per call and its output is shared by all the components that consume it. Estimators are
+    always evaluated separately.
+
+    Useful for scoring a leaderboard of pipelines on the same holdout data or serving several models side by side.
+
+    Args:
+        pipelines (list(PipelineBase)): Fitted pipelines to evaluate. Pipeline names must be unique.
+
+    Raises:
+        ValueError: If pipeline names are not unique, a pipeline is not fitted or a pipeline is a time series pipeline.
+    """
+
+    def __init__(self, pipelines):
+        names = [pipeline.name for pipeline in pipelines]
+        if len(set(names)) != len(names):
+            raise ValueError("All pipeline names must be unique.")
+        for pipeline in pipelines:
+            if not pipeline._is_fitted:
+                raise ValueError(
+                    f"Pipeline {pipeline.name} must be fitted before it is added to an execution plan.",
+                )
+            if is_time_series(pipeline.problem_type):
+                raise ValueError(
+                    "Time series pipelines cannot be added to an execution plan because their predictions depend on the training data.",
+                )
+        self.pipelines = list(pipelines)
+        self._fingerprints = _fit_fingerprints(
+            [
+                pipeline.component_graph.get_component(component_name)
+                for pipeline in self.pipelines
+                for component_name in pipeline.component_graph.compute_order[:-1]
+            ],
+        )
+        self._nodes = []
+        self._estimator_inputs = []
+        self._n_nodes_before = []
+        node_indices = {}
+        for pipeline in self.pipelines:
+            component_graph = pipeline.component_graph
+            final_component_name = component_graph.compute_order[-1]
+            local_nodes = {}
+            for component_name in component_graph.compute_order:
+                parents = {
+                    parent_input: (local_nodes[parent_input[:-2]], parent_input[-1])
+                    for parent_input in component_graph.get_inputs(component_name)
+                    if parent_input.endswith((".x", ".y"))
+                }
+                if component_name == final_component_name:
+                    self._estimator_inputs.append(parents)
+                    break
+                component_instance = component_graph.get_component(component_name)
+                elided = component_name in component_graph._elided_components
+                node_key = self._node_key(
+                    component_graph,
+                    component_name,
+                    component_instance,
+                    parents,
+                    elided,
+                )
+                if node_key is None or node_key not in node_indices:
+                    self._nodes.append(
+                        _PlanNode(
+                            component_graph,
+                            component_name,
+                            component_instance,
+                            parents,
+                            elided,
+                        ),
+                    )
+                    if node_key is not None:
+                        node_indices[node_key] = len(self._nodes) - 1
+                    local_nodes[component_name] = len(self._nodes) - 1
+                else:
+                    local_nodes[component_name] = node_indices[node_key]
+            self._n_nodes_before.append(len(self._nodes))
+
+        self._n_consumers = Counter()
+        for parents in [node.parents for node in self._nodes] + self._estimator_inputs:
+            self._n_consumers.update(parents.values())
+
+    @property
+    def n_components(self):
+        """Number of components, other than the final estimators, in all the pipelines."""
+        return sum(
+            len(pipeline.component_graph.compute_order) - 1
+            for pipeline in self.pipelines
+        )
+
+    @property
+    def n_evaluated_components(self):
+        """Number of components, other than the final estimators, the plan evaluates after merging identical fitted transformers."""
+        return len(self._nodes)
+
+    def _node_key(
+        self,
+        component_graph,
+        component_name,
+        component_instance,
+        parents,
+        elided,
+    ):
+        """Identifies a fitted transformer by its fitted state and inputs, or returns None if it should not be shared."""
+        if not isinstance(component_instance, Transformer):
+            return None
+        fingerprint = self._fingerprints[id(component_instance)]
+        inputs = []
+        for parent_input in component_graph.get_inputs(component_name):
+            if parent_input not in parents:
+                inputs.append(parent_input)
+                continue
+            node_index, output = parents[parent_input]
+            # Outputs which are Series are renamed after the input which refers to them when they are combined
+            parent_is_transformer = isinstance(
+                self._nodes[node_index].component_instance,
+                Transformer,
+            )
+            inputs.append(
+                (
+                    node_index,
+                    output,
+                    None if parent_is_transformer else parent_input,
+                ),
+            )
+        return fingerprint, elided, tuple(inputs)
+
+    def _iter_estimator_inputs(self, X):
+        """Yields each pipeline with the features its estimator receives, evaluating every shared component once."""
+        X = infer_feature_types(X)
+        for pipeline in self.pipelines:
+            pipeline.component_graph._validate_input_types(X)
+        remaining_consumers = Counter(self._n_consumers)
+        outputs = {}
+
+        def gather(node_parents):
+            """Returns the outputs a component reads and how many components, including it, still have to read each of them."""
+            inputs = {}
+            consumers = {}
+            for parent_input, output_key in node_parents.items():
+                inputs[parent_input] = outputs[output_key]
+                consumers[parent_input] = remaining_consumers[output_key]
+                remaining_consumers[output_key] -= 1
+                if remaining_consumers[output_key] == 0:
+                    del outputs[output_key]
+            return inputs, consumers
+
+        node_index = 0
+        for pipeline, estimator_parents, n_nodes in zip(
+            self.pipelines,
+            self._estimator_inputs,
+            self._n_nodes_before,
+        ):
+            while node_index < n_nodes:
+                node = self._nodes[node_index]
+                parent_outputs, consumers = gather(node.parents)
+                (
+                    x_inputs,
+                    y_input,
+                ) = node.component_graph._consolidate_inputs_for_component(
+                    parent_outputs,
+                    node.component_name,
+                    X,
+                    remaining_consumers=consumers,
+                )
+                _, component_outputs = _evaluate_component(
+                    node.component_instance,
+                    node.component_name,
+                    x_inputs,
+                    y_input,
+                    fit=False,
+                    is_final_component=False,
+                    evaluate_training_only_components=False,
+                    elided=node.elided,
+                )
+                for output in ["x", "y"]:
+                    if self._n_consumers[(node_index, output)] > 0:
+                        outputs[(node_index, output)] = component_outputs.get(
+                            f"{node.component_name}.{output}",
+                        )
+                node_index += 1
+            component_graph = pipeline.component_graph
+            parent_outputs, consumers = gather(estimator_parents)
+            features, _ = component_graph._consolidate_inputs_for_component(
+                parent_outputs,
+                component_graph.compute_order[-1],
+                X,
+                remaining_consumers=consumers,
+            )
+            yield pipeline, features
+
+    def predict(self, X, objective=None):
+        """Make predictions with every pipeline, giving the same results as each pipeline's ``predict``.
+
+        Args:
+            X (pd.DataFrame): Data of shape [n_samples, n_features].
+            objective (ObjectiveBase, str): The objective binary classification pipelines use to make predictions. Defaults to None.
+
+        Returns:
+            dict[str, pd.Series]: Predictions of each pipeline, keyed by pipeline name.
+        """
+        return {
+            pipeline.name: pipeline._decode_predictions(
+                pipeline._predict_from_features(X, features, objective=objective),
+            )
+            for pipeline, features in self._iter_estimator_inputs(X)
+        }
+
+    def predict_proba(self, X):
+        """Make probability estimates with every classification pipeline, giving the same results as each pipeline's ``predict_proba``.
+
+        Args:
+            X (pd.DataFrame): Data of shape [n_samples, n_features].
+
+        Returns:
+            dict[str, pd.DataFrame]: Probability estimates of each classification pipeline, keyed by pipeline name.
+        """
+        return {
+            pipeline.name: pipeline._predict_proba_from_features(features)
+            for pipeline, features in self._iter_estimator_inputs(X)
+            if is_classification(pipeline.problem_type)
+        }
+
+    def score(self, X, y, objectives):
+        """Score every pipeline, giving the same results as each pipeline's ``score``.
+
+        Args:
+            X (pd.DataFrame): Data of shape [n_samples, n_features].
+            y (pd.Series): True values of length [n_samples].
+            objectives (list): Objectives to score on.
+
+        Returns:
+            dict[str, dict]: Ordered dictionary of objective scores of each pipeline, keyed by pipeline name.
+        """
+        return {
+            pipeline.name: pipeline._score_from_features(X, y, features, objectives)
+            for pipeline, features in self._iter_estimator_inputs(X)
+        }
+
+    def iter_scores(self, X, y, objectives):
+        """Score the pipelines one at a time, yielding each pipeline's scores as soon as its estimator has run.
+
+        An error scoring one pipeline does not stop the others from being scored: the exception is yielded in place of its scores.
+        Errors raised while evaluating shared components are raised.
+
+        Args:
+            X (pd.DataFrame): Data of shape [n_samples, n_features].
+            y (pd.Series): True values of length [n_samples].
+            objectives (list): Objectives to score on.
+
+        Yields:
+            tuple(str, dict or Exception): Pipeline name, and its ordered dictionary of objective scores or the exception raised while scoring it.
+        """
+        for pipeline, features in self._iter_estimator_inputs(X):
+            try:
+                pipeline_scores = pipeline._score_from_features(
+                    X, y, features, objectives
+                )
+            except Exception as e:
+                pipeline_scores = e
+            yield pipeline.name, pipeline_scores
+
+    def __repr__(self):
+        """String representation of the execution plan."""
+        return (
+            f"PipelineExecutionPlan({len(self.pipelines)} pipelines, evaluating {self.n_evaluated_components} "
+            f"of {self.n_components} components)"
+        )
+
+
+class _PlanNode:
+    """A component the execution plan evaluates, and where its inputs come from."""
+
+    def __init__(
+        self,
+        component_graph,
+        component_name,
+        component_instance,
+        parents,
+        elided,
+    ):
+        self.component_graph = component_graph
+        self.component_name = component_name
+        self.component_instance = component_instance
+        self.parents = parents
+        self.elided = elided
+
+
+def _fit_fingerprint(component):
+    """Hash of a fitted component's pickled state, or None if it cannot be pickled."""
+    try:
+        return hashlib.sha256(
+            pickle.dumps(component, protocol=pickle.HIGHEST_PROTOCOL),
+        ).hexdigest()
+    except Exception:
+        return None
+
+
+def _fit_fingerprints(components):
+    """Fingerprints fitted components by id, only hashing the state of those which could match a different object of the same class and parameters.
+
+    Pickling and hashing a fitted text or DFS featurizer can cost more than the transforms sharing it saves, so components are matched by
+    identity first and their state is only hashed when another object could be a copy of them.
+    """
+    candidates = defaultdict(dict)
+    for component in components:
+        if isinstance(component, Transformer):
+            key = (type(component), repr(component.parameters))
+            candidates[key][id(component)] = component
+    fingerprints = {}
+    for same_parameters in candidates.values():
+        for component_id, component in same_parameters.items():
+            fingerprint = None
+            if len(same_parameters) > 1:
+                fingerprint = _fit_fingerprint(component)
+            fingerprints[component_id] = fingerprint or ("id", component_id)
+    return fingerprints
@@ -17,6 +17,7 @@ class MulticlassClassificationPipeline(ClassificationPipeline):
              An empty dictionary or None implies using all default values for component parameters. Defaults to None.
         custom_name (str): Custom name for the pipeline. Defaults to None.
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        executor (str, concurrent.futures.Executor): How the component graph evaluates components which do not depend on each other. Defaults to None.
 
     Example:
         >>> pipeline = MulticlassClassificationPipeline(component_graph=["Simple Imputer", "Logistic Regression Classifier"],
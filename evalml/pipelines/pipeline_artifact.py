@@ -0,0 +1,307 @@
+"""Directory and zip artifact format for saving fitted pipelines so that they load quickly and can be shared between processes."""
+import copy
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
+import zipfile
+
+import cloudpickle
+import joblib
+import numpy as np
+
+import evalml
+
+ARTIFACT_FORMAT = "evalml-pipeline"
+ARTIFACT_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+PIPELINE_FILE = "pipeline.pkl"
+COMPONENTS_DIR = "components"
+
+
+def is_pipeline_artifact(path):
+    """Checks whether a path is a pipeline artifact directory or zip file.
+
+    Args:
+        path (str): Path to check.
+
+    Returns:
+        bool: True if the path is a directory or zip file containing a pipeline artifact manifest.
+    """
+    if os.path.isdir(path):
+        return os.path.isfile(os.path.join(path, MANIFEST_FILE))
+    if os.path.isfile(path) and zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as artifact:
+            return MANIFEST_FILE in artifact.namelist()
+    return False
+
+
+def save_pipeline_artifact(pipeline, path):
+    """Saves a pipeline as an artifact directory, or as a zip file if path ends in ".zip".
+
+    The artifact holds a JSON manifest with the artifact format version, the pipeline's class, component graph and
+    parameters, a pickle of the pipeline without its components, and one file per component. Components are written with
+    joblib without compression, so the NumPy arrays inside them, such as the coefficients and tree structures of fitted
+    estimators, can be memory-mapped when the artifact is loaded.
+
+    Args:
+        pipeline (PipelineBase): Pipeline to save.
+        path (str): Directory to save the artifact to, or path of the zip file to create. Existing artifacts are overwritten.
+
+    Returns:
+        str: The path the artifact was saved to.
+
+    Raises:
+        ValueError: If path exists and is not a pipeline artifact.
+    """
+    path = os.fspath(path)
+    if os.path.exists(path) and not is_pipeline_artifact(path):
+        raise ValueError(
+            f"Cannot save pipeline artifact to {path}: path exists and is not a pipeline artifact.",
+        )
+    if path.endswith(".zip"):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            _write_artifact(pipeline, tmp_dir)
+            # Files are stored uncompressed so they can be extracted without decompressing arrays
+            with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as artifact:
+                for root, _, files in os.walk(tmp_dir):
+                    for file_name in files:
+                        file_path = os.path.join(root, file_name)
+                        artifact.write(file_path, os.path.relpath(file_path, tmp_dir))
+        return path
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    _write_artifact(pipeline, path)
+    return path
+
+
+def load_pipeline_artifact(path, mmap_mode="r", lazy=True):
+    """Loads a pipeline saved with `save_pipeline_artifact`.
+
+    Arrays inside components are memory-mapped when mmap_mode is set, so processes loading the same artifact directory share one
+    copy of them through the operating system's page cache. Zip artifacts are extracted to a temporary directory first, which is
+    removed when the loaded pipeline is garbage collected. Each process loading a zip artifact extracts its own copy of it, so to
+    share memory between processes save and load the artifact as a directory.
+
+    Args:
+        path (str): Artifact directory or zip file.
+        mmap_mode (str, None): Memory-map mode passed to joblib when loading components, one of None, "r", "r+", "w+" or "c".
+            Memory-mapped arrays are read-only with the default "r". Defaults to "r".
+        lazy (bool): If True, each component other than the estimator is only read from disk the first time it is used. Defaults to True.
+
+    Returns:
+        PipelineBase: The loaded pipeline.
+
+    Raises:
+        ValueError: If path is not a pipeline artifact or was saved with a newer artifact format.
+    """
+    path = os.fspath(path)
+    if not is_pipeline_artifact(path):
+        raise ValueError(f"{path} is not a pipeline artifact.")
+    if os.path.isdir(path):
+        return _load_artifact_directory(path, mmap_mode, lazy)
+    extracted_path = tempfile.mkdtemp(prefix="evalml_pipeline_")
+    try:
+        with zipfile.ZipFile(path) as artifact:
+            artifact.extractall(extracted_path)
+        pipeline = _load_artifact_directory(extracted_path, mmap_mode, lazy)
+    except Exception:
+        shutil.rmtree(extracted_path, True)
+        raise
+    weakref.finalize(pipeline, shutil.rmtree, extracted_path, True)
+    return pipeline
+
+
+def _load_artifact_directory(path, mmap_mode, lazy):
+    """Loads the pipeline of an artifact directory."""
+    manifest = read_pipeline_artifact_manifest(path)
+    with open(os.path.join(path, PIPELINE_FILE), "rb") as f:
+        pipeline = cloudpickle.load(f)
+    component_files = {
+        component_name: _ComponentFile(
+            os.path.join(path, component_info["file"]),
+            component_info["serializer"],
+            mmap_mode,
+        )
+        for component_name, component_info in manifest["components"].items()
+    }
+    component_instances = _LazyComponentInstances(component_files)
+    if not lazy:
+        component_instances = dict(component_instances)
+    pipeline.component_graph.component_instances = component_instances
+    if pipeline._estimator_name is not None:
+        pipeline.estimator = component_instances[pipeline._estimator_name]
+    return pipeline
+
+
+def read_pipeline_artifact_manifest(path):
+    """Reads the JSON manifest of a pipeline artifact without loading the pipeline.
+
+    Args:
+        path (str): Artifact directory or zip file.
+
+    Returns:
+        dict: The manifest, with the artifact format version, evalml version, pipeline class, component graph, parameters and component files.
+
+    Raises:
+        ValueError: If path is not a pipeline artifact or was saved with a newer artifact format.
+    """
+    path = os.fspath(path)
+    if not is_pipeline_artifact(path):
+        raise ValueError(f"{path} is not a pipeline artifact.")
+    if os.path.isdir(path):
+        with open(os.path.join(path, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+    else:
+        with zipfile.ZipFile(path) as artifact:
+            manifest = json.loads(artifact.read(MANIFEST_FILE))
+    if manifest.get("format") != ARTIFACT_FORMAT:
+        raise ValueError(f"{path} is not a pipeline artifact.")
+    if manifest["format_version"] > ARTIFACT_FORMAT_VERSION:
+        raise ValueError(
+            f"Pipeline artifact format version {manifest['format_version']} is newer than the newest version this version of evalml "
+            f"can load ({ARTIFACT_FORMAT_VERSION}). It was saved with evalml {manifest['evalml_version']}.",
+        )
+    return manifest
+
+
+def _write_artifact(pipeline, path):
+    """Writes the files of a pipeline artifact to a directory."""
+    os.makedirs(os.path.join(path, COMPONENTS_DIR))
+    component_instances = pipeline.component_graph.component_instances
+    components = {}
+    for i, component_name in enumerate(pipeline.component_graph.compute_order):
+        component_file = f"{COMPONENTS_DIR}/{i}.joblib"
+        components[component_name] = {
+            "class": _class_path(type(component_instances[component_name])),
+            "file": component_file,
+            "serializer": _dump_component(
+                component_instances[component_name],
+                os.path.join(path, component_file),
+            ),
+        }
+
+    # The components are stored in their own files, so leave them out of the pipeline's pickle
+    skeleton = copy.copy(pipeline)
+    skeleton.estimator = None
+    skeleton.component_graph = copy.copy(pipeline.component_graph)
+    skeleton.component_graph.component_instances = {}
+    with open(os.path.join(path, PIPELINE_FILE), "wb") as f:
+        cloudpickle.dump(skeleton, f)
+
+    manifest = {
+        "format": ARTIFACT_FORMAT,
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "evalml_version": evalml.__version__,
+        "pipeline_class": _class_path(type(pipeline)),
+        "name": pipeline.name,
+        "problem_type": str(pipeline.problem_type),
+        "random_seed": pipeline.random_seed,
+        "is_fitted": pipeline._is_fitted,
+        "component_graph": {
+            component_name: [
+                component_info[0]
+                if isinstance(component_info[0], str)
+                else _class_path(component_info[0]),
+            ]
+            + list(component_info[1:])
+            for component_name, component_info in pipeline.component_graph.component_dict.items()
+        },
+        "parameters": pipeline.parameters,
+        "components": components,
+    }
+    with open(os.path.join(path, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2, default=_to_json, skipkeys=True)
+
+
+def _dump_component(component, file_path):
+    """Saves a component with joblib, falling back to cloudpickle for objects pickle cannot handle, such as locally defined classes. Returns the serializer used."""
+    try:
+        joblib.dump(component, file_path)
+        return "joblib"
+    except (pickle.PicklingError, AttributeError, TypeError):
+        with open(file_path, "wb") as f:
+            cloudpickle.dump(component, f)
+        return "cloudpickle"
+
+
+def _class_path(cls):
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _to_json(value):
+    """Converts values json cannot serialize, such as NumPy scalars, for the manifest. Values without a JSON equivalent are stored as their repr."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    if isinstance(value, type):
+        return _class_path(value)
+    return repr(value)
+
+
+class _ComponentFile:
+    """A component saved in a pipeline artifact which has not been loaded yet."""
+
+    def __init__(self, file_path, serializer, mmap_mode):
+        self.file_path = file_path
+        self.serializer = serializer
+        self.mmap_mode = mmap_mode
+
+    def load(self):
+        if self.serializer == "joblib":
+            return joblib.load(self.file_path, mmap_mode=self.mmap_mode)
+        with open(self.file_path, "rb") as f:
+            return cloudpickle.load(f)
+
+
+class _LazyComponentInstances(dict):
+    """Component instances of a loaded pipeline artifact, each read from disk the first time it is accessed.
+
+    Copying or pickling the mapping loads every component.
+    """
+
+    def __getitem__(self, component_name):
+        value = super().__getitem__(component_name)
+        if isinstance(value, _ComponentFile):
+            value = value.load()
+            super().__setitem__(component_name, value)
+        return value
+
+    def get(self, component_name, default=None):
+        if component_name not in self:
+            return default
+        return self[component_name]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def values(self):
+        return [self[component_name] for component_name in self.keys()]
+
+    def items(self):
+        return [
+            (component_name, self[component_name]) for component_name in self.keys()
+        ]
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+    @property
+    def loaded(self):
+        """Names of the components which have been read from disk."""
+        return [
+            component_name
+            for component_name, value in super().items()
+            if not isinstance(value, _ComponentFile)
+        ]
@@ -15,6 +15,7 @@ import pandas as pd
 from evalml.exceptions import ObjectiveCreationError, PipelineScoreError
 from evalml.objectives import get_objective
 from evalml.pipelines import ComponentGraph
+from evalml.pipelines.compiled_pipeline import CompiledPipeline
 from evalml.pipelines.components import (
     PCA,
     ComponentBase,
@@ -23,7 +24,13 @@ from evalml.pipelines.components import (
     LinearDiscriminantAnalysis,
 )
 from evalml.pipelines.components.utils import all_components, handle_component_class
+from evalml.pipelines.pipeline_artifact import (
+    is_pipeline_artifact,
+    load_pipeline_artifact,
+    save_pipeline_artifact,
+)
 from evalml.pipelines.pipeline_meta import PipelineBaseMeta
+from evalml.pipelines.pipeline_spec import PipelineSpec
 from evalml.problem_types import is_binary
 from evalml.utils import (
     import_or_raise,
@@ -52,6 +59,14 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
              An empty dictionary or None implies using all default values for component parameters. Defaults to None.
         custom_name (str): Custom name for the pipeline. Defaults to None.
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        executor (str, concurrent.futures.Executor): How the component graph evaluates components which do not depend on each other,
+            such as separate preprocessing branches or the input estimators of an ensemble. None, "threads", "processes" or an executor,
+            as for ComponentGraph. Defaults to None, which keeps the executor of a ComponentGraph passed as component_graph and otherwise
+            evaluates components one at a time.
+
+    Note:
+        ``fit``, ``predict``, ``predict_proba`` and ``transform`` accept an optional ``profile`` keyword argument. When True,
+        the wall time, CPU time, peak memory, input/output shapes and output memory of every component evaluated during the call are recorded in ``profile_``.
     """
 
     problem_type = None
@@ -63,6 +78,7 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         parameters=None,
         custom_name=None,
         random_seed=0,
+        executor=None,
     ):
         self.random_seed = random_seed
 
@@ -78,17 +94,19 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
                     component_graph,
                 ),
                 random_seed=self.random_seed,
+                executor=executor,
             )
         elif isinstance(component_graph, dict):
             self.component_graph = ComponentGraph(
                 component_dict=component_graph,
                 random_seed=self.random_seed,
+                executor=executor,
             )
         elif isinstance(component_graph, ComponentGraph):
-            self.component_graph = ComponentGraph(
-                component_dict=component_graph.component_dict,
+            self.component_graph = component_graph._copy_topology(
                 cached_data=component_graph.cached_data,
                 random_seed=self.random_seed,
+                executor=component_graph.executor if executor is None else executor,
             )
         else:
             raise ValueError(
@@ -120,6 +138,19 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
 
         self._custom_name = custom_name
 
+    @property
+    def executor(self):
+        """How the component graph evaluates components which do not depend on each other."""
+        return self.component_graph.executor
+
+    def shutdown_executor(self, wait=True):
+        """Shuts down the thread or process pool the component graph created to evaluate independent components, if there is one.
+
+        Args:
+            wait (bool): Whether to wait for running components to finish before returning. Defaults to True.
+        """
+        self.component_graph.shutdown_executor(wait=wait)
+
     @property
     def custom_name(self):
         """Custom name of the pipeline."""
@@ -272,6 +303,18 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         """
         return self.component_graph.transform_all_but_final(X, y=y)
 
+    @property
+    def profile_(self):
+        """Per-component profile recorded by the most recent call made with ``profile=True``.
+
+        Returns:
+            pd.DataFrame: One row per component with the columns "wall_time" and "cpu_time" (seconds), "peak_memory" (bytes), "input_shape", "output_shape",
+            "output_memory" (bytes of the component's output), "retained_memory" (bytes of intermediate outputs the graph still holds after the component ran) and "n_calls".
+            Intermediate outputs are released once their last consumer has run, so the largest "retained_memory" is typically well below the sum of "output_memory".
+            None if no profile has been recorded.
+        """
+        return self.component_graph.profile_
+
     def _fit(self, X, y):
         self.input_target_name = y.name
         self.component_graph.fit(X, y)
@@ -314,10 +357,111 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
             pd.Series: Predicted values.
         """
         X = infer_feature_types(X)
-        predictions = self.component_graph.predict(X)
+        features = self.transform_all_but_final(X)
+        predictions = self._predict_from_features(X, features, objective=objective)
+        return self._decode_predictions(predictions)
+
+    def _predict_from_features(self, X, features, objective=None):
+        """Make predictions from the features the final estimator receives, before they are converted back to target values.
+
+        Args:
+            X (pd.DataFrame): Data the features were computed from.
+            features (pd.DataFrame): Features returned by ``transform_all_but_final`` for X.
+            objective (ObjectiveBase, str, None): The objective to use to make predictions. Only used by binary classification pipelines.
+
+        Returns:
+            pd.Series: Predicted values.
+
+        Raises:
+            ValueError: If final component is not an Estimator.
+        """
+        if self.estimator is None:
+            raise ValueError(
+                "Cannot call predict() on a component graph because the final component is not an Estimator.",
+            )
+        return infer_feature_types(self._estimator_predict(features))
+
+    def _estimator_predict(self, features):
+        """Get estimator predictions, recording them in the profile if one is being recorded."""
+        with self.component_graph._profile_component(
+            self._estimator_name,
+            features,
+        ) as profile_record:
+            predictions = self.estimator.predict(features)
+            profile_record["output"] = predictions
+        return predictions
+
+    def _decode_predictions(self, predictions):
+        """Converts the output of ``_predict_from_features`` to the predictions ``predict`` returns."""
         predictions.name = self.input_target_name
         return infer_feature_types(predictions)
 
+    def eliminate_dead_features(self):
+        """Stops the fitted pipeline from computing features which no downstream component uses, such as one-hot encoded columns a feature selector discards.
+
+        Returns:
+            dict: Names of the components which were pruned mapped to the features they no longer compute.
+        """
+        return self.component_graph.eliminate_dead_features()
+
+    def elide_noop_components(self, X):
+        """Skips fitted components which do nothing for the given data, such as an Imputer fitted on data without nulls, when transforming and predicting.
+
+        Elided components still run when the data they receive needs them, for example to impute nulls not seen during fit.
+
+        Args:
+            X (pd.DataFrame): Data representative of what the pipeline will predict on, usually the data it was fitted on.
+
+        Returns:
+            list(str): Names of the components elided from the inference path.
+        """
+        return self.component_graph.elide_noop_components(X)
+
+    def compile(self):
+        """Compile the fitted pipeline into a frozen object for low-latency predictions.
+
+        The compiled pipeline resolves the input schema and component order once, so each prediction skips Woodwork type inference and schema checks.
+        It accepts dicts, lists of records and arrays as well as DataFrames, and gives the same predictions as ``predict`` and ``predict_proba``.
+
+        Returns:
+            CompiledPipeline: Compiled copy of the pipeline.
+
+        Raises:
+            ValueError: If the pipeline is a time series pipeline or contains a DFS Transformer.
+        """
+        return CompiledPipeline(self)
+
+    def predict_batches(
+        self,
+        data,
+        chunk_size=100000,
+        n_jobs=1,
+        method="predict",
+        output_path=None,
+    ):
+        """Make predictions on data too large to transform in one pass, streaming it through the pipeline a chunk of rows at a time.
+
+        Args:
+            data (pd.DataFrame, iterable, str): A DataFrame, an iterable of DataFrames or records, or the path to a CSV or Parquet file.
+            chunk_size (int): Largest number of rows to predict on at once. Defaults to 100000.
+            n_jobs (int): Number of processes to predict with. -1 uses all CPUs. Defaults to 1.
+            method (str): Either "predict" or "predict_proba". Defaults to "predict".
+            output_path (str): If given, the results are written incrementally to this Parquet file instead of being yielded. Defaults to None.
+
+        Returns:
+            generator or str: A generator yielding the results for each chunk in order, or output_path once all results have been written.
+
+        Raises:
+            ValueError: If the pipeline is a time series pipeline or contains a DFS Transformer, which cannot be compiled, or if chunk_size is not positive, method is not "predict" or "predict_proba" or profile is True.
+        """
+        return self.compile().predict_batches(
+            data,
+            chunk_size=chunk_size,
+            n_jobs=n_jobs,
+            method=method,
+            output_path=output_path,
+        )
+
     @abstractmethod
     def score(self, X, y, objectives, X_train=None, y_train=None):
         """Evaluate model performance on current and additional objectives.
@@ -492,11 +636,12 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
 
         return graph_as_dict
 
-    def graph(self, filepath=None):
+    def graph(self, filepath=None, show_profile=False):
         """Generate an image representing the pipeline graph.
 
         Args:
             filepath (str, optional): Path to where the graph should be saved. If set to None (as by default), the graph will not be saved.
+            show_profile (bool): If True, annotate each component with the wall time and peak memory recorded in ``profile_``. Defaults to False.
 
         Returns:
             graphviz.Digraph: Graph object that can be directly displayed in Jupyter notebooks.
@@ -545,7 +690,11 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
                     ).format(graph_format, supported_filetypes),
                 )
 
-        graph = self.component_graph.graph(path_and_name, graph_format)
+        graph = self.component_graph.graph(
+            path_and_name,
+            graph_format,
+            show_profile=show_profile,
+        )
 
         if filepath:
             graph.render(path_and_name, cleanup=True)
@@ -612,30 +761,58 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         with open(file_path, "wb") as f:
             cloudpickle.dump(self, f, protocol=pickle_protocol)
 
+    def save_artifact(self, path):
+        """Saves pipeline as a versioned artifact directory, or as a zip file if path ends in ".zip".
+
+        Unlike ``save``, which pickles the whole pipeline into one file, the artifact stores the pipeline's parameters and metadata as JSON
+        and each component in its own file, with the NumPy arrays of fitted estimators stored so they can be memory-mapped. ``load`` reads
+        components lazily from artifacts, and processes loading the same artifact directory share one copy of the arrays through the page cache.
+
+        Args:
+            path (str): Directory to save the artifact to, or path of the zip file to create. Existing artifacts are overwritten.
+
+        Returns:
+            str: The path the artifact was saved to.
+        """
+        return save_pipeline_artifact(self, path)
+
     @staticmethod
-    def load(file_path):
+    def load(file_path, mmap_mode="r"):
         """Loads pipeline at file path.
 
         Args:
-            file_path (str): Location to load file.
+            file_path (str): Location to load file. Can be a file written by ``save`` or an artifact directory or zip file written by ``save_artifact``.
+            mmap_mode (str, None): When loading an artifact, how to memory-map the arrays in its components: None, "r", "r+", "w+" or "c". Ignored for pickled pipelines. Defaults to "r".
 
         Returns:
             PipelineBase object
         """
+        if is_pipeline_artifact(file_path):
+            return load_pipeline_artifact(file_path, mmap_mode=mmap_mode)
         with open(file_path, "rb") as f:
             return cloudpickle.load(f)
 
+    @property
+    def spec(self):
+        """Immutable, hashable description of this pipeline's class, component graph, parameters, custom name, random seed and threshold.
+
+        Returns:
+            PipelineSpec: Spec which can be stored instead of a clone of the pipeline and instantiated later.
+        """
+        return PipelineSpec.from_pipeline(self)
+
     def clone(self):
-        """Constructs a new pipeline with the same components, parameters, and random seed.
+        """Constructs a new pipeline with the same components, parameters, random seed and executor.
 
         Returns:
-            A new instance of this pipeline with identical components, parameters, and random seed.
+            A new instance of this pipeline with identical components, parameters, random seed and executor.
         """
         clone = self.__class__(
             component_graph=self.component_graph,
             parameters=self.parameters,
             custom_name=self.custom_name,
             random_seed=self.random_seed,
+            executor=self.executor,
         )
         if is_binary(self.problem_type):
             clone.threshold = self.threshold
@@ -650,13 +827,14 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
             random_seed (int): Seed for the random number generator. Defaults to 0.
 
         Returns:
-            A new instance of this pipeline with identical components.
+            A new instance of this pipeline with identical components and executor.
         """
         return self.__class__(
             self.component_graph,
             parameters=parameters,
             custom_name=self.custom_name,
             random_seed=random_seed,
+            executor=self.executor,
         )
 
     def __eq__(self, other):
@@ -703,6 +881,9 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
             f"custom_name='{self.custom_name}'" if self.custom_name else None
         )
         random_seed_str = f"random_seed={self.random_seed}"
+        executor_repr = (
+            f"executor='{self.executor}'" if isinstance(self.executor, str) else None
+        )
         additional_args_str = ", ".join(
             [
                 arg
@@ -710,6 +891,7 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
                     parameters_str,
                     custom_name_repr,
                     random_seed_str,
+                    executor_repr,
                 ]
                 if arg is not None
             ],
@@ -8,10 +8,39 @@ from evalml.utils.base_meta import BaseMeta
 class PipelineBaseMeta(BaseMeta):
     """Metaclass that overrides creating a new pipeline by wrapping methods with validators and setters."""
 
+    METHODS_TO_CHECK = BaseMeta.METHODS_TO_CHECK + [
+        "compile",
+        "elide_noop_components",
+        "eliminate_dead_features",
+        "predict_batches",
+    ]
+    # Methods which return before their work is done, so there is nothing to profile while they run
+    METHODS_WITHOUT_PROFILE = ["predict_batches"]
+
+    @classmethod
+    def set_fit(cls, method):
+        """Wrapper for the fit method.
+
+        Accepts an optional `profile` keyword argument. If True, the resources used by each component are recorded in the pipeline's `profile_`.
+        """
+
+        @wraps(method)
+        def _set_fit(self, X, y=None, profile=False):
+            with self.component_graph._profiling(profile):
+                return_value = method(self, X, y)
+            self._is_fitted = True
+            # Identifies this fit of the pipeline, so that anything cached from its fitted state is rebuilt when it is refit
+            self._fit_token = object()
+            return return_value
+
+        return _set_fit
+
     @classmethod
     def check_for_fit(cls, method):
         """`check_for_fit` wraps a method that validates if `self._is_fitted` is `True`.
 
+        The wrapped method accepts an optional `profile` keyword argument. If True, the resources used by each component are recorded in the pipeline's `profile_`.
+
         Args:
             method (callable): Method to wrap.
 
@@ -20,16 +49,20 @@ class PipelineBaseMeta(BaseMeta):
 
         Raises:
             PipelineNotYetFittedError: If pipeline is not yet fitted.
+            ValueError: If `profile` is True for a method which cannot be profiled.
         """
 
         @wraps(method)
-        def _check_for_fit(self, *args, **kwargs):
+        def _check_for_fit(self, *args, profile=False, **kwargs):
             klass = type(self).__name__
             if not self._is_fitted:
                 raise PipelineNotYetFittedError(
                     f"This {klass} is not fitted yet. You must fit {klass} before calling {method.__name__}.",
                 )
+            if profile and method.__name__ in cls.METHODS_WITHOUT_PROFILE:
+                raise ValueError(f"{method.__name__} does not support profile=True.")
 
-            return method(self, *args, **kwargs)
+            with self.component_graph._profiling(profile):
+                return method(self, *args, **kwargs)
 
         return _check_for_fit
@@ -0,0 +1,204 @@
+"""Immutable, hashable description of a pipeline which is only instantiated when needed."""
+import copy
+
+import numpy as np
+
+from evalml.pipelines.component_graph import ComponentGraph
+
+
+class PipelineSpec:
+    """Immutable description of a pipeline: its class, component graph, parameters, custom name, random seed and threshold.
+
+    Specs are cheap to create, compare and hash, so they can be used as dictionary keys and shared between many consumers
+    without building any components. The component graph's edges are validated and its compute order worked out once, when
+    the spec is created; calling ``instantiate`` reuses that topology, so only the components themselves are constructed.
+
+    Args:
+        pipeline_class (type): The pipeline class, a subclass of PipelineBase.
+        component_graph (ComponentGraph, dict): Component graph, or dictionary of components and edges.
+        parameters (dict): Dictionary with component names as keys and dictionary of that component's parameters as values.
+            An empty dictionary or None implies using all default values for component parameters. Defaults to None.
+        custom_name (str): Custom name for the pipeline. Defaults to None.
+        random_seed (int): Seed for the random number generator. Defaults to 0.
+        threshold (float): Threshold of binary classification pipelines. Defaults to None.
+        executor (str, concurrent.futures.Executor): Executor of the pipelines the spec instantiates. Not part of the spec's identity. Defaults to None.
+
+    Pipeline classes which override ``new`` may not accept these arguments in their constructor, so specs of their pipelines made with
+    ``from_pipeline`` keep an unfitted clone of the pipeline and instantiate pipelines with its ``new`` method.
+
+    Raises:
+        ValueError: If component_graph is not a ComponentGraph or dictionary, or the graph is invalid.
+    """
+
+    def __init__(
+        self,
+        pipeline_class,
+        component_graph,
+        parameters=None,
+        custom_name=None,
+        random_seed=0,
+        threshold=None,
+        executor=None,
+    ):
+        if isinstance(component_graph, dict):
+            component_graph = ComponentGraph(component_dict=component_graph)
+        elif isinstance(component_graph, ComponentGraph):
+            # Keep the topology only, so that the spec does not hold on to fitted components
+            component_graph = component_graph._copy_topology()
+        else:
+            raise ValueError("component_graph must be a dict or ComponentGraph object")
+        self._pipeline_class = pipeline_class
+        self._component_graph = component_graph
+        self._parameters = copy.deepcopy(parameters or {})
+        self._custom_name = custom_name
+        self._random_seed = random_seed
+        self._threshold = threshold
+        self._executor = executor
+        self._template = None
+        self._key = (
+            pipeline_class,
+            _freeze(component_graph.component_dict),
+            _freeze(self._parameters),
+            custom_name,
+            random_seed,
+            threshold,
+        )
+        self._hash = hash(self._key)
+
+    @classmethod
+    def from_pipeline(cls, pipeline):
+        """Describes a pipeline without copying its components.
+
+        Args:
+            pipeline (PipelineBase): The pipeline to describe. Fitted state is not part of the spec.
+
+        Returns:
+            PipelineSpec: Spec of the pipeline.
+        """
+        from evalml.pipelines.pipeline_base import PipelineBase
+
+        spec = cls(
+            pipeline.__class__,
+            pipeline.component_graph,
+            parameters=pipeline.parameters,
+            custom_name=pipeline.custom_name,
+            random_seed=pipeline.random_seed,
+            threshold=getattr(pipeline, "threshold", None),
+            executor=pipeline.executor,
+        )
+        if pipeline.__class__.new is not PipelineBase.new:
+            spec._template = pipeline.clone()
+        return spec
+
+    @property
+    def pipeline_class(self):
+        """The pipeline class."""
+        return self._pipeline_class
+
+    @property
+    def component_dict(self):
+        """Dictionary of components and edges of the component graph."""
+        return copy.copy(self._component_graph.component_dict)
+
+    @property
+    def compute_order(self):
+        """The order the components are computed in."""
+        return list(self._component_graph.compute_order)
+
+    @property
+    def parameters(self):
+        """Parameters of the components."""
+        return copy.deepcopy(self._parameters)
+
+    @property
+    def custom_name(self):
+        """Custom name of the pipeline."""
+        return self._custom_name
+
+    @property
+    def random_seed(self):
+        """Seed for the random number generator."""
+        return self._random_seed
+
+    @property
+    def threshold(self):
+        """Threshold of binary classification pipelines."""
+        return self._threshold
+
+    def new(self, parameters=None, random_seed=None, threshold=None):
+        """Constructs a spec with the same pipeline class, component graph and custom name but with different parameters.
+
+        Args:
+            parameters (dict): Parameters of the components. Defaults to None, which keeps this spec's parameters.
+            random_seed (int): Seed for the random number generator. Defaults to None, which keeps this spec's random seed.
+            threshold (float): Threshold of binary classification pipelines. Defaults to None.
+
+        Returns:
+            PipelineSpec: The new spec, sharing this spec's validated component graph.
+        """
+        spec = PipelineSpec(
+            self._pipeline_class,
+            self._component_graph,
+            parameters=self._parameters if parameters is None else parameters,
+            custom_name=self._custom_name,
+            random_seed=self._random_seed if random_seed is None else random_seed,
+            threshold=threshold,
+            executor=self._executor,
+        )
+        spec._template = self._template
+        return spec
+
+    def instantiate(self):
+        """Constructs the pipeline the spec describes.
+
+        Returns:
+            PipelineBase: A new, unfitted pipeline.
+        """
+        if self._template is not None:
+            pipeline = self._template.new(
+                self.parameters,
+                random_seed=self._random_seed,
+            )
+        else:
+            pipeline = self._pipeline_class(
+                component_graph=self._component_graph,
+                parameters=self.parameters,
+                custom_name=self._custom_name,
+                random_seed=self._random_seed,
+                executor=self._executor,
+            )
+        if self._threshold is not None:
+            pipeline.threshold = self._threshold
+        return pipeline
+
+    def __eq__(self, other):
+        """Check for equality."""
+        if not isinstance(other, PipelineSpec):
+            return False
+        return self._hash == other._hash and self._key == other._key
+
+    def __hash__(self):
+        """Hash of the spec, which is the same for specs which are equal."""
+        return self._hash
+
+    def __repr__(self):
+        """String representation of the spec."""
+        return (
+            f"PipelineSpec({self._pipeline_class.__name__}, {self._component_graph.compute_order}, "
+            f"custom_name={self._custom_name!r}, random_seed={self._random_seed}, threshold={self._threshold})"
+        )
+
+
+def _freeze(value):
+    """Converts a value into a hashable equivalent for comparing and hashing specs. Values of other types are compared by their repr."""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(value[key])) for key in sorted(value, key=str))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, np.ndarray):
+        return ("ndarray", str(value.dtype), value.shape, value.tobytes())
+    if value is None or isinstance(value, (str, int, float, np.generic, type)):
+        return value
+    return (type(value), repr(value))
@@ -18,6 +18,7 @@ class RegressionPipeline(PipelineBase):
              An empty dictionary or None implies using all default values for component parameters. Defaults to None.
         custom_name (str): Custom name for the pipeline. Defaults to None.
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        executor (str, concurrent.futures.Executor): How the component graph evaluates components which do not depend on each other. Defaults to None.
 
     Example:
         >>> pipeline = RegressionPipeline(component_graph=["Simple Imputer", "Linear Regressor"],
@@ -69,11 +70,27 @@ class RegressionPipeline(PipelineBase):
             X_train (pd.DataFrame or np.ndarray or None): Training data. Ignored. Only used for time series.
             y_train (pd.Series or None): Training labels. Ignored. Only used for time series.
 
+        Returns:
+            dict: Ordered dictionary of objective scores.
+        """
+        X = infer_feature_types(X)
+        features = self.transform_all_but_final(X)
+        return self._score_from_features(X, y, features, objectives)
+
+    def _score_from_features(self, X, y, features, objectives):
+        """Evaluate model performance on objectives, given the features the final estimator receives.
+
+        Args:
+            X (pd.DataFrame): Data the features were computed from.
+            y (pd.Series): True values of length [n_samples].
+            features (pd.DataFrame): Features returned by ``transform_all_but_final`` for X.
+            objectives (list): Non-empty list of objectives to score on.
+
         Returns:
             dict: Ordered dictionary of objective scores.
         """
         objectives = self.create_objectives(objectives)
-        y_predicted = self.predict(X)
+        y_predicted = self._decode_predictions(self._predict_from_features(X, features))
         return self._score_all_objectives(
             X,
             y,
@@ -82,20 +99,8 @@ class RegressionPipeline(PipelineBase):
             objectives=objectives,
         )
 
-    def predict(self, X, objective=None, X_train=None, y_train=None):
-        """Make predictions using selected features.
-
-        Args:
-            X (pd.DataFrame, or np.ndarray): Data of shape [n_samples, n_features].
-            objective (Object or string): The objective to use to make predictions.
-            X_train (pd.DataFrame or np.ndarray or None): Training data. Ignored. Only used for time series.
-            y_train (pd.Series or None): Training labels. Ignored. Only used for time series.
-
-        Returns:
-            pd.Series: Predicted values.
-        """
-        X = infer_feature_types(X)
-        predictions = self.component_graph.predict(X)
-        predictions = self.inverse_transform(predictions)
+    def _decode_predictions(self, predictions):
+        """Converts estimator predictions back to target values and names them after the target."""
+        predictions = self.component_graph.inverse_transform(predictions)
         predictions.name = self.input_target_name
         return infer_feature_types(predictions)
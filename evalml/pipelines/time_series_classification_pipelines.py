@@ -26,15 +26,9 @@ class TimeSeriesClassificationPipeline(TimeSeriesPipelineBase, ClassificationPip
              parameters such as time_index, gap, and max_delay must be specified with the "pipeline" key. For example:
              Pipeline(parameters={"pipeline": {"time_index": "Date", "max_delay": 4, "gap": 2}}).
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        executor (str, concurrent.futures.Executor): How the component graph evaluates components which do not depend on each other. Defaults to None.
     """
 
-    def _estimator_predict_proba(self, features):
-        """Get estimator predicted probabilities.
-
-        This helper passes y as an argument if needed by the estimator.
-        """
-        return self.estimator.predict_proba(features)
-
     def predict_proba_in_sample(self, X_holdout, y_holdout, X_train, y_train):
         """Predict on future data where the target is known, e.g. cross validation.
 
@@ -187,6 +181,7 @@ class TimeSeriesBinaryClassificationPipeline(
              parameters such as time_index, gap, and max_delay must be specified with the "pipeline" key. For example:
              Pipeline(parameters={"pipeline": {"time_index": "Date", "max_delay": 4, "gap": 2}}).
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        executor (str, concurrent.futures.Executor): How the component graph evaluates components which do not depend on each other. Defaults to None.
 
     Example:
         >>> pipeline = TimeSeriesBinaryClassificationPipeline(component_graph=["Simple Imputer", "Logistic Regression Classifier"],
@@ -283,6 +278,7 @@ class TimeSeriesMulticlassClassificationPipeline(TimeSeriesClassificationPipelin
              parameters such as time_index, gap, and max_delay must be specified with the "pipeline" key. For example:
              Pipeline(parameters={"pipeline": {"time_index": "Date", "max_delay": 4, "gap": 2}}).
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        executor (str, concurrent.futures.Executor): How the component graph evaluates components which do not depend on each other. Defaults to None.
 
     Example:
         >>> pipeline = TimeSeriesMulticlassClassificationPipeline(component_graph=["Simple Imputer", "Logistic Regression Classifier"],
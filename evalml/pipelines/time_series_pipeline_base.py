@@ -23,6 +23,7 @@ class TimeSeriesPipelineBase(PipelineBase, metaclass=PipelineBaseMeta):
              parameters such as time_index, gap, and max_delay must be specified with the "pipeline" key. For example:
              Pipeline(parameters={"pipeline": {"time_index": "Date", "max_delay": 4, "gap": 2}}).
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        executor (str, concurrent.futures.Executor): How the component graph evaluates components which do not depend on each other. Defaults to None.
     """
 
     def __init__(
@@ -31,6 +32,7 @@ class TimeSeriesPipelineBase(PipelineBase, metaclass=PipelineBaseMeta):
         parameters=None,
         custom_name=None,
         random_seed=0,
+        executor=None,
     ):
         if not parameters or "pipeline" not in parameters:
             raise ValueError(
@@ -49,6 +51,7 @@ class TimeSeriesPipelineBase(PipelineBase, metaclass=PipelineBaseMeta):
             custom_name=custom_name,
             parameters=parameters,
             random_seed=random_seed,
+            executor=executor,
         )
 
     @staticmethod
@@ -222,10 +225,3 @@ class TimeSeriesPipelineBase(PipelineBase, metaclass=PipelineBaseMeta):
             y_train,
             objective=objective,
         )
-
-    def _estimator_predict(self, features):
-        """Get estimator predictions.
-
-        This helper passes y as an argument if needed by the estimator.
-        """
-        return self.estimator.predict(features)
@@ -55,6 +55,16 @@ def test_init(process_pool):
             CFEngine(client="CFClient")
 
 
+def test_n_workers():
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        assert CFEngine(client=CFClient(pool, max_workers=3)).n_workers == 3
+        assert CFEngine(client=CFClient(pool)).n_workers == 1
+
+    engine = CFEngine()
+    assert engine.n_workers == engine.client.pool._max_workers
+    engine.close()
+
+
 @pytest.mark.parametrize("pool_type", ["threads", "processes"])
 def test_submit_training_job_single(
     X_y_binary_cls,
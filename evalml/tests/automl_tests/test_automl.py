@@ -1,5 +1,7 @@
 import inspect
 import os
+import threading
+import time
 import warnings
 from collections import OrderedDict, defaultdict
 from itertools import product
@@ -19,6 +21,7 @@ from evalml import AutoMLSearch
 from evalml.automl.automl_algorithm import IterativeAlgorithm
 from evalml.automl.automl_search import build_engine_from_str
 from evalml.automl.callbacks import (
+    AsyncCallbackDispatcher,
     log_error_callback,
     raise_error_callback,
     silent_error_callback,
@@ -3485,6 +3488,55 @@ def test_train_batch_returns_trained_pipelines(X_y_binary):
         assert fitted_pipeline.parameters == original_pipeline.parameters
 
 
+def test_score_pipelines_shares_components_of_fitted_pipelines(X_y_binary, caplog):
+    X, y = X_y_binary
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type="binary")
+    pipelines = [
+        BinaryClassificationPipeline(
+            ["Imputer", "Standard Scaler", estimator],
+            parameters={estimator: {"n_jobs": 1}},
+        )
+        for estimator in ["Random Forest Classifier", "Logistic Regression Classifier"]
+    ]
+    fitted_pipelines = list(automl.train_pipelines(pipelines).values())
+    objectives = ["Log Loss Binary", "F1"]
+    expected_scores = {
+        pipeline.name: pipeline.score(X, y, objectives) for pipeline in fitted_pipelines
+    }
+
+    with patch(
+        "evalml.automl.engine.sequential_engine.SequentialEngine.submit_scoring_job",
+    ) as mock_submit:
+        scores = automl.score_pipelines(fitted_pipelines, X, y, objectives)
+    mock_submit.assert_not_called()
+    assert scores == expected_scores
+
+    # Errors scoring one pipeline are logged without stopping the others from being scored
+    with patch(
+        "evalml.objectives.F1.objective_function",
+        side_effect=[Exception("bad F1"), 0.5],
+    ):
+        scores = automl.score_pipelines(fitted_pipelines, X, y, objectives)
+    assert (
+        "Score error for Random Forest Classifier w/ Imputer + Standard Scaler"
+        in caplog.text
+    )
+    assert np.isnan(scores[fitted_pipelines[0].name]["F1"])
+    assert scores[fitted_pipelines[1].name]["F1"] == 0.5
+
+    # Failures of the shared plan are logged with their traceback and the pipelines are scored separately
+    caplog.clear()
+    with patch(
+        "evalml.automl.automl_search.PipelineExecutionPlan",
+        side_effect=Exception("bad plan"),
+    ):
+        scores = automl.score_pipelines(fitted_pipelines, X, y, objectives)
+    assert scores == expected_scores
+    assert "Could not score pipelines together" in caplog.text
+    assert "Traceback" in caplog.text
+    assert "bad plan" in caplog.text
+
+
 @pytest.mark.parametrize(
     "pipeline_fit_side_effect",
     [
@@ -5012,3 +5064,165 @@ def test_default_algorithm_uses_n_jobs(X_y_binary, AutoMLTestEnv):
             )
 
     assert n_checked and n_feature_selector_checked
+
+
+def test_async_callback_dispatcher_runs_calls_in_order():
+    seen = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def callback(value, offset=0):
+        started.set()
+        release.wait()
+        seen.append(value + offset)
+
+    dispatcher = AsyncCallbackDispatcher(callback, max_queue_size=2)
+    assert dispatcher.name == "callback"
+    dispatcher(0)
+    started.wait()
+    dispatcher(1, offset=10)
+    dispatcher(2)
+    assert dispatcher.queue_depth == 2
+
+    blocked_call = threading.Thread(target=dispatcher, args=(3,))
+    blocked_call.start()
+    blocked_call.join(timeout=0.2)
+    # the queue is full, so the caller waits for the callback to catch up
+    assert blocked_call.is_alive()
+
+    release.set()
+    blocked_call.join()
+    dispatcher.flush()
+    assert seen == [0, 11, 2, 3]
+    assert dispatcher.queue_depth == 0
+
+
+def test_async_callback_dispatcher_raises_on_flush():
+    def callback(value):
+        if value == 1:
+            raise ValueError("bad result")
+
+    dispatcher = AsyncCallbackDispatcher(callback)
+    for value in range(3):
+        dispatcher(value)
+    with pytest.raises(ValueError, match="bad result"):
+        dispatcher.flush()
+    dispatcher.flush()
+
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        AsyncCallbackDispatcher(callback, max_queue_size=0)
+
+
+def test_automl_async_add_result_callback(AutoMLTestEnv, X_y_binary):
+    X, y = X_y_binary
+    search_thread = threading.current_thread()
+    calls = []
+
+    def add_result_callback(results, pipeline, automl_obj):
+        time.sleep(0.01)
+        calls.append((results["id"], threading.current_thread()))
+
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        max_iterations=3,
+        add_result_callback=AsyncCallbackDispatcher(add_result_callback),
+        optimize_thresholds=False,
+        n_jobs=1,
+    )
+    env = AutoMLTestEnv("binary")
+    with env.test_context(score_return_value={"Log Loss Binary": 0.3}):
+        automl.search()
+    assert [pipeline_id for pipeline_id, _ in calls] == [0, 1, 2]
+    assert all(thread is not search_thread for _, thread in calls)
+    assert "Add Result Callback: add_result_callback" in str(automl)
+
+
+def test_automl_async_add_result_callback_flushed_when_search_raises(
+    AutoMLTestEnv,
+    X_y_binary,
+):
+    X, y = X_y_binary
+
+    def add_result_callback(results, pipeline, automl_obj):
+        raise ValueError("bad callback")
+
+    dispatcher = AsyncCallbackDispatcher(add_result_callback)
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        max_iterations=3,
+        add_result_callback=dispatcher,
+        optimize_thresholds=False,
+        n_jobs=1,
+    )
+    env = AutoMLTestEnv("binary")
+    with env.test_context(score_return_value={"Log Loss Binary": 0.3}):
+        with patch.object(
+            automl.automl_algorithm,
+            "next_batch",
+            side_effect=RuntimeError("search failed"),
+        ):
+            with pytest.raises(RuntimeError, match="search failed"):
+                automl.search()
+    # The baseline pipeline's callback ran and the dispatcher was flushed, without its error masking the search's
+    assert dispatcher._thread is None
+    assert dispatcher.queue_depth == 0
+
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        max_iterations=3,
+        add_result_callback=dispatcher,
+        optimize_thresholds=False,
+        n_jobs=1,
+    )
+    with env.test_context(score_return_value={"Log Loss Binary": 0.3}):
+        with pytest.raises(ValueError, match="bad callback"):
+            automl.search()
+
+
+@pytest.mark.parametrize("engine", ["sequential", "cf_threaded"])
+def test_automl_search_metrics(engine, AutoMLTestEnv, X_y_binary):
+    X, y = X_y_binary
+    snapshots = []
+
+    def search_metrics_callback(search_metrics, automl_obj):
+        assert search_metrics is automl_obj.search_metrics
+        snapshots.append(search_metrics.to_dict())
+
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        max_iterations=4,
+        optimize_thresholds=False,
+        engine=engine,
+        search_metrics_callback=search_metrics_callback,
+    )
+    assert automl.search_metrics is None
+    env = AutoMLTestEnv("binary")
+    with env.test_context(score_return_value={"Log Loss Binary": 0.3}):
+        batch_times, search_metrics = automl.search(return_search_metrics=True)
+    automl.close_engine()
+
+    assert isinstance(batch_times, dict)
+    assert search_metrics is automl.search_metrics
+    assert search_metrics.engine == automl._engine.__class__.__name__
+    assert search_metrics.n_workers == automl._engine.n_workers
+    assert search_metrics.n_pipelines_evaluated == len(automl.full_rankings) == 4
+    assert [s["n_pipelines_evaluated"] for s in snapshots] == [1, 2, 3, 4]
+    assert search_metrics.queue_depth == 0
+    assert search_metrics.max_queue_depth >= 1
+    assert search_metrics.pipelines_per_hour > 0
+    assert 0 <= search_metrics.worker_idle_percent <= 100
+    for attribute in [
+        "tuner_time",
+        "post_evaluation_callback_time",
+        "submission_time",
+    ]:
+        assert getattr(search_metrics, attribute) > 0
+    assert search_metrics.result_time >= 0
@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+import pytest
+
+from evalml.automl.search_metrics import SearchMetrics
+
+
+@patch("evalml.automl.search_metrics.time.perf_counter")
+def test_search_metrics(mock_perf_counter):
+    mock_perf_counter.return_value = 0.0
+    metrics = SearchMetrics(engine="CFEngine", n_workers=2)
+    assert metrics.pipelines_per_hour == 0.0
+    assert metrics.worker_idle_percent == 0.0
+
+    mock_perf_counter.side_effect = [1.0, 3.0]
+    with metrics.timer("tuner_time"):
+        pass
+    mock_perf_counter.side_effect = None
+    assert metrics.tuner_time == 2.0
+
+    metrics.set_queue_depth(4)
+    metrics.set_queue_depth(1)
+    assert metrics.queue_depth == 1
+    assert metrics.max_queue_depth == 4
+
+    metrics.n_pipelines_evaluated = 3
+    metrics.pipeline_time = 6.0
+    mock_perf_counter.return_value = 10.0
+    metrics.stop()
+    mock_perf_counter.return_value = 100.0
+    assert metrics.elapsed_time == 10.0
+    assert metrics.pipelines_per_hour == pytest.approx(1080)
+    assert metrics.worker_idle_percent == pytest.approx(70)
+
+    metrics_dict = metrics.to_dict()
+    assert metrics_dict["engine"] == "CFEngine"
+    assert metrics_dict["tuner_time"] == 2.0
+    assert metrics_dict["submission_time"] == 0.0
+    assert set(metrics_dict) == {
+        "engine",
+        "n_workers",
+        "elapsed_time",
+        "n_pipelines_evaluated",
+        "pipelines_per_hour",
+        "queue_depth",
+        "max_queue_depth",
+        "worker_idle_percent",
+        "pipeline_time",
+        "tuner_time",
+        "post_evaluation_callback_time",
+        "submission_time",
+        "result_time",
+    }
+    assert repr(metrics).startswith("SearchMetrics({'engine': 'CFEngine'")
+
+
+def test_search_metrics_worker_idle_percent_is_not_negative():
+    metrics = SearchMetrics(engine="SequentialEngine")
+    metrics.pipeline_time = 1e6
+    assert metrics.worker_idle_percent == 0.0
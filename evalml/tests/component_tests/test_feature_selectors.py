@@ -153,3 +153,21 @@ def test_feature_selectors_woodwork_custom_overrides_returned_by_components(X_df
             0: logical_type,
             "another column": Double,
         }
+
+
+def test_feature_selector_transform_pruned_input(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X).add_prefix("col_")
+    selector, _ = make_rf_feature_selectors()
+    selector.fit(X, y)
+    expected = selector.transform(X)
+    X_selected = X[selector.get_names()]
+
+    # Dead feature elimination lets the selector take its selected features from input without the ones it discards
+    assert selector._drop_unused_features(set(expected.columns)) == []
+    pd.testing.assert_frame_equal(selector.transform(X_selected), expected)
+
+    # Input with missing features is rejected when the pass has not run since the selector was fitted
+    selector.fit(X, y)
+    with pytest.raises(ValueError, match="features as input"):
+        selector.transform(X_selected)
@@ -697,3 +697,36 @@ def test_imputer_woodwork_custom_overrides_returned_by_components(
         assert {k: type(v) for k, v in transformed.ww.logical_types.items()} == {
             data: Double,
         }
+
+
+@pytest.mark.parametrize(
+    "column,logical_type,numeric_impute_strategy,expected",
+    [
+        (pd.Series([1.0, 2.0, 3.0, 4.0]), "Double", "mean", True),
+        (pd.Series([1, 2, 3, 4], dtype="Int64"), "IntegerNullable", "mean", False),
+        (pd.Series([1, 2, 3, 4], dtype="Int64"), "IntegerNullable", "median", False),
+        (
+            pd.Series([1, 2, 3, 4], dtype="Int64"),
+            "IntegerNullable",
+            "most_frequent",
+            True,
+        ),
+        (pd.Series(["a", "b", "a", "b"]), "Categorical", "mean", True),
+    ],
+)
+def test_imputer_is_identity_transform(
+    column,
+    logical_type,
+    numeric_impute_strategy,
+    expected,
+):
+    X = pd.DataFrame({"col": column})
+    X.ww.init(logical_types={"col": logical_type})
+    imputer = Imputer(numeric_impute_strategy=numeric_impute_strategy)
+    imputer.fit(X)
+    assert imputer._is_identity_transform(X) is expected
+
+    X_with_nan = X.copy()
+    X_with_nan.iloc[0, 0] = None
+    X_with_nan.ww.init(logical_types={"col": logical_type})
+    assert not imputer._is_identity_transform(X_with_nan)
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -283,6 +285,39 @@ def test_handle_unknown():
     assert "Found unknown categories" in exec_info.value.args[0]
 
 
+@pytest.mark.parametrize("handle_unknown", ["ignore", "error"])
+def test_drop_unused_features_only_encodes_used_columns(handle_unknown):
+    X = pd.DataFrame(
+        {
+            "col_1": ["a", "b", "c", "d", "e", "f", "g"],
+            "col_2": ["a", "c", "d", "b", "e", "e", "f"],
+            "col_3": ["a", "a", "a", "a", "a", "a", "b"],
+            "col_4": [2, 0, 1, 3, 0, 1, 2],
+        },
+    )
+    X = set_first_three_columns_to_categorical(X)
+    encoder = OneHotEncoder(handle_unknown=handle_unknown)
+    encoder.fit(X)
+    expected = encoder.transform(X)
+    feature_names = encoder.get_feature_names()
+
+    used_features = ["col_1_a", "col_2_e", "col_3_b", "col_4"]
+    unused_features = encoder._drop_unused_features(used_features)
+    assert set(unused_features) == set(feature_names) - set(used_features)
+    assert encoder.get_feature_names() == ["col_1_a", "col_2_e", "col_3_b"]
+
+    sklearn_transform = encoder._encoder.transform
+    with patch.object(
+        encoder._encoder,
+        "transform",
+        side_effect=sklearn_transform,
+    ) as mock_transform:
+        X_t = encoder.transform(X)
+    assert mock_transform.called == (handle_unknown == "error")
+    assert_frame_equal(X_t, expected.drop(columns=unused_features))
+    assert X_t.ww.logical_types["col_1_a"] == Boolean
+
+
 def test_no_top_n():
     # test all categories in all columns are encoded when top_n is None
     X = pd.DataFrame(
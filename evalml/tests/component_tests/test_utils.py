@@ -1,4 +1,5 @@
 import inspect
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -14,6 +15,7 @@ from evalml.pipelines import (
 from evalml.pipelines.components import ComponentBase, RandomForestClassifier
 from evalml.pipelines.components.utils import (
     _all_estimators,
+    _components_by_name,
     all_components,
     estimator_unable_to_handle_nans,
     handle_component_class,
@@ -139,6 +141,24 @@ def test_handle_component_class_names():
         handle_component_class(NonComponent())
 
 
+def test_handle_component_class_reuses_registry(clear_component_caches):
+    handle_component_class("Imputer")
+    registry = _components_by_name()
+    with patch(
+        "evalml.pipelines.components.utils.all_components",
+        wraps=all_components,
+    ) as mock_all_components:
+        assert (
+            handle_component_class("Random Forest Classifier") is RandomForestClassifier
+        )
+        mock_all_components.assert_not_called()
+        with pytest.raises(MissingComponentError):
+            handle_component_class("Not A Component")
+        mock_all_components.assert_called_once()
+    assert _components_by_name() is registry
+    assert set(registry) == {component.name for component in all_components()}
+
+
 def test_scikit_learn_wrapper_invalid_problem_type():
     evalml_pipeline = MulticlassClassificationPipeline([RandomForestClassifier])
     evalml_pipeline.problem_type = None
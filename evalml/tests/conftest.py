@@ -1,4 +1,5 @@
 import contextlib
+import importlib.util
 import os
 import sys
 from unittest.mock import PropertyMock, patch
@@ -32,7 +33,7 @@ from evalml.pipelines.components import (
 from evalml.pipelines.components.ensemble.stacked_ensemble_base import (
     _nonstackable_model_families,
 )
-from evalml.pipelines.components.utils import _all_estimators
+from evalml.pipelines.components.utils import _all_estimators, _clear_component_registry
 from evalml.preprocessing import load_data
 from evalml.problem_types import (
     ProblemTypes,
@@ -41,6 +42,7 @@ from evalml.problem_types import (
     is_time_series,
 )
 from evalml.utils import infer_feature_types
+from evalml.utils.gen_utils import _clear_importable_subclasses_cache
 
 
 def pytest_configure(config):
@@ -52,6 +54,10 @@ def pytest_configure(config):
         "markers",
         "skip_during_conda: mark test to be skipped if running during conda build",
     )
+    config.addinivalue_line(
+        "markers",
+        "noncore_dependency(module): mark test to be skipped if the given dependency outside evalml's requirements is not installed",
+    )
 
 
 @pytest.fixture(scope="session")
@@ -397,6 +403,21 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if "skip_during_conda" in item.keywords:
                 item.add_marker(skip_conda)
+    for item in items:
+        for marker in item.iter_markers(name="noncore_dependency"):
+            module = marker.args[0]
+            if importlib.util.find_spec(module) is None:
+                item.add_marker(pytest.mark.skip(reason=f"{module} is not installed"))
+
+
+@pytest.fixture
+def clear_component_caches():
+    """Clears the cached component discovery before and after a test, so classes a test patches or defines are not remembered."""
+    _clear_importable_subclasses_cache()
+    _clear_component_registry()
+    yield
+    _clear_importable_subclasses_cache()
+    _clear_component_registry()
 
 
 @pytest.fixture
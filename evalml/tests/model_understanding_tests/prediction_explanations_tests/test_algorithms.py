@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pandas as pd
 import pytest
+import shap
 
 from evalml.model_family.model_family import ModelFamily
 from evalml.model_understanding.prediction_explanations._algorithms import (
@@ -13,6 +14,7 @@ from evalml.model_understanding.prediction_explanations._algorithms import (
     _compute_shap_values,
     _create_dictionary,
     _normalize_explainer_values,
+    _select_row,
 )
 from evalml.pipelines import (
     BinaryClassificationPipeline,
@@ -358,6 +360,125 @@ def test_compute_shap_values_absolute_probs(mock_predict_proba, X_y_binary):
         assert not np.isnan(feat).any()
 
 
+def test_compute_shap_values_caches_tree_explainer(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = BinaryClassificationPipeline(["Random Forest Classifier"])
+    pipeline.fit(X, y)
+
+    with patch("shap.TreeExplainer", wraps=shap.TreeExplainer) as mock_explainer:
+        first_values, _ = _compute_shap_values(pipeline, X.iloc[:5])
+        second_values, _ = _compute_shap_values(pipeline, X.iloc[:5])
+        assert mock_explainer.call_count == 1
+        assert first_values == second_values
+
+        pipeline.fit(X.iloc[:50], y[:50])
+        _compute_shap_values(pipeline, X.iloc[:5])
+        assert mock_explainer.call_count == 2
+
+
+def test_compute_shap_values_caches_kernel_explainer(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = BinaryClassificationPipeline(["Logistic Regression Classifier"])
+    pipeline.fit(X, y)
+
+    with patch("shap.KernelExplainer", wraps=shap.KernelExplainer) as mock_explainer:
+        _compute_shap_values(pipeline, X.iloc[:2], training_data=X)
+        _compute_shap_values(pipeline, X.iloc[2:4], training_data=X)
+        assert mock_explainer.call_count == 1
+
+        # A different background sample needs a new explainer
+        _compute_shap_values(pipeline, X.iloc[:2], training_data=X.iloc[:50])
+        assert mock_explainer.call_count == 2
+
+
+@pytest.mark.parametrize("problem_type", ["binary", "regression"])
+def test_compute_lime_values_batched(problem_type, X_y_binary, X_y_regression):
+    if problem_type == "binary":
+        X, y = X_y_binary
+        pipeline = BinaryClassificationPipeline(["Logistic Regression Classifier"])
+    else:
+        X, y = X_y_regression
+        pipeline = RegressionPipeline(["Linear Regressor"])
+    X = pd.DataFrame(X)
+    pipeline.fit(X, y)
+
+    # The sampling around each row is seeded by the row's index
+    batched = _compute_lime_values(pipeline, X, [3, 7])
+    one_at_a_time = [
+        _compute_lime_values(pipeline, X, 3),
+        _compute_lime_values(pipeline, X, 7),
+    ]
+    for position, row_values in enumerate(one_at_a_time):
+        assert _select_row(batched, position) == row_values
+
+
+def test_compute_lime_values_caches_explainer(X_y_binary):
+    import lime.lime_tabular
+
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = BinaryClassificationPipeline(["Logistic Regression Classifier"])
+    pipeline.fit(X, y)
+
+    with patch(
+        "lime.lime_tabular.LimeTabularExplainer",
+        wraps=lime.lime_tabular.LimeTabularExplainer,
+    ) as mock_explainer:
+        first_values = _compute_lime_values(pipeline, X, [0, 1])
+        second_values = _compute_lime_values(pipeline, X, [0, 1])
+        assert mock_explainer.call_count == 1
+        assert first_values == second_values
+
+        # Different features need a new explainer
+        _compute_lime_values(pipeline, X.iloc[:50], [0, 1])
+        assert mock_explainer.call_count == 2
+
+        # Features which cannot be hashed always get a new explainer
+        with patch(
+            "evalml.model_understanding.prediction_explanations._algorithms._data_fingerprint",
+            return_value=None,
+        ):
+            _compute_lime_values(pipeline, X, [0, 1])
+            _compute_lime_values(pipeline, X.iloc[:50], [0, 1])
+        assert mock_explainer.call_count == 4
+        _compute_lime_values(pipeline, X.iloc[:50], [0, 1])
+        assert mock_explainer.call_count == 4
+
+
+@pytest.mark.parametrize("problem_type", ["binary", "regression"])
+def test_compute_lime_values_n_jobs(problem_type, X_y_binary, X_y_regression):
+    if problem_type == "binary":
+        X, y = X_y_binary
+        pipeline = BinaryClassificationPipeline(["Logistic Regression Classifier"])
+    else:
+        X, y = X_y_regression
+        pipeline = RegressionPipeline(["Linear Regressor"])
+    X = pd.DataFrame(X)
+    pipeline.fit(X, y)
+
+    sequential = _compute_lime_values(pipeline, X, [0, 5, 9], n_jobs=1)
+    parallel = _compute_lime_values(pipeline, X, [0, 5, 9], n_jobs=2)
+    assert sequential == parallel
+    assert _compute_lime_values(pipeline, X, [0, 5, 9], random_seed=1) != sequential
+
+
+def test_compute_lime_values_predicts_on_arrays(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = BinaryClassificationPipeline(["Random Forest Classifier"])
+    pipeline.fit(X, y)
+
+    with patch.object(
+        pipeline.estimator,
+        "predict_proba",
+        wraps=pipeline.estimator.predict_proba,
+    ) as mock_estimator_predict_proba:
+        _compute_lime_values(pipeline, X, 0)
+    mock_estimator_predict_proba.assert_not_called()
+
+
 def test_normalize_values_exceptions():
 
     with pytest.raises(
@@ -8,6 +8,7 @@ import pytest
 import woodwork as ww
 
 from evalml.exceptions import PipelineScoreError
+from evalml.model_understanding.prediction_explanations import _algorithms
 from evalml.model_understanding.prediction_explanations.explainers import (
     ExplainPredictionsStage,
     abs_error,
@@ -610,6 +611,7 @@ def test_explain_predictions_best_worst_and_explain_predictions_regression(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        explainer_values=ANY,
     )
 
     best_worst_report = explain_predictions_best_worst(
@@ -632,6 +634,7 @@ def test_explain_predictions_best_worst_and_explain_predictions_regression(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        explainer_values=ANY,
     )
 
 
@@ -724,6 +727,7 @@ def test_explain_predictions_best_worst_and_explain_predictions_binary(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        explainer_values=ANY,
     )
 
     best_worst_report = explain_predictions_best_worst(
@@ -746,6 +750,7 @@ def test_explain_predictions_best_worst_and_explain_predictions_binary(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        explainer_values=ANY,
     )
 
 
@@ -851,6 +856,7 @@ def test_explain_predictions_best_worst_and_explain_predictions_multiclass(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        explainer_values=ANY,
     )
 
     best_worst_report = explain_predictions_best_worst(
@@ -873,6 +879,7 @@ def test_explain_predictions_best_worst_and_explain_predictions_multiclass(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        explainer_values=ANY,
     )
 
 
@@ -2223,6 +2230,53 @@ def test_explain_predictions_best_worst_json(algorithm, fraud_100):
     assert isinstance(json_output, str)
 
 
+@pytest.mark.parametrize("algorithm", algorithms)
+def test_explain_predictions_computes_explainer_values_once(algorithm, X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = BinaryClassificationPipeline(["Random Forest Classifier"])
+    pipeline.fit(X, y)
+    compute_function = f"_compute_{algorithm}_values"
+
+    with patch(
+        f"evalml.model_understanding.prediction_explanations._algorithms.{compute_function}",
+        wraps=getattr(_algorithms, compute_function),
+    ) as mock_compute:
+        report = explain_predictions(
+            pipeline,
+            X,
+            y,
+            indices_to_explain=[4, 0, 9, 4],
+            output_format="dict",
+            include_explainer_values=True,
+            algorithm=algorithm,
+        )
+        assert mock_compute.call_count == 1
+        mock_compute.reset_mock()
+        explain_predictions_best_worst(
+            pipeline,
+            X,
+            y,
+            num_to_explain=3,
+            algorithm=algorithm,
+            output_format="dataframe",
+        )
+        assert mock_compute.call_count == 1
+
+    if algorithm == "shap":
+        # Tree SHAP values of a row do not depend on the other rows explained
+        for explanation, index in zip(report["explanations"], [4, 0, 9, 4]):
+            row_report = explain_predictions(
+                pipeline,
+                X,
+                y,
+                indices_to_explain=[index],
+                output_format="dict",
+                include_explainer_values=True,
+            )
+            assert explanation == row_report["explanations"][0]
+
+
 def test_explain_predictions_invalid_algorithm():
     pipeline = MagicMock()
     input_features = pd.DataFrame({"a": [5, 6, 1, 2, 3, 4, 5, 6, 7, 4]})
@@ -0,0 +1,240 @@
+import gc
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.model_understanding import (
+    ModelUnderstandingCache,
+    calculate_permutation_importance,
+    explain_predictions,
+    partial_dependence,
+)
+from evalml.model_understanding.cache import _cached_call, _data_fingerprint
+from evalml.pipelines import TimeSeriesBinaryClassificationPipeline
+from evalml.utils import infer_feature_types
+
+
+@pytest.fixture
+def fitted_pipeline_and_data(X_y_binary, logistic_regression_binary_pipeline):
+    X, y = X_y_binary
+    X = infer_feature_types(pd.DataFrame(X))
+    y = infer_feature_types(pd.Series(y))
+    logistic_regression_binary_pipeline.fit(X, y)
+    return logistic_regression_binary_pipeline, X, y
+
+
+def test_cache_shared_between_functions(fitted_pipeline_and_data):
+    pipeline, X, y = fitted_pipeline_and_data
+    importance = calculate_permutation_importance(pipeline, X, y, "Log Loss Binary")
+    report = explain_predictions(pipeline, X, y, indices_to_explain=[0, 4])
+    dependence = partial_dependence(pipeline, X, 0)
+
+    with patch.object(
+        pipeline,
+        "transform_all_but_final",
+        wraps=pipeline.transform_all_but_final,
+    ) as mock_transform:
+        with ModelUnderstandingCache() as cache:
+            cached_importance = calculate_permutation_importance(
+                pipeline,
+                X,
+                y,
+                "Log Loss Binary",
+            )
+            cached_report = explain_predictions(
+                pipeline,
+                X,
+                y,
+                indices_to_explain=[0, 4],
+            )
+            cached_dependence = partial_dependence(pipeline, X, 0)
+            partial_dependence(pipeline, X, 0)
+    assert mock_transform.call_count == 3
+    assert cache.misses == 3
+    assert cache.hits == 3
+    assert len(cache) == 3
+    pd.testing.assert_frame_equal(importance, cached_importance)
+    assert report == cached_report
+    pd.testing.assert_frame_equal(dependence, cached_dependence)
+
+
+def test_cache_only_used_while_active(fitted_pipeline_and_data):
+    pipeline, X, y = fitted_pipeline_and_data
+    cache = ModelUnderstandingCache()
+    _cached_call(pipeline, "predict", X)
+    assert len(cache) == 0
+
+    with cache:
+        _cached_call(pipeline, "predict", X)
+        with ModelUnderstandingCache() as inner_cache:
+            _cached_call(pipeline, "predict", X)
+        _cached_call(pipeline, "predict", X)
+    _cached_call(pipeline, "predict", X)
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert (inner_cache.misses, inner_cache.hits) == (1, 0)
+
+
+def test_cache_results_are_copies(fitted_pipeline_and_data):
+    pipeline, X, y = fitted_pipeline_and_data
+    with ModelUnderstandingCache() as cache:
+        features = cache.transform_all_but_final(pipeline, X, y)
+        features.iloc[0, 0] = 1000
+        cached_features = cache.transform_all_but_final(pipeline, X, y)
+    assert cached_features.iloc[0, 0] != 1000
+    assert cached_features.ww.schema == features.ww.schema
+    pd.testing.assert_frame_equal(
+        cached_features,
+        pipeline.transform_all_but_final(X, y),
+    )
+
+
+@pytest.mark.parametrize("change", ["value", "index", "column", "type", "y"])
+def test_cache_keyed_by_data(change, fitted_pipeline_and_data):
+    pipeline, X, y = fitted_pipeline_and_data
+    X_other = X.ww.copy()
+    y_other = y
+    if change == "value":
+        X_other.iloc[0, 0] += 1
+    elif change == "index":
+        X_other.index = X_other.index + 1
+    elif change == "column":
+        X_other.ww.rename({0: "renamed"}, inplace=True)
+    elif change == "type":
+        X_other.ww.set_types({0: "Categorical"})
+    else:
+        y_other = y.copy()
+        y_other.iloc[0] = 1 - y_other.iloc[0]
+
+    assert (_data_fingerprint(X, index=True), _data_fingerprint(y, index=True)) != (
+        _data_fingerprint(X_other, index=True),
+        _data_fingerprint(y_other, index=True),
+    )
+    if change in ["column", "type"]:
+        # The pipeline cannot be called on data with different columns or types
+        return
+
+    cache = ModelUnderstandingCache()
+    cache.transform_all_but_final(pipeline, X, y)
+    cache.transform_all_but_final(pipeline, X_other, y_other)
+    assert cache.misses == 2
+    cache.transform_all_but_final(pipeline, X.ww.copy(), y.ww.copy())
+    assert cache.hits == 1
+
+
+def test_cache_invalidation(fitted_pipeline_and_data, X_y_binary):
+    pipeline, X, y = fitted_pipeline_and_data
+    other_pipeline = pipeline.clone().fit(X, y)
+    cache = ModelUnderstandingCache()
+    cache.predict(pipeline, X)
+    cache.predict(other_pipeline, X)
+    assert len(cache) == 2
+
+    cache.invalidate(pipeline)
+    assert len(cache) == 1
+    cache.predict(pipeline, X)
+    assert cache.misses == 3
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+    cache.predict(pipeline, X)
+    pipeline.fit(X, y)
+    cache.predict(pipeline, X)
+    assert cache.misses == 5
+    assert len(cache) == 1
+
+    pipeline.threshold = 0.9
+    cache.predict(pipeline, X)
+    cache.predict_proba(pipeline, X)
+    assert cache.misses == 7
+
+    del other_pipeline
+    gc.collect()
+    cache.predict(pipeline, X)
+    assert len(cache) == 3
+
+
+def test_cache_skips_data_which_cannot_be_hashed(fitted_pipeline_and_data):
+    pipeline, X, y = fitted_pipeline_and_data
+    assert _data_fingerprint(None) is None
+    assert _data_fingerprint(np.array([[1, "a"]], dtype=object)) is None
+    assert _data_fingerprint(np.ones((2, 2))) == _data_fingerprint(np.ones((2, 2)))
+    assert _data_fingerprint(np.ones((2, 2))) != _data_fingerprint(np.ones((4, 1)))
+
+    cache = ModelUnderstandingCache()
+    with patch(
+        "evalml.model_understanding.cache._data_fingerprint",
+        return_value=None,
+    ):
+        cache.predict(pipeline, X)
+        cache.predict(pipeline, X)
+    assert (cache.misses, cache.hits, len(cache)) == (0, 0, 0)
+
+
+def test_cache_time_series_in_sample(ts_data_binary):
+    X, y = ts_data_binary
+    pipeline = TimeSeriesBinaryClassificationPipeline(
+        component_graph={
+            "Time Series Featurizer": ["Time Series Featurizer", "X", "y"],
+            "DateTime Featurizer": [
+                "DateTime Featurizer",
+                "Time Series Featurizer.x",
+                "y",
+            ],
+            "Drop NaN Rows Transformer": [
+                "Drop NaN Rows Transformer",
+                "DateTime Featurizer.x",
+                "y",
+            ],
+            "Logistic Regression Classifier": [
+                "Logistic Regression Classifier",
+                "Drop NaN Rows Transformer.x",
+                "Drop NaN Rows Transformer.y",
+            ],
+        },
+        parameters={
+            "pipeline": {
+                "time_index": "date",
+                "gap": 0,
+                "max_delay": 2,
+                "forecast_horizon": 1,
+            },
+            "Time Series Featurizer": {
+                "gap": 0,
+                "max_delay": 2,
+                "forecast_horizon": 1,
+                "time_index": "date",
+            },
+        },
+    )
+    X_train, y_train = X[:15], y[:15]
+    X_holdout, y_holdout = X[15:], y[15:]
+    pipeline.fit(X_train, y_train)
+
+    cache = ModelUnderstandingCache()
+    for _ in range(2):
+        proba = cache.predict_proba_in_sample(
+            pipeline,
+            X_holdout,
+            y_holdout,
+            X_train,
+            y_train,
+        )
+        predictions = cache.predict_in_sample(
+            pipeline,
+            X_holdout,
+            y_holdout,
+            X_train,
+            y_train,
+        )
+    assert (cache.misses, cache.hits) == (2, 2)
+    pd.testing.assert_frame_equal(
+        proba,
+        pipeline.predict_proba_in_sample(X_holdout, y_holdout, X_train, y_train),
+    )
+    pd.testing.assert_series_equal(
+        predictions,
+        pipeline.predict_in_sample(X_holdout, y_holdout, X_train, y_train),
+    )
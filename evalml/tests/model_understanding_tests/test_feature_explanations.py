@@ -255,6 +255,7 @@ def test_readable_explanation_permutation(
         },
     )
     readable_explanation(pipeline, X, y, importance_method="permutation")
+    assert mock_permutation_importance.call_args[1]["adaptive"] is False
 
     out = caplog.text
     expected_influence = "Elastic Net Classifier: The prediction of fraud as measured by log loss binary is heavily influenced by lng."
@@ -281,7 +282,8 @@ def test_readable_explanation_different_objective(
     mock_permutation_importance.return_value = pd.DataFrame(
         {"feature": [], "importance": []},
     )
-    readable_explanation(pipeline, X, y, objective="precision")
+    readable_explanation(pipeline, X, y, objective="precision", adaptive=True)
+    assert mock_permutation_importance.call_args[1]["adaptive"] is True
 
     out = caplog.text
     expected_output = "The prediction of fraud as measured by precision"
@@ -9,6 +9,7 @@ from sklearn.preprocessing import label_binarize
 
 from evalml.exceptions import NoPositiveLabelException
 from evalml.model_understanding.metrics import (
+    confusion_counts_per_threshold,
     confusion_matrix,
     graph_confusion_matrix,
     graph_precision_recall_curve,
@@ -192,6 +193,26 @@ def binarized_ys(X_y_multi):
     return y_true, y_tr, y_pred_proba
 
 
+@pytest.mark.parametrize("data_type", ["np", "pd"])
+def test_confusion_counts_per_threshold(data_type, make_data_type):
+    rs = get_random_state(0)
+    y_true = rs.randint(0, 2, 100)
+    # rounding gives ties, some of which fall on the thresholds
+    y_pred_proba = np.round(rs.random(100), 1)
+    thresholds = np.linspace(0, 1, 21)
+    counts = confusion_counts_per_threshold(
+        make_data_type(data_type, y_true),
+        make_data_type(data_type, y_pred_proba),
+        thresholds,
+    )
+    for i, threshold in enumerate(thresholds):
+        y_pred = y_pred_proba > threshold
+        assert counts["true_positives"][i] == np.sum(y_pred & (y_true == 1))
+        assert counts["false_positives"][i] == np.sum(y_pred & (y_true == 0))
+        assert counts["true_negatives"][i] == np.sum(~y_pred & (y_true == 0))
+        assert counts["false_negatives"][i] == np.sum(~y_pred & (y_true == 1))
+
+
 def test_precision_recall_curve_return_type():
     y_true = np.array([0, 0, 1, 1])
     y_predict_proba = np.array([0.1, 0.4, 0.35, 0.8])
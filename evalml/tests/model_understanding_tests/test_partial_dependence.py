@@ -1,5 +1,6 @@
 import re
-from unittest.mock import patch
+import warnings
+from unittest.mock import PropertyMock, patch
 
 import numpy as np
 import pandas as pd
@@ -10,8 +11,10 @@ from evalml.exceptions import (
     NullsInColumnWarning,
     PartialDependenceError,
     PartialDependenceErrorCode,
+    PartialDependenceMethodWarning,
 )
 from evalml.model_understanding import graph_partial_dependence, partial_dependence
+from evalml.model_understanding._partial_dependence_utils import _predict_grid
 from evalml.pipelines import (
     BinaryClassificationPipeline,
     ClassificationPipeline,
@@ -618,6 +621,300 @@ def test_two_way_partial_dependence_ice_plot(logistic_regression_binary_pipeline
         assert ind_df.shape == (2, 3)
 
 
+def test_partial_dependence_batch_size_counts_transformed_features(fraud_100):
+    X, y = fraud_100
+    X = X.ww[["amount", "currency"]]
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "One Hot Encoder", "Random Forest Classifier"],
+    )
+    pipeline.fit(X, y)
+    n_estimator_features = len(pipeline.estimator.input_feature_names)
+    assert n_estimator_features > X.shape[1]
+
+    grid = pd.DataFrame({0: np.linspace(X["amount"].min(), X["amount"].max(), 10)})
+    # Enough for every grid point if only the columns of X were counted
+    with patch(
+        "evalml.model_understanding._partial_dependence_utils._PARTIAL_DEPENDENCE_BATCH_SIZE",
+        X.size * len(grid),
+    ):
+        batches = list(_predict_grid(pipeline, grid, ["amount"], X))
+    batch_size = max(1, len(grid) * X.shape[1] // n_estimator_features)
+    assert [len(batch) for batch in batches[:-1]] == [batch_size] * (len(batches) - 1)
+    assert sum(len(batch) for batch in batches) == len(grid)
+
+
+@pytest.mark.parametrize("supports_fast_mode", [True, False])
+@pytest.mark.parametrize("features", ["amount", ("currency", "amount")])
+def test_partial_dependence_batches_grid_points(
+    features,
+    supports_fast_mode,
+    fraud_100,
+):
+    X, y = fraud_100
+    X = X.ww[["card_id", "amount", "currency", "provider"]]
+    pipeline = BinaryClassificationPipeline(
+        component_graph={
+            "Label Encoder": ["Label Encoder", "X", "y"],
+            "Imputer": ["Imputer", "X", "Label Encoder.y"],
+            "One Hot Encoder": ["One Hot Encoder", "Imputer.x", "Label Encoder.y"],
+            "Random Forest Classifier": [
+                "Random Forest Classifier",
+                "One Hot Encoder.x",
+                "Label Encoder.y",
+            ],
+        },
+    )
+    pipeline.fit(X, y)
+
+    with patch(
+        "evalml.pipelines.PipelineBase._supports_fast_permutation_importance",
+        new_callable=PropertyMock,
+        return_value=supports_fast_mode,
+    ):
+        with patch(
+            "evalml.model_understanding._partial_dependence_utils._PARTIAL_DEPENDENCE_BATCH_SIZE",
+            1,
+        ):
+            one_at_a_time = partial_dependence(
+                pipeline,
+                X,
+                features,
+                grid_resolution=5,
+                kind="both",
+            )
+        with patch.object(
+            pipeline,
+            "transform_all_but_final",
+            wraps=pipeline.transform_all_but_final,
+        ) as mock_transform, patch.object(
+            pipeline,
+            "predict_proba",
+            wraps=pipeline.predict_proba,
+        ) as mock_predict_proba:
+            batched = partial_dependence(
+                pipeline,
+                X,
+                features,
+                grid_resolution=5,
+                kind="both",
+            )
+    if supports_fast_mode:
+        # X and the grid points are each transformed once
+        assert mock_transform.call_count == 2
+        assert mock_predict_proba.call_count == 0
+    else:
+        assert mock_predict_proba.call_count == 1
+    pd.testing.assert_frame_equal(batched[0], one_at_a_time[0])
+    if isinstance(features, str):
+        pd.testing.assert_frame_equal(batched[1], one_at_a_time[1])
+    else:
+        for batched_ice, ice in zip(batched[1], one_at_a_time[1]):
+            pd.testing.assert_frame_equal(batched_ice, ice)
+
+
+def test_partial_dependence_ice_sample_size(fraud_100):
+    X, y = fraud_100
+    X = X.ww[["card_id", "amount", "currency"]]
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "One Hot Encoder", "Random Forest Classifier"],
+    )
+    pipeline.fit(X, y)
+
+    ice = partial_dependence(
+        pipeline, X, "amount", grid_resolution=5, kind="individual"
+    )
+    sampled_ice = partial_dependence(
+        pipeline,
+        X,
+        "amount",
+        grid_resolution=5,
+        kind="individual",
+        ice_sample_size=10,
+        random_seed=3,
+    )
+    assert sampled_ice.shape == (5, 12)
+    pd.testing.assert_frame_equal(sampled_ice, ice[sampled_ice.columns])
+
+    average, both_ice = partial_dependence(
+        pipeline,
+        X,
+        "amount",
+        grid_resolution=5,
+        kind="both",
+        ice_sample_size=10,
+        random_seed=3,
+    )
+    pd.testing.assert_frame_equal(both_ice, sampled_ice)
+    # The average is still over every row
+    pd.testing.assert_frame_equal(
+        average,
+        partial_dependence(pipeline, X, "amount", grid_resolution=5),
+    )
+
+
+@pytest.mark.parametrize("features", [0, (1, 3)])
+@pytest.mark.parametrize(
+    "estimator",
+    [
+        "Decision Tree Regressor",
+        "Random Forest Regressor",
+        "Extra Trees Regressor",
+    ],
+)
+def test_partial_dependence_recursion_regression(estimator, features, X_y_regression):
+    from sklearn.inspection import partial_dependence as sk_partial_dependence
+
+    X, y = X_y_regression
+    X = pd.DataFrame(X)
+    pipeline = RegressionPipeline(["Imputer", estimator])
+    pipeline.fit(X, y)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", PartialDependenceMethodWarning)
+        part_dep = partial_dependence(
+            pipeline,
+            X,
+            features,
+            grid_resolution=10,
+            method="recursion",
+        )
+    # Average over the trees, since scikit-learn does not support the 'recursion' method for extra trees
+    estimator = pipeline.estimator._component_obj
+    expected = np.mean(
+        [
+            sk_partial_dependence(
+                tree,
+                X.to_numpy(),
+                [features] if isinstance(features, int) else list(features),
+                grid_resolution=10,
+                method="recursion",
+            )["average"][0]
+            for tree in getattr(estimator, "estimators_", [estimator])
+        ],
+        axis=0,
+    )
+    if isinstance(features, int):
+        np.testing.assert_allclose(part_dep["partial_dependence"], expected)
+    else:
+        np.testing.assert_allclose(part_dep.to_numpy(), expected)
+
+
+@pytest.mark.parametrize(
+    "estimator",
+    ["Decision Tree Classifier", "Random Forest Classifier", "Extra Trees Classifier"],
+)
+def test_partial_dependence_recursion_classification(estimator):
+    # With a single feature, averaging over the training data and over X are the same
+    rs = np.random.RandomState(0)
+    X = pd.DataFrame({"a": rs.rand(300) * 3})
+    y = pd.Series((X["a"] + rs.rand(300)).astype(int))
+    pipeline = MulticlassClassificationPipeline([estimator])
+    pipeline.fit(X, y)
+
+    recursion = partial_dependence(
+        pipeline,
+        X,
+        "a",
+        grid_resolution=10,
+        method="recursion",
+    )
+    brute = partial_dependence(pipeline, X, "a", grid_resolution=10)
+    pd.testing.assert_frame_equal(recursion, brute)
+    assert recursion.attrs["method"] == "recursion"
+    assert brute.attrs["method"] == "brute"
+
+
+@pytest.mark.parametrize(
+    "component_graph,features,kind,reason",
+    [
+        (
+            ["Imputer", "Random Forest Classifier"],
+            "amount",
+            "both",
+            "individual predictions cannot",
+        ),
+        (
+            ["Imputer", "Logistic Regression Classifier"],
+            "amount",
+            "average",
+            "only supports decision tree",
+        ),
+        (
+            ["Imputer", "Standard Scaler", "Random Forest Classifier"],
+            "amount",
+            "average",
+            "feature 'amount' is not passed",
+        ),
+        (
+            ["Imputer", "One Hot Encoder", "Random Forest Classifier"],
+            ("currency", "amount"),
+            "average",
+            "feature 'currency' is not passed",
+        ),
+    ],
+)
+def test_partial_dependence_recursion_falls_back_to_brute(
+    component_graph,
+    features,
+    kind,
+    reason,
+    fraud_100,
+):
+    X, y = fraud_100
+    X = X.ww[["card_id", "amount", "currency"]]
+    if "One Hot Encoder" not in component_graph:
+        X = X.ww.drop(columns=["currency"])
+    pipeline = BinaryClassificationPipeline(component_graph)
+    pipeline.fit(X, y)
+
+    with pytest.warns(PartialDependenceMethodWarning, match=reason):
+        recursion = partial_dependence(
+            pipeline,
+            X,
+            features,
+            grid_resolution=5,
+            kind=kind,
+            method="recursion",
+        )
+    brute = partial_dependence(pipeline, X, features, grid_resolution=5, kind=kind)
+    if kind == "both":
+        pd.testing.assert_frame_equal(recursion[0], brute[0])
+        pd.testing.assert_frame_equal(recursion[1], brute[1])
+        assert recursion[0].attrs["method"] == "brute"
+        assert recursion[1].attrs["method"] == "brute"
+    else:
+        pd.testing.assert_frame_equal(recursion, brute)
+        assert recursion.attrs["method"] == "brute"
+
+
+def test_partial_dependence_recursion_target_transformer(X_y_regression):
+    X, y = X_y_regression
+    pipeline = RegressionPipeline(
+        {
+            "Log Transformer": ["Log Transformer", "X", "y"],
+            "Random Forest Regressor": [
+                "Random Forest Regressor",
+                "X",
+                "Log Transformer.y",
+            ],
+        },
+    )
+    pipeline.fit(X, y - y.min() + 1)
+    with pytest.warns(
+        PartialDependenceMethodWarning,
+        match="the pipeline transforms the target",
+    ):
+        partial_dependence(pipeline, X, 0, grid_resolution=5, method="recursion")
+
+
+def test_partial_dependence_invalid_method(X_y_binary):
+    X, y = X_y_binary
+    pipeline = BinaryClassificationPipeline(["Random Forest Classifier"])
+    pipeline.fit(X, y)
+    with pytest.raises(PartialDependenceError, match="'method' must be"):
+        partial_dependence(pipeline, X, 0, method="fast")
+
+
 @pytest.mark.parametrize("problem_type", [ProblemTypes.BINARY, ProblemTypes.REGRESSION])
 def test_partial_dependence_ensemble_pipeline(problem_type, X_y_binary, X_y_regression):
     if problem_type == ProblemTypes.BINARY:
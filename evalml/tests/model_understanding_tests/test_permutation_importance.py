@@ -756,6 +756,139 @@ def test_permutation_importance_standard_scaler(fraud_100):
     calculate_permutation_importance(pipeline, X, y, objective="log loss binary")
 
 
+@pytest.mark.parametrize("objective", ["Log Loss Binary", "F1"])
+def test_fast_permutation_importance_batches(objective, fraud_100):
+    X, y = fraud_100
+    pipeline = BinaryClassificationPipeline(
+        [
+            "Imputer",
+            "DateTime Featurizer",
+            "One Hot Encoder",
+            "Random Forest Classifier",
+        ],
+        parameters={"Random Forest Classifier": {"n_estimators": 10, "n_jobs": 1}},
+    )
+    pipeline.fit(X, y)
+    importance = calculate_permutation_importance(
+        pipeline,
+        X,
+        y,
+        objective=objective,
+        n_repeats=5,
+    )
+    n_features = pipeline.transform_all_but_final(X, y).size
+    # Score one permutation per estimator call, then two with one left over
+    for batch_size in [1, n_features * 2]:
+        with patch(
+            "evalml.model_understanding.permutation_importance._PERMUTATION_BATCH_SIZE",
+            batch_size,
+        ):
+            pd.testing.assert_frame_equal(
+                calculate_permutation_importance(
+                    pipeline,
+                    X,
+                    y,
+                    objective=objective,
+                    n_repeats=5,
+                ),
+                importance,
+            )
+    pd.testing.assert_frame_equal(
+        calculate_permutation_importance(
+            pipeline,
+            X,
+            y,
+            objective=objective,
+            n_repeats=5,
+            n_jobs=2,
+        ),
+        importance,
+    )
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_adaptive_permutation_importance(fast):
+    rs = np.random.RandomState(0)
+    X = pd.DataFrame(rs.randn(400, 6), columns=[f"feature_{i}" for i in range(6)])
+    y = pd.Series(X["feature_0"] * 3 + X["feature_1"] + rs.randn(400) > 0)
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Logistic Regression Classifier"],
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+    )
+    pipeline.fit(X, y)
+
+    with patch(
+        "evalml.pipelines.PipelineBase._supports_fast_permutation_importance",
+        new_callable=PropertyMock,
+        return_value=fast,
+    ):
+        importance = calculate_permutation_importance(
+            pipeline,
+            X,
+            y,
+            objective="Log Loss Binary",
+            n_repeats=9,
+            adaptive=True,
+            screening_sample_size=200,
+        )
+        fixed_importance = calculate_permutation_importance(
+            pipeline,
+            X,
+            y,
+            objective="Log Loss Binary",
+            n_repeats=9,
+        ).set_index("feature")["importance"]
+    assert list(importance.columns) == [
+        "feature",
+        "importance",
+        "lower_bound",
+        "upper_bound",
+        "n_repeats",
+    ]
+    assert importance["importance"].is_monotonic_decreasing
+    assert set(importance["feature"]) == set(X.columns)
+    assert (importance["lower_bound"] <= importance["importance"]).all()
+    assert (importance["importance"] <= importance["upper_bound"]).all()
+    assert importance["n_repeats"].between(3, 9).all()
+
+    importance = importance.set_index("feature")
+    # The important features are clearly separated from zero after the first round
+    assert importance.loc["feature_0", "lower_bound"] > 0
+    assert importance.loc[["feature_0", "feature_1"], "n_repeats"].tolist() == [3, 3]
+    # Features permuted as many times as the fixed number of repeats get the same importance
+    permuted_fully = importance[importance["n_repeats"] == 9].index
+    np.testing.assert_allclose(
+        importance.loc[permuted_fully, "importance"],
+        fixed_importance[permuted_fully],
+    )
+
+
+def test_adaptive_permutation_importance_screens_negligible_features(fraud_100):
+    X, y = fraud_100
+    X = X.ww[["card_id", "store_id", "amount", "lat", "lng"]]
+    X.ww["constant"] = pd.Series([1] * len(X), index=X.index)
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Drop Columns Transformer", "Random Forest Classifier"],
+        parameters={
+            "Drop Columns Transformer": {"columns": ["constant"]},
+            "Random Forest Classifier": {"n_estimators": 10, "n_jobs": 1},
+        },
+    )
+    pipeline.fit(X, y)
+    importance = calculate_permutation_importance(
+        pipeline,
+        X,
+        y,
+        objective="Log Loss Binary",
+        n_repeats=9,
+        adaptive=True,
+        tolerance=1e-6,
+        screening_sample_size=50,
+    ).set_index("feature")
+    # The dropped column is only permuted on the sample
+    assert importance.loc["constant"].tolist() == [0, 0, 0, 3]
+
+
 def test_graph_permutation_importance(
     X_y_binary,
     logistic_regression_binary_pipeline,
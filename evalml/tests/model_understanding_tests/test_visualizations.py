@@ -22,7 +22,7 @@ from evalml.model_understanding.visualizations import (
     t_sne,
     visualize_decision_tree,
 )
-from evalml.objectives import CostBenefitMatrix
+from evalml.objectives import CostBenefitMatrix, SensitivityLowAlert, get_objective
 from evalml.pipelines import (
     DecisionTreeRegressor,
     ElasticNetRegressor,
@@ -114,33 +114,73 @@ def test_binary_objective_vs_threshold(
     assert not results_df.isnull().all().all()
 
 
+@pytest.mark.parametrize("from_confusion_counts", [True, False])
 @patch("evalml.pipelines.BinaryClassificationPipeline.score")
 def test_binary_objective_vs_threshold_steps(
     mock_score,
+    from_confusion_counts,
     X_y_binary,
     logistic_regression_binary_pipeline,
 ):
     X, y = X_y_binary
-    cbm = CostBenefitMatrix(
-        true_positive=1,
-        true_negative=-1,
-        false_positive=-7,
-        false_negative=-2,
-    )
+    if from_confusion_counts:
+        objective = CostBenefitMatrix(
+            true_positive=1,
+            true_negative=-1,
+            false_positive=-7,
+            false_negative=-2,
+        )
+    else:
+        objective = SensitivityLowAlert()
     logistic_regression_binary_pipeline.fit(X, y)
-    mock_score.return_value = {"Cost Benefit Matrix": 0.2}
+    mock_score.return_value = {objective.name: 0.2}
     cost_benefit_df = binary_objective_vs_threshold(
         logistic_regression_binary_pipeline,
         X,
         y,
-        cbm,
+        objective,
         steps=234,
     )
-    mock_score.assert_called()
+    # objectives scored from confusion matrix counts do not rescore the pipeline at each threshold
+    assert mock_score.called != from_confusion_counts
     assert list(cost_benefit_df.columns) == ["threshold", "score"]
     assert cost_benefit_df.shape == (235, 2)
 
 
+@pytest.mark.parametrize("objective", ["f1", "mcc binary", "cost benefit matrix"])
+def test_binary_objective_vs_threshold_from_confusion_counts(
+    objective,
+    X_y_binary,
+    logistic_regression_binary_pipeline,
+):
+    X, y = X_y_binary
+    y = pd.Series(y).map({0: "no", 1: "yes"})
+    if objective == "cost benefit matrix":
+        objective = CostBenefitMatrix(
+            true_positive=1,
+            true_negative=-1,
+            false_positive=-7,
+            false_negative=-2,
+        )
+    else:
+        objective = get_objective(objective, return_instance=True)
+    logistic_regression_binary_pipeline.fit(X, y)
+    results_df = binary_objective_vs_threshold(
+        logistic_regression_binary_pipeline,
+        X,
+        y,
+        objective,
+        steps=20,
+    )
+    pipeline = logistic_regression_binary_pipeline.clone()
+    pipeline.fit(X, y)
+    expected_scores = []
+    for threshold in results_df["threshold"]:
+        pipeline.threshold = threshold
+        expected_scores.append(pipeline.score(X, y, [objective])[objective.name])
+    np.testing.assert_allclose(results_df["score"], expected_scores)
+
+
 @pytest.mark.parametrize("data_type", ["np", "pd", "ww"])
 @patch("evalml.model_understanding.visualizations.binary_objective_vs_threshold")
 def test_graph_binary_objective_vs_threshold(
@@ -714,6 +754,91 @@ def test_t_sne(data_type):
     assert isinstance(output_, np.ndarray)
 
 
+@pytest.mark.parametrize("sample_size", [2.0, -2, 0])
+def test_t_sne_errors_sample_size(sample_size):
+    X = np.array([[0, 0, 0], [0, 1, 1], [1, 0, 1], [1, 1, 1]])
+
+    with pytest.raises(
+        ValueError,
+        match="The parameter sample_size must be of type integer and greater than 0",
+    ):
+        t_sne(X, sample_size=sample_size)
+
+
+@pytest.mark.parametrize("pca_components", [2.0, -2, 0])
+def test_t_sne_errors_pca_components(pca_components):
+    X = np.array([[0, 0, 0], [0, 1, 1], [1, 0, 1], [1, 1, 1]])
+
+    with pytest.raises(
+        ValueError,
+        match="The parameter pca_components must be of type integer and greater than 0",
+    ):
+        t_sne(X, pca_components=pca_components)
+
+
+def test_t_sne_errors_stratify_length():
+    X = np.array([[0, 0, 0], [0, 1, 1], [1, 0, 1], [1, 1, 1]])
+
+    with pytest.raises(ValueError, match="stratify must have the same number of rows"):
+        t_sne(X, sample_size=2, stratify=[0, 1, 0])
+
+
+@pytest.mark.parametrize("stratify", [None, "labels"])
+def test_t_sne_sample_size(stratify):
+    X = pd.DataFrame(get_random_state(0).rand(200, 4), index=range(1000, 1200))
+    labels = pd.Series([0] * 150 + [1] * 40 + [2] * 10, index=X.index)
+    if stratify == "labels":
+        stratify = labels
+
+    embedded, indices = t_sne(
+        X,
+        perplexity=5,
+        sample_size=40,
+        stratify=stratify,
+        return_indices=True,
+    )
+    assert embedded.shape == (40, 2)
+    assert len(indices) == 40
+    assert len(np.unique(indices)) == 40
+    assert (np.diff(indices) > 0).all()
+    assert indices.min() >= 0 and indices.max() < 200
+    if stratify is not None:
+        assert labels.iloc[indices].value_counts().to_dict() == {0: 30, 1: 8, 2: 2}
+
+    _, same_indices = t_sne(
+        X,
+        perplexity=5,
+        sample_size=40,
+        stratify=stratify,
+        return_indices=True,
+    )
+    np.testing.assert_array_equal(indices, same_indices)
+
+
+def test_t_sne_sample_size_larger_than_data():
+    X = get_random_state(0).rand(20, 3)
+    embedded, indices = t_sne(X, perplexity=5, sample_size=50, return_indices=True)
+    assert embedded.shape == (20, 2)
+    np.testing.assert_array_equal(indices, np.arange(20))
+
+
+@patch("evalml.model_understanding.visualizations.TSNE")
+def test_t_sne_pca_components_and_n_jobs(mock_tsne):
+    mock_tsne.return_value.fit_transform.side_effect = lambda X: np.zeros(
+        (len(X), 2),
+    )
+    X = get_random_state(0).rand(30, 10)
+
+    t_sne(X, pca_components=3, n_jobs=2, random_seed=5)
+    assert mock_tsne.call_args[1]["n_jobs"] == 2
+    assert mock_tsne.call_args[1]["random_state"] == 5
+    assert mock_tsne.return_value.fit_transform.call_args[0][0].shape == (30, 3)
+
+    t_sne(X, pca_components=20, random_state=3)
+    assert mock_tsne.call_args[1]["random_state"] == 3
+    assert mock_tsne.return_value.fit_transform.call_args[0][0].shape == (30, 10)
+
+
 @pytest.mark.parametrize("marker_line_width", [-2, -1.2])
 def test_t_sne_errors_marker_line_width(marker_line_width):
     X = np.array([[0, 0, 0], [0, 1, 1], [1, 0, 1], [1, 1, 1]])
@@ -764,3 +889,12 @@ def test_graph_t_sne(data_type, perplexity, learning_rate, go):
         assert fig_dict_data["marker"]["size"] == size_
         assert fig_dict_data["mode"] == "markers"
         assert fig_dict_data["type"] == "scatter"
+
+
+def test_graph_t_sne_sample_size(go):
+    X = pd.DataFrame(get_random_state(0).rand(50, 4), index=range(100, 150))
+    fig = graph_t_sne(X, perplexity=5, sample_size=20, pca_components=2)
+    assert len(fig.data[0].x) == 20
+    assert len(fig.data[0].text) == 20
+    rows = [int(text.split(" ")[1]) for text in fig.data[0].text]
+    assert set(rows).issubset(X.index)
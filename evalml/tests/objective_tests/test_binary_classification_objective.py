@@ -1,10 +1,24 @@
 from abc import ABCMeta, abstractmethod
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 import pytest
+from scipy.optimize import differential_evolution
 
 from evalml import AutoMLSearch
+from evalml.model_understanding.metrics import confusion_counts_per_threshold
+from evalml.objectives import (
+    AccuracyBinary,
+    BalancedAccuracyBinary,
+    CostBenefitMatrix,
+    FraudCost,
+    LeadScoring,
+    MCCBinary,
+    Precision,
+    Recall,
+    SensitivityLowAlert,
+)
 from evalml.objectives.standard_metrics import AUC, F1
 
 
@@ -19,6 +33,72 @@ def test_optimize_threshold():
     assert 0.2 < threshold and threshold < 0.4
 
 
+@pytest.mark.parametrize(
+    "objective",
+    [
+        F1(),
+        MCCBinary(),
+        Precision(),
+        CostBenefitMatrix(
+            true_positive=1,
+            true_negative=-1,
+            false_positive=-7,
+            false_negative=-2,
+        ),
+    ],
+)
+@patch("evalml.objectives.binary_classification_objective.differential_evolution")
+def test_optimize_threshold_from_confusion_counts(mock_optimize, objective):
+    rs = np.random.RandomState(0)
+    y_true = pd.Series(rs.randint(0, 2, 200))
+    ypred_proba = pd.Series(np.clip(rs.random(200) * 0.6 + y_true * 0.3, 0, 1))
+    threshold = objective.optimize_threshold(ypred_proba, y_true)
+    mock_optimize.assert_not_called()
+
+    def score(threshold):
+        return objective.objective_function(
+            y_true,
+            objective.decision_function(ypred_proba, threshold),
+        )
+
+    # the optimum is exact, so no threshold between the predicted probabilities does better
+    best_score = score(threshold)
+    for other_threshold in np.unique(np.concatenate([[0], ypred_proba, [1]])):
+        assert best_score >= score(other_threshold)
+
+
+def test_optimize_threshold_from_confusion_counts_midpoints():
+    ypred_proba = pd.Series([0.1, 0.2, 0.6, 1.0])
+    # Predicting every row positive is the only way to get a perfect recall
+    assert Recall().optimize_threshold(ypred_proba, pd.Series([1, 1, 1, 1])) < 0.1
+    assert (
+        LeadScoring(true_positives=1, false_positives=-5).optimize_threshold(
+            ypred_proba,
+            pd.Series([0, 0, 1, 1]),
+        )
+        == 0.4
+    )
+
+
+def test_optimize_threshold_uses_optimizer_with_x():
+    class ObjectiveUsingX(F1):
+        def objective_function(self, y_true, y_predicted, X=None, sample_weight=None):
+            return (y_predicted == y_true).mean() - X["cost"][y_predicted].sum()
+
+    ypred_proba = pd.Series([0.2, 0.4, 0.6, 0.8])
+    y_true = pd.Series([0, 0, 1, 1])
+    X = pd.DataFrame({"cost": [0.0, 0.0, 0.0, 0.0]})
+    objective = ObjectiveUsingX()
+    assert not objective.can_score_from_confusion_counts
+    with patch(
+        "evalml.objectives.binary_classification_objective.differential_evolution",
+        wraps=differential_evolution,
+    ) as mock_optimize:
+        threshold = objective.optimize_threshold(ypred_proba, y_true, X=X)
+    mock_optimize.assert_called_once()
+    assert 0.4 <= threshold < 0.6
+
+
 def test_optimize_threshold_neg():
     ypred_proba = np.array([0.2, 0.4])
     y_true = np.array([0, 1])
@@ -68,6 +148,58 @@ def test_decision_function_neg():
     )
 
 
+@pytest.mark.parametrize(
+    "objective",
+    [
+        AccuracyBinary(),
+        BalancedAccuracyBinary(),
+        F1(),
+        MCCBinary(),
+        Precision(),
+        Recall(),
+        CostBenefitMatrix(
+            true_positive=1,
+            true_negative=-1,
+            false_positive=-7,
+            false_negative=-2,
+        ),
+        LeadScoring(true_positives=3, false_positives=-2),
+    ],
+)
+@pytest.mark.parametrize("y_true", [[0, 1] * 10, [1] * 20, [0] * 20])
+def test_objective_function_from_confusion_counts(objective, y_true):
+    rs = np.random.RandomState(0)
+    y_true = pd.Series(y_true)
+    ypred_proba = pd.Series(np.round(rs.random(len(y_true)), 1))
+    thresholds = np.linspace(0, 1, 11)
+    assert objective.can_score_from_confusion_counts
+    scores = objective.objective_function_from_confusion_counts(
+        **confusion_counts_per_threshold(y_true, ypred_proba, thresholds),
+    )
+    expected = [
+        objective.objective_function(
+            y_true,
+            objective.decision_function(ypred_proba, threshold),
+        )
+        for threshold in thresholds
+    ]
+    np.testing.assert_allclose(scores, expected)
+
+
+def test_can_score_from_confusion_counts():
+    assert not AUC().can_score_from_confusion_counts
+    # objectives which use X or make their own decisions
+    assert not FraudCost().can_score_from_confusion_counts
+    assert not SensitivityLowAlert().can_score_from_confusion_counts
+
+    class CustomF1(F1):
+        def objective_function(self, y_true, y_predicted, X=None, sample_weight=None):
+            return 0
+
+    assert not CustomF1().can_score_from_confusion_counts
+    assert not hasattr(AUC(), "objective_function_from_confusion_counts")
+
+
 class TestBinaryObjective(metaclass=ABCMeta):
     __test__ = False
 
@@ -109,6 +109,18 @@ def test_cbm_objective_function_floats():
     )
 
 
+@pytest.mark.parametrize("label", [0, 1])
+def test_cbm_objective_function_one_class(label):
+    y = pd.Series([label] * 5)
+    cbm = CostBenefitMatrix(
+        true_positive=10,
+        true_negative=-1,
+        false_positive=-7,
+        false_negative=-2,
+    )
+    assert cbm.objective_function(y, y) == (10 if label == 1 else -1)
+
+
 def test_cbm_input_contains_nan(X_y_binary):
     y_predicted = pd.Series([np.nan, 0, 0])
     y_true = pd.Series([1, 2, 1])
@@ -1,5 +1,7 @@
+import pickle
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -19,6 +21,7 @@ from evalml.exceptions import (
     PipelineErrorCodeEnum,
 )
 from evalml.pipelines import ComponentGraph
+from evalml.pipelines.component_graph import _evaluate_component_in_worker
 from evalml.pipelines.components import (
     DateTimeFeaturizer,
     DropRowsTransformer,
@@ -2725,3 +2728,604 @@ def test_get_component_input_logical_types():
         "numeric": Integer(),
         "email": EmailAddress(),
     }
+
+
+def test_component_graph_profile(X_y_binary):
+    X, y = X_y_binary
+    component_dict = {
+        "Imputer": ["Imputer", "X", "y"],
+        "OHE": ["One Hot Encoder", "Imputer.x", "y"],
+        "RF": ["Random Forest Classifier", "OHE.x", "y"],
+    }
+    component_graph = ComponentGraph(component_dict)
+    component_graph.instantiate({"RF": {"n_estimators": 5, "n_jobs": 1}})
+    component_graph.fit(X, y)
+    assert component_graph.profile_ is None
+
+    component_graph.fit(X, y, profile=True)
+    profile = component_graph.profile_
+    assert list(profile.index) == ["Imputer", "OHE", "RF"]
+    assert list(profile.columns) == [
+        "wall_time",
+        "cpu_time",
+        "peak_memory",
+        "input_shape",
+        "output_shape",
+        "output_memory",
+        "retained_memory",
+        "n_calls",
+    ]
+    assert (profile["wall_time"] >= 0).all()
+    assert (profile["peak_memory"] >= 0).all()
+    assert (profile["n_calls"] == 1).all()
+    assert profile.loc["Imputer", "input_shape"] == X.shape
+    assert profile.loc["OHE", "output_shape"] == X.shape
+    assert profile.loc["RF", "output_shape"] is None
+
+    component_graph.predict(X, profile=True)
+    assert component_graph.profile_.loc["RF", "output_shape"] == (len(X),)
+
+    # Profiling is off by default and does not overwrite the last profile
+    last_profile = component_graph.profile_
+    component_graph.predict(X)
+    assert component_graph.profile_ is last_profile
+
+
+def test_component_graph_profile_nested_calls_record_once(X_y_binary):
+    X, y = X_y_binary
+    component_graph = ComponentGraph({"Imputer": ["Imputer", "X", "y"]})
+    component_graph.instantiate()
+    component_graph.fit(X, y)
+    with component_graph._profiling():
+        component_graph.transform(X, profile=True)
+        component_graph.transform(X)
+    assert component_graph.profile_.loc["Imputer", "n_calls"] == 2
+
+
+branching_component_dict = {
+    "Numeric": ["Select Columns By Type Transformer", "X", "y"],
+    "Numeric Imputer": ["Imputer", "Numeric.x", "y"],
+    "Categorical": ["Select Columns By Type Transformer", "X", "y"],
+    "Categorical Imputer": ["Imputer", "Categorical.x", "y"],
+    "OHE": ["One Hot Encoder", "Categorical Imputer.x", "y"],
+    "Numeric RF": ["Random Forest Classifier", "Numeric Imputer.x", "y"],
+    "Categorical RF": ["Random Forest Classifier", "OHE.x", "y"],
+    "Logistic Regression": [
+        "Logistic Regression Classifier",
+        "Numeric RF.x",
+        "Categorical RF.x",
+        "y",
+    ],
+}
+branching_parameters = {
+    "Numeric": {"column_types": ["numeric"]},
+    "Categorical": {"column_types": ["category"]},
+    "Numeric RF": {"n_estimators": 5, "n_jobs": 1},
+    "Categorical RF": {"n_estimators": 5, "n_jobs": 1},
+}
+
+
+@pytest.mark.parametrize("executor", ["threads", "processes", "instance"])
+def test_component_graph_executor_matches_sequential(
+    executor,
+    X_y_categorical_classification,
+):
+    X, y = X_y_categorical_classification
+    sequential_graph = ComponentGraph(branching_component_dict)
+    sequential_graph.instantiate(branching_parameters)
+    sequential_graph.fit(X, y)
+
+    if executor == "instance":
+        pool = ThreadPoolExecutor(max_workers=2)
+        component_graph = ComponentGraph(branching_component_dict, executor=pool)
+    else:
+        component_graph = ComponentGraph(branching_component_dict, executor=executor)
+    component_graph.instantiate(branching_parameters)
+    if executor == "processes":
+        # Components are fitted in other processes, so the graph gets back fitted copies
+        unfitted_components = list(component_graph)
+        component_graph.fit(X, y)
+        assert all(
+            fitted is not unfitted
+            for fitted, unfitted in zip(component_graph, unfitted_components)
+        )
+    else:
+        with patch(
+            "evalml.pipelines.component_graph._evaluate_component_in_worker",
+            wraps=_evaluate_component_in_worker,
+        ) as mock_evaluate:
+            component_graph.fit(X, y)
+        assert mock_evaluate.call_count == len(branching_component_dict)
+    transformed = component_graph.transform_all_but_final(X, y)
+    predictions = component_graph.predict(X)
+    if executor == "instance":
+        pool.shutdown()
+    else:
+        component_graph.shutdown_executor()
+
+    assert component_graph.input_feature_names == sequential_graph.input_feature_names
+    assert list(component_graph.input_feature_names) == list(
+        sequential_graph.input_feature_names,
+    )
+    assert all(component._is_fitted for component in component_graph)
+    expected_transformed = sequential_graph.transform_all_but_final(X, y)
+    assert_frame_equal(transformed, expected_transformed)
+    assert transformed.ww.schema == expected_transformed.ww.schema
+    assert_series_equal(predictions, sequential_graph.predict(X))
+
+
+def test_component_graph_executor_returns_component_only_when_fitting(
+    X_y_categorical_classification,
+):
+    X, y = X_y_categorical_classification
+    component_graph = ComponentGraph(branching_component_dict, executor="threads")
+    component_graph.instantiate(branching_parameters)
+    with patch(
+        "evalml.pipelines.component_graph._evaluate_component_in_worker",
+        wraps=_evaluate_component_in_worker,
+    ) as mock_evaluate:
+        component_graph.fit(X, y)
+        fitted_components = list(component_graph)
+        assert all(
+            future_call.kwargs["fit"] for future_call in mock_evaluate.call_args_list
+        )
+
+        mock_evaluate.reset_mock()
+        component_graph.predict(X)
+        assert mock_evaluate.called
+        assert not any(
+            future_call.kwargs["fit"] for future_call in mock_evaluate.call_args_list
+        )
+    assert all(
+        component is fitted
+        for component, fitted in zip(component_graph, fitted_components)
+    )
+    component_graph.shutdown_executor()
+
+    component_name = "Numeric Imputer"
+    component = component_graph.get_component(component_name)
+    x_inputs = infer_feature_types(X).ww.select("numeric")
+    y = infer_feature_types(y)
+    returned, outputs, output_schemas = _evaluate_component_in_worker(
+        component,
+        component_name,
+        x_inputs,
+        x_inputs.ww.schema,
+        y,
+        y.ww.schema,
+        fit=False,
+        is_final_component=False,
+        evaluate_training_only_components=False,
+    )
+    assert returned is None
+    assert f"{component_name}.x" in outputs
+
+
+def test_component_graph_executor_pool_is_reused(X_y_categorical_classification):
+    X, y = X_y_categorical_classification
+    component_graph = ComponentGraph(branching_component_dict, executor="threads")
+    component_graph.instantiate(branching_parameters)
+    with patch(
+        "evalml.pipelines.component_graph.ThreadPoolExecutor",
+        wraps=ThreadPoolExecutor,
+    ) as mock_pool_class:
+        component_graph.fit(X, y)
+        component_graph.transform_all_but_final(X, y)
+        component_graph.predict(X)
+        assert mock_pool_class.call_count == 1
+
+        unpickled_graph = pickle.loads(pickle.dumps(component_graph))
+        assert unpickled_graph.executor == "threads"
+        assert unpickled_graph._pool is None
+        assert_series_equal(unpickled_graph.predict(X), component_graph.predict(X))
+        assert mock_pool_class.call_count == 2
+        unpickled_graph.shutdown_executor()
+
+        pool = component_graph._pool
+        component_graph.shutdown_executor()
+        assert component_graph._pool is None
+        assert pool._shutdown
+        component_graph.shutdown_executor()
+        component_graph.predict(X)
+        assert mock_pool_class.call_count == 3
+    component_graph.shutdown_executor()
+
+
+def test_component_graph_unpickles_graphs_from_older_versions(
+    X_y_categorical_classification,
+):
+    X, y = X_y_categorical_classification
+    component_graph = ComponentGraph(branching_component_dict)
+    component_graph.instantiate(branching_parameters)
+    component_graph.fit(X, y)
+    state = pickle.loads(pickle.dumps(component_graph)).__dict__
+    for attribute in [
+        "executor",
+        "_pool",
+        "_pool_finalizer",
+        "profile_",
+        "_profile_records",
+        "_elided_components",
+    ]:
+        del state[attribute]
+
+    old_graph = ComponentGraph.__new__(ComponentGraph)
+    old_graph.__setstate__(state)
+    assert old_graph.executor is None
+    assert old_graph.profile_ is None
+    assert old_graph._elided_components == []
+    assert_series_equal(old_graph.predict(X), component_graph.predict(X))
+    old_graph.predict(X, profile=True)
+    assert old_graph.profile_ is not None
+
+
+def test_component_graph_executor_instance_is_not_shut_down():
+    pool = ThreadPoolExecutor(max_workers=1)
+    component_graph = ComponentGraph(branching_component_dict, executor=pool)
+    component_graph.shutdown_executor()
+    assert not pool._shutdown
+    assert pickle.loads(pickle.dumps(component_graph)).executor is None
+    assert component_graph._copy_topology(executor=pool).executor is pool
+    pool.shutdown()
+
+
+def test_component_graph_executor_is_not_used_when_profiling(
+    X_y_categorical_classification,
+):
+    X, y = X_y_categorical_classification
+    component_graph = ComponentGraph(branching_component_dict, executor="threads")
+    component_graph.instantiate(branching_parameters)
+    with patch(
+        "evalml.pipelines.component_graph._evaluate_component_in_worker",
+    ) as mock_evaluate:
+        component_graph.fit(X, y, profile=True)
+    mock_evaluate.assert_not_called()
+    assert list(component_graph.profile_.index) == component_graph.compute_order
+
+
+def test_component_graph_executor_errors():
+    with pytest.raises(
+        ValueError,
+        match="executor must be None, 'threads', 'processes'",
+    ):
+        ComponentGraph({"Imputer": ["Imputer", "X", "y"]}, executor="gpu")
+
+
+def test_component_graph_releases_consumed_outputs(X_y_categorical_classification):
+    X, y = X_y_categorical_classification
+    component_graph = ComponentGraph(branching_component_dict)
+    component_graph.instantiate(branching_parameters)
+    component_graph.fit(X, y, profile=True)
+
+    profile = component_graph.profile_
+    # The final estimator does not predict during fit
+    assert profile.loc["Logistic Regression", "output_memory"] == 0
+    assert (profile["output_memory"].drop("Logistic Regression") > 0).all()
+    # The numeric branch's outputs are released once the random forest has consumed them
+    assert (
+        profile.loc["Categorical RF", "retained_memory"]
+        < profile.loc["Numeric Imputer", "retained_memory"]
+        + profile.loc["Categorical RF", "output_memory"]
+    )
+    assert profile["retained_memory"].max() < profile["output_memory"].sum()
+
+    outputs = component_graph._transform_features(
+        component_graph.compute_order[:-1],
+        X,
+        y,
+    )
+    assert set(outputs) == {"Numeric RF.x", "Categorical RF.x"}
+    outputs = component_graph._transform_features(component_graph.compute_order, X)
+    assert set(outputs) == {"Logistic Regression.x"}
+
+
+def test_component_graph_consolidate_single_parent_without_concat(X_y_binary):
+    X, y = X_y_binary
+    X = infer_feature_types(X)
+    component_graph = ComponentGraph(
+        {
+            "Imputer": ["Imputer", "X", "y"],
+            "Scaler": ["Standard Scaler", "Imputer.x", "y"],
+            "Logistic Regression": ["Logistic Regression Classifier", "Scaler.x", "y"],
+        },
+    )
+    parent_x = X.ww.copy()
+    with patch("woodwork.concat_columns") as mock_concat:
+        x_input, y_input = component_graph._consolidate_inputs_for_component(
+            {"Imputer.x": parent_x},
+            "Scaler",
+            X,
+            y,
+            remaining_consumers={"Imputer.x": 1},
+        )
+    mock_concat.assert_not_called()
+    assert y_input is y
+    assert x_input is not parent_x
+    assert_frame_equal(x_input, parent_x)
+    assert x_input.ww.schema == parent_x.ww.schema
+    assert x_input.ww.schema is not parent_x.ww.schema
+    # The last consumer of an output shares its data
+    assert np.shares_memory(x_input[0].values, parent_x[0].values)
+
+    # Changing the columns a component receives leaves the parent's output alone
+    x_input.ww.drop(columns=[1], inplace=True)
+    x_input[2] = 0
+    assert 1 in parent_x.columns
+    assert parent_x.ww.schema is not None
+    assert_frame_equal(parent_x, X)
+
+
+@pytest.mark.parametrize("parent", ["X", "output read by another component"])
+def test_component_graph_consolidate_single_parent_copies_shared_data(
+    parent,
+    X_y_binary,
+):
+    X, y = X_y_binary
+    X = infer_feature_types(X)
+    X_original = X.ww.copy()
+    component_graph = ComponentGraph(
+        {
+            "Imputer": ["Imputer", "X", "y"],
+            "Scaler": ["Standard Scaler", "Imputer.x", "y"],
+            "Logistic Regression": ["Logistic Regression Classifier", "Scaler.x", "y"],
+        },
+    )
+    parent_x = X.ww.copy()
+    if parent == "X":
+        x_input, _ = component_graph._consolidate_inputs_for_component(
+            {},
+            "Imputer",
+            X,
+            y,
+        )
+    else:
+        x_input, _ = component_graph._consolidate_inputs_for_component(
+            {"Imputer.x": parent_x},
+            "Scaler",
+            X,
+            y,
+            remaining_consumers={"Imputer.x": 2},
+        )
+    assert_frame_equal(x_input, X_original)
+    assert not np.shares_memory(x_input[0].values, X[0].values)
+    assert not np.shares_memory(x_input[0].values, parent_x[0].values)
+
+    # Writes of the same dtype are made in place, so they would reach shared data
+    x_input.loc[:, 0] = x_input[0].clip(upper=0)
+    assert (x_input[0] <= 0).all()
+    assert_frame_equal(X, X_original)
+    assert_frame_equal(parent_x, X_original)
+
+
+class ClipInPlace(DummyTransformer):
+    name = "Clip In Place"
+
+    def transform(self, X, y=None):
+        X.loc[:, 0] = X[0].clip(upper=0)
+        return X
+
+
+class RecordInput(DummyTransformer):
+    name = "Record Input"
+    inputs = []
+
+    def transform(self, X, y=None):
+        self.inputs.append(X.copy())
+        X_t = X.rename(columns=lambda column: f"recorded {column}")
+        X_t.ww.init()
+        return X_t
+
+
+def test_component_graph_fit_does_not_change_shared_data_in_place(X_y_binary):
+    X, y = X_y_binary
+    X = infer_feature_types(X)
+    X_original = X.ww.copy()
+    assert (X[0] > 0).any()
+    RecordInput.inputs = []
+    component_graph = ComponentGraph(
+        {
+            "First": [TransformerA, "X", "y"],
+            "Clip": [ClipInPlace, "First.x", "y"],
+            "Record": [RecordInput, "First.x", "y"],
+            "Final": [TransformerB, "Clip.x", "Record.x", "y"],
+        },
+    )
+    component_graph.instantiate()
+    component_graph.fit(X, y)
+    component_graph.transform(X, y)
+
+    assert_frame_equal(X, X_original)
+    assert len(RecordInput.inputs) == 2
+    for recorded in RecordInput.inputs:
+        pd.testing.assert_series_equal(recorded[0], X_original[0])
+
+
+def test_component_graph_consolidate_multiple_parents_concatenates(
+    X_y_categorical_classification,
+):
+    X, y = X_y_categorical_classification
+    X = infer_feature_types(X)
+    component_graph = ComponentGraph(branching_component_dict)
+    x_input, _ = component_graph._consolidate_inputs_for_component(
+        {
+            "Numeric RF.x": pd.Series(0.25, index=X.index),
+            "Categorical RF.x": pd.Series(0.75, index=X.index),
+        },
+        "Logistic Regression",
+        X,
+        y,
+    )
+    assert list(x_input.columns) == ["Numeric RF.x", "Categorical RF.x"]
+    assert x_input.ww.schema is not None
+
+
+def test_component_graph_get_output_consumers():
+    component_graph = ComponentGraph(branching_component_dict)
+    remaining_consumers, outputs_to_keep = component_graph._get_output_consumers(
+        component_graph.compute_order[:-1],
+    )
+    assert remaining_consumers == {
+        "Numeric.x": 1,
+        "Categorical.x": 1,
+        "Categorical Imputer.x": 1,
+        "OHE.x": 1,
+        "Numeric Imputer.x": 1,
+    }
+    assert outputs_to_keep == {
+        "Logistic Regression.x",
+        "Logistic Regression.y",
+        "Numeric RF.x",
+        "Categorical RF.x",
+    }
+
+
+def test_component_graph_keeps_outputs_consumed_after_component_list(X_y_binary):
+    X, y = X_y_binary
+    component_dict = {
+        "Label Encoder": ["Label Encoder", "X", "y"],
+        "Imputer": ["Imputer", "Label Encoder.x", "Label Encoder.y"],
+        "LR": ["Logistic Regression Classifier", "Imputer.x", "Label Encoder.y"],
+    }
+    component_graph = ComponentGraph(component_dict).instantiate()
+    component_graph.fit(X, y)
+    outputs = component_graph._transform_features(
+        component_graph.compute_order[:-1],
+        X,
+        y,
+    )
+    assert set(outputs) == {"Imputer.x", "Label Encoder.y"}
+    features, target = component_graph.fit_and_transform_all_but_final(X, y)
+    assert_series_equal(target, outputs["Label Encoder.y"])
+
+
+def test_component_graph_eliminate_dead_features():
+    X = pd.DataFrame(
+        {
+            "numeric": np.arange(20, dtype=float),
+            "date": pd.date_range("2020-01-01", periods=20, freq="40D"),
+        },
+    )
+    component_graph = ComponentGraph(
+        {
+            "DFS": ["DFS Transformer", "X", "y"],
+            "Select": ["Select Columns Transformer", "DFS.x", "y"],
+            "Drop": ["Drop Columns Transformer", "Select.x", "y"],
+        },
+    )
+    component_graph.instantiate(
+        {"Select": {"columns": ["numeric", "MONTH(date)"]}, "Drop": {"columns": []}},
+    )
+    with pytest.raises(ValueError, match="before the component graph is fitted"):
+        component_graph.eliminate_dead_features()
+    component_graph.fit(X, pd.Series(np.arange(20)))
+    expected = component_graph.transform(X)
+
+    dropped_features = component_graph.eliminate_dead_features()
+    assert list(dropped_features) == ["DFS"]
+    assert set(dropped_features["DFS"]) == {"DAY(date)", "WEEKDAY(date)", "YEAR(date)"}
+    assert component_graph.input_feature_names["Select"] == [
+        "numeric",
+        "MONTH(date)",
+    ]
+    assert [
+        feature.get_name() for feature in component_graph.get_component("DFS").features
+    ] == ["numeric", "MONTH(date)"]
+    assert_frame_equal(component_graph.transform(X), expected)
+    # Nothing else can be pruned the second time around
+    assert component_graph.eliminate_dead_features() == {}
+
+
+def test_component_graph_eliminate_dead_features_keeps_features_needed_downstream(
+    X_y_categorical_classification,
+):
+    X, y = X_y_categorical_classification
+    X = infer_feature_types(X[["Pclass", "Sex", "Age", "Fare", "Embarked"]])
+    component_graph = ComponentGraph(
+        {
+            "Imputer": ["Imputer", "X", "y"],
+            "OHE": ["One Hot Encoder", "Imputer.x", "y"],
+            "Select": ["Select Columns Transformer", "OHE.x", "y"],
+            "Scaler": ["Standard Scaler", "OHE.x", "y"],
+            "Random Forest": ["Random Forest Classifier", "Select.x", "y"],
+            "Logistic Regression": ["Logistic Regression Classifier", "Scaler.x", "y"],
+            "Final Estimator": [
+                "Logistic Regression Classifier",
+                "Random Forest.x",
+                "Logistic Regression.x",
+                "y",
+            ],
+        },
+    )
+    component_graph.instantiate({"Select": {"columns": ["Fare"]}})
+    component_graph.fit(X, y)
+    expected = component_graph.predict(X)
+    # The scaler needs every one-hot encoded feature it was fitted on
+    assert component_graph.eliminate_dead_features() == {}
+    assert_series_equal(component_graph.predict(X), expected)
+
+
+def test_component_graph_elide_noop_components(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    component_graph = ComponentGraph(
+        {
+            "Drop Null Columns": ["Drop Null Columns Transformer", "X", "y"],
+            "Replace Nullable Types": [
+                "Replace Nullable Types Transformer",
+                "Drop Null Columns.x",
+                "y",
+            ],
+            "Imputer": ["Imputer", "Replace Nullable Types.x", "y"],
+            "Scaler": ["Standard Scaler", "Imputer.x", "y"],
+            "Logistic Regression": ["Logistic Regression Classifier", "Scaler.x", "y"],
+        },
+    )
+    component_graph.instantiate()
+    with pytest.raises(ValueError, match="before the component graph is fitted"):
+        component_graph.elide_noop_components(X)
+    component_graph.fit(X, y)
+    expected = component_graph.predict(X)
+
+    assert component_graph.elide_noop_components(X) == [
+        "Drop Null Columns",
+        "Replace Nullable Types",
+        "Imputer",
+    ]
+    imputer = component_graph.get_component("Imputer")
+    with patch.object(imputer, "transform", wraps=imputer.transform) as mock_transform:
+        assert_series_equal(component_graph.predict(X), expected)
+        mock_transform.assert_not_called()
+
+        # Unseen nulls are still imputed
+        X_with_nulls = X.copy()
+        X_with_nulls.iloc[0, 0] = np.nan
+        imputed = component_graph.transform_all_but_final(X_with_nulls)
+        mock_transform.assert_called_once()
+    assert not imputed.isnull().any().any()
+
+    # Refitting the graph puts every component back on the inference path
+    component_graph.fit(X, y)
+    assert component_graph._elided_components == []
+
+
+def test_component_graph_elide_noop_components_keeps_components_that_modify_data(
+    X_y_binary,
+):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    X.iloc[:5, 0] = np.nan
+    X[len(X.columns)] = np.nan
+    component_graph = ComponentGraph(
+        {
+            "Drop Null Columns": ["Drop Null Columns Transformer", "X", "y"],
+            "Imputer": ["Imputer", "Drop Null Columns.x", "y"],
+            "Logistic Regression": [
+                "Logistic Regression Classifier",
+                "Imputer.x",
+                "y",
+            ],
+        },
+    )
+    component_graph.instantiate()
+    component_graph.fit(X, y)
+    assert component_graph.elide_noop_components(X) == []
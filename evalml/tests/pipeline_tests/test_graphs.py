@@ -264,3 +264,17 @@ def test_ensemble_as_json():
     dag_dict = pipeline.graph_dict()
 
     assert list(dag_dict["Nodes"].keys()) == list(component_graph.keys()) + ["X", "y"]
+
+
+def test_graph_show_profile(X_y_binary, test_pipeline, graphviz):
+    X, y = X_y_binary
+    clf = test_pipeline
+    with pytest.raises(ValueError, match="No profile has been recorded"):
+        clf.graph(show_profile=True)
+
+    clf.fit(X, y, profile=True)
+    graph = clf.graph(show_profile=True)
+    assert isinstance(graph, graphviz.Digraph)
+    assert "wall time" in graph.source
+    assert "peak memory" in graph.source
+    assert "wall time" not in clf.graph().source
@@ -1,6 +1,9 @@
+import gc
+import json
 import os
 import pickle
 import re
+import types
 from unittest.mock import patch
 
 import cloudpickle
@@ -24,11 +27,18 @@ from evalml.model_family import ModelFamily
 from evalml.objectives import CostBenefitMatrix, FraudCost, Precision, get_objective
 from evalml.pipelines import (
     BinaryClassificationPipeline,
+    CompiledPipeline,
     MulticlassClassificationPipeline,
     PipelineBase,
+    PipelineExecutionPlan,
+    PipelineSpec,
     RegressionPipeline,
+    TimeSeriesRegressionPipeline,
+)
+from evalml.pipelines.component_graph import (
+    ComponentGraph,
+    _evaluate_component_in_worker,
 )
-from evalml.pipelines.component_graph import ComponentGraph
 from evalml.pipelines.components import (
     DropNullColumns,
     DropRowsTransformer,
@@ -48,6 +58,11 @@ from evalml.pipelines.components.utils import (
     _all_estimators_used_in_search,
     allowed_model_families,
 )
+from evalml.pipelines.pipeline_artifact import (
+    ARTIFACT_FORMAT_VERSION,
+    load_pipeline_artifact,
+    read_pipeline_artifact_manifest,
+)
 from evalml.pipelines.utils import _get_pipeline_base_class
 from evalml.preprocessing.utils import is_classification
 from evalml.problem_types import ProblemTypes, is_binary, is_multiclass, is_time_series
@@ -167,6 +182,104 @@ def test_serialization_protocol(
     assert mock_cloudpickle_dump.call_args_list[0][1]["protocol"] == 42
 
 
+@pytest.mark.parametrize("artifact_name", ["pipe", "pipe.zip"])
+def test_serialization_artifact(
+    artifact_name,
+    X_y_binary,
+    tmpdir,
+    logistic_regression_binary_pipeline,
+):
+    X, y = X_y_binary
+    path = os.path.join(str(tmpdir), artifact_name)
+    pipeline = logistic_regression_binary_pipeline
+    pipeline.fit(X, y)
+    assert pipeline.save_artifact(path) == path
+
+    manifest = read_pipeline_artifact_manifest(path)
+    assert manifest["format_version"] == ARTIFACT_FORMAT_VERSION
+    assert manifest["pipeline_class"] == (
+        "evalml.pipelines.binary_classification_pipeline.BinaryClassificationPipeline"
+    )
+    assert list(manifest["components"]) == pipeline.component_graph.compute_order
+    assert manifest["parameters"] == json.loads(json.dumps(pipeline.parameters))
+
+    loaded = PipelineBase.load(path)
+    component_instances = loaded.component_graph.component_instances
+    # Only the estimator is read when the pipeline is loaded
+    assert component_instances.loaded == ["Logistic Regression Classifier"]
+    assert isinstance(loaded.estimator._component_obj.coef_, np.memmap)
+    assert_frame_equal(loaded.predict_proba(X), pipeline.predict_proba(X))
+    assert set(component_instances.loaded) == set(
+        pipeline.component_graph.compute_order,
+    )
+    assert loaded == pipeline
+
+    # Saving over an existing artifact replaces it
+    loaded.save_artifact(path)
+    eager = load_pipeline_artifact(path, mmap_mode=None, lazy=False)
+    assert type(eager.component_graph.component_instances) is dict
+    assert not isinstance(eager.estimator._component_obj.coef_, np.memmap)
+    assert eager == pipeline
+
+
+def test_serialization_artifact_zip_extraction_removed(
+    X_y_binary,
+    tmpdir,
+    logistic_regression_binary_pipeline,
+):
+    X, y = X_y_binary
+    path = os.path.join(str(tmpdir), "pipe.zip")
+    pipeline = logistic_regression_binary_pipeline
+    pipeline.fit(X, y)
+    pipeline.save_artifact(path)
+    extracted_path = os.path.join(str(tmpdir), "extracted")
+    os.makedirs(extracted_path)
+
+    with patch(
+        "evalml.pipelines.pipeline_artifact.tempfile.mkdtemp",
+        return_value=extracted_path,
+    ):
+        loaded = load_pipeline_artifact(path)
+    assert_frame_equal(loaded.predict_proba(X), pipeline.predict_proba(X))
+    assert os.path.isdir(extracted_path)
+    del loaded
+    gc.collect()
+    assert not os.path.exists(extracted_path)
+
+    os.makedirs(extracted_path)
+    with patch(
+        "evalml.pipelines.pipeline_artifact.tempfile.mkdtemp",
+        return_value=extracted_path,
+    ), patch(
+        "evalml.pipelines.pipeline_artifact.cloudpickle.load",
+        side_effect=EOFError,
+    ):
+        with pytest.raises(EOFError):
+            load_pipeline_artifact(path)
+    assert not os.path.exists(extracted_path)
+
+
+def test_serialization_artifact_errors(tmpdir, logistic_regression_binary_pipeline):
+    pipeline = logistic_regression_binary_pipeline
+    not_an_artifact = os.path.join(str(tmpdir), "pipe.pkl")
+    pipeline.save(not_an_artifact)
+    with pytest.raises(ValueError, match="path exists and is not a pipeline artifact"):
+        pipeline.save_artifact(not_an_artifact)
+    with pytest.raises(ValueError, match="is not a pipeline artifact"):
+        load_pipeline_artifact(not_an_artifact)
+
+    path = os.path.join(str(tmpdir), "pipe")
+    pipeline.save_artifact(path)
+    manifest_path = os.path.join(path, "manifest.json")
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    manifest["format_version"] = ARTIFACT_FORMAT_VERSION + 1
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+    with pytest.raises(ValueError, match="is newer than the newest version"):
+        PipelineBase.load(path)
+
+
 @pytest.fixture
 def pickled_pipeline_path(X_y_binary, tmpdir, logistic_regression_binary_pipeline):
     X, y = X_y_binary
@@ -607,9 +720,13 @@ def make_mock_multiclass_pipeline():
 
 
 @patch("evalml.pipelines.RegressionPipeline.fit")
-@patch("evalml.pipelines.RegressionPipeline.predict")
-def test_score_regression_single(mock_predict, mock_fit, X_y_regression):
+@patch("evalml.pipelines.components.Estimator.predict")
+@patch("evalml.pipelines.ComponentGraph.transform_all_but_final")
+def test_score_regression_single(
+    mock_transform, mock_predict, mock_fit, X_y_regression
+):
     X, y = X_y_regression
+    mock_transform.side_effect = lambda X, y=None: X
     mock_predict.return_value = pd.Series(y)
     clf = make_mock_regression_pipeline()
     clf.fit(X, y)
@@ -620,14 +737,17 @@ def test_score_regression_single(mock_predict, mock_fit, X_y_regression):
 
 
 @patch("evalml.pipelines.ComponentGraph.fit")
-@patch("evalml.pipelines.RegressionPipeline.predict")
+@patch("evalml.pipelines.components.Estimator.predict")
+@patch("evalml.pipelines.ComponentGraph.transform_all_but_final")
 def test_score_nonlinear_regression(
+    mock_transform,
     mock_predict,
     mock_fit,
     nonlinear_regression_pipeline,
     X_y_regression,
 ):
     X, y = X_y_regression
+    mock_transform.side_effect = lambda X, y=None: X
     mock_predict.return_value = pd.Series(y)
     nonlinear_regression_pipeline.fit(X, y)
     objective_names = ["r2"]
@@ -667,14 +787,17 @@ def test_score_multiclass_single(mock_schema, mock_predict, mock_fit, X_y_binary
 
 
 @patch("evalml.pipelines.MulticlassClassificationPipeline.fit")
-@patch("evalml.pipelines.ComponentGraph.predict")
+@patch("evalml.pipelines.components.Estimator.predict")
+@patch("evalml.pipelines.ComponentGraph.transform_all_but_final")
 def test_score_nonlinear_multiclass(
+    mock_transform,
     mock_predict,
     mock_fit,
     nonlinear_multiclass_pipeline,
     X_y_multi,
 ):
     X, y = X_y_multi
+    mock_transform.side_effect = lambda X, y=None: X
     mock_predict.return_value = pd.Series(y)
     nonlinear_multiclass_pipeline.fit(X, y)
     objective_names = ["f1 micro", "precision micro"]
@@ -684,9 +807,11 @@ def test_score_nonlinear_multiclass(
 
 
 @patch("evalml.pipelines.RegressionPipeline.fit")
-@patch("evalml.pipelines.RegressionPipeline.predict")
-def test_score_regression_list(mock_predict, mock_fit, X_y_binary):
+@patch("evalml.pipelines.components.Estimator.predict")
+@patch("evalml.pipelines.ComponentGraph.transform_all_but_final")
+def test_score_regression_list(mock_transform, mock_predict, mock_fit, X_y_binary):
     X, y = X_y_binary
+    mock_transform.side_effect = lambda X, y=None: X
     mock_predict.return_value = pd.Series(y)
     clf = make_mock_regression_pipeline()
     clf.fit(X, y)
@@ -729,8 +854,10 @@ def test_score_multi_list(mock_schema, mock_predict, mock_fit, mock_encode, X_y_
 
 @patch("evalml.objectives.R2.score")
 @patch("evalml.pipelines.RegressionPipeline.fit")
-@patch("evalml.pipelines.RegressionPipeline.predict")
+@patch("evalml.pipelines.components.Estimator.predict")
+@patch("evalml.pipelines.ComponentGraph.transform_all_but_final")
 def test_score_regression_objective_error(
+    mock_transform,
     mock_predict,
     mock_fit,
     mock_objective_score,
@@ -738,6 +865,7 @@ def test_score_regression_objective_error(
 ):
     mock_objective_score.side_effect = Exception("finna kabooom 💣")
     X, y = X_y_binary
+    mock_transform.side_effect = lambda X, y=None: X
     mock_predict.return_value = pd.Series(y)
     clf = make_mock_regression_pipeline()
     clf.fit(X, y)
@@ -786,8 +914,10 @@ def test_score_binary_objective_error(
 @patch("evalml.pipelines.BinaryClassificationPipeline._encode_targets")
 @patch("evalml.objectives.F1.score")
 @patch("evalml.pipelines.BinaryClassificationPipeline.fit")
-@patch("evalml.pipelines.ComponentGraph.predict")
+@patch("evalml.pipelines.components.Estimator.predict")
+@patch("evalml.pipelines.ComponentGraph.transform_all_but_final")
 def test_score_nonlinear_binary_objective_error(
+    mock_transform,
     mock_predict,
     mock_fit,
     mock_objective_score,
@@ -797,6 +927,7 @@ def test_score_nonlinear_binary_objective_error(
 ):
     mock_objective_score.side_effect = Exception("finna kabooom 💣")
     X, y = X_y_binary
+    mock_transform.side_effect = lambda X, y=None: X
     mock_predict.return_value = pd.Series(y)
     mock_encode.return_value = y
     nonlinear_binary_pipeline.fit(X, y)
@@ -1165,6 +1296,103 @@ def test_clone_fitted(
     assert_frame_equal(X_t, X_t_clone)
 
 
+def test_clone_reuses_validated_component_graph(X_y_binary):
+    X, y = X_y_binary
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Standard Scaler", "Logistic Regression Classifier"],
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+    )
+    pipeline.fit(X, y)
+    with patch.object(
+        ComponentGraph,
+        "generate_order",
+        side_effect=AssertionError("graph validated again"),
+    ):
+        pipeline_clone = pipeline.clone()
+        pipeline_new = pipeline.new({"Imputer": {"numeric_impute_strategy": "median"}})
+    for new_pipeline in [pipeline_clone, pipeline_new]:
+        assert (
+            new_pipeline.component_graph.compute_order
+            == pipeline.component_graph.compute_order
+        )
+        assert not new_pipeline._is_fitted
+        assert new_pipeline.component_graph.input_feature_names == {}
+        assert all(
+            component is not pipeline.get_component(name)
+            for name, component in new_pipeline.component_graph.component_instances.items()
+        )
+    assert pipeline_new.parameters["Imputer"]["numeric_impute_strategy"] == "median"
+    pipeline_clone.fit(X, y)
+    assert_frame_equal(pipeline_clone.predict_proba(X), pipeline.predict_proba(X))
+
+    # Component dictionaries changed in place are validated again
+    pipeline.component_graph.component_dict["Logistic Regression Classifier"] = [
+        "Random Forest Classifier",
+        "Standard Scaler.x",
+        "y",
+    ]
+    pipeline_new = pipeline.new({})
+    assert isinstance(pipeline_new.estimator, RandomForestClassifier)
+
+
+def test_pipeline_spec(X_y_binary):
+    X, y = X_y_binary
+    pipeline = BinaryClassificationPipeline(
+        {
+            "Imputer": ["Imputer", "X", "y"],
+            "Logistic Regression Classifier": [
+                "Logistic Regression Classifier",
+                "Imputer.x",
+                "y",
+            ],
+        },
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1, "C": 0.5}},
+        custom_name="My Pipeline",
+        random_seed=3,
+    )
+    pipeline.fit(X, y)
+    pipeline.threshold = 0.7
+
+    spec = pipeline.spec
+    assert isinstance(spec, PipelineSpec)
+    assert spec == pipeline.spec
+    assert hash(spec) == hash(pipeline.spec)
+    assert spec.pipeline_class is BinaryClassificationPipeline
+    assert spec.compute_order == pipeline.component_graph.compute_order
+    assert spec.component_dict == pipeline.component_graph.component_dict
+    assert spec.parameters == pipeline.parameters
+    assert spec.custom_name == "My Pipeline"
+    assert spec.random_seed == 3
+    assert spec.threshold == 0.7
+    # The spec keeps none of the fitted components
+    assert all(
+        isinstance(component, type)
+        for component in spec._component_graph.component_instances.values()
+    )
+
+    parameters = spec.parameters
+    parameters["Logistic Regression Classifier"]["C"] = 2.0
+    assert spec.parameters["Logistic Regression Classifier"]["C"] == 0.5
+
+    specs = {spec: "fitted", spec.new(parameters): "new"}
+    assert len(specs) == 2
+    assert specs[pipeline.clone().spec.new(threshold=0.7)] == "fitted"
+    assert spec.new(random_seed=4) != spec
+    assert spec != pipeline
+
+    new_pipeline = spec.instantiate()
+    assert new_pipeline == pipeline.clone()
+    assert new_pipeline.threshold == 0.7
+    assert not new_pipeline._is_fitted
+    new_pipeline = spec.new(parameters, random_seed=5).instantiate()
+    assert new_pipeline.parameters == parameters
+    assert new_pipeline.random_seed == 5
+    assert new_pipeline.threshold is None
+
+    with pytest.raises(ValueError, match="must be a dict or ComponentGraph"):
+        PipelineSpec(BinaryClassificationPipeline, ["Imputer"])
+
+
 def test_feature_importance_has_feature_names(
     X_y_binary,
     logistic_regression_binary_pipeline,
@@ -2960,3 +3188,656 @@ def test_pipeline_cache_clone():
     assert pipeline.component_graph.cached_data == cache
     p2 = pipeline.clone()
     assert p2.component_graph.cached_data == cache
+
+
+@pytest.mark.parametrize("problem_type", ["binary", "multiclass", "regression"])
+def test_pipeline_profile(problem_type, X_y_binary, X_y_multi, X_y_regression):
+    component_graph = ["Imputer", "One Hot Encoder", "Random Forest Classifier"]
+    if problem_type == "binary":
+        pipeline = BinaryClassificationPipeline(component_graph)
+        X, y = X_y_binary
+    elif problem_type == "multiclass":
+        pipeline = MulticlassClassificationPipeline(component_graph)
+        X, y = X_y_multi
+    else:
+        component_graph[-1] = "Random Forest Regressor"
+        pipeline = RegressionPipeline(component_graph)
+        X, y = X_y_regression
+    assert pipeline.profile_ is None
+
+    pipeline.fit(X, y, profile=True)
+    assert list(pipeline.profile_.index) == [
+        "Imputer",
+        "One Hot Encoder",
+        component_graph[-1],
+    ]
+
+    pipeline.predict(X, profile=True)
+    profile = pipeline.profile_
+    assert (profile["n_calls"] == 1).all()
+    assert profile.loc[component_graph[-1], "output_shape"] == (len(X),)
+    assert profile.loc["Imputer", "input_shape"] == X.shape
+
+    if problem_type != "regression":
+        pipeline.predict_proba(X, profile=True)
+        assert pipeline.profile_.loc[component_graph[-1], "output_shape"] == (
+            len(X),
+            len(pipeline.classes_),
+        )
+
+
+def test_pipeline_profile_binary_threshold(X_y_binary):
+    X, y = X_y_binary
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Logistic Regression Classifier"]
+    )
+    pipeline.fit(X, y)
+    pipeline.threshold = 0.6
+    pipeline.predict(X, profile=True)
+    assert list(pipeline.profile_.index) == [
+        "Imputer",
+        "Logistic Regression Classifier",
+    ]
+    assert (pipeline.profile_["n_calls"] == 1).all()
+
+
+def test_pipeline_profile_requires_fit(X_y_binary):
+    X, _ = X_y_binary
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Logistic Regression Classifier"]
+    )
+    with pytest.raises(PipelineNotYetFittedError):
+        pipeline.predict(X, profile=True)
+    assert pipeline.profile_ is None
+
+
+compiled_pipeline_features = [
+    "Pclass",
+    "Sex",
+    "Age",
+    "SibSp",
+    "Parch",
+    "Fare",
+    "Embarked",
+]
+
+
+@pytest.mark.parametrize("problem_type", ["binary", "multiclass", "regression"])
+def test_compiled_pipeline_matches_pipeline(
+    problem_type,
+    X_y_categorical_classification,
+    X_y_categorical_regression,
+):
+    if problem_type == "regression":
+        X, y = X_y_categorical_regression
+        pipeline = RegressionPipeline(
+            ["Imputer", "One Hot Encoder", "Random Forest Regressor"],
+            parameters={"Random Forest Regressor": {"n_estimators": 5, "n_jobs": 1}},
+        )
+    else:
+        X, y = X_y_categorical_classification
+        X = X[compiled_pipeline_features]
+        if problem_type == "multiclass":
+            y = X.pop("Pclass").map({1: "first", 2: "second", 3: "third"})
+        pipeline = _get_pipeline_base_class(problem_type)(
+            {
+                "Label Encoder": ["Label Encoder", "X", "y"],
+                "Imputer": ["Imputer", "Label Encoder.x", "Label Encoder.y"],
+                "One Hot Encoder": ["One Hot Encoder", "Imputer.x", "Label Encoder.y"],
+                "Random Forest Classifier": [
+                    "Random Forest Classifier",
+                    "One Hot Encoder.x",
+                    "Label Encoder.y",
+                ],
+            },
+            parameters={"Random Forest Classifier": {"n_estimators": 5, "n_jobs": 1}},
+        )
+    X = infer_feature_types(X)
+    pipeline.fit(X, y)
+    compiled = pipeline.compile()
+
+    assert compiled.name == pipeline.name
+    assert compiled.problem_type == pipeline.problem_type
+    assert compiled.input_feature_names == list(X.columns)
+    pd.testing.assert_series_equal(compiled.predict(X), pipeline.predict(X))
+    if problem_type == "regression":
+        assert compiled.classes_ is None
+        with pytest.raises(ValueError, match="only available for classification"):
+            compiled.predict_proba(X)
+    else:
+        assert compiled.classes_ == pipeline.classes_
+        assert_frame_equal(compiled.predict_proba(X), pipeline.predict_proba(X))
+
+
+def test_compiled_pipeline_accepts_dicts_records_and_arrays(
+    X_y_categorical_classification,
+):
+    X, y = X_y_categorical_classification
+    X = infer_feature_types(X[compiled_pipeline_features])
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "One Hot Encoder", "Logistic Regression Classifier"],
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+    )
+    pipeline.fit(X, y)
+    compiled = pipeline.compile()
+    expected = pipeline.predict_proba(X.ww.iloc[:5]).reset_index(drop=True)
+
+    records = X.iloc[:5].to_dict("records")
+    assert_frame_equal(compiled.predict_proba(records), expected)
+    assert_frame_equal(compiled.predict_proba(X.iloc[:5].to_numpy()), expected)
+    assert_frame_equal(
+        compiled.predict_proba(X.iloc[:5].reset_index(drop=True).to_dict("list")),
+        expected,
+    )
+    # A single row keeps the logical types the pipeline was fitted on
+    assert_frame_equal(compiled.predict_proba(records[0]), expected.iloc[:1])
+    assert_frame_equal(
+        compiled.predict_proba(X.iloc[0].to_numpy()),
+        expected.iloc[:1],
+    )
+    # Extra features are ignored and the input is left untouched
+    extra = X.iloc[:5].copy()
+    extra["not a feature"] = 1
+    assert_frame_equal(
+        compiled.predict_proba(extra).reset_index(drop=True),
+        expected,
+    )
+    assert extra.ww.schema is None
+
+    with pytest.raises(ValueError, match="missing features"):
+        compiled.predict({"Sex": "male"})
+    with pytest.raises(ValueError, match="features per row"):
+        compiled.predict(np.zeros((2, 3)))
+    with pytest.raises(ValueError, match="must be a dict"):
+        compiled.predict("not data")
+
+
+def test_compiled_pipeline_is_frozen(X_y_binary):
+    X, y = X_y_binary
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Logistic Regression Classifier"],
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+    )
+    with pytest.raises(PipelineNotYetFittedError):
+        pipeline.compile()
+
+    pipeline.fit(X, y)
+    pipeline.threshold = 0.8
+    compiled = pipeline.compile()
+    expected = pipeline.predict(X)
+    pd.testing.assert_series_equal(compiled.predict(X), expected)
+    pd.testing.assert_series_equal(
+        compiled.predict(X, objective="f1"),
+        pipeline.predict(X, objective="f1"),
+    )
+    with pytest.raises(ValueError, match="binary classification objective"):
+        compiled.predict(X, objective="R2")
+
+    pipeline.threshold = 0.2
+    pipeline.fit(X[:50], y[:50])
+    pd.testing.assert_series_equal(compiled.predict(X), expected)
+
+
+def test_compile_unsupported_pipelines():
+    pipeline = TimeSeriesRegressionPipeline(
+        ["Time Series Featurizer", "Random Forest Regressor"],
+        parameters={
+            "pipeline": {
+                "time_index": "date",
+                "gap": 1,
+                "max_delay": 2,
+                "forecast_horizon": 3,
+            },
+        },
+    )
+    with pytest.raises(ValueError, match="Time series pipelines cannot be compiled"):
+        CompiledPipeline(pipeline)
+
+    pipeline = RegressionPipeline(["DFS Transformer", "Random Forest Regressor"])
+    with pytest.raises(ValueError, match="DFS Transformer cannot be compiled"):
+        CompiledPipeline(pipeline)
+
+
+@pytest.fixture
+def fitted_titanic_pipeline(X_y_categorical_classification):
+    X, y = X_y_categorical_classification
+    X = infer_feature_types(X[compiled_pipeline_features])
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "One Hot Encoder", "Random Forest Classifier"],
+        parameters={"Random Forest Classifier": {"n_estimators": 5, "n_jobs": 1}},
+    )
+    pipeline.fit(X, y)
+    return pipeline, X
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize("method", ["predict", "predict_proba"])
+def test_predict_batches_matches_predict(method, n_jobs, fitted_titanic_pipeline):
+    pipeline, X = fitted_titanic_pipeline
+    batches = pipeline.predict_batches(X, chunk_size=200, n_jobs=n_jobs, method=method)
+    assert isinstance(batches, types.GeneratorType)
+    batches = list(batches)
+    assert [len(batch) for batch in batches] == [200, 200, 200, 200, 91]
+    assert all(batch.ww.schema is not None for batch in batches)
+
+    expected = getattr(pipeline, method)(X)
+    if method == "predict":
+        pd.testing.assert_series_equal(pd.concat(batches), expected)
+    else:
+        assert_frame_equal(pd.concat(batches), expected)
+
+
+def test_predict_batches_from_iterable_and_csv(fitted_titanic_pipeline, tmp_path):
+    pipeline, X = fitted_titanic_pipeline
+    expected = pipeline.predict(X)
+
+    chunks = (X.iloc[start : start + 300] for start in range(0, len(X), 300))
+    batches = list(pipeline.predict_batches(chunks, chunk_size=250))
+    assert [len(batch) for batch in batches] == [250, 50, 250, 50, 250, 41]
+    pd.testing.assert_series_equal(pd.concat(batches), expected)
+
+    path = os.path.join(str(tmp_path), "titanic.csv")
+    X.to_csv(path, index=False)
+    batches = list(pipeline.predict_batches(path, chunk_size=500))
+    assert [len(batch) for batch in batches] == [500, 391]
+    pd.testing.assert_series_equal(pd.concat(batches), expected)
+
+
+@pytest.mark.noncore_dependency("pyarrow")
+def test_predict_batches_writes_parquet(fitted_titanic_pipeline, tmp_path):
+    pipeline, X = fitted_titanic_pipeline
+    path = os.path.join(str(tmp_path), "predictions.parquet")
+    assert (
+        pipeline.predict_batches(
+            X,
+            chunk_size=200,
+            method="predict_proba",
+            output_path=path,
+        )
+        == path
+    )
+    assert_frame_equal(
+        pd.read_parquet(path),
+        pipeline.predict_proba(X).rename(columns=str).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+    input_path = os.path.join(str(tmp_path), "titanic.parquet")
+    X.to_parquet(input_path)
+    batches = list(pipeline.predict_batches(input_path, chunk_size=500))
+    pd.testing.assert_series_equal(
+        pd.concat(batches, ignore_index=True),
+        pipeline.predict(X).reset_index(drop=True),
+    )
+
+
+def test_predict_batches_errors(fitted_titanic_pipeline):
+    pipeline, X = fitted_titanic_pipeline
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        pipeline.predict_batches(X, chunk_size=0)
+    with pytest.raises(ValueError, match="method must be 'predict' or 'predict_proba'"):
+        pipeline.predict_batches(X, method="transform")
+    with pytest.raises(ValueError, match="does not support profile=True"):
+        pipeline.predict_batches(X, profile=True)
+    with pytest.raises(PipelineNotYetFittedError):
+        pipeline.clone().predict_batches(X)
+
+
+def test_eliminate_dead_features(X_y_categorical_classification):
+    X, y = X_y_categorical_classification
+    X = infer_feature_types(X[compiled_pipeline_features])
+    pipeline = BinaryClassificationPipeline(
+        {
+            "Imputer": ["Imputer", "X", "y"],
+            "One Hot Encoder": ["One Hot Encoder", "Imputer.x", "y"],
+            "RF Classifier Select From Model": [
+                "RF Classifier Select From Model",
+                "One Hot Encoder.x",
+                "y",
+            ],
+            "Random Forest Classifier": [
+                "Random Forest Classifier",
+                "RF Classifier Select From Model.x",
+                "y",
+            ],
+        },
+        parameters={"One Hot Encoder": {"top_n": None}},
+    )
+    with pytest.raises(PipelineNotYetFittedError):
+        pipeline.eliminate_dead_features()
+    pipeline.fit(X, y)
+    expected = pipeline.predict_proba(X)
+    selected_features = pipeline.get_component(
+        "RF Classifier Select From Model",
+    ).get_names()
+    encoded_features = pipeline.get_component("One Hot Encoder").get_feature_names()
+
+    dropped_features = pipeline.eliminate_dead_features()
+    ohe = pipeline.get_component("One Hot Encoder")
+    assert list(dropped_features) == ["One Hot Encoder"]
+    assert set(dropped_features["One Hot Encoder"]) == set(encoded_features) - set(
+        selected_features,
+    )
+    assert set(ohe.get_feature_names()) == set(encoded_features).intersection(
+        selected_features,
+    )
+    transformed = pipeline.transform_all_but_final(X)
+    assert list(transformed.columns) == selected_features
+    assert_frame_equal(pipeline.predict_proba(X), expected)
+
+
+def test_elide_noop_components(X_y_categorical_classification):
+    X, y = X_y_categorical_classification
+    X = infer_feature_types(X[compiled_pipeline_features].dropna())
+    y = y[X.index]
+    pipeline = BinaryClassificationPipeline(
+        {
+            "Label Encoder": ["Label Encoder", "X", "y"],
+            "Imputer": ["Imputer", "X", "Label Encoder.y"],
+            "One Hot Encoder": ["One Hot Encoder", "Imputer.x", "Label Encoder.y"],
+            "Logistic Regression Classifier": [
+                "Logistic Regression Classifier",
+                "One Hot Encoder.x",
+                "Label Encoder.y",
+            ],
+        },
+    )
+    with pytest.raises(PipelineNotYetFittedError):
+        pipeline.elide_noop_components(X)
+    pipeline.fit(X, y)
+    expected = pipeline.predict_proba(X)
+
+    assert pipeline.elide_noop_components(X) == ["Imputer"]
+    assert_frame_equal(pipeline.predict_proba(X), expected)
+    assert_frame_equal(pipeline.compile().predict_proba(X), expected)
+
+
+def test_elide_noop_components_keeps_imputer_casting_nullable_ints(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(
+        {
+            "int col": pd.Series(np.arange(len(y)) % 7, dtype="Int64"),
+            "double col": X[:, 0],
+        },
+    )
+    X.ww.init(logical_types={"int col": "IntegerNullable"})
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Random Forest Classifier"],
+        parameters={"Random Forest Classifier": {"n_estimators": 5, "n_jobs": 1}},
+    )
+    pipeline.fit(X, y)
+    expected = pipeline.predict_proba(X)
+
+    assert pipeline.elide_noop_components(X) == []
+    assert_frame_equal(pipeline.predict_proba(X), expected)
+
+
+def test_execution_plan_matches_pipelines(X_y_categorical_classification):
+    X, y = X_y_categorical_classification
+    X = infer_feature_types(X[compiled_pipeline_features])
+    preprocessing = {
+        "Label Encoder": ["Label Encoder", "X", "y"],
+        "Imputer": ["Imputer", "Label Encoder.x", "Label Encoder.y"],
+        "One Hot Encoder": ["One Hot Encoder", "Imputer.x", "Label Encoder.y"],
+    }
+    logistic_regression = BinaryClassificationPipeline(
+        {
+            **preprocessing,
+            "Standard Scaler": [
+                "Standard Scaler",
+                "One Hot Encoder.x",
+                "Label Encoder.y",
+            ],
+            "Logistic Regression Classifier": [
+                "Logistic Regression Classifier",
+                "Standard Scaler.x",
+                "Label Encoder.y",
+            ],
+        },
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+        custom_name="Logistic Regression",
+    )
+    random_forest = BinaryClassificationPipeline(
+        {
+            **preprocessing,
+            "Random Forest Classifier": [
+                "Random Forest Classifier",
+                "One Hot Encoder.x",
+                "Label Encoder.y",
+            ],
+        },
+        parameters={"Random Forest Classifier": {"n_estimators": 5, "n_jobs": 1}},
+        custom_name="Random Forest",
+    )
+    stacked = BinaryClassificationPipeline(
+        {
+            **preprocessing,
+            "Random Forest Classifier": [
+                "Random Forest Classifier",
+                "One Hot Encoder.x",
+                "Label Encoder.y",
+            ],
+            "Elastic Net Classifier": [
+                "Elastic Net Classifier",
+                "One Hot Encoder.x",
+                "Label Encoder.y",
+            ],
+            "Logistic Regression Classifier": [
+                "Logistic Regression Classifier",
+                "Random Forest Classifier.x",
+                "Elastic Net Classifier.x",
+                "Label Encoder.y",
+            ],
+        },
+        parameters={
+            "Random Forest Classifier": {"n_estimators": 5, "n_jobs": 1},
+            "Elastic Net Classifier": {"n_jobs": 1},
+            "Logistic Regression Classifier": {"n_jobs": 1},
+        },
+        custom_name="Stacked",
+    )
+    pipelines = [logistic_regression, random_forest, stacked]
+    for pipeline in pipelines:
+        pipeline.fit(X, y)
+    logistic_regression.threshold = 0.3
+
+    plan = PipelineExecutionPlan(pipelines)
+    # The Label Encoder, Imputer and One Hot Encoder are shared by all three pipelines
+    assert plan.n_components == 12
+    assert plan.n_evaluated_components == 6
+    objectives = ["Log Loss Binary", "F1", "AUC"]
+    predictions = plan.predict(X)
+    predicted_probabilities = plan.predict_proba(X)
+    scores = plan.score(X, y, objectives)
+    assert list(scores) == [pipeline.name for pipeline in pipelines]
+    for pipeline in pipelines:
+        pd.testing.assert_series_equal(
+            predictions[pipeline.name],
+            pipeline.predict(X),
+        )
+        assert_frame_equal(
+            predicted_probabilities[pipeline.name],
+            pipeline.predict_proba(X),
+        )
+        assert scores[pipeline.name] == pipeline.score(X, y, objectives)
+    assert dict(plan.iter_scores(X, y, objectives)) == scores
+
+
+def test_execution_plan_regression(X_y_regression):
+    X, y = X_y_regression
+    pipelines = [
+        RegressionPipeline(
+            ["Imputer", estimator],
+            parameters={estimator: parameters},
+        )
+        for estimator, parameters in [
+            ("Random Forest Regressor", {"n_estimators": 5, "n_jobs": 1}),
+            ("Elastic Net Regressor", {}),
+        ]
+    ]
+    for pipeline in pipelines:
+        pipeline.fit(X, y)
+    plan = PipelineExecutionPlan(pipelines)
+    assert plan.n_evaluated_components == 1
+    predictions = plan.predict(X)
+    scores = plan.score(X, y, ["R2", "MAE"])
+    assert plan.predict_proba(X) == {}
+    for pipeline in pipelines:
+        pd.testing.assert_series_equal(predictions[pipeline.name], pipeline.predict(X))
+        assert scores[pipeline.name] == pipeline.score(X, y, ["R2", "MAE"])
+
+
+def test_execution_plan_does_not_share_components_fitted_differently(X_y_binary):
+    X, y = X_y_binary
+    pipelines = [
+        BinaryClassificationPipeline(
+            ["Standard Scaler", "Logistic Regression Classifier"],
+            parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+            custom_name=f"Pipeline {i}",
+        )
+        for i in range(2)
+    ]
+    pipelines[0].fit(X, y)
+    pipelines[1].fit(X[:50], y[:50])
+    plan = PipelineExecutionPlan(pipelines)
+    assert plan.n_evaluated_components == 2
+    predicted_probabilities = plan.predict_proba(X)
+    for pipeline in pipelines:
+        assert_frame_equal(
+            predicted_probabilities[pipeline.name],
+            pipeline.predict_proba(X),
+        )
+
+
+def test_execution_plan_only_hashes_components_which_could_match(X_y_binary):
+    X, y = X_y_binary
+    pipeline = BinaryClassificationPipeline(
+        {
+            "Imputer": ["Imputer", "X", "y"],
+            "Standard Scaler": ["Standard Scaler", "Imputer.x", "y"],
+            "Logistic Regression Classifier": [
+                "Logistic Regression Classifier",
+                "Standard Scaler.x",
+                "y",
+            ],
+        },
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+    )
+    pipeline.fit(X, y)
+    other_pipeline = BinaryClassificationPipeline(
+        pipeline.component_graph.component_dict,
+        parameters={
+            "Standard Scaler": {"with_mean": False},
+            "Logistic Regression Classifier": {"n_jobs": 1},
+        },
+        custom_name="Other Pipeline",
+    )
+    other_pipeline.fit(X, y)
+    other_pipeline.component_graph.component_instances[
+        "Imputer"
+    ] = pipeline.get_component("Imputer")
+
+    # The Imputer is the same object in both pipelines and the Standard Scalers have different parameters
+    with patch("evalml.pipelines.execution_plan._fit_fingerprint") as mock_fingerprint:
+        plan = PipelineExecutionPlan([pipeline, other_pipeline])
+    mock_fingerprint.assert_not_called()
+    assert plan.n_evaluated_components == 3
+    predicted_probabilities = plan.predict_proba(X)
+    for fitted_pipeline in [pipeline, other_pipeline]:
+        assert_frame_equal(
+            predicted_probabilities[fitted_pipeline.name],
+            fitted_pipeline.predict_proba(X),
+        )
+
+
+def test_execution_plan_errors(X_y_binary):
+    X, y = X_y_binary
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Logistic Regression Classifier"],
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+    )
+    with pytest.raises(ValueError, match="must be fitted"):
+        PipelineExecutionPlan([pipeline])
+    pipeline.fit(X, y)
+    with pytest.raises(ValueError, match="names must be unique"):
+        PipelineExecutionPlan([pipeline, pipeline.clone()])
+
+    time_series_pipeline = TimeSeriesRegressionPipeline(
+        ["Time Series Featurizer", "Random Forest Regressor"],
+        parameters={
+            "pipeline": {
+                "time_index": "date",
+                "gap": 1,
+                "max_delay": 2,
+                "forecast_horizon": 3,
+            },
+        },
+    )
+    time_series_pipeline._is_fitted = True
+    with pytest.raises(ValueError, match="Time series pipelines cannot be added"):
+        PipelineExecutionPlan([time_series_pipeline])
+
+    plan = PipelineExecutionPlan([pipeline])
+    with pytest.raises(PipelineError, match="Input X data types are different"):
+        plan.predict(pd.DataFrame(X).astype(str))
+
+
+def test_pipeline_executor(X_y_binary):
+    X, y = X_y_binary
+    component_dict = {
+        "Imputer": ["Imputer", "X", "y"],
+        "Random Forest": ["Random Forest Classifier", "Imputer.x", "y"],
+        "Decision Tree": ["Decision Tree Classifier", "Imputer.x", "y"],
+        "Logistic Regression": [
+            "Logistic Regression Classifier",
+            "Random Forest.x",
+            "Decision Tree.x",
+            "y",
+        ],
+    }
+    parameters = {"Random Forest": {"n_estimators": 5, "n_jobs": 1}}
+    sequential_pipeline = BinaryClassificationPipeline(component_dict, parameters)
+    pipeline = BinaryClassificationPipeline(
+        component_dict,
+        parameters,
+        executor="threads",
+    )
+    assert sequential_pipeline.executor is None
+    assert pipeline.executor == "threads"
+    assert "executor='threads'" in repr(pipeline)
+    assert pipeline.clone().executor == "threads"
+    assert pipeline.new(parameters, random_seed=1).executor == "threads"
+    assert pipeline.spec.instantiate().executor == "threads"
+    assert (
+        BinaryClassificationPipeline(pipeline.component_graph, parameters).executor
+        == "threads"
+    )
+    assert (
+        BinaryClassificationPipeline(
+            pipeline.component_graph,
+            parameters,
+            executor="processes",
+        ).executor
+        == "processes"
+    )
+
+    with patch(
+        "evalml.pipelines.component_graph._evaluate_component_in_worker",
+        wraps=_evaluate_component_in_worker,
+    ) as mock_evaluate:
+        pipeline.fit(X, y)
+    assert mock_evaluate.call_count == len(component_dict)
+    sequential_pipeline.fit(X, y)
+    pd.testing.assert_frame_equal(
+        pipeline.predict_proba(X),
+        sequential_pipeline.predict_proba(X),
+    )
+    unpickled_pipeline = pickle.loads(pickle.dumps(pipeline))
+    assert unpickled_pipeline.executor == "threads"
+    pd.testing.assert_series_equal(
+        unpickled_pipeline.predict(X),
+        pipeline.predict(X),
+    )
+    pipeline.shutdown_executor()
+    unpickled_pipeline.shutdown_executor()
+    assert pipeline.component_graph._pool is None
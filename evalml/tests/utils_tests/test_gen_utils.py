@@ -12,6 +12,8 @@ from evalml.model_understanding.visualizations import visualize_decision_tree
 from evalml.pipelines.components import ComponentBase
 from evalml.utils.gen_utils import (
     SEED_BOUNDS,
+    _clear_importable_subclasses_cache,
+    _divide,
     _rename_column_names_to_numeric,
     are_datasets_separated_by_gap_time_index,
     are_ts_parameters_valid_for_split,
@@ -212,6 +214,46 @@ def test_get_importable_subclasses_wont_get_custom_classes():
     assert ChildClass not in get_importable_subclasses(ComponentBase)
 
 
+def test_get_importable_subclasses_checks_each_class_once(clear_component_caches):
+    from evalml.pipelines.components import Imputer
+
+    get_importable_subclasses(ComponentBase)
+    with patch.object(Imputer, "__init__", side_effect=ImportError) as mock_init:
+        assert Imputer in get_importable_subclasses(ComponentBase)
+        assert Imputer in get_importable_subclasses(ComponentBase, False)
+    mock_init.assert_not_called()
+
+
+def test_get_importable_subclasses_cache_can_be_cleared(clear_component_caches):
+    from evalml.pipelines.components import Imputer
+
+    with patch.object(Imputer, "__init__", side_effect=ImportError):
+        assert Imputer not in get_importable_subclasses(ComponentBase)
+    assert Imputer not in get_importable_subclasses(ComponentBase)
+    _clear_importable_subclasses_cache()
+    assert Imputer in get_importable_subclasses(ComponentBase)
+
+
+def test_get_importable_subclasses_picks_up_new_subclasses(clear_component_caches):
+    from evalml.utils.gen_utils import _get_subclasses
+
+    subclasses = _get_subclasses(ComponentBase)
+    assert get_importable_subclasses(ComponentBase) == get_importable_subclasses(
+        ComponentBase,
+    )
+
+    new_component = MagicMock(__module__="evalml.pipelines.components.new")
+    new_component.__name__ = "NewComponent"
+    with patch(
+        "evalml.utils.gen_utils._get_subclasses",
+        return_value=subclasses + [new_component],
+    ):
+        assert new_component in get_importable_subclasses(ComponentBase)
+        assert new_component in get_importable_subclasses(ComponentBase)
+    new_component.assert_called_once()
+    assert new_component not in get_importable_subclasses(ComponentBase)
+
+
 @patch("importlib.import_module")
 def test_import_or_warn_errors(dummy_importlib):
     def _mock_import_function(library_str):
@@ -876,3 +918,17 @@ def test_is_categorical_actually_boolean():
     assert not is_categorical_actually_boolean(X, "categorical")
     assert is_categorical_actually_boolean(X, "boolean_categorical")
     assert not is_categorical_actually_boolean(X, "boolean")
+
+
+def test_divide():
+    assert _divide(1, 4) == 0.25
+    assert _divide(1, 0) == 0.0
+    assert isinstance(_divide(0, 0), float)
+    np.testing.assert_array_equal(
+        _divide(np.array([1, 2, 0]), np.array([2, 0, 0])),
+        np.array([0.5, 0.0, 0.0]),
+    )
+    np.testing.assert_array_equal(
+        _divide(np.array([3, 6]), 3),
+        np.array([1.0, 2.0]),
+    )
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _run_in_fresh_interpreter(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "evalml.automl",
+        "evalml.demos",
+        "evalml.model_understanding",
+        "evalml.pipelines",
+        "pkg_resources",
+        "plotly",
+        "shap",
+        "skopt",
+        "sklearn",
+    ],
+)
+def test_import_evalml_is_lazy(module):
+    loaded = _run_in_fresh_interpreter(
+        f"import sys; import evalml; print({module!r} in sys.modules)",
+    )
+    assert loaded == "False"
+
+
+def test_import_model_understanding_does_not_load_explainers():
+    loaded = _run_in_fresh_interpreter(
+        "import sys; import evalml.model_understanding; print('shap' in sys.modules)",
+    )
+    assert loaded == "False"
+
+
+def test_lazy_attributes():
+    import evalml
+
+    assert evalml.AutoMLSearch is evalml.automl.AutoMLSearch
+    assert evalml.search is evalml.automl.search
+    assert evalml.pipelines.ComponentGraph is not None
+    assert "AutoMLSearch" in dir(evalml)
+    assert "model_understanding" in dir(evalml)
+    assert (
+        evalml.model_understanding.partial_dependence
+        is evalml.model_understanding.partial_dependence_functions.partial_dependence
+    )
+    assert (
+        evalml.model_understanding.metrics.confusion_matrix
+        is evalml.model_understanding.confusion_matrix
+    )
+    assert "metrics" in dir(evalml.model_understanding)
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_module'"):
+        evalml.not_a_module
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_function'"):
+        evalml.model_understanding.not_a_function
@@ -1,4 +1,5 @@
 from itertools import product
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -156,6 +157,18 @@ def test_infer_feature_types_preserves_semantic_tags():
     assert series.ww.schema == infer_feature_types(series).ww.schema
 
 
+def test_infer_feature_types_keeps_valid_dataframe_schema():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"]})
+    df.ww.init(logical_types={"b": "Categorical"})
+    schema = df.ww.schema
+
+    with patch("woodwork.table_accessor.WoodworkTableAccessor.init") as mock_init:
+        new_df = infer_feature_types(df)
+    mock_init.assert_not_called()
+    assert new_df is df
+    assert new_df.ww.schema == schema
+
+
 def test_infer_feature_types_raises_invalid_schema_error():
 
     df = pd.DataFrame(pd.Series([1, 2, None]))
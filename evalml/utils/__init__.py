@@ -12,6 +12,7 @@ from evalml.utils.gen_utils import (
     drop_rows_with_nans,
     pad_with_nans,
     _get_rows_without_nans,
+    _divide,
     save_plot,
     is_all_numeric,
     get_importable_subclasses,
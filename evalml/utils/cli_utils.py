@@ -7,7 +7,6 @@ import platform
 import struct
 import sys
 
-import pkg_resources
 import requirements
 
 import evalml
@@ -88,6 +87,8 @@ def get_installed_packages():
     Returns:
         Dictionary mapping installed package names to their versions.
     """
+    import pkg_resources
+
     installed_packages = {}
     for d in pkg_resources.working_set:
         installed_packages[d.project_name.lower()] = d.version
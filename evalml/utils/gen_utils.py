@@ -241,9 +241,37 @@ _not_used_in_automl = {
 }
 
 
+# Whether each evalml class could be instantiated, i.e. whether its optional dependencies are installed.
+_importable_classes = {}
+# Results of get_importable_subclasses, keyed by the subclasses they were computed from and used_in_automl.
+_importable_subclasses_cache = {}
+
+
+def _clear_importable_subclasses_cache():
+    """Forgets which classes could be instantiated, so that get_importable_subclasses checks them again."""
+    _importable_classes.clear()
+    _importable_subclasses_cache.clear()
+
+
+def _is_importable(cls):
+    if cls not in _importable_classes:
+        try:
+            cls()
+            _importable_classes[cls] = True
+        except (ImportError, MissingComponentError, TypeError):
+            logger.debug(
+                f"Could not import class {cls.__name__} in get_importable_subclasses",
+            )
+            _importable_classes[cls] = False
+    return _importable_classes[cls]
+
+
 def get_importable_subclasses(base_class, used_in_automl=True):
     """Get importable subclasses of a base class. Used to list all of our estimators, transformers, components and pipelines dynamically.
 
+    Whether a class can be imported is only checked the first time it is seen, and the result for a given base class is
+    reused until a new subclass is defined.
+
     Args:
         base_class (abc.ABCMeta): Base class to find all of the subclasses for.
         used_in_automl: Not all components/pipelines/estimators are used in automl search. If True,
@@ -253,22 +281,20 @@ def get_importable_subclasses(base_class, used_in_automl=True):
     Returns:
         List of subclasses.
     """
-    all_classes = _get_subclasses(base_class)
-
-    classes = []
-    for cls in all_classes:
-        if "evalml.pipelines" not in cls.__module__:
-            continue
-        try:
-            cls()
-            classes.append(cls)
-        except (ImportError, MissingComponentError, TypeError):
-            logger.debug(
-                f"Could not import class {cls.__name__} in get_importable_subclasses",
-            )
+    all_classes = tuple(_get_subclasses(base_class))
+    cache_key = (all_classes, used_in_automl)
+    if cache_key in _importable_subclasses_cache:
+        return list(_importable_subclasses_cache[cache_key])
+
+    classes = [
+        cls
+        for cls in all_classes
+        if "evalml.pipelines" in cls.__module__ and _is_importable(cls)
+    ]
     if used_in_automl:
         classes = [cls for cls in classes if cls.__name__ not in _not_used_in_automl]
 
+    _importable_subclasses_cache[cache_key] = tuple(classes)
     return classes
 
 
@@ -403,6 +429,27 @@ def _get_rows_without_nans(*data):
     return mask
 
 
+def _divide(numerator, denominator):
+    """Divides elementwise, giving 0 where the denominator is 0 like scikit-learn metrics with zero_division=0.
+
+    Args:
+        numerator (float, np.ndarray): The numerator.
+        denominator (float, np.ndarray): The denominator.
+
+    Returns:
+        float or np.ndarray: The quotient, a float if both arguments are scalars.
+    """
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    quotient = np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(np.broadcast(numerator, denominator).shape),
+        where=denominator != 0,
+    )
+    return quotient if quotient.ndim else quotient.item()
+
+
 def drop_rows_with_nans(*pd_data):
     """Drop rows that have any NaNs in all dataframes or series.
 
@@ -477,17 +524,22 @@ def save_plot(
         String representing the final filepath the image was saved to if return_filepath is set to True.
         Defaults to None.
     """
-    plotly_ = import_or_raise("plotly", error_msg="Cannot find dependency plotly")
+    plotly_ = import_or_raise(
+        "plotly.graph_objects",
+        error_msg="Cannot find dependency plotly",
+    )
     graphviz_ = import_or_raise(
         "graphviz",
         error_msg="Please install graphviz to visualize trees.",
     )
-    matplotlib = import_or_raise(
-        "matplotlib",
+    plt_ = import_or_raise(
+        "matplotlib.pyplot",
+        error_msg="Cannot find dependency matplotlib",
+    )
+    axes_ = import_or_raise(
+        "matplotlib.axes",
         error_msg="Cannot find dependency matplotlib",
     )
-    plt_ = matplotlib.pyplot
-    axes_ = matplotlib.axes
 
     is_plotly = False
     is_graphviz = False
@@ -495,7 +547,7 @@ def save_plot(
     is_seaborn = False
 
     format = format if format else "png"
-    if isinstance(fig, plotly_.graph_objects.Figure):
+    if isinstance(fig, plotly_.Figure):
         is_plotly = True
     elif isinstance(fig, graphviz_.Source):
         is_graphviz = True
@@ -1,7 +1,15 @@
 """Check if EvalML has updated since the user installed."""
-from pkg_resources import iter_entry_points
+from importlib.metadata import entry_points
 
-for entry_point in iter_entry_points("alteryx_open_src_initialize"):
+
+def _iter_entry_points(group):
+    try:
+        return entry_points(group=group)
+    except TypeError:  # Python < 3.10 returns a dict of groups
+        return entry_points().get(group, [])
+
+
+for entry_point in _iter_entry_points("alteryx_open_src_initialize"):
     try:
         method = entry_point.load()
         if callable(method):
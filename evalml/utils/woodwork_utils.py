@@ -47,12 +47,14 @@ def infer_feature_types(data, feature_types=None):
     elif isinstance(data, np.ndarray):
         data = _numpy_to_pandas(data)
 
-    if data.ww.schema is not None:
+    # Woodwork returns a deep copy of the schema on every access, so fetch it once
+    schema = data.ww.schema
+    if schema is not None:
         if isinstance(data, pd.DataFrame) and not ww.is_schema_valid(
             data,
-            data.ww.schema,
+            schema,
         ):
-            ww_error = ww.get_invalid_schema_message(data, data.ww.schema)
+            ww_error = ww.get_invalid_schema_message(data, schema)
             if "dtype mismatch" in ww_error:
                 ww_error = (
                     "Dataframe types are not consistent with logical types. This usually happens "
@@ -62,7 +64,9 @@ def infer_feature_types(data, feature_types=None):
             else:
                 ww_error = f"{ww_error}. Please initialize ww with df.ww.init() to get rid of this message."
             raise ValueError(ww_error)
-        data.ww.init(schema=data.ww.schema)
+        if isinstance(data, pd.Series):
+            data.ww.init(schema=schema)
+        # DataFrame schemas were validated above, so initializing again would only repeat the same checks
         return data
 
     if isinstance(data, pd.Series):